@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------
+# Copyright (c) Merchise Autrement [~º/~] and Contributors
+# All rights reserved.
+#
+# This is free software; you can do what the LICENCE file allows you to.
+#
+"""Measure the memory, hashing and comparison of large ASTs.
+
+Run with::
+
+    python benchmarks/bench_ast.py [--depths 10,14,17] [--chain 100000] [--repeat 5]
+
+The balanced trees have applications, lambdas and literals (lets are left
+out because they couldn't be hashed before the AST was slotted); a tree of
+depth `d` has about ``2**d`` nodes.  The memory is measured with
+`tracemalloc`:mod: while the tree is built, then an equal tree is built
+(and timed), and `hash` and ``==`` are timed
+on two equal trees built separately (the best of `--repeat` runs).
+Finally, a chain of `--chain` nested applications is hashed and compared.
+
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+
+from xotl.fl.ast.expressions import Application, Identifier, Lambda, Literal
+from xotl.fl.builtins import NumberType
+
+
+def build(depth, leaf=0):
+    # Build the tree bottom-up (without recursion) and return it with the
+    # number of nodes.
+    level = [Literal(leaf + i, NumberType) for i in range(2**depth)]
+    count = len(level)
+    kind = 0
+    while len(level) > 1:
+        pairs = zip(level[::2], level[1::2])
+        if kind % 2 == 0:
+            level = [Application(Identifier(f"f{kind}"), Application(a, b)) for a, b in pairs]
+            count += 3 * len(level)
+        else:
+            level = [Lambda(f"x{kind}", Application(a, b)) for a, b in pairs]
+            count += 2 * len(level)
+        kind += 1
+    return level[0], count
+
+
+def chain(length):
+    result = Identifier("x")
+    for i in range(length):
+        result = Application(Identifier("f"), result)
+    return result
+
+
+def best(function, repeat):
+    result = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        result = min(result, time.perf_counter() - start)
+    return result
+
+
+def attempt(function, repeat):
+    try:
+        return f"{best(function, repeat) * 1000:9.2f} ms"
+    except (RecursionError, TypeError) as error:
+        return type(error).__name__
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--depths", default="10,14,17")
+    parser.add_argument("--chain", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    for depth in (int(depth) for depth in args.depths.split(",")):
+        tracemalloc.start()
+        tree, count = build(depth)
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        start = time.perf_counter()
+        other, _ = build(depth)
+        built = time.perf_counter() - start
+        print(
+            f"depth {depth:>2} ({count:>7} nodes)  {size / count:6.1f} bytes/node"
+            f"  build {built * 1000:9.2f} ms"
+            f"  hash {attempt(lambda: hash(tree), args.repeat)}"
+            f"  eq {attempt(lambda: tree == other, args.repeat)}"
+        )
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 10000))
+    first, second = chain(args.chain), chain(args.chain)
+    print(
+        f"chain of {args.chain} applications"
+        f"  hash {attempt(lambda: hash(first), args.repeat)}"
+        f"  eq {attempt(lambda: first == second, args.repeat)}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------
+# Copyright (c) Merchise Autrement [~º/~] and Contributors
+# All rights reserved.
+#
+# This is free software; you can do what the LICENCE file allows you to.
+#
+"""Compare the binary encoding of programs with pickle.
+
+Run with::
+
+    python benchmarks/bench_codec.py [--sizes 100,1000,5000] [--repeat 5]
+
+The throughput is in top-level definitions per second; the times are the
+best of `--repeat` runs.
+
+"""
+
+import argparse
+import pickle
+import time
+
+from xotl.fl import parse
+from xotl.fl.ast.codec import decode, encode
+from xotl.fl.builtins import _load_builtins_program
+
+RULE = r"""
+rule{i} :: Number -> (Number, String)
+rule{i} x = (x * base + length [1, 2, 3], label)
+  where base = {i}
+        label = "rule {i}"
+"""
+
+
+def best(function, argument, repeat):
+    result = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(argument)
+        result = min(result, time.perf_counter() - start)
+    return result
+
+
+def compare(name, definitions, repeat):
+    formats = (
+        ("codec", encode, decode),
+        ("pickle", lambda obj: pickle.dumps(obj, pickle.HIGHEST_PROTOCOL), pickle.loads),
+    )
+    for format, dumps, loads in formats:
+        data = dumps(definitions)
+        assert loads(data) == definitions
+        dumping = best(dumps, definitions, repeat)
+        loading = best(loads, data, repeat)
+        count = len(definitions)
+        print(
+            f"{name:>10} {format:7} {len(data):>9} bytes"
+            f"  encode {dumping * 1000:7.1f} ms ({count / dumping:9.0f} defs/s)"
+            f"  decode {loading * 1000:7.1f} ms ({count / loading:9.0f} defs/s)"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="100,1000,5000")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    compare("builtins", _load_builtins_program(), args.repeat)
+    for size in (int(size) for size in args.sizes.split(",")):
+        source = "".join(RULE.format(i=i) for i in range(size))
+        compare(f"{size} rules", parse(source, cache=False), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------
+# Copyright (c) Merchise Autrement [~º/~] and Contributors
+# All rights reserved.
+#
+# This is free software; you can do what the LICENCE file allows you to.
+#
+"""Measure the cold start of a one-shot type check in a new process.
+
+Each run is a new interpreter that parses and type-checks a single
+expression in the builtins environment.  Run with::
+
+    python benchmarks/bench_cold_start.py [--runs 10]
+
+Runs labeled 'no snapshot' ignore the snapshot of the builtins environment
+(and parse 'builtins.fl' instead).
+
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+ONE_SHOT = r"""
+import time
+start = time.perf_counter()
+from xotl.fl import builtins
+if {no_snapshot}:
+    builtins._load_builtin_typeenv.__globals__["_read_snapshot"] = lambda digest: None
+from xotl.fl.builtins import builtins_env
+from xotl.fl.parsers.expressions import parse
+from xotl.fl.typecheck import typecheck
+typecheck(parse(r"map (\x -> x + 1) [1, 2]"), builtins_env)
+print(time.perf_counter() - start)
+"""
+
+
+def measure(no_snapshot):
+    code = ONE_SHOT.format(no_snapshot=no_snapshot)
+    output = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout
+    return float(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+    for label, no_snapshot in (("snapshot", False), ("no snapshot", True)):
+        times = [measure(no_snapshot) for _ in range(args.runs)]
+        print(f"{label:12} median {statistics.median(times) * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------
+# Copyright (c) Merchise Autrement [~º/~] and Contributors
+# All rights reserved.
+#
+# This is free software; you can do what the LICENCE file allows you to.
+#
+"""Type-check deeply nested expressions with both engines.
+
+The substitution-based engine (the reference) is recursive; the union-find
+engine uses an explicit stack of tasks.  Run with::
+
+    python benchmarks/bench_deep_typecheck.py [--sizes 100,400,1600] [--big 100000]
+
+The reference engine is run with the default recursion limit; sizes where it
+overflows the stack are reported as such.
+
+"""
+
+import argparse
+import time
+
+from xotl.fl.ast.expressions import Identifier, Let, Literal, build_application, build_list_expr
+from xotl.fl.builtins import NumberType, builtins_env
+from xotl.fl.typecheck import typecheck
+
+
+def list_literal(size):
+    "[0, 1, ..., size - 1]; nested applications of (:)."
+    return build_list_expr(*(Literal(i, NumberType) for i in range(size)))
+
+
+def application_spine(size):
+    "id id ... id; a left-nested spine of applications."
+    return build_application("id", *(Identifier("id") for _ in range(size)))
+
+
+def nested_lets(size):
+    "let x0 = id in let x1 = x0 in ... in x{size-1}"
+    result = Identifier(f"x{size - 1}")
+    for i in reversed(range(size)):
+        value = Identifier(f"x{i - 1}") if i else Identifier("id")
+        result = Let({f"x{i}": value}, result)
+    return result
+
+
+SHAPES = {
+    "list": list_literal,
+    "spine": application_spine,
+    "lets": nested_lets,
+}
+
+
+def measure(expr, engine):
+    start = time.perf_counter()
+    try:
+        typecheck(expr, builtins_env, engine=engine)
+    except RecursionError:
+        return None
+    return time.perf_counter() - start
+
+
+def show(shape, size, engine, elapsed):
+    if elapsed is None:
+        result = "RecursionError"
+    else:
+        result = f"{elapsed * 1000:10.1f} ms  ({elapsed / size * 1e6:.1f} µs/node)"
+    print(f"{shape:6} {size:>8} {engine:13} {result}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="100,200,400,800,1600")
+    parser.add_argument("--big", type=int, default=100000)
+    args = parser.parse_args()
+    sizes = [int(size) for size in args.sizes.split(",")]
+    for shape, build in SHAPES.items():
+        for size in sizes:
+            expr = build(size)
+            for engine in ("substitution", "unionfind"):
+                show(shape, size, engine, measure(expr, engine))
+        if args.big:
+            show(shape, args.big, "unionfind", measure(build(args.big), "unionfind"))
+
+
+if __name__ == "__main__":
+    main()
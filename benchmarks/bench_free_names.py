@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------
+# Copyright (c) Merchise Autrement [~º/~] and Contributors
+# All rights reserved.
+#
+# This is free software; you can do what the LICENCE file allows you to.
+#
+"""Measure the free names analysis of a program with many local definitions.
+
+Run with::
+
+    python benchmarks/bench_free_names.py [--rules 2000] [--locals 20]
+
+Each of the `--rules` rules has a 'where' clause with `--locals` local
+definitions.  The dependencies of all the rules are found (which counts the
+free names of every equation), then they are found again with the counts
+kept in the equations.  Finally, the 'where' clauses are compiled, which finds
+the dependencies among the local definitions.
+
+"""
+
+import argparse
+import time
+
+from xotl.fl import parse
+from xotl.fl.ast.expressions import count_free_names
+from xotl.fl.ast.pattern import ConcreteLet
+from xotl.fl.typecheck.program import Program
+
+LOCAL = "    l{k} x = l{p} (x + {k}) * helper x\n"
+RULE = "rule{i} y = l{last} y\n  where\n"
+
+
+def timed(function):
+    start = time.perf_counter()
+    function()
+    return f"{(time.perf_counter() - start) * 1000:9.1f} ms"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rules", type=int, default=2000)
+    parser.add_argument("--locals", type=int, default=20)
+    args = parser.parse_args()
+    source = "helper x = x\n" + "".join(
+        RULE.format(i=i, last=args.locals - 1)
+        + "".join(LOCAL.format(k=k, p=max(k - 1, 0)) for k in range(args.locals))
+        for i in range(args.rules)
+    )
+    program = Program(parse(source, cache=False, max_workers=1))
+    equations = [equation for eqs in program.equations.values() for equation in eqs]
+    wheres = [equation.body for equation in equations if isinstance(equation.body, ConcreteLet)]
+
+    def dependencies():
+        program._dependencies.clear()
+        for name in program.equations:
+            program.dependencies(name)
+
+    print(f"{args.rules} rules with {args.locals} local definitions")
+    print(f"  dependencies (counting)  {timed(dependencies)}")
+    print(f"  dependencies (counted)   {timed(dependencies)}")
+    print(f"  count again              {timed(lambda: [count_free_names(eq) for eq in equations])}")
+    print(f"  compile 'where' clauses  {timed(lambda: [where.compile() for where in wheres])}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------
+# Copyright (c) Merchise Autrement [~º/~] and Contributors
+# All rights reserved.
+#
+# This is free software; you can do what the LICENCE file allows you to.
+#
+"""Compare the topological order and the SCCs of graphs with the previous ones.
+
+Run with::
+
+    python benchmarks/bench_graphs.py [--nodes 100000] [--diamonds 18] [--small 60] [--edits 1000]
+
+The graphs have `--nodes` nodes: a chain, a chain of diamonds, a random DAG
+(each node links to up to 4 later nodes) and random cycles.  The previous
+implementations were recursive (so they fail on long chains) and the
+previous topological order computed the score of a node again for each
+path to it; since that's exponential on diamonds (and DAGs with many
+paths), it only gets a chain of `--diamonds` diamonds and a random DAG of
+`--small` nodes.
+
+The last line compares `--edits` random edits (adding and removing edges)
+of a `~xotl.fl.graphs.Condensation`:class: of the random DAG with building
+the condensation again after each edit (the time of one build).
+
+"""
+
+import argparse
+import random
+import time
+
+from xotl.fl.graphs import Condensation, Graph
+
+
+def previous_topological_order(graph):
+    stack = []
+
+    def score(node):
+        if node in stack:
+            raise RuntimeError("Cycle detected")
+        stack.append(node)
+        try:
+            links = graph.nodes.get(node, [])
+            return max(score(dep) for dep in links) + 1 if links else 0
+        finally:
+            stack.pop()
+
+    return sorted(graph.nodes, key=score)
+
+
+def previous_sccs(graph):
+    def find_scc(node):
+        nonlocal index
+        indexed[node] = lowlinks[node] = index
+        index += 1
+        stack.append(node)
+        for link in graph[node]:
+            if link not in indexed:
+                find_scc(link)
+                lowlinks[node] = min(lowlinks[node], lowlinks[link])
+            elif link in stack:
+                lowlinks[node] = min(lowlinks[node], indexed[link])
+        if indexed[node] == lowlinks[node]:
+            w = stack.pop()
+            scc = {w}
+            while w != node:
+                w = stack.pop()
+                scc.add(w)
+            result.append(scc)
+
+    index = 0
+    indexed, lowlinks, result, stack = {}, {}, [], []
+    for node in graph.nodes:
+        if node not in indexed:
+            find_scc(node)
+    return result
+
+
+def chain(size):
+    result = Graph()
+    for node in range(size):
+        result.add_many(node, {node + 1} if node + 1 < size else set())
+    return result
+
+
+def diamonds(size):
+    # 0 -> (1, 2) -> 3 -> (4, 5) -> 6 ...
+    result = Graph()
+    for node in range(0, size - 3, 3):
+        result.add_many(node, {node + 1, node + 2})
+        result.add_many(node + 1, {node + 3})
+        result.add_many(node + 2, {node + 3})
+    return result
+
+
+def random_dag(size):
+    result = Graph()
+    for node in range(size):
+        result.add_many(node, {random.randrange(node, size) + 1 for _ in range(4)} - {size})
+    return result
+
+
+def random_cycles(size):
+    result = Graph()
+    for node in range(size):
+        result.add_many(node, {random.randrange(size) for _ in range(2)})
+    return result
+
+
+def timed(function, graph):
+    start = time.perf_counter()
+    try:
+        function(graph)
+    except (RecursionError, RuntimeError) as error:
+        return type(error).__name__
+    return f"{(time.perf_counter() - start) * 1000:9.1f} ms"
+
+
+def edit(condensation, size, edits):
+    for _ in range(edits):
+        from_, to_ = random.randrange(size), random.randrange(size)
+        if random.random() < 0.5:
+            condensation.add_edge(from_, to_)
+        else:
+            condensation.remove_edge(from_, to_)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=100000)
+    parser.add_argument("--diamonds", type=int, default=18)
+    parser.add_argument("--small", type=int, default=60)
+    parser.add_argument("--edits", type=int, default=1000)
+    args = parser.parse_args()
+    random.seed(1)
+    size = args.nodes
+    long_chain = chain(size)
+    graphs = [
+        ("chain", long_chain, long_chain),
+        ("diamonds", diamonds(size), diamonds(3 * args.diamonds + 1)),
+        ("random DAG", random_dag(size), random_dag(args.small)),
+    ]
+    for name, graph, small in graphs:
+        print(
+            f"{name:>13} topological order"
+            f"  previous {timed(previous_topological_order, small)}"
+            f"{'' if small is graph else ' (%d nodes)' % len(small.nodes)}"
+            f"  current {timed(Graph.get_topological_order, graph)}"
+        )
+    graphs[1:] = [("random cycles", random_cycles(size), None)]
+    for name, graph, _ in graphs:
+        print(
+            f"{name:>13} SCCs             "
+            f"  previous {timed(previous_sccs, graph)}"
+            f"  current {timed(Graph.get_sccs, graph)}"
+        )
+    dag = random_dag(size)
+    condensation = Condensation(dag)
+    start = time.perf_counter()
+    edit(condensation, size, args.edits)
+    elapsed = (time.perf_counter() - start) * 1000 / args.edits
+    print(
+        f"{'condensation':>13} per edit         "
+        f"  rebuild  {timed(Condensation, dag)}"
+        f"  update  {elapsed:9.3f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
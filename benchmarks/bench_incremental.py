@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------
+# Copyright (c) Merchise Autrement [~º/~] and Contributors
+# All rights reserved.
+#
+# This is free software; you can do what the LICENCE file allows you to.
+#
+"""Measure the time of single-character edits of programs of increasing size.
+
+Run with::
+
+    python benchmarks/bench_incremental.py [--sizes 100,1000,10000] [--edits 100]
+
+The edits type ten digits (one at a time) in the body of a random
+definition; the time of an edit is compared with parsing the whole program
+again.
+
+"""
+
+import argparse
+import random
+import time
+
+from xotl.fl import parse
+from xotl.fl.parsers.incremental import Document
+
+RULE = r"""
+rule{i} :: Number -> (Number, String)
+rule{i} x = (x * base + length [1, 2, 3], label)
+  where base = {i}
+        label = "rule {i}"
+"""
+LINES = RULE.count("\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="100,1000,10000")
+    parser.add_argument("--edits", type=int, default=100)
+    args = parser.parse_args()
+    rnd = random.Random(0)
+    for size in (int(size) for size in args.sizes.split(",")):
+        source = "".join(RULE.format(i=i) for i in range(size))
+        start = time.perf_counter()
+        parse(source, cache=False, max_workers=1)
+        full = time.perf_counter() - start
+        document = Document(source)
+        start = time.perf_counter()
+        for _ in range(args.edits):
+            # The line of 'where base = ...' of a random rule.
+            line = rnd.randrange(size) * LINES + 4
+            for column in range(15, 25):
+                document.edit((line, column), (line, column), "7")
+        edit = (time.perf_counter() - start) / (args.edits * 10)
+        assert document.definitions == parse(document.source, cache=False)
+        print(
+            f"{size:>6} rules  full parse {full * 1000:9.1f} ms"
+            f"  edit {edit * 1000:7.3f} ms  ({full / edit:8.0f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
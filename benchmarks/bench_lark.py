@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------
+# Copyright (c) Merchise Autrement [~º/~] and Contributors
+# All rights reserved.
+#
+# This is free software; you can do what the LICENCE file allows you to.
+#
+"""Compare the parsers of the lark front end with the previous setup.
+
+Run with::
+
+    python benchmarks/bench_lark.py [--sizes 10,100,1000] [--terms 1,5,10] [--repeat 5]
+
+The previous setup opened the grammar once per start symbol with the
+Earley parser (and `debug`), and transformed the parse trees with
+`~xotl.fl.parsers.larkish.ASTBuilder`:class: afterwards.  Only the type
+language is LALR(1), the expressions still need the Earley parser (and they
+are slow to parse, hence the few `--terms`).  The times are the best of
+`--repeat` runs.
+
+"""
+
+import argparse
+import time
+
+from lark import Lark
+from xotl.fl.parsers.larkish import (
+    GRAMMAR,
+    ASTBuilder,
+    LexerHelper,
+    _grammar,
+    expr_parser,
+    type_expr_parser,
+)
+
+# The type expressions of the tests of the parser of types.
+TYPES = [
+    "a -> a",
+    "a -> b -> a",
+    "(a -> b -> c) -> (a -> b) -> a -> c",
+    "(a -> b) -> [a] -> [b]",
+    "A (B b) (C c)",
+    "Eq a, Ord a => a -> a -> Bool",
+    "{name: String, birthdate: Date}",
+]
+EXPRESSION = "f x{i} (y{i} + 1) * g [1, 2, {i}] . h"
+
+
+def best(function, repeat):
+    result = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        result = min(result, time.perf_counter() - start)
+    return result
+
+
+def open_parser(start, **options):
+    return Lark.open(
+        GRAMMAR,
+        lexer="standard",
+        propagate_positions=True,
+        start=start,
+        debug=True,
+        postlex=LexerHelper(),
+        **options,
+    )
+
+
+def report(name, previous, current):
+    print(
+        f"{name:>28}  previous {previous * 1000:9.2f} ms"
+        f"  current {current * 1000:9.2f} ms  ({previous / current:5.1f}x)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="10,100,1000")
+    parser.add_argument("--terms", default="1,5,10")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    builder = ASTBuilder()
+
+    def load_previous():
+        return [open_parser(start) for start in ("type_expr", "expr", "program")]
+
+    def load_current():
+        Lark(
+            _grammar,
+            parser="lalr",
+            lexer="standard",
+            propagate_positions=True,
+            start="type_expr",
+            cache=True,
+            transformer=ASTBuilder(),
+            postlex=LexerHelper(),
+        )
+        Lark(
+            _grammar,
+            lexer="standard",
+            propagate_positions=True,
+            start=["expr", "program"],
+            postlex=LexerHelper(),
+        )
+
+    report("load the grammar", best(load_previous, 1), best(load_current, 1))
+
+    previous_types, previous_exprs, _ = load_previous()
+    for type_ in TYPES:
+        assert builder.transform(previous_types.parse(type_)) == type_expr_parser.parse(type_)
+    report(
+        "types of the tests",
+        best(lambda: [builder.transform(previous_types.parse(t)) for t in TYPES], args.repeat),
+        best(lambda: [type_expr_parser.parse(t) for t in TYPES], args.repeat),
+    )
+    for size in (int(size) for size in args.sizes.split(",")):
+        # A tuple of `size` function types.
+        source = "(" + ", ".join(f"a{i} -> Maybe [b{i}] -> c" for i in range(size)) + ")"
+        report(
+            f"tuple of {size} types",
+            best(lambda: builder.transform(previous_types.parse(source)), args.repeat),
+            best(lambda: type_expr_parser.parse(source), args.repeat),
+        )
+    for terms in (int(terms) for terms in args.terms.split(",")):
+        source = " + ".join(EXPRESSION.format(i=i) for i in range(terms))
+        report(
+            f"expression of {terms} terms",
+            best(lambda: builder.transform(previous_exprs.parse(source)), args.repeat),
+            best(lambda: builder.transform(expr_parser.parse(source)), args.repeat),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------
+# Copyright (c) Merchise Autrement [~º/~] and Contributors
+# All rights reserved.
+#
+# This is free software; you can do what the LICENCE file allows you to.
+#
+"""Measure the time to check 'main' in programs with many unused definitions.
+
+Run with::
+
+    python benchmarks/bench_lazy.py [--sizes 100,1000,10000] [--used 5]
+
+The programs have `--sizes` rules, but 'main' uses only `--used` of them.
+The time includes parsing the program (with and without ``lazy=True``) and
+type-checking the definitions reachable from 'main'.
+
+"""
+
+import argparse
+import time
+
+from xotl.fl import parse
+from xotl.fl.builtins import builtins_env
+from xotl.fl.typecheck import typecheck_program
+
+RULE = r"""
+rule{i} :: Number -> (Number, Number)
+rule{i} x = (x * base + {i}, twice)
+  where base = {i}
+        twice = base + base
+"""
+
+
+def check_main(source, lazy):
+    start = time.perf_counter()
+    program = parse(source, cache=False, max_workers=1, lazy=lazy)
+    parsed = time.perf_counter()
+    env = typecheck_program(program, builtins_env, roots=["main"])
+    end = time.perf_counter()
+    return env, parsed - start, end - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="100,1000,10000")
+    parser.add_argument("--used", type=int, default=5)
+    args = parser.parse_args()
+    for size in (int(size) for size in args.sizes.split(",")):
+        used = min(args.used, size)
+        source = "".join(RULE.format(i=i) for i in range(size))
+        source += "main = [" + ", ".join(f"rule{i} 1" for i in range(used)) + "]\n"
+        env, eager_parse, eager = check_main(source, False)
+        lazy_env, lazy_parse, lazy = check_main(source, True)
+        assert env == lazy_env
+        print(
+            f"{size:>6} rules  eager {eager * 1000:8.1f} ms (parse {eager_parse * 1000:8.1f} ms)"
+            f"  lazy {lazy * 1000:8.1f} ms (parse {lazy_parse * 1000:8.1f} ms)"
+            f"  ({eager / lazy:5.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
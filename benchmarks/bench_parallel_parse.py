@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------
+# Copyright (c) Merchise Autrement [~º/~] and Contributors
+# All rights reserved.
+#
+# This is free software; you can do what the LICENCE file allows you to.
+#
+"""Parse a multi-megabyte program with an increasing number of worker processes.
+
+Run with::
+
+    python benchmarks/bench_parallel_parse.py [--megabytes 2] [--workers 1,2,4,8]
+
+The speedup is relative to the serial parse (``max_workers=1``).
+
+"""
+
+import argparse
+import os
+import time
+
+from xotl.fl import parse
+
+RULE = r"""
+-- Rule number {i}
+rule{i} :: Number -> (Number, String)
+rule{i} x = (x * base + length [1, 2, 3], label)
+  where base = {i}
+        label = "rule {i}"
+"""
+
+
+def program(megabytes):
+    rules, size, i = [], 0, 0
+    while size < megabytes * 2**20:
+        rule = RULE.format(i=i)
+        rules.append(rule)
+        size += len(rule)
+        i += 1
+    return "".join(rules)
+
+
+def measure(source, workers):
+    start = time.perf_counter()
+    parse(source, max_workers=workers)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--megabytes", type=float, default=2)
+    parser.add_argument("--workers", default=",".join(str(2**i) for i in range(1, 4)))
+    args = parser.parse_args()
+    source = program(args.megabytes)
+    print(f"{len(source) / 2**20:.1f} MiB, {os.cpu_count()} CPUs")
+    serial = measure(source, 1)
+    print(f"{'serial':>8} {serial * 1000:10.1f} ms")
+    for workers in (int(w) for w in args.workers.split(",")):
+        elapsed = measure(source, workers)
+        print(f"{workers:>8} {elapsed * 1000:10.1f} ms  (speedup {serial / elapsed:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
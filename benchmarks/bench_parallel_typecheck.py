@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------
+# Copyright (c) Merchise Autrement [~º/~] and Contributors
+# All rights reserved.
+#
+# This is free software; you can do what the LICENCE file allows you to.
+#
+"""Type-check a wide program with an increasing number of worker processes.
+
+The program has many independent definitions (all in the first level of the
+dependency DAG) and a few definitions using them.  Run with::
+
+    python benchmarks/bench_parallel_typecheck.py [--size 500] [--workers 1,2,4,8]
+
+The speedup is relative to the serial check (``max_workers=None``).
+
+"""
+
+import argparse
+import os
+import time
+
+from xotl.fl import parse
+from xotl.fl.builtins import builtins_env
+from xotl.fl.typecheck import typecheck_program
+
+RULE = r"""
+rule{i} x y = let swap a b = (b, a)
+                  twice f = f . f
+                  pick p = if (p x) (then (swap x y)) (else (y, x))
+              in (twice (\z -> z + {i}), pick (\z -> z == y), [x, y, {i}])
+"""
+
+
+def wide_program(size):
+    rules = "".join(RULE.format(i=i) for i in range(size))
+    uses = "".join(f"use{j} = rule{j} 1 2\n" for j in range(0, size, 100))
+    return parse(rules + uses)
+
+
+def measure(program, engine, workers):
+    start = time.perf_counter()
+    typecheck_program(program, builtins_env, engine=engine, max_workers=workers)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=500)
+    parser.add_argument("--workers", default=",".join(str(2**i) for i in range(4)))
+    parser.add_argument("--engine", default="substitution")
+    args = parser.parse_args()
+    program = wide_program(args.size)
+    print(f"{args.size} definitions, {os.cpu_count()} CPUs, {args.engine} engine")
+    serial = measure(program, args.engine, None)
+    print(f"{'serial':>8} {serial * 1000:10.1f} ms")
+    for workers in (int(w) for w in args.workers.split(",")):
+        elapsed = measure(program, args.engine, workers)
+        print(f"{workers:>8} {elapsed * 1000:10.1f} ms  (speedup {serial / elapsed:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------
+# Copyright (c) Merchise Autrement [~º/~] and Contributors
+# All rights reserved.
+#
+# This is free software; you can do what the LICENCE file allows you to.
+#
+"""Compare parsing programs with hits (and misses) in the on-disk cache.
+
+Run with::
+
+    python benchmarks/bench_parse_cache.py [--sizes 100,1000,5000]
+
+"""
+
+import argparse
+import tempfile
+import time
+
+from xotl.fl import parse
+from xotl.fl.cache import ParseCache
+
+RULE = r"""
+rule{i} :: Number -> (Number, String)
+rule{i} x = (x * base + length [1, 2, 3], label)
+  where base = {i}
+        label = "rule {i}"
+"""
+
+
+def measure(source, cache):
+    start = time.perf_counter()
+    parse(source, cache=cache, max_workers=1)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="100,1000,5000")
+    args = parser.parse_args()
+    parse("x = 1\n", cache=False)  # build the parser before measuring
+    with tempfile.TemporaryDirectory() as directory:
+        cache = ParseCache(directory)
+        for size in (int(size) for size in args.sizes.split(",")):
+            source = "".join(RULE.format(i=i) for i in range(size))
+            for name, cache_ in (("no cache", False), ("miss", cache), ("hit", cache)):
+                elapsed = measure(source, cache_)
+                print(f"{size:>6} {name:10} {elapsed * 1000:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
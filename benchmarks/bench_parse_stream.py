@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------
+# Copyright (c) Merchise Autrement [~º/~] and Contributors
+# All rights reserved.
+#
+# This is free software; you can do what the LICENCE file allows you to.
+#
+"""Compare the peak memory of parsing a file as a whole and as a stream.
+
+Run with::
+
+    python benchmarks/bench_parse_stream.py [--sizes 500,1000,2000]
+
+"""
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+
+from xotl.fl import parse, parse_stream
+
+RULE = r"""
+-- Rule number {i}
+rule{i} :: Number -> (Number, String)
+rule{i} x = (x * base + length [1, 2, 3], label)
+  where base = {i}
+        label = "rule {i}"
+"""
+
+
+def measure(fn, *args):
+    tracemalloc.start()
+    start = time.perf_counter()
+    count = fn(*args)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return count, elapsed, peak
+
+
+def whole(path):
+    with open(path) as f:
+        return len(parse(f.read()))
+
+
+def streamed(path):
+    with open(path) as f:
+        return sum(1 for _ in parse_stream(f))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="500,1000,2000")
+    args = parser.parse_args()
+    parse("x = 1\n")  # build the parser before measuring
+    for size in (int(size) for size in args.sizes.split(",")):
+        with tempfile.NamedTemporaryFile("w", suffix=".fl") as f:
+            f.write("".join(RULE.format(i=i) for i in range(size)))
+            f.flush()
+            for name, fn in (("parse", whole), ("parse_stream", streamed)):
+                count, elapsed, peak = measure(fn, f.name)
+                print(
+                    f"{size:>6} {name:12} {count:>6} definitions "
+                    f"{elapsed * 1000:10.1f} ms  peak {peak / 2**20:8.2f} MiB"
+                )
+
+
+if __name__ == "__main__":
+    main()
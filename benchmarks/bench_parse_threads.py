@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------
+# Copyright (c) Merchise Autrement [~º/~] and Contributors
+# All rights reserved.
+#
+# This is free software; you can do what the LICENCE file allows you to.
+#
+"""Parse many small programs from a pool of threads.
+
+Reports the throughput (programs per second) for an increasing number of
+threads, and checks the results match a sequential parse.  Run with::
+
+    python benchmarks/bench_parse_threads.py [--programs 2000] [--threads 1,2,4,8]
+
+"""
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from xotl.fl import parse
+
+PROGRAM = """
+f{i} :: Number -> Number
+f{i} x = x + {i}
+
+g{i} (x:xs) = f{i} x : g{i} xs
+g{i} [] = []
+
+h{i} = let y = f{i} 1
+           z = g{i} [y, {i}]
+       in (y, z)
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--programs", type=int, default=2000)
+    parser.add_argument("--threads", default="1,2,4,8")
+    args = parser.parse_args()
+    sources = [PROGRAM.format(i=i) for i in range(args.programs)]
+    expected = [parse(source) for source in sources]
+    for threads in (int(t) for t in args.threads.split(",")):
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            start = time.perf_counter()
+            result = list(executor.map(parse, sources))
+            elapsed = time.perf_counter() - start
+        assert result == expected
+        print(f"{threads:>4} threads {len(sources) / elapsed:10.1f} programs/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------
+# Copyright (c) Merchise Autrement [~º/~] and Contributors
+# All rights reserved.
+#
+# This is free software; you can do what the LICENCE file allows you to.
+#
+"""Type-check many small expressions, as a service would do.
+
+Measures the per-call cost of `typecheck` with the default environment and
+the cost of creating environments.  Run with::
+
+    python benchmarks/bench_small_expressions.py [--number 5000]
+
+"""
+
+import argparse
+import timeit
+
+from xotl.fl import builtins
+from xotl.fl.builtins import BuiltinEnvDict
+from xotl.fl.parsers.expressions import parse
+from xotl.fl.typecheck import typecheck
+
+EXPRESSIONS = [r"(\x -> x) []", r"(1, 'a')", r"let id x = x in id id"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=5000)
+    args = parser.parse_args()
+    number = args.number
+    exprs = [parse(code) for code in EXPRESSIONS]
+    cases = {
+        "BuiltinEnvDict()": lambda: BuiltinEnvDict(),
+        "builtins_env": lambda: builtins.builtins_env,
+        "typecheck(expr)": lambda: [typecheck(expr) for expr in exprs],
+    }
+    for label, fn in cases.items():
+        elapsed = timeit.timeit(fn, number=number)
+        print(f"{label:20} {elapsed / number * 1e6:10.2f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------
+# Copyright (c) Merchise Autrement [~º/~] and Contributors
+# All rights reserved.
+#
+# This is free software; you can do what the LICENCE file allows you to.
+#
+"""Measure a corpus of rules with and without the expression store.
+
+Run with::
+
+    python benchmarks/bench_store.py [--rules 50000]
+
+The rules share most of their terms (the same helper applications, literals
+and lambdas).  The memory is the size (measured with `tracemalloc`:mod:) of
+the parsed program, and of the program built by
+`xotl.fl.ast.store.intern`:func: (the time to intern includes the overhead
+of tracing the memory).  Both programs are type-checked.
+
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from xotl.fl import parse
+from xotl.fl.ast.store import _interned, intern
+from xotl.fl.builtins import builtins_env
+from xotl.fl.typecheck import typecheck_program
+
+HELPERS = r"""
+clamp :: Number -> Number -> Number
+clamp x y = x + y
+
+weight :: Number -> Number
+weight x = x * 2
+"""
+
+RULE = r"""
+rule{i} :: Number -> Number
+rule{i} x = clamp (weight (x + 1)) (weight (1 + 2 * 3)) + (\y -> y * 2) {j} + {i}
+"""
+
+
+def check(program):
+    start = time.perf_counter()
+    env = typecheck_program(program, builtins_env)
+    return env, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rules", type=int, default=50000)
+    args = parser.parse_args()
+    source = HELPERS + "".join(RULE.format(i=i, j=i % 7) for i in range(args.rules))
+    gc.collect()
+    tracemalloc.start()
+    program = parse(source, cache=False, max_workers=1)
+    plain, _ = tracemalloc.get_traced_memory()
+    start = time.perf_counter()
+    interned = [intern(dfn) for dfn in program]
+    interning = time.perf_counter() - start
+    # The interned nodes are new objects (the store was empty).
+    size = tracemalloc.get_traced_memory()[0] - plain
+    tracemalloc.stop()
+    env, plain_time = check(program)
+    interned_env, interned_time = check(interned)
+    assert env == interned_env
+    print(f"{args.rules} rules, {len(_interned)} nodes in the store")
+    print(f"    parsed  {plain / 2**20:8.1f} MiB  check {plain_time:8.2f} s")
+    print(
+        f"  interned  {size / 2**20:8.1f} MiB  check {interned_time:8.2f} s"
+        f"  (intern {interning:6.2f} s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
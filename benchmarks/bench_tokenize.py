@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------
+# Copyright (c) Merchise Autrement [~º/~] and Contributors
+# All rights reserved.
+#
+# This is free software; you can do what the LICENCE file allows you to.
+#
+"""Tokenize (and parse) large generated programs with the ply lexer and the scanner.
+
+Run with::
+
+    python benchmarks/bench_tokenize.py [--sizes 100,1000,5000]
+
+"""
+
+import argparse
+import time
+
+from xotl.fl import scan, tokenize
+from xotl.fl.parsers import ParserContext
+
+RULE = r"""
+-- Rule number {i}
+rule{i} :: Number -> Date -> (Number, String)
+rule{i} x d = let base = if (before d <2018-12-{day:02d}>) (then 0x{i:x}) (else {i}.5)
+                  label = "rule {i}"
+              in (x * base + length [1, 2, 3], label ++ ['a', 'b'])
+"""
+
+
+def program(size):
+    return "".join(RULE.format(i=i, day=i % 28 + 1) for i in range(size))
+
+
+def measure(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="100,1000,5000")
+    args = parser.parse_args()
+    lexer_context, scanner_context = ParserContext(), ParserContext(scanner=True)
+    for size in (int(size) for size in args.sizes.split(",")):
+        source = program(size)
+        elapsed, tokens = measure(tokenize, source)
+        count = len(tokens)
+        print(f"{size:>6} tokenize  {elapsed * 1000:10.1f} ms  {count / elapsed:12,.0f} tokens/s")
+        elapsed, _ = measure(lambda s: sum(1 for _ in scan(s)), source)
+        print(f"{size:>6} scan      {elapsed * 1000:10.1f} ms  {count / elapsed:12,.0f} tokens/s")
+        for name, context in (("lexer", lexer_context), ("scanner", scanner_context)):
+            elapsed, _ = measure(context.parse_program, source)
+            print(f"{size:>6} parse ({name:7}) {elapsed * 1000:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------
+# Copyright (c) Merchise Autrement [~º/~] and Contributors
+# All rights reserved.
+#
+# This is free software; you can do what the LICENCE file allows you to.
+#
+"""Type-check programs with many top-level definitions.
+
+Compare `typecheck_program` (one check per strongly connected component)
+with checking the whole program as a single let expression; and measure the
+update of a `TypecheckSession` after editing a single definition.  Run with::
+
+    python benchmarks/bench_typecheck_program.py [--sizes 50,100,200]
+
+"""
+
+import argparse
+import time
+
+from xotl.fl import parse
+from xotl.fl.ast.expressions import Identifier
+from xotl.fl.ast.pattern import ConcreteLet
+from xotl.fl.builtins import builtins_env
+from xotl.fl.typecheck import TypecheckSession, typecheck, typecheck_program
+
+
+def chain(size, edited=None):
+    "f0 x = x; f1 x = f0 x + 1; ...; each definition uses the previous one."
+    lines = ["f0 x = x"]
+    for i in range(1, size):
+        if i == edited:
+            lines.append(f"f{i} y = f{i - 1} y + {i}")
+        else:
+            lines.append(f"f{i} x = f{i - 1} x + {i}")
+    return parse("\n".join(lines))
+
+
+def as_let(program, size):
+    return ConcreteLet(program, Identifier(f"f{size - 1}")).ast
+
+
+def measure(fn, *args, **kwargs):
+    start = time.perf_counter()
+    fn(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="50,100,200")
+    args = parser.parse_args()
+    for size in (int(size) for size in args.sizes.split(",")):
+        program = chain(size)
+        for engine in ("substitution", "unionfind"):
+            elapsed = measure(typecheck_program, program, builtins_env, engine=engine)
+            print(f"{size:>6} program {engine:13} {elapsed * 1000:10.1f} ms")
+            session = TypecheckSession(builtins_env, engine=engine)
+            session.update(program)
+            edited = chain(size, edited=size // 2)
+            elapsed = measure(session.update, edited)
+            print(f"{size:>6} update  {engine:13} {elapsed * 1000:10.1f} ms")
+            try:
+                elapsed = measure(typecheck, as_let(program, size), builtins_env, engine=engine)
+            except RecursionError:
+                print(f"{size:>6} let     {engine:13} RecursionError")
+            else:
+                print(f"{size:>6} let     {engine:13} {elapsed * 1000:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------
+# Copyright (c) Merchise Autrement [~º/~] and Contributors
+# All rights reserved.
+#
+# This is free software; you can do what the LICENCE file allows you to.
+#
+"""Look up the schemes of wide tuple constructors and extractors.
+
+These schemes are synthesized by `BuiltinEnvDict.__missing__` and cached
+(see `xotl.fl.builtins.SYNTHETIC_SCHEMES_CACHE_SIZE`).  Run with::
+
+    python benchmarks/bench_wide_tuples.py [--sizes 10,100,1000,10000]
+
+'first' is the cost of a cache miss; 'cached' is the cost of a lookup in a
+new environment afterwards.
+
+"""
+
+import argparse
+import time
+
+from xotl.fl.builtins import BuiltinEnvDict
+from xotl.fl.match import Extract
+
+
+def measure(fn, number=1):
+    start = time.perf_counter()
+    for _ in range(number):
+        fn()
+    return (time.perf_counter() - start) / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="10,100,1000,10000")
+    args = parser.parse_args()
+    BuiltinEnvDict()[","]  # build the base environment and warm up
+    for size in (int(size) for size in args.sizes.split(",")):
+        cons = "," * (size - 1)
+        keys = {"cons": cons, "extract": Extract(cons, size // 2 + 1)}
+        for label, key in keys.items():
+            first = measure(lambda: BuiltinEnvDict()[key])
+            cached = measure(lambda: BuiltinEnvDict()[key], number=100)
+            print(
+                f"{size:>6} {label:8} first {first * 1000:9.2f} ms"
+                f"   cached {cached * 1e6:9.2f} µs"
+            )
+
+
+if __name__ == "__main__":
+    main()
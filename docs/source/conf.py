@@ -35,19 +35,20 @@ class CheckWithEval(doctest.OutputChecker):
         return super().check_output(want, got, optionflags)
 
 
-LITERAL_EVAL = doctest.register_optionflag('LITERAL_EVAL')
+LITERAL_EVAL = doctest.register_optionflag("LITERAL_EVAL")
 
 
-sys.path.insert(0, os.path.abspath('../'))
+sys.path.insert(0, os.path.abspath("../"))
 
 
 # -- Project information -----------------------------------------------------
 
-project = 'xotl.fl'
-from datetime import datetime    # noqa
-copyright = '{}, Merchise Autrement [~º/~]'
+project = "xotl.fl"
+from datetime import datetime  # noqa
+
+copyright = "{}, Merchise Autrement [~º/~]"
 copyright = copyright.format(datetime.now().year)
-author = 'Merchise Autrement [~º/~]'
+author = "Merchise Autrement [~º/~]"
 
 # The version info for the project you're documenting, acts as replacement for
 # |version| and |release|, also used in various other places throughout the
@@ -55,7 +56,8 @@ author = 'Merchise Autrement [~º/~]'
 #
 # The short X.Y version.
 import pkg_resources
-dist = pkg_resources.get_distribution('xotl.fl')
+
+dist = pkg_resources.get_distribution("xotl.fl")
 version = dist.version
 release = version
 
@@ -70,23 +72,23 @@ release = version
 # extensions coming with Sphinx (named 'sphinx.ext.*') or your custom
 # ones.
 extensions = [
-    'sphinx.ext.autodoc',
-    'sphinx.ext.doctest',
-    'sphinx.ext.intersphinx',
-    'sphinx.ext.viewcode',
+    "sphinx.ext.autodoc",
+    "sphinx.ext.doctest",
+    "sphinx.ext.intersphinx",
+    "sphinx.ext.viewcode",
 ]
 
 # Add any paths that contain templates here, relative to this directory.
-templates_path = ['_templates']
+templates_path = ["_templates"]
 
 # The suffix(es) of source filenames.
 # You can specify multiple suffix as a list of string:
 #
 # source_suffix = ['.rst', '.md']
-source_suffix = '.rst'
+source_suffix = ".rst"
 
 # The master toctree document.
-master_doc = 'index'
+master_doc = "index"
 
 # The language for content autogenerated by Sphinx. Refer to documentation
 # for a list of supported languages.
@@ -101,7 +103,7 @@ language = None
 exclude_patterns = []
 
 # The name of the Pygments (syntax highlighting) style to use.
-pygments_style = 'sphinx'
+pygments_style = "sphinx"
 
 
 # -- Options for HTML output -------------------------------------------------
@@ -111,10 +113,11 @@ pygments_style = 'sphinx'
 #
 try:
     import sphinx_rtd_theme as theme
-    html_theme = 'sphinx_rtd_theme'
+
+    html_theme = "sphinx_rtd_theme"
     html_theme_path = [theme.get_html_theme_path()]
 except ImportError:
-    html_theme = 'pyramid'
+    html_theme = "pyramid"
 
 # Theme options are theme-specific and customize the look and feel of a theme
 # further.  For a list of options available for each theme, see the
@@ -125,8 +128,8 @@ except ImportError:
 # Add any paths that contain custom static files (such as style sheets) here,
 # relative to this directory. They are copied after the builtin static files,
 # so a file named "default.css" will overwrite the builtin "default.css".
-html_static_path = ['_static']
-html_style = 'custom.css'
+html_static_path = ["_static"]
+html_style = "custom.css"
 
 # Custom sidebar templates, must be a dictionary that maps document names
 # to template names.
@@ -142,7 +145,7 @@ html_style = 'custom.css'
 # -- Options for HTMLHelp output ---------------------------------------------
 
 # Output file base name for HTML help builder.
-htmlhelp_basename = 'xotlfldoc'
+htmlhelp_basename = "xotlfldoc"
 
 
 # -- Options for LaTeX output ------------------------------------------------
@@ -151,15 +154,12 @@ latex_elements = {
     # The paper size ('letterpaper' or 'a4paper').
     #
     # 'papersize': 'letterpaper',
-
     # The font size ('10pt', '11pt' or '12pt').
     #
     # 'pointsize': '10pt',
-
     # Additional stuff for the LaTeX preamble.
     #
     # 'preamble': '',
-
     # Latex figure (float) alignment
     #
     # 'figure_align': 'htbp',
@@ -169,8 +169,13 @@ latex_elements = {
 # (source start file, target name, title,
 #  author, documentclass [howto, manual, or own class]).
 latex_documents = [
-    (master_doc, 'xotl.fl.tex', 'xotl.fl Documentation',
-     'Merchise Autrement {[}\\textasciitilde{}º/\\textasciitilde{}{]}', 'manual'),
+    (
+        master_doc,
+        "xotl.fl.tex",
+        "xotl.fl Documentation",
+        "Merchise Autrement {[}\\textasciitilde{}º/\\textasciitilde{}{]}",
+        "manual",
+    ),
 ]
 
 
@@ -178,10 +183,7 @@ latex_documents = [
 
 # One entry per manual page. List of tuples
 # (source start file, name, description, authors, manual section).
-man_pages = [
-    (master_doc, 'xotlfl', 'xotl.fl Documentation',
-     [author], 1)
-]
+man_pages = [(master_doc, "xotlfl", "xotl.fl Documentation", [author], 1)]
 
 
 # -- Options for Texinfo output ----------------------------------------------
@@ -190,9 +192,15 @@ man_pages = [
 # (source start file, target name, title, author,
 #  dir menu entry, description, category)
 texinfo_documents = [
-    (master_doc, 'xotlfl', 'xotl.fl Documentation',
-     author, 'xotlfl', 'One line description of project.',
-     'Miscellaneous'),
+    (
+        master_doc,
+        "xotlfl",
+        "xotl.fl Documentation",
+        author,
+        "xotlfl",
+        "One line description of project.",
+        "Miscellaneous",
+    ),
 ]
 
 
@@ -201,4 +209,4 @@ texinfo_documents = [
 # -- Options for intersphinx extension ---------------------------------------
 
 # Example configuration for intersphinx: refer to the Python standard library.
-intersphinx_mapping = {'https://docs.python.org/': None}
+intersphinx_mapping = {"https://docs.python.org/": None}
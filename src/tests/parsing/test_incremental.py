@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------
+# Copyright (c) Merchise Autrement [~º/~] and Contributors
+# All rights reserved.
+#
+# This is free software; you can do what the LICENCE file allows you to.
+#
+import pytest
+from ply.lex import LexError
+from xotl.fl import parse
+from xotl.fl.parsers import ParserError
+from xotl.fl.parsers.incremental import Document
+
+PROGRAM = """-- A program
+data Bool = True | False
+deriving (Eq)
+
+reverse :: [a] -> [a]
+reverse [] = []
+reverse ((x:xs)) = reverse xs ++ [x]   -- a comment
+
+main = result
+where result = let x = reverse [1, 2]
+in x
+"""
+
+
+def check(document):
+    assert not document.errors
+    assert document.definitions == parse(document.source, cache=False)
+    assert [lineno for lineno, _ in document.toplevels()] == [
+        lineno for lineno, _ in Document(document.source).toplevels()
+    ]
+
+
+@pytest.mark.parametrize("indentation", ["", "    "])
+def test_document_as_parse(indentation):
+    source = "".join(indentation + line for line in PROGRAM.splitlines(True))
+    document = Document(source)
+    assert document.source == source
+    check(document)
+
+
+def test_edits_reparse_the_definitions_touched():
+    document = Document(PROGRAM * 3)
+    assert document.edit((10, 36), (10, 36), ", 3") == 1
+    assert "reverse [1, 2, 3]" in document.source
+    check(document)
+    # Replace the data type and its type annotation with a single equation.
+    assert document.edit((13, 0), (16, 21), "id x = x") == 1
+    check(document)
+    # Indenting 'reverse []' makes it continue the previous equation.
+    assert document.edit((14, 0), (14, 0), "  ") == 1
+    with pytest.raises(ParserError):
+        parse(document.source)
+    assert len(document.errors) == 1
+    assert document.edit((14, 0), (14, 2), "") == 2
+    check(document)
+
+
+def test_edits_at_the_ends():
+    document = Document(PROGRAM)
+    document.edit((12, 0), (12, 0), "x = 1\n")
+    document.edit((1, 0), (1, 0), "y = 2\n")
+    check(document)
+    document.edit((1, 0), (14, 0), "")
+    assert document.source == "" and document.definitions == []
+    document.edit((1, 0), (1, 0), "  z = 3")
+    document.edit((1, 7), (1, 7), "\n  w = 4")
+    check(document)
+
+
+def test_errors_have_line_numbers_of_the_document():
+    document = Document(PROGRAM * 2)
+    document.edit((16, 0), (16, 0), "broken x = = x\n")
+    (error,) = document.errors
+    assert "'=',16," in str(error)
+    assert len(document.definitions) == len(parse(PROGRAM * 2))
+    document.edit((1, 0), (1, 0), "\n\n")
+    (error,) = document.errors
+    assert "'=',18," in str(error)
+
+
+def test_unbalanced_quotes_are_errors():
+    document = Document("f x = x\ng = 1\n")
+    document.edit((2, 4), (2, 5), "'")
+    assert document.source == "f x = x\ng = '\n"
+    (error,) = document.errors
+    assert isinstance(error, LexError)
+    assert len(document.definitions) == 1
+    document.edit((2, 4), (2, 5), "2")
+    check(document)
+    assert Document("c = '\n").errors
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------
+# Copyright (c) Merchise Autrement [~º/~] and Contributors
+# All rights reserved.
+#
+# This is free software; you can do what the LICENCE file allows you to.
+#
+import pickle
+
+import pytest
+from xotl.fl import parse
+from xotl.fl.ast.types import TypeScheme
+from xotl.fl.builtins import builtins_env
+from xotl.fl.parsers import ParserError
+from xotl.fl.parsers.lazy import LazyEquation
+from xotl.fl.typecheck import typecheck_program
+
+PROGRAM = r"""-- A program
+data List a = Nil | Cons a (List a)
+deriving (Eq)
+
+count :: List a -> Number
+count Nil = 0
+count (Cons _ xs) = 1 + count xs
+
+(<+>) :: Number -> Number -> Number
+(<+>) x y = x + y
+_ = 0
+
+unused x = this is = not parsed
+main = count (Cons 1 Nil) <+> total
+  where total = 1
+"""
+
+
+def test_lazy_parse_of_valid_programs():
+    source = PROGRAM.replace("this is = not parsed", "x")
+    result = parse(source, lazy=True)
+    equations = [dfn for dfn in result if isinstance(dfn, LazyEquation)]
+    assert [eq.name for eq in equations] == ["count", "count", "<+>", "_", "unused", "main"]
+    assert not any(eq.parsed for eq in equations)
+    assert result == parse(source)
+    assert all(eq.parsed for eq in equations)
+    assert pickle.loads(pickle.dumps(result)) == result
+
+
+def test_only_reachable_equations_are_parsed():
+    program = parse(PROGRAM, lazy=True)
+    env = typecheck_program(program, builtins_env, roots=["main"])
+    assert env == {
+        "count": TypeScheme.from_str("List a0 -> Number"),
+        "<+>": TypeScheme.from_str("Number -> Number -> Number"),
+        "main": TypeScheme.from_str("Number"),
+    }
+    (unused,) = (dfn for dfn in program if getattr(dfn, "name", None) == "unused")
+    assert not unused.parsed
+    with pytest.raises(ParserError) as error:
+        unused.body
+    assert ",13," in str(error.value)  # the line in PROGRAM
+
+
+def test_annotations_are_not_lazy():
+    with pytest.raises(ParserError):
+        parse("f :: Number ->\nf = 1\n", lazy=True)
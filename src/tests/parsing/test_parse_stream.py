@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------
+# Copyright (c) Merchise Autrement [~º/~] and Contributors
+# All rights reserved.
+#
+# This is free software; you can do what the LICENCE file allows you to.
+#
+import io
+import mmap
+import tempfile
+
+import pytest
+from xotl.fl import parse, parse_stream
+from xotl.fl.parsers import ParserError
+from xotl.fl.parsers.streaming import split_definitions
+
+PROGRAM = """
+-- A program with the continuations a top-level definition can have.
+data Bool = True | False
+deriving (Eq)
+
+reverse :: [a] -> [a]
+reverse [] = []
+
+-- The ((x:xs)) is just the same as x:xs.
+reverse ((x:xs)) = reverse xs ++ [x]   -- a comment
+
+main = result
+where result = let x = reverse [1, 2]
+in x
+"""
+
+
+@pytest.mark.parametrize("indentation", ["", "    "])
+def test_parse_stream_as_parse(indentation):
+    source = "".join(indentation + line for line in PROGRAM.splitlines(True))
+    assert list(parse_stream(io.StringIO(source))) == parse(source)
+
+
+def test_parse_stream_binary_files():
+    with tempfile.TemporaryFile() as f:
+        f.write(PROGRAM.encode("utf-8"))
+        f.flush()
+        f.seek(0)
+        assert list(parse_stream(f)) == parse(PROGRAM)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            assert list(parse_stream(m)) == parse(PROGRAM)
+
+
+def test_split_definitions():
+    data, annotation, equation1, equation2, main = split_definitions(PROGRAM.splitlines(True))
+    assert equation1.startswith("reverse [] = []")
+    assert data.startswith("\n-- A program") and "deriving (Eq)" in data
+    assert annotation.startswith("reverse ::")
+    assert equation2.endswith("-- a comment\n\n")
+    assert main.endswith("in x\n")
+
+
+def test_parallel_parse():
+    source = PROGRAM * 20
+    assert parse(source, max_workers=2) == parse(source)
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_line_numbers_of_errors(max_workers):
+    source = PROGRAM * 3 + "\nbroken x = = x\n"
+    with pytest.raises(ParserError, match=f"'=',{source.count(chr(10))},"):
+        parse(source, max_workers=max_workers)
+    with pytest.raises(ParserError, match=f"'=',{source.count(chr(10))},"):
+        list(parse_stream(io.StringIO(source)))
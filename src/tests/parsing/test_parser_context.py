@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------
+# Copyright (c) Merchise Autrement [~º/~] and Contributors
+# All rights reserved.
+#
+# This is free software; you can do what the LICENCE file allows you to.
+#
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from ply import yacc
+from xotl.fl import parse, parsers
+from xotl.fl.ast.types import Type
+from xotl.fl.parsers import ParserContext
+from xotl.fl.parsers.expressions import parse as parse_expression
+
+
+def program(i):
+    indentation = " " * (i % 5)
+    return (
+        f"\n{indentation}f{i} :: Number -> Number\n"
+        f"{indentation}f{i} x = x + {i}\n"
+        f"{indentation}g{i} = let y = f{i} 1 in y\n"
+    )
+
+
+def test_indentation_does_not_leak_between_parses():
+    assert parse("\n    undefined :: a\n    value = 1\n    ")
+    assert parse("f :: Char\nf = 1\n") == parse("\nf :: Char\nf = 1\n")
+
+
+def test_parser_context():
+    context = ParserContext()
+    assert context.parse_program(program(1)) == parse(program(1))
+    assert context.parse_expression("let x = 1 in x") == parse_expression("let x = 1 in x")
+    assert context.parse_type("a -> [b]") == Type.from_str("a -> [b]")
+
+
+def test_parse_from_many_threads():
+    sources = [program(i) for i in range(200)]
+    expected = [parse(source) for source in sources]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert list(executor.map(parse, sources)) == expected
+    context = ParserContext()
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert list(executor.map(context.parse_program, sources)) == expected
+
+
+def test_the_parser_is_built_once(monkeypatch):
+    built = []
+
+    def build(*args, **kwargs):
+        time.sleep(0.05)  # Let the other threads reach the lock.
+        built.append(parser)
+        return parser
+
+    parser = parsers._get_parser()
+    monkeypatch.setattr(parsers, "_parser", None)
+    monkeypatch.setattr(yacc, "yacc", build)
+    with ThreadPoolExecutor(8) as executor:
+        results = list(executor.map(lambda _: parsers._get_parser(), range(8)))
+    assert built == [parser] and all(result is parser for result in results)
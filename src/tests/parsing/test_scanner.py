@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------
+# Copyright (c) Merchise Autrement [~º/~] and Contributors
+# All rights reserved.
+#
+# This is free software; you can do what the LICENCE file allows you to.
+#
+import os
+from datetime import date, datetime
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as s
+from ply.lex import LexError
+from xotl.fl import scan, tokenize
+from xotl.fl.parsers import ParserContext, default_context, parse_datetime_literal
+
+BUILTINS = os.path.join(os.path.dirname(__file__), "..", "..", "xotl", "fl", "builtins.fl")
+
+SOURCES = [
+    "\n  -- A comment\n  id x = x\n  const x _ = x  -- another\n",
+    'data Pair a b = Pair a b\nf (Pair a _) = (a, "a \\"string\\"", \'c\', [0x1F, 0b10, 1.5e-3])',
+    "f x = g x\n  where g y = let z = y in z\n        h = `div`",
+    "f <2018-12-04> x <2018-12-04 10:20:05.25> <from 2018-01-01 to 2018-02-01> > y",
+    "x" * 70 + " = <2018-12-04> y > z",
+    "a@'b' + _c . D",
+]
+
+
+def tokens(iterable):
+    return [(tok.type, tok.value, tok.lineno, tok.lexpos) for tok in iterable]
+
+
+@pytest.mark.parametrize("source", SOURCES)
+def test_scan_produces_the_lexer_tokens(source):
+    assert tokens(scan(source)) == tokens(tokenize(source))
+
+
+def test_scan_builtins():
+    with open(BUILTINS) as f:
+        source = f.read()
+    assert tokens(scan(source)) == tokens(tokenize(source))
+    context = ParserContext(scanner=True)
+    assert context.parse_program(source) == default_context.parse_program(source)
+
+
+@given(s.text(alphabet="ab Z_01.-+<>=()[]'\"\n\t`@,:|$%*/", max_size=30))
+def test_scan_random_sources(source):
+    try:
+        expected = tokens(tokenize(source))
+    except Exception as error:
+        with pytest.raises(type(error)):
+            list(scan(source))
+    else:
+        assert tokens(scan(source)) == expected
+
+
+def test_scan_illegal_character():
+    with pytest.raises(LexError):
+        list(scan("x = 1 ?"))
+
+
+def test_date_literals():
+    (tok,) = scan("<2018-12-04>")
+    assert tok.value == date(2018, 12, 4)
+    result = parse_datetime_literal("2018-12-04T10:20:05.25")
+    assert result == datetime(2018, 12, 4, 10, 20, 5, 250000)
+    # These are left to dateutil.
+    assert parse_datetime_literal("2018-12-04 10:20.5") == datetime(2018, 12, 4, 10, 20, 30)
+    with pytest.raises(ValueError):
+        parse_datetime_literal("2018-02-30")
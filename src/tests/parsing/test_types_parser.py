@@ -17,21 +17,25 @@ from xotl.fl.ast.types import ListTypeCons, TupleTypeCons
 from xotl.fl.ast.types import TypeCons as C
 from xotl.fl.ast.types import TypeConstraint
 from xotl.fl.ast.types import TypeVariable as T
-from xotl.fl.parsers.larkish import ASTBuilder, type_expr_parser
+from xotl.fl.parsers.larkish import GRAMMAR, type_expr_parser
 from xotl.fl.testing.strategies.lark import from_lark
 from xotl.fl.utils import tvarsupply
 
 # COMMENT is explicitly set to the a single space, because our COMMENT regex
 # allows for it to be generated at arbitrary points (the usage of ^ and $
 # implies it doesn't generate the proper newlines).
+#
+# The `type_expr_parser` may be loaded from the cache of Lark (without the
+# grammar), so the strategy uses its own.
 type_factors = from_lark(
-    type_expr_parser, start="type_factor", explicit={"COMMENT": strategies.just(" ")}
+    lark.Lark.open(GRAMMAR, lexer="standard", start="type_factor"),
+    start="type_factor",
+    explicit={"COMMENT": strategies.just(" ")},
 )
 
 
 def parse(source):
-    builder = ASTBuilder()
-    return builder.transform(type_expr_parser.parse(dedent(source).strip()))
+    return type_expr_parser.parse(dedent(source).strip())
 
 
 # The id function type
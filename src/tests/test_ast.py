@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------
+# Copyright (c) Merchise Autrement [~º/~] and Contributors
+# All rights reserved.
+#
+# This is free software; you can do what the LICENCE file allows you to.
+#
+import copy
+import pickle
+import tracemalloc
+
+from xotl.fl import parse
+from xotl.fl.ast.expressions import (
+    Application,
+    Identifier,
+    Lambda,
+    LambdaLC,
+    Let,
+    Letrec,
+    Literal,
+    count_free_names,
+    find_free_names,
+    replace_free_occurrences,
+)
+from xotl.fl.ast.pattern import ConsPattern, Equation, NamedPattern
+from xotl.fl.ast.types import TypeScheme
+from xotl.fl.builtins import CharType, NumberType, StringType
+
+
+def build_let(body):
+    return Let(
+        {"x": Literal(1, NumberType), "f": Lambda("y", Identifier("y"))},
+        body,
+        {"x": TypeScheme.from_str("Number")},
+    )
+
+
+def test_structurally_equal_nodes_hash_equally():
+    first = build_let(Application(Identifier("f"), Identifier("x")))
+    second = build_let(Application(Identifier("f"), Identifier("x")))
+    assert first == second and hash(first) == hash(second)
+    assert first != build_let(Application(Identifier("f"), Identifier("y")))
+    assert first != Letrec(dict(first.bindings), first.body, first.localenv)
+    assert Lambda("x", Identifier("x")) != LambdaLC("x", Identifier("x"))
+    assert Literal("a", CharType) != Literal("a", StringType)
+    pattern = ConsPattern("Cons", ["x", NamedPattern("xs", ConsPattern("Nil"))])
+    equation = Equation("f", [pattern], Identifier("x"))
+    assert equation == Equation("f", [copy.deepcopy(pattern)], Identifier("x"))
+    assert len({first, second, equation, copy.copy(equation)}) == 2
+
+
+def test_nodes_are_slotted():
+    nodes = [
+        Identifier("x"),
+        Literal(1, NumberType),
+        build_let(Identifier("x")),
+        Equation("f", [ConsPattern("Nil")], Identifier("x")),
+    ]
+    assert not any(hasattr(node, "__dict__") for node in nodes)
+
+
+def test_deep_trees_hash_and_compare_without_recursion():
+    def chain(length):
+        result = Identifier("x")
+        for _ in range(length):
+            result = Application(Identifier("f"), result)
+        return result
+
+    first, second = chain(50000), chain(50000)
+    assert first == second and hash(first) == hash(second)
+    assert first != chain(49999)
+
+
+def test_pickled_nodes_recompute_their_hashes():
+    expr = build_let(Application(Identifier("f"), Literal("a", StringType)))
+    clone = pickle.loads(pickle.dumps(expr))
+    assert clone == expr and hash(clone) == hash(expr)
+    assert clone._hash is not None
+
+
+def test_free_names_are_kept_in_the_equations():
+    (length,) = parse(
+        """
+        length xs = count xs 0
+          where count [] n = n
+                count x:xs n = count xs (n + 1)
+        """
+    )
+    assert dict(count_free_names(length)) == {"+": 1}
+    cached = length._free_names
+    assert count_free_names(length) == cached and length._free_names is cached
+    compiled = length.body.compile()
+    counts = count_free_names(compiled)
+    assert dict(counts) == {"xs": 1, "+": 1, ":OR:": 2, ":NO_MATCH_ERROR:": 1}
+    assert sorted(find_free_names(compiled)) == ["+", "xs"]
+    assert sorted(find_free_names(compiled, exclude=())) == [
+        "+",
+        ":NO_MATCH_ERROR:",
+        ":OR:",
+        ":OR:",
+        "xs",
+    ]
+    assert sorted(find_free_names(compiled, exclude=("xs",))) == [
+        "+",
+        ":NO_MATCH_ERROR:",
+        ":OR:",
+        ":OR:",
+    ]
+    body = compiled.body
+    assert find_free_names(Application(body, body)).count("xs") == 2
+    assert find_free_names(Application(length, length)).count("+") == 2
+
+
+def test_substitutions_keep_the_subtrees_without_the_names():
+    expr = Let({"f": Lambda("y", Application(Identifier("g"), Identifier("y")))}, Identifier("x"))
+    result = replace_free_occurrences(expr, {"x": "z"})
+    assert result == Let(dict(expr.bindings), Identifier("z"))
+    assert dict(result.bindings)["f"] is dict(expr.bindings)["f"]
+
+
+def test_free_names_of_deep_trees():
+    result = Identifier("x")
+    for _ in range(50000):
+        result = Lambda("y", Application(Identifier("f"), result))
+    assert dict(count_free_names(result)) == {"f": 50000, "x": 1}
+
+
+def test_free_names_of_long_chains():
+    # main = x0 + x1 + ... + x3999; the counts of the inner nodes are not
+    # kept, nor copied from one node to the next.
+    (main,) = parse("main = " + " + ".join(f"x{i}" for i in range(4000)))
+    chain = Identifier("x")
+    for i in range(8000):
+        chain = Application(chain, Identifier(f"y{i}"))
+    tracemalloc.start()
+    try:
+        assert dict(count_free_names(main)) == {"+": 3999, **{f"x{i}": 1 for i in range(4000)}}
+        assert len(count_free_names(chain)) == 8001
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert peak < 16 * 1024 * 1024
+    assert not hasattr(main.body, "_free_names")
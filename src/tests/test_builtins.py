@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------
+# Copyright (c) Merchise Autrement [~º/~] and Contributors
+# All rights reserved.
+#
+# This is free software; you can do what the LICENCE file allows you to.
+#
+import pickle
+import shutil
+
+import pytest
+from xotl.fl import builtins
+from xotl.fl.ast.expressions import Literal
+from xotl.fl.ast.types import TypeScheme
+from xotl.fl.builtins import NumberType
+from xotl.fl.match import Extract, MatchLiteral
+
+# `builtins` is customized by `moduleproperty`; its functions use the globals
+# of the original module.
+namespace = builtins._load_builtin_typeenv.__globals__
+
+
+@pytest.fixture
+def resources(tmp_path, monkeypatch):
+    "Work with a copy of 'builtins.fl' and its snapshot in `tmp_path`."
+    shutil.copy(builtins._resource(builtins._BUILTINS_SOURCE), tmp_path)
+    monkeypatch.setitem(namespace, "_resource", lambda name: str(tmp_path / name))
+    return tmp_path
+
+
+def test_builtins_snapshot(resources, monkeypatch):
+    builtins.write_snapshot()
+    expected = builtins._load_builtin_typeenv()
+
+    def fail(source):
+        raise AssertionError("The snapshot must be used")
+
+    with monkeypatch.context() as m:
+        m.setitem(namespace, "_build_builtin_typeenv", fail)
+        assert builtins._load_builtin_typeenv() == expected
+
+
+def test_shipped_builtins_snapshot_is_fresh():
+    # Otherwise, run 'make snapshot'.
+    _, digest = builtins._read_builtins_source()
+    assert builtins._read_snapshot(digest) is not None
+
+
+def test_builtins_snapshot_is_invalidated(resources, monkeypatch):
+    builtins.write_snapshot()
+    snapshot = (resources / builtins._BUILTINS_SNAPSHOT).read_bytes()
+    with open(resources / builtins._BUILTINS_SOURCE, "a", encoding="utf-8") as f:
+        f.write("\nsnapshot_test :: a -> a\n")
+    gamma = builtins._load_builtin_typeenv()
+    assert gamma["snapshot_test"] == TypeScheme.from_str("a -> a")
+    # A new version of the derivation ignores the snapshot.
+    monkeypatch.setitem(namespace, "SNAPSHOT_VERSION", builtins.SNAPSHOT_VERSION + 1)
+    assert builtins._load_builtin_typeenv() == gamma
+    # The snapshot is only read at runtime.
+    assert (resources / builtins._BUILTINS_SNAPSHOT).read_bytes() == snapshot
+
+
+def test_corrupt_builtins_snapshot(resources):
+    expected = builtins._load_builtin_typeenv()
+    (resources / builtins._BUILTINS_SNAPSHOT).write_bytes(b"garbage")
+    assert builtins._load_builtin_typeenv() == expected
+    assert (resources / builtins._BUILTINS_SNAPSHOT).read_bytes() == b"garbage"
+
+
+def test_builtin_env_overlays():
+    base = builtins.builtins_env
+    env = builtins.BuiltinEnvDict(base, x=TypeScheme.from_str("a"))
+    assert env["x"] == TypeScheme.from_str("a")
+    assert env["map"] == base["map"]
+    assert "x" not in base
+
+    child = env.new_child({"map": TypeScheme.from_str("Number")})
+    assert child["map"] == TypeScheme.from_str("Number")
+    assert env["map"] == base["map"]
+    # No chains: an overlay of an overlay shares the same base.
+    assert child._base is env._base is base._base
+
+    del child["map"]
+    assert "map" not in child and "map" in env
+    assert child.get("map") is None
+    with pytest.raises(KeyError):
+        del child["map"]
+    assert len(child) == len(env) - 1
+    assert set(child) == set(env) - {"map"}
+
+    # Tuple constructors are still computed on demand.
+    assert len(child[",,"].generics) == 3
+    assert ",," not in child
+
+    # Pickles share the base again, and keep the deleted names.
+    clone = pickle.loads(pickle.dumps(child))
+    assert clone._base is base._base
+    assert dict(clone) == dict(child) and "map" not in clone
+    basic = pickle.loads(pickle.dumps(builtins.BuiltinEnvDict({"x": TypeScheme.from_str("a")})))
+    assert basic._base is builtins.BuiltinEnvDict()._base and "x" in basic
+
+
+def test_builtin_env_dict_does_not_parse(monkeypatch):
+    namespace["_basic_env"]()  # The base is built only once.
+    x = TypeScheme.from_str("a")
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Must not parse")
+
+    with monkeypatch.context() as m:
+        m.setattr(TypeScheme, "from_str", fail)
+        env = builtins.BuiltinEnvDict({"x": x})
+    assert env["[]"] == TypeScheme.from_str("[a]")
+
+
+def extracted_component(scheme: TypeScheme) -> int:
+    "Return which component of the tuple gets the continuation of `scheme`."
+    tuple_, cont = scheme.type_.subtypes
+    (component, res), res2 = cont.subtypes[0].subtypes, cont.subtypes[1]
+    assert res == res2 and res not in tuple_.subtypes
+    return tuple_.subtypes.index(component) + 1
+
+
+def test_tuple_schemes():
+    env = builtins.BuiltinEnvDict()
+    assert [extracted_component(env[Extract(",,", i)]) for i in (1, 2, 3)] == [1, 2, 3]
+    match = env[MatchLiteral(Literal(1, NumberType))].type_
+    assert match.subtypes[0] == NumberType
+    # The synthesized schemes are shared by all environments.
+    wide = "," * 9999
+    assert env[wide] is builtins.builtins_env[wide]
+    assert env[Extract(wide, 5000)] is builtins.BuiltinEnvDict()[Extract(wide, 5000)]
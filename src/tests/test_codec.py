@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------
+# Copyright (c) Merchise Autrement [~º/~] and Contributors
+# All rights reserved.
+#
+# This is free software; you can do what the LICENCE file allows you to.
+#
+from datetime import date, datetime
+
+import pytest
+from xotl.fl import parse
+from xotl.fl.ast.adt import DataCons
+from xotl.fl.ast.codec import CODEC_VERSION, decode, encode
+from xotl.fl.ast.expressions import (
+    Application,
+    ApplicationLC,
+    Identifier,
+    Lambda,
+    LambdaLC,
+    Let,
+    LetLC,
+    Letrec,
+    LetrecLC,
+    Literal,
+)
+from xotl.fl.ast.pattern import ConstructorBranch, LiteralBranch
+from xotl.fl.ast.types import ListTypeCons, TupleTypeCons, TypeCons, TypeRecord, TypeVariable
+from xotl.fl.builtins import BoolType, DateType, NumberType, StringType, _load_builtins_program
+from xotl.fl.match import Extract, Match, MatchLiteral, Select
+from xotl.fl.parsers import ParserContext
+from xotl.tools.future.datetime import TimeSpan
+
+EXPRESSIONS = [
+    "let count Nil = 0\n    count (Cons _ xs) = 1 + count xs\n    fst (x, _) = x\nin count",
+    "let f x@(Just 1) = id <2020-01-01>\n    g 'a' = 1.5\n    h = id <2020-01-01 10:30>\nin f",
+    '(\\x -> x * 0x1F, [1, -2, 12345678901234567890], "añño", (), '
+    "id <from 2020-01-01 to 2020-02-01>)",
+]
+
+
+def assert_roundtrip(obj):
+    data = encode(obj)
+    result = decode(data)
+    assert encode(result) == data
+    return result
+
+
+def test_builtins_roundtrip():
+    program = _load_builtins_program()
+    assert assert_roundtrip(program) == program
+
+
+@pytest.mark.parametrize("source", EXPRESSIONS)
+def test_expressions_roundtrip(source):
+    expr = ParserContext().parse_expression(source)
+    result = assert_roundtrip(expr)
+    assert str(result) == str(expr)
+    if not source.startswith("let f"):  # NamedPattern doesn't define __eq__
+        assert result == expr
+    if source.startswith("let count"):
+        assert assert_roundtrip(expr.ast) == expr.ast
+        assert assert_roundtrip(expr.ast.translate()) == expr.ast.translate()
+
+
+def test_nodes_roundtrip():
+    a = TypeVariable("a")
+    x = Identifier("x")
+    nodes = [
+        None,
+        [True, False, 0, -1, 2**70, 0.1, "", "x", {"a": (1, 2)}],
+        Literal(date(2020, 1, 1), DateType),
+        Literal(datetime(2020, 1, 1, 10, 30, 15), DateType, "UTC"),
+        Literal(TimeSpan(date(2020, 1, 1), date(2020, 2, 1)), DateType),
+        Identifier(Match("Nil")),
+        Identifier(Extract("Cons", 2)),
+        Identifier(Select(3)),
+        Identifier(MatchLiteral(Literal(1, NumberType))),
+        Let({"x": Literal(1, NumberType)}, x, {"x": NumberType}),
+        Letrec({"x": Application(Identifier("f"), x)}, Lambda("y", x)),
+        LetLC({"x": LambdaLC("y", x)}, x),
+        LetrecLC({"x": ApplicationLC(x, x)}, x),
+        TypeCons("Either", [a, ListTypeCons(a)]),
+        TupleTypeCons(),
+        TupleTypeCons(a, a >> BoolType, StringType),
+        TypeRecord({"name": StringType, "age": NumberType}),
+        LiteralBranch(Literal(1, NumberType)),
+        ConstructorBranch(DataCons("Just", [a])),
+    ]
+    assert assert_roundtrip(nodes) == nodes
+
+
+def test_types_are_shared():
+    program = parse("f :: Number -> Number\ng :: Number -> Number\nh :: [Number]\n")
+    result = assert_roundtrip(program)
+    assert result[0]["f"] is result[1]["g"] is program[0]["f"]
+    assert result[2]["h"].type_.subtypes[0] is NumberType
+
+
+def test_deep_trees():
+    # Pickle can't handle trees as deep as this one.
+    program = parse("xs = [" + ", ".join(map(str, range(3000))) + "]\n", cache=False)
+    assert_roundtrip(program)
+
+
+def test_invalid_data():
+    data = encode(parse("x = 1\n"))
+    with pytest.raises(ValueError):
+        decode(data[:-3])
+    with pytest.raises(ValueError):
+        decode(b"XYZ" + data[3:])
+    with pytest.raises(ValueError):
+        decode(data[:3] + bytes([CODEC_VERSION + 1]) + data[4:])
+    with pytest.raises(TypeError):
+        encode(object())
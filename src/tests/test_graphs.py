@@ -6,8 +6,10 @@
 #
 # This is free software; you can do what the LICENCE file allows you to.
 #
+import random
+
 import pytest
-from xotl.fl.graphs import Graph
+from xotl.fl.graphs import Condensation, Graph
 
 graph = Graph()
 graph.add_many(1, {2, 3})
@@ -57,3 +59,53 @@ def test_topo_dag():
 def test_top_cycles():
     with pytest.raises(RuntimeError):
         graph.get_topological_order()
+
+
+def test_scores_are_the_longest_paths():
+    dag = Graph()
+    dag.add_many("a", {"b", "c"})
+    dag.add_many("b", {"d"})
+    dag.add_many("c", {"b", "d"})
+    dag.add_node("e")
+    assert dag.get_topological_order(with_score=True) == [("e", 0), ("b", 1), ("c", 2), ("a", 3)]
+    assert dag.get_topological_order(reverse=True) == ["a", "c", "b", "e"]
+
+
+def test_long_chains_and_diamonds():
+    size = 60000
+    chain = Graph()
+    for node in range(size):
+        chain.add_many(node, {node + 1, node + 2})  # a chain of diamonds
+    chain.add_edge(size, 0)
+    with pytest.raises(RuntimeError):
+        chain.get_topological_order()
+    sccs = chain.get_sccs()
+    assert len(sccs) == 2 and {size + 1} in sccs
+    del chain.nodes[size]
+    assert chain.get_topological_order(reverse=True)[:2] == [0, 1]
+    assert len(chain.get_sccs()) == size + 2
+
+
+def test_condensation_follows_the_edits():
+    random.seed(42)
+    links = {node: set() for node in range(12)}
+    condensation = Condensation()
+    for node in links:
+        condensation.add_node(node)
+    for _ in range(400):
+        from_, to_ = random.randrange(12), random.randrange(12)
+        if random.random() < 0.6:
+            condensation.add_edge(from_, to_)
+            links[from_].add(to_)
+        else:
+            condensation.remove_edge(from_, to_)
+            links[from_].discard(to_)
+        graph = Graph()
+        for node, targets in links.items():
+            graph.add_node(node)
+            graph.add_many(node, targets)
+        expected = Condensation(graph)
+        assert set(condensation.components) == set(expected.components)
+        assert condensation.dag.nodes == expected.dag.nodes
+    condensation.remove_node(0)
+    assert 0 not in condensation and all(0 not in c for c in condensation.components)
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------
+# Copyright (c) Merchise Autrement [~º/~] and Contributors
+# All rights reserved.
+#
+# This is free software; you can do what the LICENCE file allows you to.
+#
+import os
+import random
+
+import pytest
+import xotl.fl
+from xotl.fl import parse
+from xotl.fl.cache import CACHE_DIR_ENVVAR, ParseCache
+from xotl.fl.parsers import ParserContext
+
+PROGRAM = "data Maybe a = Nothing | Just a\nfromMaybe d Nothing = d\nfromMaybe _ (Just x) = x\n"
+
+
+def entries(cache):
+    return [
+        os.path.join(root, name)
+        for root, _, names in os.walk(cache.directory)
+        for name in names
+        if name.endswith(".xfl")
+    ]
+
+
+def test_hits_dont_parse(tmp_path, monkeypatch):
+    cache = ParseCache(tmp_path)
+    expected = parse(PROGRAM, cache=cache)
+    assert len(entries(cache)) == 1
+
+    def fail(*args, **kwargs):
+        raise AssertionError("parsed")
+
+    monkeypatch.setattr(ParserContext, "parse_program", fail)
+    assert parse(PROGRAM, cache=cache) == expected
+    assert parse(PROGRAM, cache=str(tmp_path)) == expected
+    with pytest.raises(AssertionError):
+        parse(PROGRAM, cache=False)
+
+
+def test_default_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv(CACHE_DIR_ENVVAR, str(tmp_path))
+    parse(PROGRAM)
+    assert len(entries(ParseCache(tmp_path))) == 1
+
+
+def test_corrupted_entries_are_ignored(tmp_path):
+    cache = ParseCache(tmp_path)
+    expected = parse(PROGRAM, cache=cache)
+    (filename,) = entries(cache)
+    with open(filename, "wb") as f:
+        f.write(b"garbage")
+    assert cache.get(PROGRAM) is None
+    assert parse(PROGRAM, cache=cache) == expected
+    assert cache.get(PROGRAM) == expected
+
+
+def test_eviction(tmp_path):
+    cache = ParseCache(tmp_path, max_size=0)
+    parse(PROGRAM, cache=cache)
+    assert entries(cache) == []
+
+    sources = [f"x{i} = {i}\n" for i in range(3)]
+    cache = ParseCache(tmp_path)
+    for i, source in enumerate(sources):
+        parse(source, cache=cache)
+        os.utime(cache._filename(cache.key(source)), (i, i))
+    size = sum(os.path.getsize(filename) for filename in entries(cache))
+    cache.get(sources[0])  # Now the most recently used
+    cache.max_size = size - 1
+    cache.evict()
+    assert cache.get(sources[1]) is None
+    assert cache.get(sources[0]) is not None and cache.get(sources[2]) is not None
+
+
+def test_damaged_entries_are_misses(tmp_path):
+    cache = ParseCache(tmp_path)
+    with open(os.path.join(os.path.dirname(xotl.fl.__file__), "builtins.fl")) as f:
+        source = f.read()
+    expected = parse(source, cache=cache)
+    (filename,) = entries(cache)
+    with open(filename, "rb") as f:
+        data = f.read()
+    start = len(cache.key(source))  # damage the encoded definitions, not the key
+    random.seed(3)
+    for _ in range(300):
+        damaged = bytearray(data)
+        for _ in range(3):
+            damaged[random.randrange(start, len(damaged))] = random.randrange(256)
+        with open(filename, "wb") as f:
+            f.write(damaged)
+        result = cache.get(source)
+        assert result is None or isinstance(result, list)
+    cache.put(source, expected)
+    assert cache.get(source) == expected
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------
+# Copyright (c) Merchise Autrement [~º/~] and Contributors
+# All rights reserved.
+#
+# This is free software; you can do what the LICENCE file allows you to.
+#
+import multiprocessing
+from textwrap import dedent
+
+import pytest
+from xotl.fl import parse
+from xotl.fl.ast.types import TypeScheme
+from xotl.fl.builtins import builtins_env
+from xotl.fl.typecheck import TypecheckSession, typecheck_program
+from xotl.fl.typecheck import program as module
+from xotl.fl.typecheck.program import Program
+
+ENGINES = ("substitution", "unionfind")
+
+PROGRAM = r"""
+data List a = Nil | Cons a (List a)
+
+lhead :: List a -> a
+lhead (Cons a _) = a
+
+count Nil = 0
+count (Cons _ xs) = 1 + count xs
+
+even 0 = True
+even n = odd (n - 1)
+odd 0 = False
+odd n = even (n - 1)
+
+compose f g x = f (g x)
+twice f = compose f f
+pair x y = (x, y)
+main = (twice (\x -> x + 1), pair 1, count (Cons 1 Nil), lhead (Cons 'a' Nil), even 10)
+"""
+
+
+def scheme(code: str) -> TypeScheme:
+    # The program checker names the generics 'a0', 'a1', ..., in order of
+    # first occurrence.
+    return TypeScheme.from_str(code)
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_typecheck_program(engine):
+    env = typecheck_program(parse(PROGRAM), builtins_env, engine=engine)
+    assert env == {
+        "lhead": scheme("List a0 -> a0"),
+        "count": scheme("List a0 -> Number"),
+        "even": scheme("Number -> Bool"),
+        "odd": scheme("Number -> Bool"),
+        "compose": scheme("(a0 -> a1) -> (a2 -> a0) -> a2 -> a1"),
+        "twice": scheme("(a0 -> a0) -> a0 -> a0"),
+        "pair": scheme("a0 -> a1 -> (a0, a1)"),
+        "main": scheme("(Number -> Number, a0 -> (Number, a0), Number, Char, Bool)"),
+    }
+
+
+def test_components_in_dependency_order():
+    program = Program(parse(PROGRAM))
+    components = program.get_components()
+    assert {"even", "odd"} in components
+    position = {name: i for i, component in enumerate(components) for name in component}
+    for name in program.equations:
+        for dep in program.dependencies(name):
+            assert position[dep] <= position[name]
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_mutually_recursive_definitions_are_generalized(engine):
+    # Within a let, `g` would not be generalized because `f` is annotated.
+    code = r"""
+    f :: a -> [a]
+    f x = g x
+    g x = if (is_null (h x)) (then [x]) (else (f x))
+    h x = [x]
+    """
+    env = typecheck_program(parse(dedent(code)), builtins_env, engine=engine)
+    assert env["g"] == scheme("a0 -> [a0]")
+    assert env["h"] == scheme("a0 -> [a0]")
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_declarations_and_annotations(engine):
+    code = r"""
+    undefined :: a
+    twice :: (Number -> Number) -> Number -> Number
+    twice f x = f (f x)
+    value = twice undefined 1
+    """
+    env = typecheck_program(parse(dedent(code)), builtins_env, engine=engine)
+    assert "undefined" not in env
+    assert env["twice"] == scheme("(Number -> Number) -> Number -> Number")
+    assert env["value"] == scheme("Number")
+    with pytest.raises(TypeError):
+        typecheck_program(parse("f :: Char\nf = 1\n"), builtins_env, engine=engine)
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_many_definitions(engine):
+    # Definitions are checked one by one in an environment with only the
+    # schemes of their dependencies; not as a single (deeply nested) let.
+    size = 500
+    code = "".join(["f0 x = x\n"] + [f"f{i} x = f{i - 1} x + {i}\n" for i in range(1, size)])
+    env = typecheck_program(parse(dedent(code)), builtins_env, engine=engine)
+    assert len(env) == size
+    assert env[f"f{size - 1}"] == scheme("Number -> Number")
+
+
+def test_unknown_engine():
+    with pytest.raises(ValueError):
+        typecheck_program(parse("x = 1\n"), builtins_env, engine="unknown")
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_session_rechecks_only_what_changed(engine):
+    session = TypecheckSession(builtins_env, engine=engine)
+    env = session.update(parse(PROGRAM))
+    assert len(session.rechecked) == len(Program(parse(PROGRAM)).get_components())
+
+    # Nothing changed.
+    assert session.update(parse(PROGRAM)) == env
+    assert session.rechecked == []
+
+    # The scheme of `compose` doesn't change, so `twice` is not rechecked.
+    source = PROGRAM.replace("compose f g x = f (g x)", "compose h g x = h (g x)")
+    assert session.update(parse(source)) == env
+    assert session.rechecked == [{"compose"}]
+
+    # The new scheme of `pair` requires to check `main` again.
+    source = source.replace("pair x y = (x, y)", "pair x y = (y, x)")
+    new_env = session.update(parse(source))
+    assert new_env["pair"] == scheme("a0 -> a1 -> (a1, a0)")
+    assert new_env["main"] == scheme("(Number -> Number, a0 -> (a0, Number), Number, Char, Bool)")
+    assert session.rechecked == [{"pair"}, {"main"}]
+
+
+def test_session_updates_the_dependencies_of_the_edited_names(monkeypatch):
+    session = TypecheckSession(builtins_env)
+    session.update(parse(PROGRAM))
+    # 'even' and 'odd' are no longer mutually recursive, 'main' uses a new
+    # name, and 'lhead' is removed.
+    source = (
+        PROGRAM.replace("odd n = even (n - 1)", "odd n = odd (n - 1)")
+        .replace("lhead (Cons 'a' Nil)", "second (Cons 'a' Nil)")
+        .replace("lhead (Cons a _) = a", "second (Cons a _) = a")
+        .replace("lhead ::", "second ::")
+    )
+    counted = []
+    counter = module.count_free_names
+    monkeypatch.setattr(module, "count_free_names", lambda e: counted.append(e) or counter(e))
+    env = session.update(parse(source))
+    assert {eq.name for eq in counted} == {"odd", "main", "second"}
+    assert env == typecheck_program(parse(source), builtins_env)
+    assert sorted(map(sorted, session._condensation.components)) == sorted(
+        map(sorted, Program(parse(source)).get_components())
+    )
+    # And back again.
+    assert session.update(parse(PROGRAM)) == typecheck_program(parse(PROGRAM), builtins_env)
+    assert {"even", "odd"} in session._condensation.components
+
+
+def test_session_only_looks_at_the_names_reachable_from_the_roots(monkeypatch):
+    session = TypecheckSession(builtins_env)
+    counted = []
+    counter = module.count_free_names
+    monkeypatch.setattr(module, "count_free_names", lambda e: counted.append(e) or counter(e))
+    assert set(session.update(parse(PROGRAM), roots=["twice"])) == {"twice", "compose"}
+    assert {eq.name for eq in counted} == {"twice", "compose"}
+    source = PROGRAM.replace("odd n = even (n - 1)", "odd n = odd (n - 1)")
+    assert session.update(parse(source)) == typecheck_program(parse(source), builtins_env)
+
+
+def test_session_data_types_changes():
+    session = TypecheckSession(builtins_env)
+    session.update(parse(PROGRAM))
+    source = PROGRAM.replace(
+        "data List a = Nil | Cons a (List a)",
+        "data List a = Nil | Cons a (List a) | Snoc (List a) a",
+    )
+    session.update(parse(source))
+    assert len(session.rechecked) == len(Program(parse(source)).get_components())
+
+
+def test_session_keeps_its_state_after_errors():
+    session = TypecheckSession(builtins_env)
+    env = session.update(parse(PROGRAM))
+    with pytest.raises(TypeError):
+        session.update(parse(PROGRAM.replace("pair x y = (x, y)", "pair x y = x + 'a'")))
+    assert session.update(parse(PROGRAM)) == env
+    assert session.rechecked == []
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_parallel_typecheck_program(engine):
+    program = parse(PROGRAM)
+    expected = typecheck_program(program, builtins_env, engine=engine)
+    assert typecheck_program(program, builtins_env, engine=engine, max_workers=2) == expected
+    with pytest.raises(TypeError):
+        code = PROGRAM.replace("pair x y = (x, y)", "pair x y = x + 'a'")
+        typecheck_program(parse(code), builtins_env, engine=engine, max_workers=2)
+
+
+def test_session_keeps_its_workers():
+    with TypecheckSession(builtins_env, max_workers=2) as session:
+        expected = session.update(parse(PROGRAM))
+        executor = session._executor
+        assert executor is not None
+        source = PROGRAM.replace("pair x y = (x, y)", "pair x y = (y, x)").replace(
+            "compose f g x = f (g x)", "compose f g y = f (g y)"
+        )
+        session.update(parse(source))
+        assert len(session.rechecked) > 1
+        assert session._executor is executor
+        # The workers have the global environment, which changes with the
+        # data types.
+        source = PROGRAM.replace("Cons a (List a)", "Cons a (List a) | Snoc (List a) a")
+        session.update(parse(source))
+        assert session._executor is not executor
+        assert session.update(parse(PROGRAM)) == expected
+    assert session._executor is None
+
+
+def test_parallel_typecheck_program_with_spawned_workers():
+    # The workers get the global environment pickled (e.g. on macOS and
+    # Windows).
+    program = parse(PROGRAM)
+    expected = typecheck_program(program, builtins_env)
+    method = multiprocessing.get_start_method()
+    multiprocessing.set_start_method("spawn", force=True)
+    try:
+        assert typecheck_program(program, builtins_env, max_workers=2) == expected
+    finally:
+        multiprocessing.set_start_method(method, force=True)
+
+
+def test_levels_of_components():
+    program = Program(parse(PROGRAM))
+    levels = program.get_levels()
+    assert sorted(sorted(c) for c in levels[0]) == [
+        ["compose"],
+        ["count"],
+        ["even", "odd"],
+        ["lhead"],
+        ["pair"],
+    ]
+    assert levels[1:] == [[{"twice"}], [{"main"}]]
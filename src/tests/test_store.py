@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------
+# Copyright (c) Merchise Autrement [~º/~] and Contributors
+# All rights reserved.
+#
+# This is free software; you can do what the LICENCE file allows you to.
+#
+import gc
+
+from xotl.fl import parse
+from xotl.fl.ast.expressions import Application, Identifier, Literal
+from xotl.fl.ast.store import _interned, intern
+from xotl.fl.builtins import NumberType
+
+PROGRAM = r"""
+clamp :: Number -> Number -> Number
+clamp x y = x + y
+
+data List a = Nil | Cons a (List a)
+
+first (Cons 1 Nil) = clamp (1 + 2) 1.0
+second x = clamp (1 + 2) 1 + twice
+  where twice = 1 + 2
+"""
+
+
+def test_equal_subtrees_are_shared():
+    program = parse(PROGRAM)
+    interned = [intern(dfn) for dfn in program]
+    assert interned == program
+    assert [type(dfn) for dfn in interned] == [type(dfn) for dfn in program]
+    _, clamp, _, first, second = interned
+    assert clamp is intern(parse(PROGRAM)[1])
+    # 'clamp (1 + 2)' is shared, but not the literals 1.0 and 1.
+    assert first.body.e1 is second.body.body.e1.e2.e1
+    assert first.body.e2 is not second.body.body.e1.e2.e2
+    (local,) = second.body.definitions
+    assert local.body is first.body.e1.e2
+
+
+def test_the_store_only_keeps_living_nodes():
+    def build():
+        return Application(Identifier("unique"), Literal(12345, NumberType))
+
+    gc.collect()
+    count = len(_interned)
+    node = intern(build())
+    assert intern(build()) is node
+    assert len(_interned) == count + 3
+    del node
+    gc.collect()
+    assert len(_interned) == count
+
+
+def test_deep_trees_are_interned_without_recursion():
+    result = Identifier("x")
+    for _ in range(50000):
+        result = Application(Identifier("f"), result)
+    interned = intern(result)
+    assert interned == result and interned.e2.e2 is intern(result.e2.e2)
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------
+# Copyright (c) Merchise Autrement [~º/~] and Contributors
+# All rights reserved.
+#
+# This is free software; you can do what the LICENCE file allows you to.
+#
+import copy
+import pickle
+
+from xotl.fl.ast.types import (
+    ConstrainedType,
+    ListTypeCons,
+    TupleTypeCons,
+    Type,
+    TypeConstraint,
+    TypeCons,
+    TypeScheme,
+    TypeVariable,
+)
+
+
+def test_equal_types_are_the_same_object():
+    assert TypeVariable("a") is TypeVariable("a")
+    assert Type.from_str("a -> [b] -> (a, b)") is Type.from_str("a -> [b] -> (a, b)")
+    assert TypeScheme.from_str("a -> b") is TypeScheme.from_str("a -> b")
+    assert Type.from_str("a -> b") is not Type.from_str("b -> a")
+
+
+def test_subclasses_are_kept_apart_but_equal():
+    a, b = TypeVariable("a"), TypeVariable("b")
+    pair = TupleTypeCons(a, b)
+    cons = TypeCons(",", [a, b])
+    assert pair is not cons
+    assert pair == cons and hash(pair) == hash(cons)
+    assert str(pair) == "(a, b)"
+    assert ListTypeCons(a) == TypeCons("[]", [a])
+    assert ListTypeCons(a) is ListTypeCons(a)
+
+
+def test_subtypes_of_subclasses_are_kept_apart():
+    a = TypeVariable("a")
+    plain = TypeCons("Maybe", [TypeCons("[]", [a])])
+    maybe = TypeCons("Maybe", [ListTypeCons(a)])
+    assert maybe == plain and maybe is not plain
+    assert str(maybe) == "Maybe [a]"
+    assert str(TypeScheme(["a"], ListTypeCons(a))) != str(TypeScheme(["a"], TypeCons("[]", [a])))
+
+
+def test_cached_attributes():
+    t = Type.from_str("(a -> b) -> [a] -> [b]")
+    assert t.ftv == {"a", "b"}
+    assert len(t) == 5
+    assert hash(t) == hash((TypeCons, t.cons, tuple(t.subtypes)))
+    scheme = TypeScheme(["a"], t)
+    assert scheme.ftv == scheme.nongenerics == {"b"}
+    nested = TypeCons("->", [scheme, TypeVariable("c")], binary=True)
+    assert nested.ftv == {"b", "c"}
+
+
+def test_pickle_and_copy_keep_identity():
+    t = Type.from_str("Either a (b, [c]) -> Maybe a")
+    scheme = TypeScheme.from_typeexpr(t)
+    constrained = ConstrainedType(["a"], t, [TypeConstraint("Eq", TypeVariable("a"))])
+    internal = TypeVariable(".a0", check=False)
+    for obj in (t, scheme, constrained, internal, TupleTypeCons(), ListTypeCons(internal)):
+        assert pickle.loads(pickle.dumps(obj)) is obj
+        assert copy.deepcopy(obj) is obj
+        assert copy.copy(obj) is obj
+    assert pickle.loads(pickle.dumps(constrained)).constraints == constrained.constraints
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------
+# Copyright (c) Merchise Autrement [~º/~] and Contributors
+# All rights reserved.
+#
+# This is free software; you can do what the LICENCE file allows you to.
+#
+import pytest
+from hypothesis import given, settings
+from xotl.fl.ast.expressions import (
+    Identifier,
+    Lambda,
+    Let,
+    Literal,
+    build_application,
+    build_list_expr,
+)
+from xotl.fl.ast.types import Type, TypeCons, TypeScheme, TypeVariable
+from xotl.fl.builtins import BuiltinEnvDict, NumberType, builtins_env
+from xotl.fl.parsers.expressions import parse as parse_expression
+from xotl.fl.testing.strategies.tools import TestTypingEnvironment
+from xotl.fl.testing.strategies.trees import welltyped_expressions
+from xotl.fl.typecheck import EMPTY_TYPE_ENV, typecheck
+from xotl.fl.typecheck.exceptions import UnificationError
+from xotl.fl.typecheck.unionfind import (
+    ConsTerm,
+    Inference,
+    TypeCell,
+    export,
+    find,
+    resolve,
+    unify_terms,
+)
+
+
+def normalized(t: Type) -> Type:
+    "Rename the type variables of `t` in the order of their first occurrence."
+    names: dict = {}
+
+    def rename(t):
+        if isinstance(t, TypeVariable):
+            if t.name not in names:
+                names[t.name] = TypeVariable(f"v{len(names)}", check=False)
+            return names[t.name]
+        else:
+            assert isinstance(t, TypeCons)
+            return TypeCons(t.cons, [rename(st) for st in t.subtypes], binary=t.binary)
+
+    return rename(t)
+
+
+def assert_same_principal_type(expr, env):
+    _, expected = typecheck(expr, env)
+    _, result = typecheck(expr, env, engine="unionfind")
+    assert normalized(result) == normalized(expected), f"{result} != {expected}"
+
+
+def test_union_by_rank_and_path_compression():
+    cells = [TypeCell(f"a{i}") for i in range(4)]
+    unify_terms(cells[0], cells[1])
+    unify_terms(cells[2], cells[3])
+    unify_terms(cells[1], cells[3])
+    root = find(cells[0])
+    assert root.rank == 2
+    assert all(find(cell) is root for cell in cells)
+    assert all(cell.parent is root for cell in cells)
+
+
+def test_unification_keeps_the_outermost_level():
+    a, b, c = TypeCell("a", 3), TypeCell("b", 1), TypeCell("c", 2)
+    unify_terms(a, b)
+    assert find(a).level == 1
+    unify_terms(c, ConsTerm("[]", [ConsTerm("[]", [a])]))
+    assert find(c).level == 2
+    d = TypeCell("d", 5)
+    unify_terms(d, ConsTerm("->", [c, c], binary=True))
+    assert find(c).level == 2
+    assert find(a).level == 1
+    unify_terms(TypeCell("e", 0), d)
+    assert find(a).level == 0
+
+
+def test_generalization_does_not_scan_the_environment():
+    class LookupOnly(BuiltinEnvDict):
+        def __iter__(self):
+            raise AssertionError("The environment must not be scanned")
+
+    code = " ".join(f"let x{i} = \\y -> (y, x{i - 1}) in" for i in range(1, 50))
+    expr = parse_expression(f"let x0 = id in {code} x49")
+    env = LookupOnly({"id": TypeScheme.from_str("a -> a")})
+    _, t = typecheck(expr, env, engine="unionfind")
+    assert isinstance(t, TypeCons) and t.cons == "->"
+    assert Inference(env, iter([])).level == 1
+
+
+def test_unify_binds_roots():
+    a, b = TypeCell("a"), TypeCell("b")
+    number = ConsTerm("Number", [])
+    unify_terms(ConsTerm("->", [a, b], binary=True), ConsTerm("->", [b, number], binary=True))
+    assert resolve(a) is number
+    assert export(a) == export(b) == TypeCons("Number")
+
+
+def test_occurs_check():
+    a = TypeCell("a")
+    with pytest.raises(UnificationError):
+        unify_terms(a, ConsTerm("[]", [a]))
+    b, c = TypeCell("b"), TypeCell("c")
+    unify_terms(b, ConsTerm("[]", [c]))
+    with pytest.raises(UnificationError):
+        unify_terms(c, ConsTerm("->", [b, b], binary=True))
+
+
+def test_mismatching_constructors():
+    with pytest.raises(UnificationError):
+        unify_terms(ConsTerm("Int", []), ConsTerm("Num", []))
+    with pytest.raises(UnificationError):
+        unify_terms(ConsTerm("T", [TypeCell("a")]), ConsTerm("T", []))
+
+
+def test_unknown_engine():
+    with pytest.raises(ValueError):
+        typecheck(parse_expression("1"), EMPTY_TYPE_ENV, engine="unknown")
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        r"\a b -> a",
+        r"\x y z -> x z (y z)",
+        r"let id x = x in id . id",
+        r"Left . Right",
+        r"either id id",
+        r"let pair x y = (x, y) in pair 1 2",
+        r"(1, 2, 3)",
+        r"""
+        let map = \f xs -> if (is_null xs) (then xs) (else (f (head xs):map f (tail xs)))
+        in map
+        """,
+        r"""
+        let map = \f xs -> if (is_null xs) (then xs) (else (f (head xs):map f (tail xs)))
+            squarelist xs = map (\x -> x * x) xs
+            conflict   xs = map (\x -> "" ++ x) xs
+        in conflict
+        """,
+        r"""
+        let map :: (a -> b) -> [a] -> [b]
+            map = \f xs -> if (is_null xs) (then xs) (else (f (head xs):map f (tail xs)))
+            squarelist xs = map (\x -> x * x) xs
+        in squarelist
+        """,
+        r"let f x = let g y = (x, y) in g in f",
+        r"\x -> let y = x in let z = y in (z, z)",
+        r"\x -> let f y = (x y, y) in (f, f 1)",
+        r"""
+        let id :: a -> a
+            id x = x
+            k x = id x
+        in (k, id 1, id 'a')
+        """,
+    ],
+)
+def test_same_principal_types(code):
+    assert_same_principal_type(parse_expression(code), builtins_env)
+
+
+def test_same_principal_types_with_nongenerics():
+    code = r"""
+    let prxI c  = c free id
+        p1 x y  = x
+        p2 x y  = y
+    in prxI p2 (prxI p2)
+    """
+    env = BuiltinEnvDict({
+        "free": TypeScheme.from_str("f", generics=[]),
+        "id": TypeScheme.from_str("a -> a"),
+    })
+    assert_same_principal_type(parse_expression(code), env)
+    _, t = typecheck(parse_expression(r"\x -> (x, free)"), env, engine="unionfind")
+    assert normalized(t) == normalized(Type.from_str("a -> (a, f)"))
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        r"\x -> x x",
+        r"\f -> (\x -> f (x x))(\x -> f (x x))",
+        r"not 0",
+        r"(+) . Left",
+        r"let f get = (get [1,2], get ['a','b','c']) in f",
+        r"""let g :: [Char]
+                g = [1, 2, 3]
+            in g""",
+    ],
+)
+def test_same_type_errors(code):
+    expr = parse_expression(code)
+    with pytest.raises(TypeError):
+        typecheck(expr, builtins_env)
+    with pytest.raises(TypeError):
+        typecheck(expr, builtins_env, engine="unionfind")
+
+
+@settings(max_examples=20)
+@given(welltyped_expressions)
+def test_same_principal_types_of_generated_expressions(expr):
+    assert_same_principal_type(expr, TestTypingEnvironment())
+
+
+# Deep enough to overflow the stack of a recursive algorithm.
+DEEP = 20000
+
+
+def test_deep_list_literal():
+    expr = build_list_expr(*(Literal(i, NumberType) for i in range(DEEP)))
+    _, t = typecheck(expr, builtins_env, engine="unionfind")
+    assert t == Type.from_str("[Number]")
+
+
+def test_deep_application_spine():
+    expr = build_application("id", *(Identifier("id") for _ in range(DEEP)))
+    _, t = typecheck(expr, builtins_env, engine="unionfind")
+    assert normalized(t) == normalized(Type.from_str("a -> a"))
+
+
+def test_deep_lets():
+    body = Identifier(f"y{DEEP - 1}")
+    for i in reversed(range(DEEP)):
+        body = Let({f"y{i}": Identifier(f"y{i - 1}" if i else "x")}, body)
+    _, t = typecheck(Lambda("x", body), builtins_env, engine="unionfind")
+    assert normalized(t) == normalized(Type.from_str("a -> a"))
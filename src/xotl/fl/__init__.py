@@ -11,7 +11,9 @@
 # importing 'xotl.fl.release'.
 
 
-def parse(program_source: str, *, debug: bool = False):
+def parse(
+    program_source: str, *, debug: bool = False, max_workers=None, cache=None, lazy: bool = False
+):
     '''Parse the program source and return its AST.
 
     It returns a list of definitions.  Definitions come in five types:
@@ -30,6 +32,22 @@ def parse(program_source: str, *, debug: bool = False):
 
     This function doesn't type-check the program.
 
+    If `max_workers` is larger than 1, the top-level definitions are parsed
+    by that many processes (see `xotl.fl.parsers.streaming.parse_parallel`:func:).
+    If it's None, programs larger than
+    `~xotl.fl.parsers.streaming.PARALLEL_PARSE_THRESHOLD`:data: are parsed
+    with a process per CPU (if there are several).
+
+    If `cache` is a `~xotl.fl.cache.ParseCache`:class: (or the name
+    of a directory), the result is looked up there before parsing and stored
+    afterwards.  If it's None, the cache in the directory named by the
+    environment variable ``XOTL_FL_PARSE_CACHE`` is used, if set.  Pass
+    False to not use any cache.
+
+    If `lazy` is True, the equations are parsed the first time their
+    patterns or body are needed (see `xotl.fl.parsers.lazy.parse_lazy`:func:);
+    `max_workers` and `cache` are ignored.
+
     Example:
 
     .. doctest::
@@ -45,12 +63,38 @@ def parse(program_source: str, *, debug: bool = False):
         <equation lhead (Cons a _) = Identifier('a')>]
 
     '''
-    from xotl.fl.parsers import lexer, program_parser
+    import os
+
+    if lazy:
+        from xotl.fl.parsers.lazy import parse_lazy
+
+        return parse_lazy(program_source, debug=debug)
 
-    defs = program_parser.parse(program_source, lexer=lexer, debug=debug)
+    from xotl.fl.cache import ParseCache, default_cache
+
+    if cache is None:
+        cache = default_cache()
+    elif cache is not False and not isinstance(cache, ParseCache):
+        cache = ParseCache(cache)
+    if cache:
+        defs = cache.get(program_source)
+        if defs is not None:
+            return defs
+
+    from xotl.fl.parsers import default_context
+    from xotl.fl.parsers.streaming import PARALLEL_PARSE_THRESHOLD, parse_parallel
+
+    if max_workers is None and len(program_source) > PARALLEL_PARSE_THRESHOLD:
+        max_workers = os.cpu_count()
+    if max_workers and max_workers > 1:
+        defs = parse_parallel(program_source, max_workers=max_workers, debug=debug)
+    else:
+        defs = default_context.parse_program(program_source, debug=debug)
     # Here we try to perform sanity checks and also *group* otherwise
     # separated stuff (several equations for the same name are given
     # separately, but we group them under a single Equations object).
+    if cache:
+        cache.put(program_source, defs)
     return defs
 
 
@@ -60,3 +104,27 @@ def tokenize(source):
     lexer = lexer.clone()
     lexer.input(source)
     return [tok for tok in lexer]
+
+
+def scan(source):
+    """Generate the tokens of `source`.
+
+    The tokens are the same `tokenize`:func: returns, but they are produced
+    one by one (by `xotl.fl.parsers.scanner.scan`:func:).
+
+    """
+    from xotl.fl.parsers.scanner import scan
+
+    return scan(source)
+
+
+def parse_stream(stream, *, encoding="utf-8", debug=False):
+    """Parse the program read from `stream`, one definition at a time.
+
+    This is a generator of the definitions `parse`:func: would return for the
+    whole source; see `xotl.fl.parsers.streaming.parse_stream`:func:.
+
+    """
+    from xotl.fl.parsers.streaming import parse_stream
+
+    return parse_stream(stream, encoding=encoding, debug=debug)
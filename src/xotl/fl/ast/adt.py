@@ -203,7 +203,8 @@ class DataType:
         constructor and, possibly, extract one of the components.
 
         The ``pattern_matching_evn`` returns the type environment of those
-        functions:
+        functions.  Each takes the value to match and a continuation, which
+        receives the component extracted (if any):
 
         .. doctest::
            :options: +NORMALIZE_WHITESPACE
@@ -211,9 +212,9 @@ class DataType:
             >>> datatype = parse('data List a = Nil | Cons a (List a)')[0]
 
             >>> datatype.pattern_matching_env
-            {<Match: Nil>: <TypeScheme: forall a. List a>,
-             <Extract: 1 from Cons>: <TypeScheme: forall a. (List a) -> a>,
-             <Extract: 2 from Cons>: <TypeScheme: forall a. (List a) -> (List a)>}
+            {<Match: Nil>: <TypeScheme: forall .r a. (List a) -> (.r -> .r)>,
+             <Extract: 1 from Cons>: <TypeScheme: forall .r a. (List a) -> ((a -> .r) -> .r)>,
+             <Extract: 2 from Cons>: <TypeScheme: forall .r a. (List a) -> (((List a) -> .r) -> .r)>}
 
         .. doctest::
            :options: +NORMALIZE_WHITESPACE
@@ -221,8 +222,8 @@ class DataType:
             >>> datatype = parse('data Pair a b = Pair a b')[0]
 
             >>> datatype.pattern_matching_env
-            {<Extract: 1 from Pair>: <TypeScheme: forall a b. (Pair a b) -> a>,
-             <Extract: 2 from Pair>: <TypeScheme: forall a b. (Pair a b) -> b>}
+            {<Extract: 1 from Pair>: <TypeScheme: forall .r a b. (Pair a b) -> ((a -> .r) -> .r)>,
+             <Extract: 2 from Pair>: <TypeScheme: forall .r a b. (Pair a b) -> ((b -> .r) -> .r)>}
 
         .. doctest::
            :options: +NORMALIZE_WHITESPACE
@@ -230,21 +231,26 @@ class DataType:
             >>> datatype = parse('data Unit = Unit')[0]
 
             >>> datatype.pattern_matching_env
-            {<Match: Unit>: <TypeScheme: Unit>}
+            {<Match: Unit>: <TypeScheme: forall .r. Unit -> (.r -> .r)>}
 
         .. note:: The names of those special functions are not strings.
 
         """
         from xotl.fl.ast.types import FunctionTypeCons as F
+        from xotl.fl.ast.types import TypeVariable
         from xotl.fl.match import Extract, Match
 
+        # The result of the match (or extraction); its name cannot clash
+        # with those of the data type.
+        r = TypeVariable(".r", check=False)
+
         def _implied_funs(dc: DataCons) -> Iterator[Tuple[Symbolic, TypeScheme]]:
             scheme = TypeScheme.from_typeexpr
             if not dc.args:
-                yield Match(dc.name), scheme(self.type_)
+                yield Match(dc.name), scheme(F(self.type_, F(r, r)))
             else:
                 for i, type_ in enumerate(dc.args):
-                    yield Extract(dc.name, i + 1), scheme(F(self.type_, type_))
+                    yield Extract(dc.name, i + 1), scheme(F(self.type_, F(F(type_, r), r)))
 
         return {name: ts for dc in self.dataconses for name, ts in _implied_funs(dc)}
 
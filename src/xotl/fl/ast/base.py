@@ -8,6 +8,8 @@
 #
 """The language AST."""
 
+from typing import Any, List, Optional, Tuple
+
 
 class ILC:
     """The intermediate language nodes.
@@ -16,14 +18,96 @@ class ILC:
 
     """
 
+    __slots__ = ()
+
 
 class AST:
     """A AST node in the language."""
 
+    __slots__ = ()
+
     def translate(self) -> ILC:  # pragma: no cover
         ...
 
 
 class Dual(AST, ILC):
+    __slots__ = ()
+
     def translate(self) -> ILC:  # pragma: no cover
         return self
+
+
+class Node:
+    """A node with structural equality and a hash computed once.
+
+    Subclasses set `_hash` in their constructors (see `structural_hash`:func:)
+    and return the arguments of their constructor from `_values`:meth:.
+    Nodes are immutable.
+
+    """
+
+    __slots__ = ("_hash", "__weakref__")
+
+    _hash: Optional[int]
+
+    def _values(self) -> Tuple[Any, ...]:  # pragma: no cover
+        "The attributes of the node, in the order of the constructor's arguments."
+        raise NotImplementedError
+
+    def __hash__(self):
+        result = self._hash
+        if result is None:
+            raise TypeError(f"unhashable node: {self!r}")
+        return result
+
+    def __eq__(self, other):
+        if isinstance(other, Node):
+            return equal(self, other)
+        else:
+            return NotImplemented
+
+    def __reduce__(self):
+        return type(self), self._values()
+
+
+def structural_hash(key: Tuple[Any, ...]) -> Optional[int]:
+    """Return the hash of `key`, or None if it has unhashable parts.
+
+    The children of a node have their hashes already computed, so this
+    doesn't walk the tree.
+
+    """
+    try:
+        return hash(key)
+    except TypeError:
+        return None
+
+
+def equal(first: Node, second: Node) -> bool:
+    """Return True if the nodes are structurally equal.
+
+    The trees are compared with an explicit stack, so deep trees don't hit
+    the recursion limit.  The hashes (when both are known) are compared
+    first; so most different nodes are told apart without looking at their
+    children.
+
+    """
+    pending: List[Tuple[Any, Any]] = [(first, second)]
+    pop, extend = pending.pop, pending.extend
+    while pending:
+        a, b = pop()
+        if a is b:
+            continue
+        elif isinstance(a, Node) and isinstance(b, Node):
+            if type(a) is not type(b) and not (isinstance(a, type(b)) or isinstance(b, type(a))):
+                return False
+            if a._hash != b._hash and a._hash is not None and b._hash is not None:
+                return False
+            extend(zip(a._values(), b._values()))
+        elif isinstance(a, tuple) and isinstance(b, tuple):
+            if len(a) != len(b):
+                return False
+            extend(zip(a, b))
+        elif a != b:
+            return False
+    return True
@@ -0,0 +1,798 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------
+# Copyright (c) Merchise Autrement [~º/~] and Contributors
+# All rights reserved.
+#
+# This is free software; you can do what the LICENCE file allows you to.
+#
+"""A compact binary encoding of expressions, types and programs.
+
+`encode`:func: writes a tree as a sequence of unsigned integers (*words*)
+and a table of strings.  Each node is written in preorder: a tag, the
+operands of the node (indexes in the string table, counts, flags) and then
+its children.  All the words have the same width (1, 2, 4 or 8 bytes), the
+smallest one holding the biggest word; so the words of most programs take
+1 or 2 bytes.  Identifiers, constructors and other strings are stored once
+in the table; and, since types are hash-consed, each type is encoded once
+and then referenced by its position.
+
+The layout of the encoded data is:
+
+- a header: the magic ``b"XFL"``, the `CODEC_VERSION`:data:, the width of
+  the words and the number of words;
+
+- the words: the number of strings, the length of each string and the
+  nodes;
+
+- the strings, as UTF-8.
+
+Besides the nodes in `xotl.fl.ast`:mod: and the symbols in
+`xotl.fl.match`:mod:, the values None, booleans, numbers, strings, dates,
+datetimes, time spans, tuples, lists and dicts are encoded; so programs (the
+result of `xotl.fl.parse`:func:) and type environments can be encoded as
+well.
+
+Both `encode`:func: and `decode`:func: use an explicit stack, so deep trees
+(e.g. long lists) don't exhaust the recursion limit.
+
+"""
+
+import struct
+import sys
+from array import array
+from datetime import date, datetime
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+from xotl.fl.ast.adt import DataCons, DataType
+from xotl.fl.ast.expressions import (
+    Application,
+    ApplicationLC,
+    Identifier,
+    Lambda,
+    LambdaLC,
+    Let,
+    LetLC,
+    Letrec,
+    LetrecLC,
+    Literal,
+)
+from xotl.fl.ast.pattern import (
+    ConcreteLet,
+    ConsPattern,
+    ConstructorBranch,
+    Equation,
+    LiteralBranch,
+    NamedPattern,
+)
+from xotl.fl.ast.typeclasses import Instance, TypeClass
+from xotl.fl.ast.types import (
+    ConstrainedType,
+    ListTypeCons,
+    TupleTypeCons,
+    TypeCons,
+    TypeConstraint,
+    TypeRecord,
+    TypeScheme,
+    TypeVariable,
+)
+from xotl.fl.match import Extract, Match, MatchLiteral, Select
+from xotl.tools.future.datetime import TimeSpan
+
+#: The version of the encoding.  Data encoded with another version is
+#: rejected by `decode`:func:.
+CODEC_VERSION = 1
+
+MAGIC = b"XFL"
+
+_HEADER = struct.Struct("<3sBBQ")  # magic, version, width, number of words
+
+# The typecode of the array holding words of each width.
+_TYPECODES = {array(code).itemsize: code for code in "QLIHB"}
+
+# Integers up to this value are written inline, bigger ones as strings.
+_MAX_INLINE_INT = 0xFFFF
+
+# The tags.  Don't reuse the number of removed tags; bump CODEC_VERSION
+# when changing the meaning of one.
+NONE = 0
+FALSE = 1
+TRUE = 2
+INT = 3  # value
+BIGINT = 4  # string
+FLOAT = 5  # string (float.hex)
+STR = 6  # string
+TUPLE = 7  # count; items
+LIST = 8  # count; items
+DICT = 9  # count; key, value, key, value...
+DATE = 10  # string (ISO format)
+DATETIME = 11  # string (ISO format)
+TIMESPAN = 12  # ; start, end
+NAME = 13  # string -- an Identifier whose name is a string
+IDENTIFIER = 14  # ; symbol
+MATCH = 15  # string
+EXTRACT = 16  # string, arg
+SELECT = 17  # arg
+MATCH_LITERAL = 18  # ; literal
+LITERAL = 19  # ; value, type, annotation
+LAMBDA = 20  # varname; body
+LAMBDA_LC = 21
+APPLICATION = 22  # ; e1, e2
+APPLICATION_LC = 23
+LET = 24  # count, names...; values..., localenv, body
+LET_LC = 25
+LETREC = 26
+LETREC_LC = 27
+CONS_PATTERN = 28  # cons, count; params...
+NAMED_PATTERN = 29  # name; pattern
+EQUATION = 30  # name, count; patterns..., body
+CONCRETE_LET = 31  # count; definitions..., body
+DATA_CONS = 32  # name, count; args...
+DATA_TYPE = 33  # name, count, derivations..., count; type, dataconses...
+TYPE_CLASS = 34  # count, count; superclasses..., newclass, definitions...
+INSTANCE = 35  # typeclass_name, count, count; constraints..., type, definitions...
+TYPE_VARIABLE = 36  # name
+TYPE_CONS = 37  # cons, count; subtypes...
+BINARY_TYPE_CONS = 38  # cons; left, right
+TUPLE_TYPE = 39  # count; subtypes...
+LIST_TYPE = 40  # ; subtype
+TYPE_SCHEME = 41  # count, generics...; type
+CONSTRAINED_TYPE = 42  # count, generics..., count; type, constraints...
+TYPE_CONSTRAINT = 43  # name; type
+TYPE_RECORD = 44  # count, names...; types...
+LITERAL_BRANCH = 45  # ; value
+CONSTRUCTOR_BRANCH = 46  # ; datacons
+REF = 47  # index -- a type already decoded
+
+
+def encode(obj: Any) -> bytes:
+    """Return the encoding of `obj`.
+
+    Raise TypeError if `obj` contains values that cannot be encoded.
+
+    """
+    strings: Dict[str, int] = {}
+    string = lambda s: strings.setdefault(s, len(strings))  # noqa: E731
+    # The position of the (hash-consed) types already encoded, by identity.
+    shared: Dict[int, int] = {}
+    words: List[int] = []
+    pending = [obj]
+    while pending:
+        obj = pending.pop()
+        cls = type(obj)
+        if cls in _SHARED:
+            index = shared.get(id(obj))
+            if index is not None:
+                words += (REF, index)
+                continue
+            shared[id(obj)] = len(shared)
+        encoder = _ENCODERS.get(cls)
+        if encoder is None:
+            raise TypeError(f"Cannot encode {obj!r} of type '{cls.__name__}'")
+        children = encoder(obj, words, string)
+        if children:
+            pending.extend(reversed(children))
+    header = [len(strings)]
+    header.extend(len(s) for s in strings)
+    words[:0] = header
+    width = 1
+    biggest = max(words)
+    while biggest >= 1 << (8 * width):
+        width *= 2
+    body = array(_TYPECODES[width], words)
+    if sys.byteorder != "little":
+        body.byteswap()
+    text = "".join(strings).encode("utf-8", "surrogatepass")
+    return b"".join([_HEADER.pack(MAGIC, CODEC_VERSION, width, len(words)), body.tobytes(), text])
+
+
+def decode(data: bytes) -> Any:
+    """Return the object encoded in `data`.
+
+    Raise ValueError if `data` is not a valid encoding.
+
+    """
+    data = memoryview(data)
+    try:
+        magic, version, width, count = _HEADER.unpack_from(data)
+    except struct.error:
+        raise ValueError("Invalid encoded data: too short")
+    if magic != MAGIC:
+        raise ValueError("Invalid encoded data: bad magic number")
+    if version != CODEC_VERSION:
+        raise ValueError(f"Invalid encoded data: version {version} (expected {CODEC_VERSION})")
+    typecode = _TYPECODES.get(width)
+    end = _HEADER.size + width * count
+    if typecode is None or len(data) < end:
+        raise ValueError("Invalid encoded data: truncated words")
+    body = array(typecode)
+    body.frombytes(data[_HEADER.size : end])
+    if sys.byteorder != "little":
+        body.byteswap()
+    try:
+        return _decode(body, str(data[end:], "utf-8", "surrogatepass"))
+    except ValueError:
+        raise
+    except Exception as error:
+        # Damaged data may reach the constructors of the nodes with any
+        # values; e.g. IndexError, StopIteration, or an AssertionError.
+        raise ValueError(f"Invalid encoded data: {error!r}")
+
+
+def _decode(body: Sequence[int], text: str) -> Any:
+    words = iter(body)
+    strings: List[str] = []
+    pos = 0
+    for _ in range(next(words)):
+        length = next(words)
+        strings.append(text[pos : pos + length])
+        pos += length
+    if pos != len(text):
+        raise ValueError("Invalid encoded data: mismatching strings")
+    readers = _READERS
+    shared_tags = _SHARED_TAGS
+    # The types that can be referenced; a slot is taken when the type starts
+    # (in preorder) and filled when it's complete.
+    shared: List[Any] = []
+    # The values of the children decoded so far, and the nodes waiting for
+    # them: the builder, its arguments, the position of the first child and
+    # the slot in `shared` (or -1).
+    values: List[Any] = []
+    frames: List[Tuple[Any, Any, int, int]] = []
+    ends: List[int] = [1]  # the number of values when the node is complete
+    end = 1
+    append = values.append
+    while True:
+        tag = next(words)
+        # Names, strings and references are the most common leaves.
+        if tag == NAME:
+            value = Identifier(strings[next(words)])
+        elif tag == STR:
+            value = strings[next(words)]
+        elif tag == REF:
+            value = shared[next(words)]
+        else:
+            arity, build, value = readers[tag](words, strings)
+            if arity:
+                if tag in shared_tags:
+                    slot = len(shared)
+                    shared.append(None)
+                else:
+                    slot = -1
+                start = len(values)
+                frames.append((build, value, start, slot))
+                end = start + arity
+                ends.append(end)
+                continue
+            elif tag in shared_tags:
+                shared.append(value)
+        append(value)
+        if len(values) == end:
+            while frames and len(values) == end:
+                build, args, start, slot = frames.pop()
+                ends.pop()
+                end = ends[-1]
+                value = build(args, values[start:])
+                if slot >= 0:
+                    shared[slot] = value
+                del values[start:]
+                append(value)
+            if not frames:
+                if next(words, None) is not None:
+                    raise ValueError("Invalid encoded data: trailing words")
+                return value
+
+
+# Encoders.  Each one appends the tag and the operands of a node to the
+# words and returns its children.
+Encoder = Callable[[Any, List[int], Callable[[str], int]], Sequence[Any]]
+
+
+def _encode_none(obj, words, string):
+    words.append(NONE)
+
+
+def _encode_bool(obj, words, string):
+    words.append(TRUE if obj else FALSE)
+
+
+def _encode_int(obj, words, string):
+    if 0 <= obj <= _MAX_INLINE_INT:
+        words += (INT, obj)
+    else:
+        words += (BIGINT, string(str(obj)))
+
+
+def _encode_float(obj, words, string):
+    words += (FLOAT, string(obj.hex()))
+
+
+def _encode_str(obj, words, string):
+    words += (STR, string(obj))
+
+
+def _encode_tuple(obj, words, string):
+    words += (TUPLE, len(obj))
+    return obj
+
+
+def _encode_list(obj, words, string):
+    words += (LIST, len(obj))
+    return obj
+
+
+def _encode_dict(obj, words, string):
+    words += (DICT, len(obj))
+    return [item for pair in obj.items() for item in pair]
+
+
+def _encode_date(obj, words, string):
+    words += (DATE, string(obj.isoformat()))
+
+
+def _encode_datetime(obj, words, string):
+    words += (DATETIME, string(obj.isoformat()))
+
+
+def _encode_timespan(obj, words, string):
+    words.append(TIMESPAN)
+    return (obj.start_date, obj.end_date)
+
+
+def _encode_identifier(obj, words, string):
+    if type(obj.name) is str:
+        words += (NAME, string(obj.name))
+    else:
+        words.append(IDENTIFIER)
+        return (obj.name,)
+
+
+def _encode_match(obj, words, string):
+    words += (MATCH, string(obj.name))
+
+
+def _encode_extract(obj, words, string):
+    words += (EXTRACT, string(obj.name), obj.arg)
+
+
+def _encode_select(obj, words, string):
+    words += (SELECT, obj.arg)
+
+
+def _encode_match_literal(obj, words, string):
+    words.append(MATCH_LITERAL)
+    return (obj.value,)
+
+
+def _encode_literal(obj, words, string):
+    words.append(LITERAL)
+    return (obj.value, obj.type_, obj.annotation)
+
+
+def _encode_lambda(tag):
+    def encoder(obj, words, string):
+        words += (tag, string(obj.varname))
+        return (obj.body,)
+
+    return encoder
+
+
+def _encode_application(tag):
+    def encoder(obj, words, string):
+        words.append(tag)
+        return (obj.e1, obj.e2)
+
+    return encoder
+
+
+def _encode_let(tag):
+    def encoder(obj, words, string):
+        words += (tag, len(obj.bindings))
+        words.extend(string(name) for name, _ in obj.bindings)
+        children = [value for _, value in obj.bindings]
+        children += (obj.localenv, obj.body)
+        return children
+
+    return encoder
+
+
+def _encode_cons_pattern(obj, words, string):
+    words += (CONS_PATTERN, string(obj.cons), len(obj.params))
+    return obj.params
+
+
+def _encode_named_pattern(obj, words, string):
+    words += (NAMED_PATTERN, string(obj.name))
+    return (obj.pattern,)
+
+
+def _encode_equation(obj, words, string):
+    words += (EQUATION, string(obj.name), len(obj.patterns))
+    return obj.patterns + (obj.body,)
+
+
+def _encode_concrete_let(obj, words, string):
+    words += (CONCRETE_LET, len(obj.definitions))
+    return obj.definitions + (obj.body,)
+
+
+def _encode_datacons(obj, words, string):
+    words += (DATA_CONS, string(obj.name), len(obj.args))
+    return obj.args
+
+
+def _encode_datatype(obj, words, string):
+    words += (DATA_TYPE, string(obj.name), len(obj.derivations))
+    words.extend(string(name) for name in obj.derivations)
+    words.append(len(obj.dataconses))
+    return (obj.type_,) + obj.dataconses
+
+
+def _encode_typeclass(obj, words, string):
+    words += (TYPE_CLASS, len(obj.superclasses), len(obj.definitions))
+    return [*obj.superclasses, obj.newclass, *obj.definitions]
+
+
+def _encode_instance(obj, words, string):
+    words += (INSTANCE, string(obj.typeclass_name), len(obj.constraints), len(obj.definitions))
+    return [*obj.constraints, obj.type_, *obj.definitions]
+
+
+def _encode_typevar(obj, words, string):
+    words += (TYPE_VARIABLE, string(obj.name))
+
+
+def _encode_typecons(obj, words, string):
+    if obj.binary:
+        words += (BINARY_TYPE_CONS, string(obj.cons))
+    else:
+        words += (TYPE_CONS, string(obj.cons), len(obj.subtypes))
+    return obj.subtypes
+
+
+def _encode_tuple_type(obj, words, string):
+    words += (TUPLE_TYPE, len(obj.subtypes))
+    return obj.subtypes
+
+
+def _encode_list_type(obj, words, string):
+    words.append(LIST_TYPE)
+    return obj.subtypes
+
+
+def _encode_typescheme(obj, words, string):
+    words += (TYPE_SCHEME, len(obj.generics))
+    words.extend(string(name) for name in obj.generics)
+    return (obj.type_,)
+
+
+def _encode_constrained_type(obj, words, string):
+    words += (CONSTRAINED_TYPE, len(obj.generics))
+    words.extend(string(name) for name in obj.generics)
+    words.append(len(obj.constraints))
+    return (obj.type_,) + obj.constraints
+
+
+def _encode_type_constraint(obj, words, string):
+    words += (TYPE_CONSTRAINT, string(obj.name))
+    return (obj.type_,)
+
+
+def _encode_type_record(obj, words, string):
+    words += (TYPE_RECORD, len(obj.fields))
+    words.extend(string(name) for name in obj.fields)
+    return list(obj.fields.values())
+
+
+def _encode_literal_branch(obj, words, string):
+    words.append(LITERAL_BRANCH)
+    return (obj.value,)
+
+
+def _encode_constructor_branch(obj, words, string):
+    words.append(CONSTRUCTOR_BRANCH)
+    return (obj.datacons,)
+
+
+_ENCODERS: Dict[type, Encoder] = {
+    type(None): _encode_none,
+    bool: _encode_bool,
+    int: _encode_int,
+    float: _encode_float,
+    str: _encode_str,
+    tuple: _encode_tuple,
+    list: _encode_list,
+    dict: _encode_dict,
+    date: _encode_date,
+    datetime: _encode_datetime,
+    TimeSpan: _encode_timespan,
+    Identifier: _encode_identifier,
+    Match: _encode_match,
+    Extract: _encode_extract,
+    Select: _encode_select,
+    MatchLiteral: _encode_match_literal,
+    Literal: _encode_literal,
+    Lambda: _encode_lambda(LAMBDA),
+    LambdaLC: _encode_lambda(LAMBDA_LC),
+    Application: _encode_application(APPLICATION),
+    ApplicationLC: _encode_application(APPLICATION_LC),
+    Let: _encode_let(LET),
+    LetLC: _encode_let(LET_LC),
+    Letrec: _encode_let(LETREC),
+    LetrecLC: _encode_let(LETREC_LC),
+    ConsPattern: _encode_cons_pattern,
+    NamedPattern: _encode_named_pattern,
+    Equation: _encode_equation,
+    ConcreteLet: _encode_concrete_let,
+    DataCons: _encode_datacons,
+    DataType: _encode_datatype,
+    TypeClass: _encode_typeclass,
+    Instance: _encode_instance,
+    TypeVariable: _encode_typevar,
+    TypeCons: _encode_typecons,
+    TupleTypeCons: _encode_tuple_type,
+    ListTypeCons: _encode_list_type,
+    TypeScheme: _encode_typescheme,
+    ConstrainedType: _encode_constrained_type,
+    TypeConstraint: _encode_type_constraint,
+    TypeRecord: _encode_type_record,
+    LiteralBranch: _encode_literal_branch,
+    ConstructorBranch: _encode_constructor_branch,
+}
+
+
+# Types are hash-consed, so equal types are usually the same object.  These
+# are encoded once, and then referenced by their position.
+_SHARED = frozenset({
+    TypeVariable,
+    TypeCons,
+    TupleTypeCons,
+    ListTypeCons,
+    TypeScheme,
+    ConstrainedType,
+})
+_SHARED_TAGS = frozenset({
+    TYPE_VARIABLE,
+    TYPE_CONS,
+    BINARY_TYPE_CONS,
+    TUPLE_TYPE,
+    LIST_TYPE,
+    TYPE_SCHEME,
+    CONSTRAINED_TYPE,
+})
+
+
+# Readers.  Each one reads the operands of a node and returns the number of
+# its children, the function that builds the node from its arguments and
+# children, and the arguments.  Leaves (without children) return the value
+# instead of the arguments.
+def _leaf(value):
+    return lambda words, strings: (0, None, value)
+
+
+def _read_string(build):
+    def reader(words, strings):
+        return 0, None, build(strings[next(words)])
+
+    return reader
+
+
+def _read_int(words, strings):
+    return 0, None, next(words)
+
+
+def _read_select(words, strings):
+    return 0, None, Select(next(words))
+
+
+def _read_extract(words, strings):
+    return 0, None, Extract(strings[next(words)], next(words))
+
+
+def _read_fixed(arity, build):
+    def reader(words, strings):
+        return arity, build, None
+
+    return reader
+
+
+def _read_sequence(build):
+    def reader(words, strings):
+        count = next(words)
+        if count:
+            return count, build, None
+        else:
+            return 0, None, build(None, [])
+
+    return reader
+
+
+def _read_lambda(cls):
+    def reader(words, strings):
+        return 1, build, strings[next(words)]
+
+    def build(varname, children):
+        return cls(varname, children[0])
+
+    return reader
+
+
+def _read_let(cls):
+    def reader(words, strings):
+        names = [strings[next(words)] for _ in range(next(words))]
+        return len(names) + 2, build, names
+
+    def build(names, children):
+        *values, localenv, body = children
+        return cls(dict(zip(names, values)), body, localenv)
+
+    return reader
+
+
+def _read_named(arity, build):
+    def reader(words, strings):
+        return arity, build, strings[next(words)]
+
+    return reader
+
+
+def _read_counted(build):
+    # A node with a name and a number of children.
+    def reader(words, strings):
+        name = strings[next(words)]
+        count = next(words)
+        if count:
+            return count, build, name
+        else:
+            return 0, None, build(name, ())
+
+    return reader
+
+
+def _read_equation(words, strings):
+    name = strings[next(words)]
+    return next(words) + 1, _build_equation, name
+
+
+def _build_equation(name, children):
+    *patterns, body = children
+    return Equation(name, patterns, body)
+
+
+def _read_concrete_let(words, strings):
+    return next(words) + 1, _build_concrete_let, None
+
+
+def _build_concrete_let(_, children):
+    *definitions, body = children
+    return ConcreteLet(definitions, body)
+
+
+def _read_datatype(words, strings):
+    name = strings[next(words)]
+    derivations = [strings[next(words)] for _ in range(next(words))]
+    return next(words) + 1, _build_datatype, (name, derivations)
+
+
+def _build_datatype(args, children):
+    name, derivations = args
+    type_, *dataconses = children
+    return DataType(name, type_, dataconses, derivations)
+
+
+def _read_typeclass(words, strings):
+    superclasses = next(words)
+    return superclasses + next(words) + 1, _build_typeclass, superclasses
+
+
+def _build_typeclass(superclasses, children):
+    return TypeClass(children[:superclasses], children[superclasses], children[superclasses + 1 :])
+
+
+def _read_instance(words, strings):
+    name = strings[next(words)]
+    constraints = next(words)
+    return constraints + next(words) + 1, _build_instance, (name, constraints)
+
+
+def _build_instance(args, children):
+    name, constraints = args
+    return Instance(
+        children[:constraints], name, children[constraints], children[constraints + 1 :]
+    )
+
+
+def _read_type_scheme(words, strings):
+    generics = [strings[next(words)] for _ in range(next(words))]
+    return 1, _build_type_scheme, generics
+
+
+def _build_type_scheme(generics, children):
+    return TypeScheme(generics, children[0])
+
+
+def _read_constrained_type(words, strings):
+    generics = [strings[next(words)] for _ in range(next(words))]
+    return next(words) + 1, _build_constrained_type, generics
+
+
+def _build_constrained_type(generics, children):
+    type_, *constraints = children
+    return ConstrainedType(generics, type_, constraints)
+
+
+def _read_type_record(words, strings):
+    names = [strings[next(words)] for _ in range(next(words))]
+    if names:
+        return len(names), _build_type_record, names
+    else:
+        return 0, None, TypeRecord({})
+
+
+def _build_type_record(names, children):
+    return TypeRecord(dict(zip(names, children)))
+
+
+def _build_dict(_, children):
+    return dict(zip(children[::2], children[1::2]))
+
+
+def _read_dict(words, strings):
+    count = next(words)
+    if count:
+        return 2 * count, _build_dict, None
+    else:
+        return 0, None, {}
+
+
+Reader = Callable[[Any, List[str]], Any]
+
+_READERS: Dict[int, Reader] = {
+    NONE: _leaf(None),
+    FALSE: _leaf(False),
+    TRUE: _leaf(True),
+    INT: _read_int,
+    BIGINT: _read_string(int),
+    FLOAT: _read_string(float.fromhex),
+    STR: _read_string(str),
+    TUPLE: _read_sequence(lambda _, children: tuple(children)),
+    LIST: _read_sequence(lambda _, children: children),
+    DICT: _read_dict,
+    DATE: _read_string(date.fromisoformat),
+    DATETIME: _read_string(datetime.fromisoformat),
+    TIMESPAN: _read_fixed(2, lambda _, children: TimeSpan(*children)),
+    NAME: _read_string(Identifier),
+    IDENTIFIER: _read_fixed(1, lambda _, children: Identifier(children[0])),
+    MATCH: _read_string(Match),
+    EXTRACT: _read_extract,
+    SELECT: _read_select,
+    MATCH_LITERAL: _read_fixed(1, lambda _, children: MatchLiteral(children[0])),
+    LITERAL: _read_fixed(3, lambda _, children: Literal(*children)),
+    LAMBDA: _read_lambda(Lambda),
+    LAMBDA_LC: _read_lambda(LambdaLC),
+    APPLICATION: _read_fixed(2, lambda _, children: Application(*children)),
+    APPLICATION_LC: _read_fixed(2, lambda _, children: ApplicationLC(*children)),
+    LET: _read_let(Let),
+    LET_LC: _read_let(LetLC),
+    LETREC: _read_let(Letrec),
+    LETREC_LC: _read_let(LetrecLC),
+    CONS_PATTERN: _read_counted(ConsPattern),
+    NAMED_PATTERN: _read_named(1, lambda name, children: NamedPattern(name, children[0])),
+    EQUATION: _read_equation,
+    CONCRETE_LET: _read_concrete_let,
+    DATA_CONS: _read_counted(DataCons),
+    DATA_TYPE: _read_datatype,
+    TYPE_CLASS: _read_typeclass,
+    INSTANCE: _read_instance,
+    TYPE_VARIABLE: _read_string(lambda name: TypeVariable(name, check=False)),
+    TYPE_CONS: _read_counted(TypeCons),
+    BINARY_TYPE_CONS: _read_named(2, lambda cons, children: TypeCons(cons, children, binary=True)),
+    TUPLE_TYPE: _read_sequence(lambda _, children: TupleTypeCons(*children)),
+    LIST_TYPE: _read_fixed(1, lambda _, children: ListTypeCons(children[0])),
+    TYPE_SCHEME: _read_type_scheme,
+    CONSTRAINED_TYPE: _read_constrained_type,
+    TYPE_CONSTRAINT: _read_named(1, lambda name, children: TypeConstraint(name, children[0])),
+    TYPE_RECORD: _read_type_record,
+    LITERAL_BRANCH: _read_fixed(1, lambda _, children: LiteralBranch(children[0])),
+    CONSTRUCTOR_BRANCH: _read_fixed(1, lambda _, children: ConstructorBranch(children[0])),
+}
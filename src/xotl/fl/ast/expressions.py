@@ -8,33 +8,37 @@
 #
 """The AST of the enriched lambda calculus."""
 
-from collections import deque
+from types import MappingProxyType
 from typing import (
     Any,
-    Deque,
+    Dict,
     FrozenSet,
     Iterator,
     List,
     Mapping,
-    Optional,
     Reversible,
     Sequence,
     Tuple,
 )
 
-from xotl.fl.ast.base import AST, ILC, Dual
+from xotl.fl.ast.base import AST, ILC, Dual, Node, structural_hash
 from xotl.fl.ast.types import Type, TypeEnvironment
 from xotl.fl.builtins import UnitType
 from xotl.fl.meta import Symbolic
 from xotl.tools.fp.tools import fst
-from xotl.tools.objects import validate_attrs
 
 
-class Identifier(Dual):
+class Identifier(Node, Dual):
     """A name (variable if you like)."""
 
+    __slots__ = ("name",)
+
     def __init__(self, name: Symbolic) -> None:
         self.name = name
+        self._hash = structural_hash((Identifier, name))
+
+    def _values(self):
+        return (self.name,)
 
     def __repr__(self):
         return f"Identifier({self.name!r})"
@@ -42,19 +46,10 @@ class Identifier(Dual):
     def __str__(self):
         return str(self.name)
 
-    def __hash__(self):
-        return hash((Identifier, self.name))
-
-    def __eq__(self, other):
-        if isinstance(other, Identifier):
-            return self.name == other.name
-        else:
-            return NotImplemented
-
 
 # An extension to the algorithm.  Literals are allowed, but have a the
 # most specific type possible.
-class Literal(Dual):
+class Literal(Node, Dual):
     """A literal value with its type.
 
     The `parser <xotl.fl.parsers.expressions.parse>`:func: only recognizes
@@ -63,10 +58,16 @@ class Literal(Dual):
 
     """
 
+    __slots__ = ("value", "type_", "annotation")
+
     def __init__(self, value: Any, type_: Type, annotation: Any = None) -> None:
         self.value = value
         self.type_ = type_
         self.annotation = annotation
+        self._hash = structural_hash((Literal, value, type_, annotation))
+
+    def _values(self):
+        return (self.value, self.type_, self.annotation)
 
     def __repr__(self):
         if self.annotation is not None:
@@ -77,18 +78,14 @@ class Literal(Dual):
     def __str__(self):
         return str(self.value)
 
-    def __eq__(self, other):
-        if isinstance(other, Literal):
-            return validate_attrs(self, other, ("type", "value", "annotation"))
-        else:
-            return NotImplemented
 
-    def __hash__(self):
-        return hash((Literal, self.value, self.type_, self.annotation))
+class _Lambda(Node):
+    """A lambda abstraction over a single parameter."""
 
+    __slots__ = ("varname", "body")
 
-class _Lambda:
-    """A lambda abstraction over a single parameter."""
+    def _values(self):
+        return (self.varname, self.body)
 
     def __repr__(self):
         return f"Lambda({self.varname!r}, {self.body!r})"
@@ -96,34 +93,36 @@ class _Lambda:
     def __str__(self):
         return f"\\{self.varname!s} -> {self.body!s}"
 
-    def __eq__(self, other):
-        if isinstance(other, _Lambda):
-            return self.varname == other.varname and self.body == other.body
-        else:
-            return NotImplemented
-
-    def __hash__(self):
-        return hash((type(self), self.varname, self.body))
-
 
 class Lambda(_Lambda, AST):
+    __slots__ = ()
+
     def __init__(self, varname: str, body: AST) -> None:
         self.varname = varname
         self.body = body
+        self._hash = structural_hash((Lambda, varname, body))
 
     def translate(self) -> ILC:
         return LambdaLC(self.varname, self.body.translate())
 
 
 class LambdaLC(_Lambda, ILC):
+    __slots__ = ()
+
     def __init__(self, varname: str, body: ILC) -> None:
         self.varname = varname
         self.body = body
+        self._hash = structural_hash((LambdaLC, varname, body))
 
 
-class _Application:
+class _Application(Node):
     """The application of `e1` to its *argument* e2."""
 
+    __slots__ = ("e1", "e2")
+
+    def _values(self):
+        return (self.e1, self.e2)
+
     def __repr__(self):
         return f"Application({self.e1!r}, {self.e2!r})"
 
@@ -136,34 +135,33 @@ class _Application:
             e2 = f"({e2})"
         return f"{e1} {e2}"
 
-    def __eq__(self, other):
-        if isinstance(other, _Application):
-            return self.e1 == other.e1 and self.e2 == other.e2
-        else:
-            return NotImplemented
-
-    def __hash__(self):
-        return hash((type(self), self.e1, self.e2))
-
 
 class Application(_Application, AST):
+    __slots__ = ()
+
     def __init__(self, e1: AST, e2: AST) -> None:
         self.e1 = e1
         self.e2 = e2
+        self._hash = structural_hash((Application, e1, e2))
 
     def translate(self) -> ILC:
         return ApplicationLC(self.e1.translate(), self.e2.translate())
 
 
 class ApplicationLC(_Application, ILC):
+    __slots__ = ()
+
     def __init__(self, e1: ILC, e2: ILC) -> None:
         self.e1 = e1
         self.e2 = e2
+        self._hash = structural_hash((ApplicationLC, e1, e2))
 
 
 # We assume (as the Book does) that there are no "translation" errors; i.e
 # that you haven't put a Let where you needed a Letrec.
-class _LetExpr:
+class _LetExpr(Node):
+    __slots__ = ("bindings", "localenv", "body")
+
     def __init__(self, bindings: Mapping[str, Any], body, localenv: TypeEnvironment = None) -> None:
         # Sort by names (in a _LetExpr names can't be repeated, repetition for
         # pattern-matching should be translated to a lambda using the MATCH
@@ -171,19 +169,19 @@ class _LetExpr:
         self.bindings: Sequence[Tuple[str, Any]] = tuple(sorted(bindings.items(), key=fst))
         self.localenv = localenv or {}  # type: TypeEnvironment
         self.body = body
+        # The local environment is a dict; hash its items instead.
+        self._hash = structural_hash((
+            type(self),
+            self.bindings,
+            frozenset(self.localenv.items()),
+            body,
+        ))
 
-    def __eq__(self, other):
-        if isinstance(other, type(self)):
-            return (
-                self.bindings == other.bindings
-                and self.localenv == other.localenv
-                and self.body == self.body
-            )
-        else:
-            return NotImplemented
+    def _values(self):
+        return (self.bindings, self.body, self.localenv)
 
-    def __hash__(self):
-        return hash((type(self), self.keys(), self.values(), self.localenv, self.body))
+    def __reduce__(self):
+        return type(self), (dict(self.bindings), self.body, self.localenv)
 
     def keys(self) -> Iterator[str]:
         return (k for k, _ in self.bindings)
@@ -201,6 +199,8 @@ class _Let(_LetExpr):
 
     """
 
+    __slots__ = ()
+
     def __repr__(self):
         return f"Let({self.bindings!r}, {self.body!r})"
 
@@ -212,11 +212,15 @@ class _Letrec(_LetExpr):
 
     """
 
+    __slots__ = ()
+
     def __repr__(self):
         return f"Letrec({self.bindings!r}, {self.body!r})"
 
 
 class Let(_Let, AST):
+    __slots__ = ()
+
     bindings: Sequence[Tuple[str, AST]]
     body: AST
 
@@ -233,6 +237,8 @@ class Let(_Let, AST):
 
 
 class LetLC(_Let, ILC):
+    __slots__ = ()
+
     bindings: Sequence[Tuple[str, ILC]]
     body: ILC
 
@@ -243,6 +249,8 @@ class LetLC(_Let, ILC):
 
 
 class Letrec(_Letrec, AST):
+    __slots__ = ()
+
     bindings: Sequence[Tuple[str, AST]]
     body: AST
 
@@ -259,6 +267,8 @@ class Letrec(_Letrec, AST):
 
 
 class LetrecLC(_Letrec, ILC):
+    __slots__ = ()
+
     bindings: Sequence[Tuple[str, ILC]]
     body: ILC
 
@@ -313,92 +323,150 @@ def find_free_names(expr: AST, *, exclude: Sequence[str] = None) -> List[Symboli
        >>> set(find_free_names(parse(program).compile(), exclude=()))  # doctest: +LITERAL_EVAL
        {'+', ':NO_MATCH_ERROR:', ':OR:'}
 
+    The names are those counted by `count_free_names`:func:.
+
     '''
-    from xotl.fl.ast.pattern import ConcreteLet, Equation
-    from xotl.fl.match import MATCH_OPERATOR, NO_MATCH_ERROR, Extract, Match, MatchLiteral
+    from xotl.fl.match import MATCH_OPERATOR, NO_MATCH_ERROR
 
-    POPFRAME = None  # remove a binding from the 'stack'
-    result: List[Symbolic] = []
     if exclude is None:
-        bindings: Deque[Symbolic] = deque([MATCH_OPERATOR.name, NO_MATCH_ERROR.name])
-    else:
-        bindings = deque([])
-    nodes: Deque[Optional[AST]] = deque([expr])
-    while nodes:
-        node = nodes.pop()
-        if node is POPFRAME:
-            bindings.pop()
-        elif isinstance(node, Identifier):
-            if node.name not in bindings:
-                if isinstance(node.name, str):
-                    result.append(node.name)
-                else:
-                    assert isinstance(node.name, (Match, Extract, MatchLiteral))
-        elif isinstance(node, Literal):
-            if isinstance(node.annotation, AST):
-                nodes.append(node)
-        elif isinstance(node, Application):
-            nodes.extend([node.e1, node.e2])
-        elif isinstance(node, Lambda):
-            bindings.append(node.varname)
-            nodes.append(POPFRAME)
-            nodes.append(node.body)
-        elif isinstance(node, _LetExpr):
-            # This is tricky; the bindings can be used recursively in the
-            # bodies of a letrec:
-            #
-            #    letrec f1 = ....f1 ... f2 ....
-            #           f2 = ... f1 ... f2 ....
-            #           ....
-            #    in ... f1 ... f2 ...
-            #
-            # So we must make all the names in the bindings bound and then
-            # look at all the definitions.
-            #
-            # We push several POPFRAME to account for that.
-            bindings.extend(node.keys())
-            nodes.extend(POPFRAME for _ in node.keys())
-            nodes.extend(node.values())
-            nodes.append(node.body)
-        elif isinstance(node, ConcreteLet):
-            # This is much like the _LetExpr above; but patterns may bind more
-            # names; but for a single equation.
-            #
-            # In the following (ill-programmed) expression the 'xs' is bound
-            # in the first equation, but free in the last.  However, 'tail' is
-            # bound in the last equation.  The name 'y' is free in the body.
-            #
-            #    let tail  x:xs = xs
-            #        tail2 y:ys = tail xs
-            #    in (tail, tail2, y)
-            #
-            # The patterns of each equation only bind variables in the RHS of
-            # the same equation.  So we cannot accumulate the nodes as in the
-            # rest of the algorithm and we chose a recursive one:
-            names = node.value_definitions.keys()
-            for equations in node.value_definitions.values():
-                for equation in equations:
-                    args = tuple(equation.bindings)
-                    fnames = find_free_names(equation.body, exclude=exclude)
-                    result.extend(
-                        name
-                        for name in fnames
-                        if name not in args
-                        if name not in bindings
-                        if name not in names
-                    )
-            bindings.extend(names)
-            nodes.extend(POPFRAME for _ in names)
-            nodes.append(node.body)
-        elif isinstance(node, Equation):
-            # We don't normally enter this case but while doing dependency
-            # analysis of the equations; we need to know the free variables of
-            # each equation separately.
-            args = tuple(node.bindings)
-            fnames = find_free_names(node.body, exclude=exclude)
-            result.extend(name for name in fnames if name not in args if name not in bindings)
+        exclude = (MATCH_OPERATOR.name, NO_MATCH_ERROR.name)
+    return [
+        name
+        for name, count in count_free_names(expr).items()
+        if name not in exclude
+        for _ in range(count)
+    ]
+
+
+_NO_NAMES: Dict[Symbolic, int] = {}
+
+
+def count_free_names(expr: AST) -> Mapping[Symbolic, int]:
+    r"""Return the names free in `expr` and the number of their occurrences.
+
+    Example:
+
+      >>> dict(count_free_names(parse(r'\x -> f x y y')))
+      {'f': 1, 'y': 2}
+
+    The tree is visited once, bottom-up.  The counts of the equations and
+    let/where expressions are kept in them and reused afterwards (the mapping
+    returned is read-only); those are the roots of the dependency analysis
+    of programs and local definitions.  Other nodes keep nothing: the counts
+    of their children are merged into the largest one.
+
+    Unlike `find_free_names`:func:, special identifiers are not excluded.
+
+    """
+    from xotl.fl.ast.pattern import ConcreteLet, Equation
+
+    # A node is pushed twice: first to push its children (unless its names
+    # are kept), and then (with the number of its children and the names it
+    # binds) to count its names from theirs.  The counts of the children are
+    # on top of `results`, each with a flag telling whether it can be
+    # changed (i.e. it's not kept by a node).
+    results: List[Tuple[Dict[Symbolic, int], bool]] = []
+    pending: List[Tuple[Any, Any]] = [(expr, None)]
+    pop, push = pending.pop, pending.append
+    while pending:
+        node, parts = pop()
+        if parts is None:
+            kept = getattr(node, "_free_names", None)
+            if kept is not None:
+                results.append((kept, False))
+                continue
+            elif isinstance(node, Identifier):
+                name = node.name
+                results.append(({name: 1}, True) if isinstance(name, str) else (_NO_NAMES, False))
+                continue
+            elif isinstance(node, Application):
+                children: Sequence[AST] = (node.e1, node.e2)
+                bound = ()
+            elif isinstance(node, Lambda):
+                children = (node.body,)
+                bound = (node.varname,)
+            elif isinstance(node, Literal):
+                annotation = node.annotation
+                if not isinstance(annotation, AST):
+                    results.append((_NO_NAMES, False))
+                    continue
+                children = (annotation,)
+                bound = ()
+            elif isinstance(node, _LetExpr):
+                # This is tricky; the bindings can be used recursively in the
+                # bodies of a letrec:
+                #
+                #    letrec f1 = ....f1 ... f2 ....
+                #           f2 = ... f1 ... f2 ....
+                #           ....
+                #    in ... f1 ... f2 ...
+                #
+                # So the names in the bindings are bound in all the
+                # definitions and the body.
+                children = (*node.values(), node.body)
+                bound = tuple(node.keys())
+            elif isinstance(node, ConcreteLet):
+                # This is much like the _LetExpr above; but patterns may bind
+                # more names; but for a single equation.
+                #
+                # In the following (ill-programmed) expression the 'xs' is
+                # bound in the first equation, but free in the last.  However,
+                # 'tail' is bound in the last equation.  The name 'y' is free
+                # in the body.
+                #
+                #    let tail  x:xs = xs
+                #        tail2 y:ys = tail xs
+                #    in (tail, tail2, y)
+                #
+                # The patterns of each equation only bind variables in the RHS
+                # of the same equation; so the equations are the children.
+                definitions = node.value_definitions
+                children = (*(eq for eqs in definitions.values() for eq in eqs), node.body)
+                bound = tuple(definitions)
+            elif isinstance(node, Equation):
+                # We enter this case for the equations of a ConcreteLet, and
+                # while doing dependency analysis of the equations; we need
+                # to know the free variables of each equation separately.
+                children = (node.body,)
+                bound = tuple(node.bindings)
+            else:
+                assert False, f"Unknown AST node: {node!r}"
+            push((node, (len(children), bound)))
+            pending.extend((child, None) for child in children)
         else:
-            assert False, f"Unknown AST node: {node!r}"
+            count, bound = parts
+            names = _merge_names(results[-count:], bound)
+            del results[-count:]
+            if isinstance(node, (Equation, ConcreteLet)):
+                node._free_names = names
+                results.append((names, False))
+            else:
+                results.append((names, True))
+    names, _ = results.pop()
+    return MappingProxyType(names)
+
+
+def _merge_names(
+    children: Sequence[Tuple[Dict[Symbolic, int], bool]], bound: Sequence[Symbolic]
+) -> Dict[Symbolic, int]:
+    # Return the names free in the children, but not bound by their parent.
+    # Only strings are free names (a lambda may bind a pattern).  The counts
+    # of the other children are added to the largest one, which is copied
+    # unless it can be changed.  So, a long chain of nodes costs time
+    # proportional to its length (not to its square).
+    largest = max(range(len(children)), key=lambda index: len(children[index][0]))
+    result, owned = children[largest]
+    for index, (names, _) in enumerate(children):
+        if index != largest and names:
+            if not owned:
+                result, owned = result.copy(), True
+            for name, count in names.items():
+                result[name] = result.get(name, 0) + count
+    for name in bound:
+        if isinstance(name, str) and name in result:
+            if not owned:
+                result, owned = result.copy(), True
+            del result[name]
     return result
 
 
@@ -413,34 +481,72 @@ def replace_free_occurrences(self: AST, substitutions: Mapping[Symbolic, str]) -
     """
     from xotl.fl.match import MATCH_OPERATOR, NO_MATCH_ERROR
 
-    def replace(expr: AST, bindings: FrozenSet[Symbolic]):
+    # We visit the nodes with an explicit stack.  A node is pushed twice:
+    # first to push its children, and then (when `built` is True) to build
+    # it from the replaced children, which are on top of `results`.
+    # Subtrees where nothing is replaced are kept as they are.
+    results: List[AST] = []
+    stack: List[Tuple[AST, FrozenSet[Symbolic], bool]] = [
+        (self, frozenset({NO_MATCH_ERROR.name, MATCH_OPERATOR.name}), False)
+    ]
+    while stack:
+        expr, bindings, built = stack.pop()
         if isinstance(expr, Identifier):
+            replacement = None
             if expr.name not in bindings:
                 replacement = substitutions.get(expr.name, None)
-                if replacement is not None:
-                    return Identifier(replacement)
-            return expr
+            results.append(expr if replacement is None else Identifier(replacement))
         elif isinstance(expr, Literal):
-            if isinstance(expr.annotation, AST):
-                return Literal(expr.value, expr.type_, replace(expr.annotation, bindings))
+            if not isinstance(expr.annotation, AST):
+                results.append(expr)
+            elif built:
+                annotation = results.pop()
+                if annotation is not expr.annotation:
+                    expr = Literal(expr.value, expr.type_, annotation)
+                results.append(expr)
             else:
-                return expr
+                stack.append((expr, bindings, True))
+                stack.append((expr.annotation, bindings, False))
         elif isinstance(expr, Application):
-            return Application(replace(expr.e1, bindings), replace(expr.e2, bindings))
+            if built:
+                e2 = results.pop()
+                e1 = results.pop()
+                if e1 is not expr.e1 or e2 is not expr.e2:
+                    expr = Application(e1, e2)
+                results.append(expr)
+            else:
+                stack.append((expr, bindings, True))
+                stack.append((expr.e2, bindings, False))
+                stack.append((expr.e1, bindings, False))
         elif isinstance(expr, Lambda):
-            return Lambda(expr.varname, replace(expr.body, bindings | {expr.varname}))
+            if built:
+                body = results.pop()
+                if body is not expr.body:
+                    expr = Lambda(expr.varname, body)
+                results.append(expr)
+            else:
+                stack.append((expr, bindings, True))
+                stack.append((expr.body, bindings | {expr.varname}, False))
         elif isinstance(expr, _LetExpr):
-            newvars = {name for name, _ in expr.bindings}
-            newbindings = bindings | newvars
-            return type(expr)(
-                {name: replace(dfn, newbindings) for name, dfn in expr.bindings},
-                replace(expr.body, newbindings),
-                expr.localenv,
-            )
+            if built:
+                body = results.pop()
+                count = len(expr.bindings)
+                dfns = results[len(results) - count :]
+                del results[len(results) - count :]
+                if body is not expr.body or any(
+                    dfn is not old for dfn, (_, old) in zip(dfns, expr.bindings)
+                ):
+                    names = [name for name, _ in expr.bindings]
+                    expr = type(expr)(dict(zip(names, dfns)), body, expr.localenv)
+                results.append(expr)
+            else:
+                newbindings = bindings | {name for name, _ in expr.bindings}
+                stack.append((expr, bindings, True))
+                stack.append((expr.body, newbindings, False))
+                stack.extend((dfn, newbindings, False) for _, dfn in reversed(expr.bindings))
         else:
             assert False
-
-    return replace(self, frozenset({NO_MATCH_ERROR.name, MATCH_OPERATOR.name}))
+    return results.pop()
 
 
 def build_tuple(*exprs):
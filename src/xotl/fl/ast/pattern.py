@@ -15,8 +15,8 @@ from typing import Type as Class
 from typing import Union
 
 from xotl.fl.ast.adt import DataCons
-from xotl.fl.ast.base import AST, ILC
-from xotl.fl.ast.expressions import Let, Letrec, Literal, _LetExpr, find_free_names
+from xotl.fl.ast.base import AST, ILC, Node, structural_hash
+from xotl.fl.ast.expressions import Let, Letrec, Literal, _LetExpr, count_free_names
 from xotl.fl.ast.types import TypeEnvironment
 from xotl.tools.fp.tools import fst, snd
 from xotl.tools.objects import memoized_property
@@ -47,12 +47,18 @@ UnnamedPattern = Union[str, Literal, "ConsPattern"]
 Pattern = Union[str, Literal, "ConsPattern", "NamedPattern"]
 
 
-class ConsPattern(AST):
+class ConsPattern(Node, AST):
     """The syntactical notion of a pattern."""
 
+    __slots__ = ("cons", "params")
+
     def __init__(self, cons: str, params: Sequence[Pattern] = None) -> None:
         self.cons: str = cons
         self.params: Tuple[Pattern, ...] = tuple(params or [])
+        self._hash = structural_hash((ConsPattern, cons, self.params))
+
+    def _values(self):
+        return (self.cons, self.params)
 
     def __repr__(self):
         return f"<pattern {self.cons!r} {self.params!r}>"
@@ -75,15 +81,6 @@ class ConsPattern(AST):
 
         return " ".join(map(_str, self.params))
 
-    def __eq__(self, other):
-        if isinstance(other, ConsPattern):
-            return self.cons == other.cons and self.params == other.params
-        else:
-            return NotImplemented
-
-    def __hash__(self):
-        return hash((ConsPattern, self.cons, self.params))
-
     @property
     def bindings(self) -> Iterator[str]:
         for param in self.params:
@@ -95,10 +92,16 @@ class ConsPattern(AST):
                 yield from param.bindings
 
 
-class NamedPattern(AST):
+class NamedPattern(Node, AST):
+    __slots__ = ("name", "pattern")
+
     def __init__(self, name: str, pattern: UnnamedPattern) -> None:
         self.name = name
         self.pattern = pattern
+        self._hash = structural_hash((NamedPattern, name, pattern))
+
+    def _values(self):
+        return (self.name, self.pattern)
 
     def __str__(self):
         return f"{self.name} @ {self.pattern}"
@@ -115,14 +118,21 @@ class NamedPattern(AST):
             yield from pattern.bindings
 
 
-class Equation(AST):
+class Equation(Node, AST):
     """The syntactical notion of an equation."""
 
+    # `_free_names` is set by `xotl.fl.ast.expressions.count_free_names`.
+    __slots__ = ("name", "patterns", "body", "_free_names")
+
     def __init__(self, name: str, patterns: Sequence[Pattern], body: AST) -> None:
         self.name = name
         self.patterns: Tuple[Pattern, ...] = tuple(patterns or [])
         self.body = body
         self._check_non_repeated_vars()
+        self._hash = structural_hash((Equation, name, self.patterns, body))
+
+    def _values(self):
+        return (self.name, self.patterns, self.body)
 
     def _check_non_repeated_vars(self):
         names = list(n for n in self.bindings)
@@ -143,19 +153,6 @@ class Equation(AST):
         else:
             return f"<equation {self.name!s} = {self.body!r}>"
 
-    def __eq__(self, other):
-        if isinstance(other, Equation):
-            return (
-                self.name == other.name
-                and self.patterns == other.patterns
-                and self.body == other.body
-            )
-        else:
-            return NotImplemented
-
-    def __hash__(self):
-        return hash((Equation, self.name, self.patterns, self.body))
-
     @property
     def bindings(self) -> Iterator[str]:
         """The names bound in the arguments"""
@@ -224,7 +221,7 @@ class ConcreteLet(AST):
            led id = \x -> ...
 
         """
-        from xotl.fl.graphs import Graph
+        from xotl.fl.graphs import Condensation, Graph
         from xotl.fl.match import FunctionDefinition
 
         # Type checking letrecs don't generalize definitions, we could end up
@@ -235,46 +232,27 @@ class ConcreteLet(AST):
         # the ContreteLet definition and rewrite the definition into several
         # nested Let/Letrec.
         #
-        # We create a graph where nodes are (essentially) the names defined in
-        # the ConcreteLet and there's an edge from name A to name B, if B is
-        # used free in the RHS of A.
-        #
-        nodes = {}
-        for name, equations in self.value_definitions.items():
-            nodes[name] = _LetGraphNode(name, tuple(equations))
-        graph: Graph[_LetGraphNode] = Graph()
-        for node in nodes.values():
-            graph.add_node(node)
-            for dependency in node.dependencies:
-                if dependency in nodes:
-                    graph.add_edge(node, nodes[dependency])
-        #
-        # After the graph is created; we compute the Strongly Connected
-        # Components (SCC).  Each SCC will be a bundle of mutually-recursive
-        # nodes.
+        # We create a graph where nodes are the names defined in the
+        # ConcreteLet and there's an edge from name A to name B, if B is used
+        # free in the RHS of A.
         #
-        components = []
-        components_index = {}
-        for scc in graph.get_sccs():
-            component = _ComponentNode(tuple(scc))
-            for name in component.names:
-                components_index[name] = component
-            components.append(component)
-        del nodes, graph
+        definitions = self.value_definitions
+        graph: Graph[str] = Graph()
+        for name, equations in definitions.items():
+            graph.add_node(name)
+            graph.add_many(
+                name,
+                {dep for eq in equations for dep in count_free_names(eq) if dep in definitions},
+            )
         #
-        # Each SCC has the names that must be kept together.  But a node may
-        # depend on another one in a different SCC, so there's still some
-        # order we need to respect: Construct another graph, where the nodes
-        # are the SCCs and there's an edge from a node C to D if any of names
-        # in C depends on any of the names in D (this graph is guaranteed to
-        # have no cycles, aka a DAG).
+        # Each Strongly Connected Component (SCC) of the graph is a bundle of
+        # mutually-recursive names, that must be kept together.  But a name
+        # may depend on another one in a different SCC, so there's still some
+        # order we need to respect: the condensation of the graph has the
+        # DAG of the SCCs, with an edge from C to D if any of names in C
+        # depends on any of the names in D.
         #
-        dag: Graph[_ComponentNode] = Graph()
-        for component in components:
-            dag.add_node(component)
-            for dep in component.other_dependencies:
-                if dep in components_index:
-                    dag.add_edge(component, components_index[dep])
+        condensation = Condensation(graph)
         #
         # Construct several nested Let/Letrec nodes following the reversed
         # topological sort of the DAG.  But we collapse the components with
@@ -283,80 +261,23 @@ class ConcreteLet(AST):
         #
         body: _LetExpr = self.body  # type: ignore
         for score, collapsable in groupby(
-            dag.get_topological_order(reverse=True, with_score=True), key=snd
+            condensation.get_topological_order(reverse=True, with_score=True), key=snd
         ):
-            component = _ComponentNode.union(*(comp for comp, _ in collapsable))
-            defs = {node.name: FunctionDefinition(node.equations) for node in component.nodes}
-            compiled = {name: dfn.compile() for name, dfn in defs.items()}
-            if component.recursive:
+            components = [component for component, _ in collapsable]
+            names = frozenset().union(*components)
+            compiled = {name: FunctionDefinition(definitions[name]).compile() for name in names}
+            if any(condensation.recursive(component) for component in components):
                 klass: Class[_LetExpr] = Letrec
             else:
                 klass = Let
             body = klass(
                 compiled,
                 body,
-                {k: v for k, v in self.local_environment.items() if k in component.names},
+                {k: v for k, v in self.local_environment.items() if k in names},
             )
         return body
 
 
-@dataclass(unsafe_hash=True)
-class _LetGraphNode:
-    name: str
-    equations: Sequence[Equation]
-
-    @property
-    def dependencies(self):
-        from functools import reduce
-        from operator import or_
-
-        return reduce(or_, (set(find_free_names(eq)) for eq in self.equations), set())
-
-
-@dataclass(unsafe_hash=True)
-class _ComponentNode:
-    nodes: Sequence[_LetGraphNode]
-
-    @property
-    def names(self):
-        return {node.name for node in self.nodes}
-
-    @property
-    def dependencies(self):
-        from functools import reduce
-        from operator import or_
-
-        return reduce(or_, (node.dependencies for node in self.nodes), set())
-
-    @property
-    def other_dependencies(self):
-        names = self.names
-        return {dep for dep in self.dependencies if dep not in names}
-
-    @property
-    def recursive(self):
-        deps = self.dependencies
-        return any(name in deps for name in self.names)
-
-    def __eq__(self, other):
-        if isinstance(other, _ComponentNode):
-            return self.names == other.names
-        else:
-            return NotImplemented
-
-    def __or__(self, other):
-        if isinstance(other, _ComponentNode):
-            return _ComponentNode(tuple(self.nodes) + tuple(other.nodes))
-        else:
-            return NotImplemented
-
-    def union(self, *others) -> "_ComponentNode":
-        from functools import reduce
-        from operator import or_
-
-        return reduce(or_, others, self)
-
-
 class Case(ILC):
     """The case expression.
 
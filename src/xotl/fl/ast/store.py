@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------
+# Copyright (c) Merchise Autrement [~º/~] and Contributors
+# All rights reserved.
+#
+# This is free software; you can do what the LICENCE file allows you to.
+#
+"""A global store of hash-consed expressions.
+
+Types are always hash-consed (see `xotl.fl.ast.types`:mod:), expressions
+only when you ask for it: `intern`:func: returns a tree whose subtrees are
+the ones kept in the store; so structurally equal subtrees (of the same or
+of different programs) are a single object.  Programs with many rules that
+share terms take less memory, equal subtrees compare by identity, and the
+results cached in the nodes (e.g. their hash) are computed once per unique
+subtree.
+
+The store keeps only living nodes: an entry goes away with the last
+reference to its node.
+
+Example:
+
+   >>> from xotl.fl import parse
+   >>> first, second = (intern(dfn) for dfn in parse('f = g 1 (h 2)\\ng = h 2'))
+   >>> first.body.e2 is second.body
+   True
+
+"""
+
+from typing import Any, Dict, List, Tuple, TypeVar
+from weakref import WeakValueDictionary
+
+from xotl.fl.ast.base import Node
+from xotl.fl.ast.pattern import ConcreteLet
+
+T = TypeVar("T")
+
+# The store of the interned nodes.  Keys are the class of the node, the
+# types of the arguments of its constructor (so that the literals 1 and 1.0
+# are kept apart) and the arguments themselves, with the (interned) children
+# replaced by their ids: structural equality would take 'f 1' for 'f 1.0'.
+# The ids are valid while the entry lives, since the node keeps its children.
+_interned: "WeakValueDictionary[Any, Node]" = WeakValueDictionary()
+
+
+def intern(tree: T) -> T:
+    """Return `tree` built from the nodes in the store.
+
+    Nodes missing in the store are created and stored.  Besides nodes, the
+    `tree` may be any definition of a program: definitions without
+    expressions (type annotations, data types, etc.) are returned unchanged;
+    and the equations and body of `~xotl.fl.ast.pattern.ConcreteLet`:class:
+    objects are interned, but not the objects themselves.  Interning lazy
+    equations parses them.
+
+    The tree is visited with an explicit stack, so deep trees don't hit the
+    recursion limit.
+
+    """
+    if not isinstance(tree, (Node, ConcreteLet)):
+        return tree
+    done: Dict[int, Any] = {}
+    pending: List[Tuple[Any, Any]] = [(tree, None)]
+    while pending:
+        node, parts = pending.pop()
+        if parts is None:
+            if id(node) in done:
+                continue
+            parts = _constructor(node)
+            children = [child for child in _children(parts[1]) if id(child) not in done]
+            if children:
+                pending.append((node, parts))
+                pending.extend((child, None) for child in children)
+                continue
+        cls, args = parts
+        args = tuple(_replace(arg, done) for arg in args)
+        if cls is ConcreteLet:
+            done[id(node)] = ConcreteLet(*args)
+        else:
+            done[id(node)] = _lookup(cls, args)
+    return done[id(tree)]
+
+
+def _constructor(node) -> Tuple[Any, Tuple[Any, ...]]:
+    if isinstance(node, Node):
+        return node.__reduce__()  # type: ignore
+    else:
+        return ConcreteLet, (node.definitions, node.body)
+
+
+def _children(value):
+    # Yield the nodes in the arguments of a constructor.
+    pending = [value]
+    while pending:
+        value = pending.pop()
+        if isinstance(value, (Node, ConcreteLet)):
+            yield value
+        elif isinstance(value, tuple):
+            pending.extend(value)
+        elif isinstance(value, dict):
+            pending.extend(value.values())
+
+
+def _replace(value, done: Dict[int, Any]):
+    # Return `value` with the nodes replaced by their interned versions.
+    if isinstance(value, (Node, ConcreteLet)):
+        return done[id(value)]
+    elif isinstance(value, tuple):
+        return tuple(_replace(item, done) for item in value)
+    elif isinstance(value, dict):
+        return {key: _replace(item, done) for key, item in value.items()}
+    else:
+        return value
+
+
+def _lookup(cls, args: Tuple[Any, ...]) -> Node:
+    # Return the stored node built by `cls(*args)`, storing it if needed.
+    try:
+        key = (cls, tuple(type(arg) for arg in args), *(_key(arg) for arg in args))
+        result = _interned.get(key)
+    except TypeError:
+        # Unhashable parts; e.g. an equation with a 'where' clause.
+        return cls(*args)
+    if result is None:
+        result = _interned.setdefault(key, cls(*args))
+    return result
+
+
+def _key(value):
+    if isinstance(value, Node):
+        return id(value)
+    elif isinstance(value, tuple):
+        return tuple(_key(item) for item in value)
+    elif isinstance(value, dict):
+        return frozenset((key, _key(item)) for key, item in value.items())
+    else:
+        return value
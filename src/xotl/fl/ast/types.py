@@ -14,18 +14,40 @@ Implementation of Functional Programming Languages'.
 .. note:: We should see if the types in stdlib's typing module are
           appropriate.
 
+Type variables, type constructors and type schemes are immutable and
+hash-consed: creating a type structurally equal to a living one returns the
+same object.  Each of them computes its hash, its size (`len`) and its set
+of free type variables (`ftv`) once, when it's created.
+
 """
 
 from collections import deque
 from dataclasses import dataclass
-from itertools import zip_longest
-from typing import Deque, Iterable, List, Mapping, Sequence, Set, Union
+from typing import Any, Deque, FrozenSet, Iterable, List, Mapping, Sequence, Set, Union
+from weakref import WeakValueDictionary
 
 from xotl.fl.ast.base import Dual
 from xotl.fl.meta import Symbolic
 
+# The store of the living types.  Keys start with the class of the type, so
+# that instances of subclasses (which only differ in how they are printed)
+# are kept apart; and have the (interned) subtypes replaced by their ids:
+# structural equality would take 'Maybe [a]' for 'Maybe ([] a)'.  The ids are
+# valid while the entry lives, since the type keeps its subtypes.
+_interned: "WeakValueDictionary[Any, Type]" = WeakValueDictionary()
+
+
+def _intern(key, build):
+    """Return the living type for `key`, or the one created by `build`."""
+    result = _interned.get(key)
+    if result is None:
+        result = _interned.setdefault(key, build())
+    return result
+
 
 class Type(Dual):
+    __slots__ = ()
+
     @classmethod
     def from_str(cls, source: str) -> "Type":
         """Parse a single type expression.
@@ -63,12 +85,28 @@ class Type(Dual):
 class TypeVariable(Type):
     """A type variable, which may stand for any type."""
 
-    def __init__(self, name: str, *, check=True) -> None:
+    __slots__ = ("name", "ftv", "_hash", "__weakref__")
+
+    name: str
+    ftv: FrozenSet[str]
+
+    def __new__(cls, name: str, *, check=True) -> "TypeVariable":
         # `check` is only here to avoid the check when generating internal
         # names (which start with a dot)
-        self.name = name
         assert not check or name.isidentifier()
 
+        def build():
+            self = object.__new__(cls)
+            self.name = name
+            self.ftv = frozenset([name])
+            self._hash = hash((TypeVariable, name))
+            return self
+
+        return _intern((cls, name), build)
+
+    def __reduce__(self):
+        return _typevar, (self.name,)
+
     def __str__(self):
         return f"{self.name}"
 
@@ -76,13 +114,15 @@ class TypeVariable(Type):
         return f"TypeVariable({self.name!r})"
 
     def __eq__(self, other):
-        if isinstance(other, TypeVariable):
+        if self is other:
+            return True
+        elif isinstance(other, TypeVariable):
             return self.name == other.name
         else:
             return NotImplemented
 
     def __hash__(self):
-        return hash((TypeVariable, self.name))
+        return self._hash
 
     def __len__(self):
         return 0  # So that 'Int' has a bigger size than 'a'.
@@ -94,13 +134,34 @@ class TypeVariable(Type):
 class TypeCons(Type):
     """The syntax for a type constructor expression."""
 
-    def __init__(self, constructor: str, subtypes: Iterable[Type] = None, *, binary=False) -> None:
-        assert not subtypes or all(
-            isinstance(t, Type) for t in subtypes
-        ), f"Invalid subtypes: {subtypes!r}"
-        self.cons = constructor
-        self.subtypes: Sequence[Type] = tuple(subtypes or [])
-        self.binary = binary
+    __slots__ = ("cons", "subtypes", "binary", "ftv", "_hash", "_size", "__weakref__")
+
+    cons: str
+    subtypes: Sequence[Type]
+    binary: bool
+    ftv: FrozenSet[str]
+
+    def __new__(cls, constructor: str, subtypes: Iterable[Type] = None, *, binary=False):
+        return cls._make(constructor, tuple(subtypes or ()), binary)
+
+    @classmethod
+    def _make(cls, constructor: str, subtypes: Sequence[Type], binary: bool) -> "TypeCons":
+        assert all(isinstance(t, Type) for t in subtypes), f"Invalid subtypes: {subtypes!r}"
+
+        def build():
+            self = object.__new__(cls)
+            self.cons = constructor
+            self.subtypes = subtypes
+            self.binary = binary
+            self.ftv = _union_ftv(subtypes)
+            self._hash = hash((TypeCons, constructor, subtypes))
+            self._size = 1 + sum(len(st) for st in subtypes)
+            return self
+
+        return _intern((cls, constructor, tuple(map(id, subtypes)), binary), build)
+
+    def __reduce__(self):
+        return _typecons, (self.cons, self.subtypes, self.binary)
 
     def __str__(self):
         def wrap(s):
@@ -118,18 +179,24 @@ class TypeCons(Type):
         return f"TypeCons({self.cons!r}, {self.subtypes!r})"
 
     def __eq__(self, other):
-        if isinstance(other, TypeCons):
-            return self.cons == other.cons and all(
-                t1 == t2 for t1, t2 in zip_longest(self.subtypes, other.subtypes)
+        # Equal types of the same class are the same object.  Otherwise (e.g
+        # a TupleTypeCons and a TypeCons) compare them structurally.
+        if self is other:
+            return True
+        elif isinstance(other, TypeCons):
+            return (
+                self._hash == other._hash
+                and self.cons == other.cons
+                and self.subtypes == other.subtypes
             )
         else:
             return NotImplemented
 
     def __hash__(self):
-        return hash((TypeCons, self.cons, self.subtypes))
+        return self._hash
 
     def __len__(self):
-        return 1 + sum(len(st) for st in self.subtypes)
+        return self._size
 
 
 @dataclass
@@ -155,24 +222,51 @@ class TypeScheme(Type):
 
     """
 
+    __slots__ = ("generics", "type_", "ftv", "_hash", "__weakref__")
+
+    generics: Sequence[str]
+    type_: Type
+    ftv: FrozenSet[str]
+
     # I choose the word 'generic' instead of schematic (and thus non-generic
     # instead of unknown), because that's probably more widespread.
-    def __init__(self, generics: Sequence[str], t: Type) -> None:
-        self.generics = tuple(generics or [])
+    def __new__(cls, generics: Sequence[str], t: Type) -> "TypeScheme":
+        generics = tuple(generics or [])
+        return _intern((cls, generics, id(t)), lambda: cls._build(generics, t))
+
+    @classmethod
+    def _build(cls, generics: Sequence[str], t: Type) -> "TypeScheme":
+        self = object.__new__(cls)
+        self.generics = generics
         self.type_ = t
+        self.ftv = t.ftv.difference(generics)
+        self._hash = hash((TypeScheme, generics, t))
+        return self
+
+    def __reduce__(self):
+        return TypeScheme, (self.generics, self.type_)
 
     @property
-    def nongenerics(self) -> List[str]:
-        return [tv.name for tv in find_tvars(self.type_) if tv.name not in self.generics]
+    def nongenerics(self) -> FrozenSet[str]:
+        return self.ftv
 
     def __eq__(self, other):
-        if isinstance(other, TypeScheme):
-            return self.generics == other.generics and self.type_ == other.type_
+        if self is other:
+            return True
+        elif isinstance(other, TypeScheme):
+            return (
+                self._hash == other._hash
+                and self.generics == other.generics
+                and self.type_ == other.type_
+            )
         else:
             return NotImplemented
 
     def __hash__(self):
-        return hash((TypeScheme, self.generics, self.type_))
+        return self._hash
+
+    def __len__(self):
+        return len(self.type_)
 
     @property
     def names(self):
@@ -202,7 +296,7 @@ class TypeScheme(Type):
         if isinstance(type_, TypeScheme):
             return type_
         if generics is None:
-            generics = list(sorted(set(find_tvars_names(type_))))
+            generics = list(sorted(type_.ftv))
         else:
             generics = list(sorted(generics))
         return cls(generics, type_)
@@ -228,6 +322,10 @@ class TypeScheme(Type):
 class TypeRecord(Type):
     fields: Mapping[str, Type]
 
+    @property
+    def ftv(self) -> FrozenSet[str]:
+        return frozenset().union(*(t.ftv for t in self.fields.values()))
+
     def __str__(self):
         items = ", ".join(f"{name}: {type_!s}" for name, type_ in self.fields.items())
         return f"{{{items}}}"
@@ -240,17 +338,31 @@ class TypeRecord(Type):
 # We remove some of the complexity by disallowing unused constraints (e.g
 # you can't express 'forall a. Eq b => a -> a'.)
 class ConstrainedType(TypeScheme):
-    def __init__(
-        self, generics: Sequence[str], t: Type, constraints: Sequence[TypeConstraint]
-    ) -> None:
+    __slots__ = ("constraints",)
+
+    constraints: Sequence[TypeConstraint]
+
+    def __new__(  # type: ignore
+        cls, generics: Sequence[str], t: Type, constraints: Sequence[TypeConstraint]
+    ) -> "ConstrainedType":
         constraints = tuple(constraints or [])
         assert all(isinstance(c.type_, TypeVariable) for c in constraints)
         constrained = {c.type_.name for c in constraints if isinstance(c.type_, TypeVariable)}
-        names = set(tv.name for tv in find_tvars(t))
+        names = t.ftv
         if constrained - names:
             raise TypeError(f"Constraint not applied: {constrained - names} in {t}")
-        self.constraints = constraints
-        super().__init__(generics, t)
+        generics = tuple(generics or [])
+
+        def build():
+            self = cls._build(generics, t)
+            self.constraints = constraints
+            return self
+
+        key = (cls, generics, id(t), tuple((c.name, id(c.type_)) for c in constraints))
+        return _intern(key, build)
+
+    def __reduce__(self):
+        return ConstrainedType, (self.generics, self.type_, self.constraints)
 
     def __str__(self):
         constraints = ", ".join(map(str, self.constraints))
@@ -278,7 +390,9 @@ FunctionTypeCons = lambda a, b: TypeCons("->", [a, b], binary=True)
 #: Shortcut to create a tuple type from types `ts`.  The Unit type can be
 #: regarded as the tuple type without arguments.
 class TupleTypeCons(TypeCons):
-    def __init__(self, *ts: Type) -> None:
+    __slots__ = ()
+
+    def __new__(cls, *ts: Type) -> "TupleTypeCons":  # type: ignore
         if not ts:
             name = "Unit"
         else:
@@ -286,7 +400,10 @@ class TupleTypeCons(TypeCons):
                 name = "Singleton"
             else:
                 name = "," * (len(ts) - 1)
-        super().__init__(name, ts)
+        return cls._make(name, ts, False)  # type: ignore
+
+    def __reduce__(self):
+        return TupleTypeCons, tuple(self.subtypes)
 
     def __str__(self):
         ts = self.subtypes
@@ -301,14 +418,40 @@ class TupleTypeCons(TypeCons):
 
 
 class ListTypeCons(TypeCons):
-    def __init__(self, t: Type) -> None:
-        super().__init__("[]", [t])
+    __slots__ = ()
+
+    def __new__(cls, t: Type) -> "ListTypeCons":  # type: ignore
+        return cls._make("[]", (t,), False)  # type: ignore
+
+    def __reduce__(self):
+        return ListTypeCons, (self.subtypes[0],)
 
     def __str__(self):
         t = self.subtypes[0]
         return f"[{t!s}]"
 
 
+def _union_ftv(types: Iterable[Type]) -> FrozenSet[str]:
+    # Share the biggest set if it contains the others; this is the common
+    # case for (deep) function types and lists.
+    sets = [t.ftv for t in types if t.ftv]
+    if not sets:
+        return frozenset()
+    biggest = max(sets, key=len)
+    if all(s is biggest or s <= biggest for s in sets):
+        return biggest
+    else:
+        return biggest.union(*sets)
+
+
+def _typevar(name: str) -> TypeVariable:
+    return TypeVariable(name, check=False)
+
+
+def _typecons(cons: str, subtypes: Sequence[Type], binary: bool) -> TypeCons:
+    return TypeCons(cons, subtypes, binary=binary)
+
+
 def find_tvars(t: Type) -> List[TypeVariable]:
     """Get all type variables (possibly repeated) in type `t`.
 
@@ -9,6 +9,10 @@
 """The *type* objects of builtins types."""
 
 import re
+from collections.abc import Mapping, MutableMapping
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, List, Tuple
 
 from xotl.fl.ast.types import (  # We need to import here because the AST imports the builtins UnitType
     ListTypeCons,
@@ -17,6 +21,7 @@ from xotl.fl.ast.types import (  # We need to import here because the AST import
     TypeCons,
     TypeEnvironment,
     TypeScheme,
+    TypeVariable,
 )
 from xotl.tools.modules import moduleproperty
 
@@ -48,14 +53,21 @@ DateTimeIntervalType = TypeCons("DateTimeInterval")
 
 
 _gamma = None
+_builtins_base = None
 
 
 @moduleproperty
 def builtins_env(self) -> TypeEnvironment:
-    global _gamma
-    if _gamma is None:
-        _gamma = _load_builtin_typeenv()
-    return BuiltinEnvDict(_gamma)
+    return BuiltinEnvDict._from_base(_builtins_env())
+
+
+def _builtins_env() -> Mapping:
+    global _gamma, _builtins_base
+    if _builtins_base is None:
+        if _gamma is None:
+            _gamma = _load_builtin_typeenv()
+        _builtins_base = MappingProxyType({**_basic_env(), **_gamma})
+    return _builtins_base
 
 
 TUPLE_CONS = re.compile(r",+")
@@ -63,19 +75,16 @@ EXTRACT_FROM_PRODUCT = re.compile(r":extract:(?P<type>.*):::")
 EXTRACT_FROM_CONS = re.compile(r":extract:(?P<cons>[,\w]+)(:(?P<idx>\d+))?")
 
 
-class BuiltinEnvDict(dict):
-    """Type environment that contains type schemes for parser-available \
-    identifiers.
+_basic_base = None
 
-    """
 
-    def __init__(self, d=None, **kw):
+def _basic_env() -> Mapping:
+    global _basic_base
+    if _basic_base is None:
         from xotl.fl.ast.types import TypeScheme
         from xotl.fl.match import MATCH_OPERATOR, NO_MATCH_ERROR, Extract, Match
 
-        if not d:
-            d = {}
-        init = {
+        _basic_base = MappingProxyType({
             # These can't be parsed (yet) and are really builtin -- their
             # values cannot be directly expressed in the language, even
             # though isomorphic types can be expressed, i.e 'data List a =
@@ -89,67 +98,301 @@ class BuiltinEnvDict(dict):
             NO_MATCH_ERROR.name: TypeScheme.from_str("a"),
             # These are 'match' and 'extract' for lists pattern matching.
             Match("[]"): TypeScheme.from_str("[a] -> b -> b"),
-            Extract(":", 1): TypeScheme.from_str("[a] -> ([a] -> b) -> b"),
+            Extract(":", 1): TypeScheme.from_str("[a] -> (a -> b) -> b"),
             Extract(":", 2): TypeScheme.from_str("[a] -> ([a] -> b) -> b"),
             # Pattern matching requires 'extracting' the type from the Pattern
             # Cons.  These are dynamic and require knowledge from the locally
             # (program) defined types; we cannot provide the types here.
-        }
-        init.update(d)
-        super().__init__(init, **kw)
+        })
+    return _basic_base
+
+
+# Markers in the overlays of BuiltinEnvDict.
+_ABSENT = object()
+_DELETED = object()
+
+
+class BuiltinEnvDict(MutableMapping):
+    """Type environment that contains type schemes for parser-available \
+    identifiers.
+
+    The type schemes of the builtins are kept in a frozen *base* shared by
+    all instances, which is never copied.  The items given (or set later)
+    are kept in an *overlay*; so creating an environment costs only the
+    items given to it.  Lookups take at most two dict lookups.
+
+    An environment created from another `BuiltinEnvDict` shares its base and
+    copies its overlay.  Changes to an environment never affect others.
+
+    """
+
+    def __init__(self, d=None, **kw):
+        if isinstance(d, BuiltinEnvDict):
+            self._base = d._base
+            self._overlay = dict(d._overlay)
+        else:
+            self._base = _basic_env()
+            self._overlay = dict(d) if d else {}
+        if kw:
+            self._overlay.update(kw)
+
+    @classmethod
+    def _from_base(cls, base: Mapping) -> "BuiltinEnvDict":
+        result = cls.__new__(cls)
+        result._base = base
+        result._overlay = {}
+        return result
+
+    def new_child(self, m: Mapping = None) -> "BuiltinEnvDict":
+        """Return a new environment with the items of `m` over this one.
+
+        Unlike `collections.ChainMap.new_child`, the lookups in the result
+        don't traverse a chain of mappings.
+
+        """
+        result = type(self)._from_base(self._base)
+        result._overlay = dict(self._overlay)
+        if m:
+            result._overlay.update(m)
+        return result
+
+    def copy(self) -> "BuiltinEnvDict":
+        return self.new_child()
+
+    def __reduce__(self):
+        # The shared bases are not pickled, but found again when unpickling;
+        # e.g. in the workers of `~xotl.fl.typecheck.TypecheckSession`:class:.
+        base: Any
+        if self._base is _builtins_base:
+            base = "builtins"
+        elif self._base is _basic_base:
+            base = "basic"
+        else:
+            base = dict(self._base)
+        overlay = {key: value for key, value in self._overlay.items() if value is not _DELETED}
+        deleted = [key for key, value in self._overlay.items() if value is _DELETED]
+        return _restore_env, (type(self), base, overlay, deleted)
+
+    def __getitem__(self, key):
+        value = self._overlay.get(key, _ABSENT)
+        if value is _ABSENT:
+            value = self._base.get(key, _ABSENT)
+        if value is _ABSENT or value is _DELETED:
+            return self.__missing__(key)
+        return value
+
+    def get(self, key, default=None):
+        # Like dict.get, this doesn't call __missing__.
+        value = self._overlay.get(key, _ABSENT)
+        if value is _ABSENT:
+            return self._base.get(key, default)
+        elif value is _DELETED:
+            return default
+        else:
+            return value
+
+    def __contains__(self, key) -> bool:
+        value = self._overlay.get(key, _ABSENT)
+        if value is _ABSENT:
+            return key in self._base
+        else:
+            return value is not _DELETED
+
+    def __setitem__(self, key, value) -> None:
+        self._overlay[key] = value
+
+    def __delitem__(self, key) -> None:
+        if key not in self:
+            raise KeyError(key)
+        elif key in self._base:
+            self._overlay[key] = _DELETED
+        else:
+            del self._overlay[key]
+
+    def __iter__(self):
+        overlay = self._overlay
+        for key, value in overlay.items():
+            if value is not _DELETED:
+                yield key
+        for key in self._base:
+            if key not in overlay:
+                yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({dict(self)!r})"
 
     def __missing__(self, key) -> TypeScheme:
-        from xotl.fl.ast.types import TypeVariable
         from xotl.fl.match import Extract, MatchLiteral
-        from xotl.fl.utils import tvarsupply
 
         # Constructors of tuples are not fixed, since now you can have (1, 2,
         # 3..., 10000); that's a long tuple with a single constructor
         # (,,...,,); i.e 9999 commas.
         if isinstance(key, str) and TUPLE_CONS.match(key):
-            items = len(key) + 1
-            names = list(tvarsupply(limit=items))
-            type: Type = TypeCons(key, names)
-            for name in reversed(names):
-                type = name >> type
-            return TypeScheme.from_typeexpr(type)
+            return _tuple_cons_scheme(len(key) + 1)
         elif isinstance(key, Extract) and TUPLE_CONS.match(key.name):
-            # The type of 'extract' for tuple varies with the number of
-            # components of the tuple.  Example, for a triple, Extract(',,',
-            # 2) -- i.e. extracting the second element; has the type scheme
-            # 'forall a b c r. (a, b, c) -> (b -> r) -> r'.
-            type_ = self[key.name].type_
-            assert isinstance(type_, TypeCons)
-            res = TypeVariable(".r", check=False)
-            return TypeScheme.from_typeexpr(type_ >> ((type_.subtypes[key.arg - 1] >> res) >> res))
+            return _tuple_extract_scheme(len(key.name) + 1, key.arg)
         elif isinstance(key, MatchLiteral):
-            # The match has type 'a -> (a -> r) -> r'; where a is the type of
-            # the literal.  We must ensure to generate a new variable not free
-            # in type a.  Everywhere else we generate types '.a0', '.a1'.
-            # Let's use '.r' as the result type.
-            a = key.value.type_
-            res = TypeVariable(".r", check=False)
-            return TypeScheme.from_typeexpr(a >> ((a >> res) >> res))
+            return _match_literal_scheme(key.value.type_)
         else:
             raise KeyError(key)  # pragma: no cover
 
 
-def _load_builtins_program():
-    import pkg_resources
+def _restore_env(cls, base, overlay, deleted) -> BuiltinEnvDict:
+    if base == "builtins":
+        base = _builtins_env()
+    elif base == "basic":
+        base = _basic_env()
+    else:
+        base = MappingProxyType(base)
+    result = cls._from_base(base)
+    result._overlay = overlay
+    result._overlay.update(dict.fromkeys(deleted, _DELETED))
+    return result
+
+
+# The schemes of tuple constructors, extractors and literal matches are
+# synthesized on demand and shared by all environments.  For wide tuples
+# they are O(n) to build, so we keep the most recently used ones.
+SYNTHETIC_SCHEMES_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=SYNTHETIC_SCHEMES_CACHE_SIZE)
+def _tuple_cons_scheme(arity: int) -> TypeScheme:
+    "The scheme 'forall a b ... . a -> b -> ... -> (a, b, ...)'."
+    names, type_ = _tuple_type(arity)
+    for name in reversed(names):
+        type_ = name >> type_
+    return TypeScheme.from_typeexpr(type_)
+
+
+@lru_cache(maxsize=SYNTHETIC_SCHEMES_CACHE_SIZE)
+def _tuple_extract_scheme(arity: int, arg: int) -> TypeScheme:
+    """The scheme of extracting the `arg`-th component of a tuple.
+
+    Example, for a triple, Extract(',,', 2) -- i.e. extracting the second
+    element; has the type scheme 'forall a b c r. (a, b, c) -> (b -> r) ->
+    r'.
+
+    """
+    names, type_ = _tuple_type(arity)
+    res = TypeVariable(".r", check=False)
+    return TypeScheme.from_typeexpr(type_ >> ((names[arg - 1] >> res) >> res))
+
+
+@lru_cache(maxsize=SYNTHETIC_SCHEMES_CACHE_SIZE)
+def _match_literal_scheme(type_: Type) -> TypeScheme:
+    # The match has type 'a -> r -> r'; where a is the type of the literal.
+    # We must ensure to generate a new variable not free in type a.
+    # Everywhere else we generate types '.a0', '.a1'.  Let's use '.r' as the
+    # result type.
+    res = TypeVariable(".r", check=False)
+    return TypeScheme.from_typeexpr(type_ >> (res >> res))
+
+
+def _tuple_type(arity: int) -> Tuple[List[TypeVariable], Type]:
+    from xotl.fl.utils import tvarsupply
+
+    names = list(tvarsupply(limit=arity))
+    return names, TypeCons("," * (arity - 1), names)
+
+
+# Parsing 'builtins.fl' is costly, so we ship a snapshot (a pickle) of the
+# type environment beside it.  The snapshot records the digest of the
+# 'builtins.fl' it was generated from, and `SNAPSHOT_VERSION`.  It's only
+# read at runtime (the package may be read-only or shared): a stale snapshot
+# is ignored and the environment is built in memory.  Regenerate it with
+# ``make snapshot`` (see `write_snapshot`:func:) when releasing.
+#
+# Bump SNAPSHOT_VERSION whenever the way the environment is derived from
+# 'builtins.fl' changes; e.g. the types of the pattern matching functions of
+# data types.
+SNAPSHOT_VERSION = 1
+
+_BUILTINS_SOURCE = "builtins.fl"
+_BUILTINS_SNAPSHOT = "builtins_env.pickle"
+
+
+def _resource(name: str) -> str:
+    import os
+
+    return os.path.join(os.path.dirname(__file__), name)
+
+
+def _load_builtins_program(source: str = None):
     from xotl.fl import parse
 
-    builtins = pkg_resources.resource_filename("xotl.fl", "builtins.fl")
-    with open(builtins, "r", encoding="utf-8") as f:
-        source = f.read()
+    if source is None:
+        with open(_resource(_BUILTINS_SOURCE), "r", encoding="utf-8") as f:
+            source = f.read()
     program = parse(source)
     return program
 
 
+def _read_builtins_source() -> Tuple[bytes, str]:
+    import hashlib
+
+    with open(_resource(_BUILTINS_SOURCE), "rb") as f:
+        source = f.read()
+    return source, hashlib.sha256(source).hexdigest()
+
+
 def _load_builtin_typeenv():
+    source, digest = _read_builtins_source()
+    gamma = _read_snapshot(digest)
+    if gamma is None:
+        gamma = _build_builtin_typeenv(source.decode("utf-8"))
+    return gamma
+
+
+def _read_snapshot(digest: str):
+    import pickle
+
+    try:
+        with open(_resource(_BUILTINS_SNAPSHOT), "rb") as f:
+            version, snapshot_digest, gamma = pickle.load(f)
+    except Exception:
+        # Missing or unreadable; e.g. pickled with classes that no longer
+        # exist.
+        return None
+    if version == SNAPSHOT_VERSION and snapshot_digest == digest:
+        return gamma
+    else:
+        return None
+
+
+def write_snapshot() -> None:
+    """Write the snapshot of the type environment of 'builtins.fl'.
+
+    This is done when building a release (``make snapshot``), never at
+    runtime.
+
+    """
+    import os
+    import pickle
+    import tempfile
+
+    source, digest = _read_builtins_source()
+    gamma = _build_builtin_typeenv(source.decode("utf-8"))
+    filename = _resource(_BUILTINS_SNAPSHOT)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(filename), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump((SNAPSHOT_VERSION, digest, gamma), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, filename)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _build_builtin_typeenv(source: str):
     from xotl.fl.ast.adt import DataType
     from xotl.fl.ast.typeclasses import TypeClass
 
-    res = _load_builtins_program()
+    res = _load_builtins_program(source)
     gamma = {}
     # The strange dict(**gamma, **x) are there to catch duplicated annotations
     # that may cause trouble.
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------
+# Copyright (c) Merchise Autrement [~º/~] and Contributors
+# All rights reserved.
+#
+# This is free software; you can do what the LICENCE file allows you to.
+#
+"""An on-disk cache of parsed programs.
+
+The entries are keyed by the hash of the source and the version of the
+parser (a hash of the sources of the parser, the builtin types and the AST
+modules).  So a change in the grammar or the AST invalidates all the
+entries.
+
+Entries are written to a temporary file which is then renamed; so many
+processes can share the same directory.  The definitions are stored with
+the binary encoding of `xotl.fl.ast.codec`:mod:.
+
+This module doesn't import the parser, which is only needed (and imported)
+when the cache misses.
+
+"""
+
+import glob
+import hashlib
+import os
+import tempfile
+from functools import lru_cache
+from typing import List, Optional
+
+from xotl.fl.ast.codec import decode, encode
+
+#: The environment variable naming the cache directory `xotl.fl.parse`:func:
+#: uses by default.  If it's not set, programs are not cached.
+CACHE_DIR_ENVVAR = "XOTL_FL_PARSE_CACHE"
+
+# Bump CACHE_VERSION whenever the format of the entries changes.
+CACHE_VERSION = 2
+
+DEFAULT_MAX_SIZE = 256 * 2**20
+
+
+class ParseCache:
+    """A cache of the results of `xotl.fl.parse`:func: in `directory`.
+
+    When the size of the entries exceeds `max_size` (in bytes), the least
+    recently used ones are removed.
+
+    """
+
+    def __init__(self, directory, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        self.directory = os.fspath(directory)
+        self.max_size = max_size
+
+    def __repr__(self):
+        return f"ParseCache({self.directory!r}, max_size={self.max_size!r})"
+
+    def key(self, source: str) -> str:
+        "Return the key of the entry for `source`."
+        hash = hashlib.sha256(f"{CACHE_VERSION}:{_parser_version()}:".encode())
+        hash.update(source.encode("utf-8", "surrogatepass"))
+        return hash.hexdigest()
+
+    def get(self, source: str) -> Optional[List]:
+        "Return the definitions of `source`; or None if they are not cached."
+        key = self.key(source)
+        filename = self._filename(key)
+        try:
+            with open(filename, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+        try:
+            if data[: len(key)] != key.encode("ascii"):
+                raise ValueError("Mismatching key")
+            definitions = decode(data[len(key) :])
+        except ValueError:
+            # Unreadable; e.g. encoded with another version of the codec.
+            _remove(filename)
+            return None
+        try:
+            os.utime(filename)  # Mark it as recently used.
+        except OSError:
+            pass
+        return definitions
+
+    def put(self, source: str, definitions: List) -> None:
+        "Store the `definitions` of `source`."
+        key = self.key(source)
+        filename = self._filename(key)
+        data = encode(definitions)
+        try:
+            os.makedirs(os.path.dirname(filename), exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(filename), suffix=".tmp")
+        except OSError:
+            return  # Not writable, the cache is just not used.
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(key.encode("ascii"))
+                f.write(data)
+            os.chmod(tmp, 0o644)
+            os.replace(tmp, filename)
+        except OSError:
+            _remove(tmp)
+            return
+        self.evict()
+
+    def evict(self) -> None:
+        "Remove the least recently used entries to keep the size of the cache."
+        entries = []
+        total = 0
+        for filename in glob.iglob(os.path.join(self.directory, "??", "*.xfl")):
+            try:
+                stat = os.stat(filename)
+            except OSError:
+                continue  # Removed by another process.
+            entries.append((stat.st_mtime, stat.st_size, filename))
+            total += stat.st_size
+        if total > self.max_size:
+            entries.sort()
+            for _, size, filename in entries:
+                _remove(filename)
+                total -= size
+                if total <= self.max_size:
+                    break
+
+    def clear(self) -> None:
+        "Remove all the entries."
+        for filename in glob.iglob(os.path.join(self.directory, "??", "*.xfl")):
+            _remove(filename)
+
+    def _filename(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.xfl")
+
+
+def default_cache() -> Optional[ParseCache]:
+    """Return the cache in the directory named by `CACHE_DIR_ENVVAR`:data:."""
+    directory = os.environ.get(CACHE_DIR_ENVVAR)
+    return ParseCache(directory) if directory else None
+
+
+@lru_cache(maxsize=None)
+def _parser_version() -> str:
+    # The parser builds the literals with the types in 'builtins.py'.
+    base = os.path.dirname(__file__)
+    filenames = [os.path.join(base, "parsers", "__init__.py"), os.path.join(base, "builtins.py")]
+    filenames.extend(sorted(glob.glob(os.path.join(base, "ast", "*.py"))))
+    hash = hashlib.sha256()
+    for filename in filenames:
+        with open(filename, "rb") as f:
+            hash.update(f.read())
+    return hash.hexdigest()
+
+
+def _remove(filename: str) -> None:
+    try:
+        os.unlink(filename)
+    except OSError:
+        pass
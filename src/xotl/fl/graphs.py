@@ -10,8 +10,6 @@
 
 from collections import deque
 
-from xotl.tools.fp.tools import snd
-
 
 class Graph:
     def __init__(self) -> None:
@@ -37,92 +35,341 @@ class Graph:
     def get_topological_order(self, reverse=False, with_score=False):
         """Find a topological sort of the nodes.
 
-        If the graph contains cycles, raise a RuntimeError.
-
-        """
-
-        def raise_on_cycle(func):
-            """Make `func` to raise on the first recursive call with the same
-            argument.
+        The *score* of a node is the length of the longest path from it to a
+        node without links: nodes come sorted by score (and in the order
+        they were added, within the same score).  If `with_score` is True,
+        return pairs of the node and its score.
 
-            """
-            stack = deque([])
-
-            def inner(node):
-                if node in stack:
-                    raise NonDAGError("Cycle detected: %r" % (list(stack) + [node]))
-                else:
-                    stack.append(node)
-                    try:
-                        return func(node)
-                    finally:
-                        stack.pop()
-
-            return inner
-
-        @raise_on_cycle
-        def score(node):
-            links = self.nodes.get(node, [])
-            if links:
-                return max(score(dep) for dep in links) + 1
-            else:
-                return 0
+        The scores are found with Kahn's algorithm, from the nodes without
+        links backwards; so it takes linear time.  If the graph contains
+        cycles, raise a `NonDAGError`:class:.
 
+        """
+        scores = self._get_scores()
+        levels = [[] for _ in range(max(scores.values(), default=-1) + 1)]
+        for node in self.nodes:
+            levels[scores[node]].append(node)
+        if reverse:
+            levels.reverse()
         if not with_score:
-            return list(sorted(self.nodes.keys(), key=score, reverse=reverse))
+            return [node for level in levels for node in level]
         else:
-            return list(
-                sorted(
-                    ((node, score(node)) for node in self.nodes),
-                    key=snd,
-                    reverse=reverse,
-                )
-            )
+            return [(node, scores[node]) for level in levels for node in level]
+
+    def _get_scores(self):
+        pending = {}  # the number of links without a score yet
+        linked = {}  # the reversed edges
+        for node, links in self.nodes.items():
+            pending[node] = len(links)
+            for link in links:
+                linked.setdefault(link, []).append(node)
+                pending.setdefault(link, 0)
+        scores = {}
+        queue = deque(node for node, count in pending.items() if not count)
+        for node in queue:
+            scores[node] = 0
+        while queue:
+            node = queue.popleft()
+            score = scores[node] + 1
+            for dependent in linked.get(node, ()):
+                if scores.get(dependent, -1) < score:
+                    scores[dependent] = score
+                count = pending[dependent] = pending[dependent] - 1
+                if not count:
+                    queue.append(dependent)
+        if any(pending.values()):
+            raise NonDAGError("Cycle detected: %r" % self._find_cycle(pending))
+        return scores
+
+    def _find_cycle(self, pending):
+        # Nodes with pending links are in a cycle or lead to one; follow
+        # the pending links until a node repeats.
+        node = next(node for node, count in pending.items() if count)
+        path = [node]
+        seen = {node: 0}
+        while True:
+            node = next(link for link in self[node] if pending.get(link))
+            if node in seen:
+                return path[seen[node] :] + [node]
+            seen[node] = len(path)
+            path.append(node)
 
     def get_sccs(self):
         """Find the Strongly Connected Components.
 
-        This is an implementation of Tarjan's Algorithm [Tarjan1972]_.
+        This is an implementation of Tarjan's Algorithm [Tarjan1972]_.  It
+        uses an explicit stack instead of recursion, so long chains of
+        dependencies don't hit the recursion limit.
 
         """
-
-        def _find_scc(node):
-            nonlocal index
-            indexed[node] = index
-            lowlinks[node] = index
-            index += 1
-            stack.append(node)
-            for link in self[node]:
-                if link not in indexed:
-                    _find_scc(link)
-                    lowlinks[node] = min(lowlinks[node], lowlinks[link])
-                elif link in stack:
-                    # Successor link is in stack and hence in the current SCC
-                    # If link is not on stack, then (node, link) is a
-                    # cross-edge in the DFS tree and must be ignored.
-                    #
-                    # The next line may look odd - but is correct.  It says
-                    # indexed[link] and not lowlinks[link]; that is deliberate
-                    # and from the original paper
-                    lowlinks[node] = min(lowlinks[node], indexed[link])
-            if indexed[node] == lowlinks[node]:
-                w = stack.pop()
-                scc = {w}
-                while w != node:
-                    w = stack.pop()
-                    scc.add(w)
-                result.append(scc)
-
         index = 0
         indexed = {}
         lowlinks = {}
         result = []
-        stack = deque([])
-        for node in self.nodes:
-            if node not in indexed:
-                _find_scc(node)
+        stack = []
+        onstack = set()
+        for root in self.nodes:
+            if root in indexed:
+                continue
+            indexed[root] = lowlinks[root] = index
+            index += 1
+            stack.append(root)
+            onstack.add(root)
+            # The nodes being visited, with an iterator over their links.
+            visiting = [(root, iter(self[root]))]
+            while visiting:
+                node, links = visiting[-1]
+                for link in links:
+                    if link not in indexed:
+                        indexed[link] = lowlinks[link] = index
+                        index += 1
+                        stack.append(link)
+                        onstack.add(link)
+                        visiting.append((link, iter(self[link])))
+                        break
+                    elif link in onstack:
+                        # Successor link is in stack and hence in the current
+                        # SCC.  If link is not on stack, then (node, link) is
+                        # a cross-edge in the DFS tree and must be ignored.
+                        #
+                        # The next line may look odd - but is correct.  It
+                        # says indexed[link] and not lowlinks[link]; that is
+                        # deliberate and from the original paper
+                        lowlinks[node] = min(lowlinks[node], indexed[link])
+                else:
+                    visiting.pop()
+                    if visiting:
+                        parent, _ = visiting[-1]
+                        lowlinks[parent] = min(lowlinks[parent], lowlinks[node])
+                    if indexed[node] == lowlinks[node]:
+                        w = stack.pop()
+                        onstack.discard(w)
+                        scc = {w}
+                        while w != node:
+                            w = stack.pop()
+                            onstack.discard(w)
+                            scc.add(w)
+                        result.append(scc)
         return result  # type: ignore
 
 
+class Condensation:
+    """The strongly connected components of a graph and the DAG between them.
+
+    The *components* are frozensets of nodes; there's an edge from a
+    component C to a component D (C ≠ D) in the `dag`:attr: if there's an
+    edge from a node of C to a node of D.  Nodes and edges can be added and
+    removed; only the components touched are computed again:
+
+    - an edge inside a component, or one that doesn't close a cycle, only
+      updates the counts of edges between components;
+
+    - an edge closing a cycle merges the components in the paths of the
+      `dag` between its ends;
+
+    - removing an edge inside a component looks for the components of its
+      nodes (and only those nodes) again.
+
+    The edges of a `Graph`:class: go from its nodes to their links.  Unlike
+    a graph, the ends of every edge are nodes of the condensation.
+
+    Example:
+
+       >>> graph = Graph()
+       >>> graph.add_many("a", {"b"})
+       >>> graph.add_many("b", {"c"})
+       >>> condensation = Condensation(graph)
+       >>> condensation.get_topological_order()
+       [frozenset({'c'}), frozenset({'b'}), frozenset({'a'})]
+
+       >>> condensation.add_edge("c", "b")
+       >>> condensation.add_edge("c", "a")
+       >>> condensation.component("a") == {"a", "b", "c"}
+       True
+
+       >>> condensation.remove_edge("c", "a")
+       >>> sorted(sorted(component) for component in condensation.components)
+       [['a'], ['b', 'c']]
+
+    """
+
+    def __init__(self, graph: Graph = None) -> None:
+        self._links = {}  # node -> the nodes it links to
+        self._linked = {}  # node -> the nodes linking to it
+        self._component = {}  # node -> its component
+        # component -> {component it links to: number of edges}
+        self._dag = {}
+        self._dag_linked = {}  # component -> the components linking to it
+        if graph is not None:
+            for scc in graph.get_sccs():
+                self._new_component(scc)
+                for node in scc:
+                    self._links[node] = set(graph[node])
+                    self._linked[node] = set()
+            for node, links in self._links.items():
+                for link in links:
+                    self._linked[link].add(node)
+            self._link_components(self._links)
+
+    def __contains__(self, node) -> bool:
+        return node in self._component
+
+    def __iter__(self):
+        return iter(self._component)
+
+    @property
+    def components(self):
+        "The components, in no particular order."
+        return list(self._dag)
+
+    @property
+    def dag(self) -> Graph:
+        "The DAG of the components."
+        result = Graph()
+        for component, links in self._dag.items():
+            result.add_node(component)
+            result.add_many(component, set(links))
+        return result
+
+    def component(self, node):
+        "The component of `node`."
+        return self._component[node]
+
+    def dependencies(self, component):
+        "The components with edges from `component`."
+        return set(self._dag[component])
+
+    def recursive(self, component) -> bool:
+        "True if the nodes of `component` link (maybe through others) to themselves."
+        if len(component) > 1:
+            return True
+        else:
+            (node,) = component
+            return node in self._links[node]
+
+    def get_topological_order(self, reverse=False, with_score=False):
+        "The components in a topological order; see `Graph.get_topological_order`:meth:."
+        return self.dag.get_topological_order(reverse=reverse, with_score=with_score)
+
+    def add_node(self, node) -> None:
+        if node not in self._component:
+            self._links[node] = set()
+            self._linked[node] = set()
+            self._new_component([node])
+
+    def add_edge(self, from_, to_) -> None:
+        self.add_node(from_)
+        self.add_node(to_)
+        links = self._links[from_]
+        if to_ in links:
+            return
+        links.add(to_)
+        self._linked[to_].add(from_)
+        source, target = self._component[from_], self._component[to_]
+        if source is target:
+            return
+        # The new edge closes a cycle if there's a path from the target to
+        # the source.  The components in such paths are merged.
+        following = self._reach(target, self._dag)
+        if source not in following:
+            self._add_dag_edge(source, target, 1)
+        else:
+            merged = following & self._reach(source, self._dag_linked)
+            self._replace(merged, [frozenset().union(*merged)])
+
+    def remove_edge(self, from_, to_) -> None:
+        links = self._links.get(from_)
+        if links is None or to_ not in links:
+            return
+        links.remove(to_)
+        self._linked[to_].remove(from_)
+        source, target = self._component[from_], self._component[to_]
+        if source is not target:
+            self._remove_dag_edge(source, target)
+        elif len(source) > 1:
+            subgraph = Graph()
+            for node in source:
+                subgraph.add_node(node)
+                subgraph.add_many(node, self._links[node] & source)
+            sccs = subgraph.get_sccs()
+            if len(sccs) > 1:
+                self._replace({source}, [frozenset(scc) for scc in sccs])
+
+    def remove_node(self, node) -> None:
+        "Remove `node` and its edges."
+        if node in self._component:
+            for link in list(self._links[node]):
+                self.remove_edge(node, link)
+            for other in list(self._linked[node]):
+                self.remove_edge(other, node)
+            component = self._component.pop(node)
+            del self._links[node], self._linked[node]
+            del self._dag[component], self._dag_linked[component]
+
+    def _new_component(self, nodes) -> frozenset:
+        component = frozenset(nodes)
+        for node in component:
+            self._component[node] = component
+        self._dag[component] = {}
+        self._dag_linked[component] = set()
+        return component
+
+    def _add_dag_edge(self, source, target, count) -> None:
+        links = self._dag[source]
+        links[target] = links.get(target, 0) + count
+        self._dag_linked[target].add(source)
+
+    def _remove_dag_edge(self, source, target) -> None:
+        links = self._dag[source]
+        links[target] -= 1
+        if not links[target]:
+            del links[target]
+            self._dag_linked[target].discard(source)
+
+    def _link_components(self, nodes) -> None:
+        # Count the edges from `nodes` to other components.
+        for node in nodes:
+            source = self._component[node]
+            for link in self._links[node]:
+                target = self._component[link]
+                if target is not source:
+                    self._add_dag_edge(source, target, 1)
+
+    def _replace(self, old, new) -> None:
+        # Replace the components in `old` by those in `new` (which have the
+        # same nodes), and count the edges of their nodes again.
+        nodes = [node for component in old for node in component]
+        outside = set()
+        for component in old:
+            for target in self._dag.pop(component):
+                if target not in old:
+                    self._dag_linked[target].discard(component)
+            for source in self._dag_linked.pop(component):
+                if source not in old:
+                    del self._dag[source][component]
+                    outside.add(source)
+        for component in new:
+            self._new_component(component)
+        self._link_components(nodes)
+        for node in nodes:
+            target = self._component[node]
+            for other in self._linked[node]:
+                source = self._component[other]
+                if source in outside:
+                    self._add_dag_edge(source, target, 1)
+
+    @staticmethod
+    def _reach(start, edges) -> set:
+        # The components reachable from `start` following `edges`.
+        result = {start}
+        pending = [start]
+        while pending:
+            for other in edges[pending.pop()]:
+                if other not in result:
+                    result.add(other)
+                    pending.append(other)
+        return result
+
+
 class NonDAGError(RuntimeError):
     pass
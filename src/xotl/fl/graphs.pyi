@@ -1,4 +1,15 @@
-from typing import AbstractSet, Generic, List, MutableMapping, Set, Tuple, TypeVar, Union
+from typing import (
+    AbstractSet,
+    FrozenSet,
+    Generic,
+    Iterator,
+    List,
+    MutableMapping,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 T = TypeVar("T")
 
@@ -9,5 +20,26 @@ class Graph(Generic[T]):
     def add_many(self, from_: T, to_: AbstractSet[T]) -> None: ...
     def get_topological_order(
         self, reverse: bool = ..., with_score: bool = ...
-    ) -> List[Union[T, Tuple[int, T]]]: ...
+    ) -> List[Union[T, Tuple[T, int]]]: ...
     def get_sccs(self) -> List[AbstractSet[T]]: ...
+
+class Condensation(Generic[T]):
+    def __init__(self, graph: Graph[T] = ...) -> None: ...
+    def __contains__(self, node: T) -> bool: ...
+    def __iter__(self) -> Iterator[T]: ...
+    @property
+    def components(self) -> List[FrozenSet[T]]: ...
+    @property
+    def dag(self) -> Graph[FrozenSet[T]]: ...
+    def component(self, node: T) -> FrozenSet[T]: ...
+    def dependencies(self, component: FrozenSet[T]) -> Set[FrozenSet[T]]: ...
+    def recursive(self, component: FrozenSet[T]) -> bool: ...
+    def get_topological_order(
+        self, reverse: bool = ..., with_score: bool = ...
+    ) -> List[Union[FrozenSet[T], Tuple[FrozenSet[T], int]]]: ...
+    def add_node(self, node: T) -> None: ...
+    def add_edge(self, from_: T, to_: T) -> None: ...
+    def remove_edge(self, from_: T, to_: T) -> None: ...
+    def remove_node(self, node: T) -> None: ...
+
+class NonDAGError(RuntimeError): ...
@@ -7,7 +7,7 @@
 # This is free software; you can do what the LICENCE file allows you to.
 #
 from dataclasses import dataclass
-from typing import Iterable, Tuple
+from typing import Iterable, List, Tuple
 
 from xotl.fl.ast.base import AST
 from xotl.fl.ast.expressions import Application, Identifier, Lambda, Literal
@@ -46,7 +46,7 @@ class FunctionDefinition:
         # but I want to avoid *enlarging* simple functions needlessly.
         if self.arity:
             vars = list(namesupply(f".{self.name}_arg", limit=self.arity))
-            body: AST = NO_MATCH_ERROR
+            alternatives: List[AST] = []
             for eq in self.equations:
                 dfn = eq.body
                 patterns: Iterable[Tuple[str, Pattern]] = zip(vars, eq.patterns)
@@ -84,8 +84,13 @@ class FunctionDefinition:
                                     raise NotImplementedError(f"Nested patterns {param}")
                     else:
                         assert False
-                body = build_lambda(vars, build_application(MATCH_OPERATOR, dfn, body))
-            return body
+                alternatives.append(dfn)
+            # The equations are tried in order: ``eq1 :OR: (eq2 :OR: ...
+            # :NO_MATCH_ERROR:)``, all of them under the same lambda.
+            body: AST = NO_MATCH_ERROR
+            for dfn in reversed(alternatives):
+                body = build_application(MATCH_OPERATOR, dfn, body)
+            return build_lambda(vars, body)
         else:
             # This should be a simple value, so we return the body of the
             # first equation.
@@ -6,8 +6,13 @@
 #
 # This is free software; you can do what the LICENCE file allows you to.
 #
+import os
 import re
-from typing import List
+import threading
+from copy import copy
+from datetime import date, datetime
+from itertools import chain
+from typing import Iterable, List
 
 from ply import lex, yacc
 from xotl.fl.ast.adt import DataCons, DataType
@@ -92,6 +97,11 @@ tokens = [
     "DATETIME_INTERVAL",
     "DATE_INTERVAL",
     "PIPE",
+    # Never issued by the lexer: the parser is given one of these as its
+    # first token to select the start symbol; see `ParserContext`:class:.
+    "START_PROGRAM",
+    "START_EXPR",
+    "START_TYPE",
 ]
 
 # Reserved keywords: pairs of (keyword, regexp).  If the regexp is None, it
@@ -315,6 +325,10 @@ def t_BASE10_INTEGER(t):
 # but required.
 #
 # See more details in the file ``indentation.rst``.
+_SPACELESS_AFTER = "=<>`.,:+-%@!$*^/|,[("
+_SPACELESS_BEFORE = "=<>`.,:+-%@!$*^/|,)]"
+
+
 def t_SPACE(t):
     r"[ \t\n]+"
     if "\n" in t.value:
@@ -353,11 +367,10 @@ def t_SPACE(t):
                 return t
         if before == ">":
             pos = t.lexpos
-            preceding = t.lexer.lexdata[pos - MAX_DT_LITERAL_LENGTH : pos]
+            preceding = t.lexer.lexdata[max(pos - MAX_DT_LITERAL_LENGTH, 0) : pos]
             if PRECEDES_DT_LITERAL_REGEXP.search(preceding):
                 return t
-        common = "=<>`.,:+-%@!$*^/|,"
-        if before in common + "[(" or after in common + ")]":
+        if before in _SPACELESS_AFTER or after in _SPACELESS_BEFORE:
             return  # This removes the token entirely.
         else:
             return t
@@ -398,21 +411,13 @@ def t_ANNOTATION(t):
 
 def t_DATETIME(t):
     r"<\d{4,}-\d\d-\d\d[ T]\d\d:\d\d(:\d\d)?(\.\d+)?>"
-    import dateutil.parser
-
-    val = t.value[1:-1]
-    res = dateutil.parser.parse(val)
-    t.value = res
+    t.value = parse_datetime_literal(t.value[1:-1])
     return t
 
 
 def t_DATE(t):
     r"<\d{4,}-\d\d-\d\d>"
-    import dateutil.parser
-
-    val = t.value[1:-1]
-    res = dateutil.parser.parse(val).date()
-    t.value = res
+    t.value = parse_date_literal(t.value[1:-1])
     return t
 
 
@@ -426,16 +431,61 @@ def t_DATETIME_INTERVAL(t):
 
 def t_DATE_INTERVAL(t):
     r"<from[ \t]+\d{4,}-\d\d-\d\d[ \t]+to[ \t]+\d{4,}-\d\d-\d\d>"
-    import dateutil.parser
-
     source = t.value[1:-1]
     _, start, _, end = source.split()
-    start = dateutil.parser.parse(start)
-    end = dateutil.parser.parse(end)
+    start = parse_datetime_literal(start)
+    end = parse_datetime_literal(end)
     t.value = TimeSpan(start, end)
     return t
 
 
+# The literals are ISO dates (as matched by the rules above), so most of them
+# can be parsed by slicing.  Years with more than 4 digits, fractions of
+# minutes and invalid dates are left to dateutil.
+def parse_date_literal(value: str) -> date:
+    """Parse the `value` of a date literal, i.e 'YYYY-MM-DD'."""
+    if len(value) == 10:
+        try:
+            return date(int(value[:4]), int(value[5:7]), int(value[8:]))
+        except ValueError:
+            pass
+    return _parse_datetime(value).date()
+
+
+def parse_datetime_literal(value: str) -> datetime:
+    """Parse the `value` of a date-time literal, e.g 'YYYY-MM-DDTHH:MM:SS.ffffff'.
+
+    A date without time is also accepted.
+
+    """
+    if value[4:5] == "-":
+        if len(value) == 10:
+            time, second, fraction = "", "0", ""
+        else:
+            time = value[10:]
+            second, _, fraction = time[7:].partition(".")
+        if len(fraction) <= 6 and (time[6:7] == ":" or not time[6:]):
+            try:
+                return datetime(
+                    int(value[:4]),
+                    int(value[5:7]),
+                    int(value[8:10]),
+                    int(time[1:3] or 0),
+                    int(time[4:6] or 0),
+                    int(second or 0),
+                    int(fraction.ljust(6, "0")),
+                )
+            except ValueError:
+                pass
+    return _parse_datetime(value)
+
+
+def _parse_datetime(value):
+    import dateutil.parser
+
+    return dateutil.parser.parse(value)
+
+
 MAX_DATE_LITERAL_LENGTH = len("<YYYY-MM-DD>")
 MAX_DATETIME_LITERAL_LENGTH = len("<YYYY-MM-DDTHH:MM:SS.ZZZZZZZ>")
 MAX_DATEINTERAL_LITERAL_LENGTH = len("<from YYYY-MM-DD to YYYY-MM-DD>")
@@ -763,8 +813,7 @@ def p_concrete_number(prod):
     """
     number = prod[1]
     assert isinstance(number, Literal)
-    number.annotation = prod[3]
-    prod[0] = number
+    prod[0] = Literal(number.value, number.type_, prod[3])
 
 
 def p_empty(prod):
@@ -1391,11 +1440,123 @@ def p_derivations_list_trail_empty(prod):
     prod[0] = []
 
 
-type_parser = yacc.yacc(debug=False, start="st_type_expr", tabmodule="type_parsertab")
+def p_start(prod):
+    """_start : START_PROGRAM program
+    | START_EXPR st_expr
+    | START_TYPE st_type_expr
+    """
+    prod[0] = prod[2]
+
+
+# The three parsers share a single set of LALR tables, stored in a pickle
+# next to this module.  If the grammar changes, ply builds the tables again
+# (and tries to update the pickle) the first time a parser is needed.
+_TABLES = os.path.join(os.path.dirname(__file__), "parsetab.pickle")
+_parser = None
+_parser_lock = threading.Lock()
+
+
+def _get_parser():
+    global _parser
+    if _parser is None:
+        # Contexts may be used from many threads; only one builds the parser
+        # (and may write the tables).
+        with _parser_lock:
+            if _parser is None:
+                _parser = yacc.yacc(debug=False, start="_start", picklefile=_TABLES)
+    return _parser
+
+
+class ParserContext:
+    """A context to parse programs, expressions and type expressions.
+
+    The module-level `lexer` and the parser keep the state of the parse (the
+    indentation levels, the line number, the parser stacks) in themselves.
+    A context, instead, gives each parse its own lexer (a clone) and parser
+    (a copy sharing the parsing tables); which are reset before each parse
+    and reused afterwards.
+
+    There's a single parser for programs, expressions and type expressions:
+    the first token given to it selects the start symbol.  It's built the
+    first time a context needs it.
+
+    So a context can be used from many threads at the same time, and it's
+    re-entrant.  `xotl.fl.parse`:func:, `xotl.fl.parsers.expressions.parse`:func:
+    and `xotl.fl.parsers.types.parse`:func: use the `default_context`.
+
+    If `scanner` is True, the tokens are produced by
+    `xotl.fl.parsers.scanner.scan`:func: instead of a lexer.
+
+    """
+
+    def __init__(self, *, scanner: bool = False) -> None:
+        self.scanner = scanner
+        self._free: List[_ParserState] = []
+
+    def parse_program(
+        self, source: str, debug=False, *, lineno: int = 1, tokens: Iterable[lex.LexToken] = None
+    ):
+        """Parse a whole program; see `xotl.fl.parse`:func:.
+
+        `lineno` is the line number of the first line of `source`; e.g. when
+        it's part of a larger program.
+
+        If `tokens` is given, they are the tokens of `source` (e.g. kept from
+        a previous `xotl.fl.parsers.scanner.scan`:func:) and `source` is not
+        lexed again.
+
+        """
+        return self._parse("START_PROGRAM", source, lineno, debug=debug, tokens=tokens)
+
+    def parse_expression(self, code: str, debug=False, tracking=False):
+        "Parse a single expression."
+        return self._parse("START_EXPR", code, 1, debug=debug, tracking=tracking)
+
+    def parse_type(self, code: str, debug=False, tracking=False):
+        "Parse a single type expression."
+        return self._parse("START_TYPE", code, 1, debug=debug, tracking=tracking)
+
+    def _parse(self, start, code, lineno, **kwargs):
+        # list.pop() and list.append() are atomic; so each state is used by
+        # a single parse at a time.
+        try:
+            state = self._free.pop()
+        except IndexError:
+            state = _ParserState(self.scanner)
+        try:
+            return state.parse(start, code, lineno, **kwargs)
+        finally:
+            self._free.append(state)
+
+
+class _ParserState:
+    def __init__(self, scanner: bool) -> None:
+        self.lexer = lexer.clone()
+        self.parser = copy(_get_parser())
+        if scanner:
+            from xotl.fl.parsers.scanner import scan
+
+            self.scan = scan
+        else:
+            self.scan = self._lex
+
+    def parse(self, start, code, lineno, tokens=None, **kwargs):
+        first = lex.LexToken()
+        first.type, first.value, first.lineno, first.lexpos = start, None, lineno, 0
+        if tokens is None:
+            tokens = self.scan(code, lineno)
+        tokens = chain([first], tokens)
+        return self.parser.parse(lexer=self.lexer, tokenfunc=lambda: next(tokens, None), **kwargs)
+
+    def _lex(self, code, lineno):
+        lexer = self.lexer
+        lexer.lineno = lineno
+        lexer._indentation_level = lexer._min_indentation_level = 0
+        lexer.input(code)
+        return iter(lexer.token, None)
 
-expr_parser = yacc.yacc(debug=False, start="st_expr", tabmodule="expr_parsertab")
 
-program_parser = yacc.yacc(debug=True, start="program", tabmodule="program_parsertab")
+default_context = ParserContext()
 
 
 def _collect_item(prod, lst_index=None, item_index=None):
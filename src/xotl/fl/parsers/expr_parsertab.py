@@ -1,8738 +0,0 @@
-# expr_parsertab.py
-# This file is automatically generated. Do not edit.
-# pylint: disable=W,C,R
-# type: ignore
-# flake8: noqa
-_tabversion = "3.10"
-
-_lr_method = "LALR"
-
-_lr_signature = "st_exprrightARROWleftKEYWORD_LETleftKEYWORD_INleftKEYWORD_WHEREleftTICK_OPERATORleftOPERATORleftPLUSMINUSleftSTARSLASHDOUBLESLASHPERCENTrightDOT_OPERATORleftSPACEANNOTATION ARROW ATSYM BACKSLASH BASE10_INTEGER BASE16_INTEGER BASE2_INTEGER BASE8_INTEGER CHAR COLON COMMA DATE DATETIME DATETIME_INTERVAL DATE_INTERVAL DOT_OPERATOR DOUBLESLASH DOUBLE_COLON EQ FATARROW FLOAT KEYWORD_CLASS KEYWORD_DATA KEYWORD_DERIVING KEYWORD_FORALL KEYWORD_IN KEYWORD_INSTANCE KEYWORD_LET KEYWORD_WHERE LBRACKET LOWER_IDENTIFIER LPAREN MINUS NEWLINE OPERATOR PADDING PERCENT PIPE PLUS RBRACKET RPAREN SLASH SPACE STAR STRING TICK_OPERATOR UNDER_IDENTIFIER UPPER_IDENTIFIERexpr_factor : expr_factor SPACE expr_factor\n    expr_term9 : expr_factor infixr_operator_9 expr_term9\n               | expr_factor\n\n    expr_term7 : expr_term7 infixl_operator_7 expr_term9\n               | expr_term9\n\n    expr_term6 : expr_term6 infixl_operator_6 expr_term7\n               | expr_term7\n\n    expr_term2 : expr_term2 infixl_operator_2 expr_term6\n               | expr_term6\n\n    expr_term1 : expr_term2 infixr_operator_2 expr_term1\n               | expr_term2\n\n    expr_term0 : expr infixl_operator_0 expr_term0\n               | expr_term1\n\n    \n    st_expr : expr\n\n    expr : expr_term0\n\n    expr_factor : literal\n                | identifier\n                | enclosed_expr\n                | letexpr\n                | where_expr\n                | lambda_expr\n                | simple_list_expr\n                | simple_tuple_expr\n\n    st_type_expr : type_expr\n                 | constrained_type_expr\n\n    literal : number\n             | concrete_number\n             | string\n             | char\n             | date\n             | datetime\n             | date_interval\n             | datetime_interval\n    simple_tuple_expr : LPAREN _list_items RPAREN\n    simple_list_expr : LBRACKET _list_items RBRACKET\n    _list_items : expr _list_items_cont\n       _list_items_cont : COMMA expr _list_items_cont\n    _list_items : empty\n       _list_items_cont : empty\n    date : DATE\n    datetime : DATETIME\n    date_interval : DATE_INTERVAL\n    datetime_interval : DATETIME_INTERVAL\n    char : CHARstring : STRINGidentifier : _identifier\n\n    _identifier : UNDER_IDENTIFIER\n                   | UPPER_IDENTIFIER\n                   | LOWER_IDENTIFIER\n\n    enclosed_expr : LPAREN expr RPARENexpr_factor : enclosed_expr expr_factor\n                   | expr_factor enclosed_expr\n    enclosed_expr : _enclosed_operator\n    _enclosed_operator : LPAREN _st_operator RPAREN\n    infixr_operator_9 : DOT_OPERATOR\n\n    infixl_operator_7 : STAR\n                     | SLASH\n                     | DOUBLESLASH\n                     | PERCENT\n\n    infixl_operator_6 : PLUS\n                     | MINUS\n\n\n    infixr_operator_2 : COLON\n\n    infixl_operator_2 : OPERATOR\n                      | ARROW\n                      | ATSYM\n\n    infixl_operator_0 : TICK_OPERATOR\n\n    _st_operator : infixl_operator_2\n                 | infixr_operator_2\n                 | infixl_operator_6\n                 | infixl_operator_7\n                 | infixr_operator_9\n                 | COMMA\n\n    number : BASE10_INTEGER\n              | BASE16_INTEGER\n              | BASE8_INTEGER\n              | BASE2_INTEGER\n    number : FLOATconcrete_number :  number ANNOTATION string\n                        | number ANNOTATION char\n                        | number ANNOTATION identifier\n    empty : lambda_expr : BACKSLASH patterns ARROW expr\n    \n    pattern : possibly_named_pattern\n\n    simple_pattern : literal\n    simple_pattern : cons_pattern\n    simple_pattern : list_cons_pattern\n    simple_pattern : tuple_cons_pattern\n    simple_pattern : empty_list_pattern\n    simple_pattern : empty_tuple_pattern\n    simple_pattern : LOWER_IDENTIFIER\n       simple_pattern : UNDER_IDENTIFIER\n    possibly_named_pattern : _pattern_name simple_pattern\n    _pattern_name : LOWER_IDENTIFIER ATSYM\n    _pattern_name : empty\n    simple_pattern : UPPER_IDENTIFIER\n    list_cons_pattern : pattern COLON pattern\n       list_cons_pattern : simple_pattern COLON simple_pattern\n    cons_pattern : LPAREN _identifier SPACE patterns RPAREN\n    simple_pattern : LPAREN pattern RPAREN\n    simple_pattern : LPAREN simple_pattern RPAREN\n    empty_list_pattern : LBRACKET RBRACKETempty_tuple_pattern : LPAREN RPARENtuple_cons_pattern : LPAREN patterns_comma_sep RPAREN\n    patterns : pattern _patterns\n       patterns : simple_pattern _patterns\n       patterns_comma_sep : pattern _patterns_comma\n       patterns_comma_sep : simple_pattern _patterns_comma\n       _patterns : SPACE pattern _patterns\n       _patterns : SPACE simple_pattern _patterns\n       _patterns_comma : COMMA pattern _patterns_comma_trail\n       _patterns_comma : COMMA simple_pattern _patterns_comma_trail\n       _patterns_comma_trail : COMMA pattern _patterns_comma_trail\n       _patterns_comma_trail : COMMA simple_pattern _patterns_comma_trail\n    _patterns : empty\n       _patterns_comma_trail : empty\n    equation : _identifier _patterns EQ expr\n       equation : _enclosed_operator _patterns EQ expr\n    equations : equation _equation_set\n    \n    _equation_set : PADDING equation _equation_set\n    \n    _equation_set : empty\n    \n    letexpr : KEYWORD_LET SPACE local_definitions KEYWORD_IN SPACE st_expr\n\n    \n    where_expr : expr KEYWORD_WHERE SPACE equations\n    where_expr : expr KEYWORD_WHERE PADDING equations\n    type_expr : type_scheme type_function_expr\n                 | type_scheme type_termtype_scheme : emptytype_scheme : KEYWORD_FORALL SPACE _type_scheme_generics_type_scheme_generics : _identifier SPACE _type_scheme_generics_type_scheme_generics : _identifier DOT_OPERATORtype_function_expr : type_term ARROW _maybe_padding type_function_expr\n                          | type_term\n    type_term : type_app_expression\n                 | type_factortype_app_expression : type_factor _app_args_non_empty_app_args : SPACE type_factor _app_args\n       _app_args_non_empty : SPACE type_factor _app_args\n    _app_args : emptytype_variable : LOWER_IDENTIFIERtype_cons : UPPER_IDENTIFIERtype_factor : type_variable\n                   | type_cons\n\n    type_factor : LPAREN _maybe_padding _type_expr_list _maybe_padding RPARENtype_factor : LPAREN RPAREN_type_expr_list : type_expr COMMA _type_expr_list_trail\n       _type_expr_list_trail : type_expr COMMA _type_expr_list_trail\n    _type_expr_list_trail : type_expr\n    type_factor : LPAREN _maybe_padding type_expr _maybe_padding RPARENtype_factor : LBRACKET _maybe_padding type_expr _maybe_padding RBRACKETconstrained_type_expr : _constrained_type_expr_bare\n\n    _constrained_type_expr_bare : type_constraints FATARROW type_expr\n    _maybe_constrained_type_expr : type_expr\n    _maybe_constrained_type_expr : _constrained_type_expr_bare\n    instance : KEYWORD_INSTANCE _maybe_constrained_type_expr                   KEYWORD_WHERE PADDING local_definitionstype_constraints : _type_expr_list_trail\n    _maybe_padding : PADDING\n                      | empty\n    program : definitions _trailing_new_lines\n    _trailing_new_lines : empty\n       _trailing_new_lines : NEWLINE _trailing_new_lines\n    definitions : definition _definition_set\n    _definition_set : newlines definition _definition_set\n    newlines : NEWLINE _trailing_new_lines_definition_set : empty\n       _definition_set : newlines\n    definition : local_definition\n                  | datatype_definition\n                  | typeclass\n                  | instance\n    \n    local_definition : nametype_decl\n                     | valuedef\n    local_definitions : local_definition _local_definition_set\n    _local_definition_set : PADDING definition _local_definition_set\n    _local_definition_set : empty\n    typeclass : KEYWORD_CLASS _typeclass_def                    KEYWORD_WHERE PADDING local_definitions\n    _typeclass_def : simple_type_constraint\n    _typeclass_def : simple_type_constraints FATARROW simple_type_constraint\n    simple_type_constraint : UPPER_IDENTIFIER SPACE type_variable\n    simple_type_constraints : simple_type_constraint _simple_type_constraints\n       _simple_type_constraints : COMMA simple_type_constraint _simple_type_constraints\n    _simple_type_constraints : empty\n    valuedef : equation\n    nametype_decl : _identifier DOUBLE_COLON st_type_expr\n    nametype_decl : LPAREN _st_operator RPAREN DOUBLE_COLON st_type_expr\n    datatype_definition : _datatype_lhs EQ _data_rhs\n    _datatype_lhs : KEYWORD_DATA SPACE UPPER_IDENTIFIER _cons_params\n    _cons_params : SPACE LOWER_IDENTIFIER _cons_params\n    _cons_params : empty\n    _data_rhs : data_cons _data_conses\n       _data_conses : _maybe_padding PIPE data_cons _data_conses\n    _data_conses : empty_data_conses : _maybe_padding KEYWORD_DERIVING                        LPAREN _derivations_list RPAREN_data_conses : _maybe_padding KEYWORD_DERIVING UPPER_IDENTIFIERdata_cons : _data_cons_data_cons : UPPER_IDENTIFIER _cons_args_data_cons : cons_arg OPERATOR cons_arg _cons_args_cons_args : SPACE cons_arg _cons_args\n    _cons_args : empty\n    cons_arg : type_variable\n       cons_arg : type_cons\n       cons_arg : _cons_arg_factor\n    _cons_arg_factor : LPAREN type_expr RPAREN\n    _cons_arg_factor : LBRACKET type_expr RBRACKET\n    _derivations_list : UPPER_IDENTIFIER _derivations_list_trail\n       _derivations_list_trail : COMMA UPPER_IDENTIFIER _derivations_list_trail\n    _derivations_list_trail : empty\n    "
-
-_lr_action_items = {
-    "LPAREN": (
-        [
-            0,
-            2,
-            3,
-            4,
-            5,
-            6,
-            7,
-            8,
-            9,
-            10,
-            11,
-            12,
-            13,
-            14,
-            15,
-            16,
-            17,
-            18,
-            19,
-            20,
-            21,
-            22,
-            23,
-            24,
-            25,
-            26,
-            27,
-            28,
-            30,
-            31,
-            32,
-            33,
-            34,
-            35,
-            36,
-            37,
-            38,
-            39,
-            40,
-            41,
-            42,
-            43,
-            44,
-            45,
-            46,
-            48,
-            49,
-            50,
-            51,
-            52,
-            53,
-            54,
-            55,
-            56,
-            57,
-            58,
-            59,
-            60,
-            61,
-            62,
-            63,
-            64,
-            65,
-            66,
-            67,
-            68,
-            81,
-            95,
-            96,
-            98,
-            102,
-            103,
-            104,
-            105,
-            106,
-            107,
-            108,
-            109,
-            110,
-            112,
-            113,
-            114,
-            115,
-            117,
-            119,
-            120,
-            129,
-            131,
-            132,
-            135,
-            136,
-            148,
-            149,
-            150,
-            153,
-            157,
-            159,
-            163,
-            171,
-            174,
-            176,
-            177,
-            178,
-            180,
-            188,
-            193,
-            195,
-            199,
-            201,
-            207,
-            208,
-            210,
-            219,
-            226,
-            227,
-            231,
-            232,
-            233,
-            234,
-            235,
-            240,
-            249,
-            250,
-            261,
-            263,
-            264,
-            266,
-            267,
-            268,
-            269,
-            279,
-            281,
-            284,
-            288,
-            292,
-            298,
-            301,
-            302,
-            313,
-            318,
-            320,
-        ],
-        [
-            27,
-            -14,
-            -15,
-            -13,
-            -11,
-            -9,
-            -7,
-            -5,
-            67,
-            -16,
-            -17,
-            27,
-            -19,
-            -20,
-            -21,
-            -22,
-            -23,
-            -26,
-            -27,
-            -28,
-            -29,
-            -30,
-            -31,
-            -32,
-            -33,
-            -46,
-            27,
-            -53,
-            95,
-            27,
-            -73,
-            -74,
-            -75,
-            -76,
-            -77,
-            -45,
-            -44,
-            -40,
-            -41,
-            -42,
-            -43,
-            -47,
-            -48,
-            -49,
-            27,
-            -66,
-            27,
-            27,
-            -62,
-            -63,
-            -64,
-            -65,
-            27,
-            -60,
-            -61,
-            27,
-            -56,
-            -57,
-            -58,
-            -59,
-            27,
-            27,
-            -52,
-            -55,
-            27,
-            67,
-            126,
-            95,
-            95,
-            -94,
-            -12,
-            152,
-            152,
-            -10,
-            -8,
-            -6,
-            -4,
-            -2,
-            -1,
-            -78,
-            -79,
-            -80,
-            -50,
-            27,
-            -34,
-            -54,
-            27,
-            -81,
-            95,
-            95,
-            -93,
-            -35,
-            -122,
-            -81,
-            -123,
-            126,
-            -81,
-            -82,
-            95,
-            95,
-            -118,
-            152,
-            -120,
-            27,
-            -81,
-            226,
-            -126,
-            27,
-            27,
-            -81,
-            -121,
-            249,
-            -81,
-            -81,
-            -81,
-            -81,
-            -116,
-            -81,
-            -117,
-            95,
-            -119,
-            -81,
-            -81,
-            -81,
-            226,
-            -81,
-            -155,
-            -156,
-            -81,
-            -127,
-            249,
-            249,
-            126,
-            126,
-            226,
-            -129,
-            249,
-            322,
-            226,
-            -81,
-            -128,
-        ],
-    ),
-    "KEYWORD_LET": (
-        [
-            0,
-            12,
-            27,
-            28,
-            31,
-            46,
-            48,
-            49,
-            50,
-            51,
-            52,
-            53,
-            54,
-            55,
-            56,
-            57,
-            58,
-            59,
-            60,
-            61,
-            62,
-            63,
-            64,
-            66,
-            67,
-            115,
-            117,
-            120,
-            129,
-            180,
-            199,
-            201,
-        ],
-        [
-            29,
-            29,
-            29,
-            -53,
-            29,
-            29,
-            -66,
-            29,
-            29,
-            -62,
-            -63,
-            -64,
-            -65,
-            29,
-            -60,
-            -61,
-            29,
-            -56,
-            -57,
-            -58,
-            -59,
-            29,
-            29,
-            -55,
-            29,
-            -50,
-            29,
-            -54,
-            29,
-            29,
-            29,
-            29,
-        ],
-    ),
-    "BACKSLASH": (
-        [
-            0,
-            12,
-            27,
-            28,
-            31,
-            46,
-            48,
-            49,
-            50,
-            51,
-            52,
-            53,
-            54,
-            55,
-            56,
-            57,
-            58,
-            59,
-            60,
-            61,
-            62,
-            63,
-            64,
-            66,
-            67,
-            115,
-            117,
-            120,
-            129,
-            180,
-            199,
-            201,
-        ],
-        [
-            30,
-            30,
-            30,
-            -53,
-            30,
-            30,
-            -66,
-            30,
-            30,
-            -62,
-            -63,
-            -64,
-            -65,
-            30,
-            -60,
-            -61,
-            30,
-            -56,
-            -57,
-            -58,
-            -59,
-            30,
-            30,
-            -55,
-            30,
-            -50,
-            30,
-            -54,
-            30,
-            30,
-            30,
-            30,
-        ],
-    ),
-    "LBRACKET": (
-        [
-            0,
-            12,
-            27,
-            28,
-            30,
-            31,
-            46,
-            48,
-            49,
-            50,
-            51,
-            52,
-            53,
-            54,
-            55,
-            56,
-            57,
-            58,
-            59,
-            60,
-            61,
-            62,
-            63,
-            64,
-            66,
-            67,
-            95,
-            96,
-            98,
-            115,
-            117,
-            120,
-            129,
-            131,
-            132,
-            135,
-            136,
-            159,
-            171,
-            174,
-            180,
-            188,
-            193,
-            195,
-            199,
-            201,
-            210,
-            219,
-            226,
-            227,
-            231,
-            233,
-            235,
-            249,
-            250,
-            261,
-            263,
-            264,
-            266,
-            267,
-            268,
-            269,
-            279,
-            281,
-            292,
-            298,
-            301,
-            313,
-            318,
-            320,
-        ],
-        [
-            31,
-            31,
-            31,
-            -53,
-            97,
-            31,
-            31,
-            -66,
-            31,
-            31,
-            -62,
-            -63,
-            -64,
-            -65,
-            31,
-            -60,
-            -61,
-            31,
-            -56,
-            -57,
-            -58,
-            -59,
-            31,
-            31,
-            -55,
-            31,
-            97,
-            97,
-            -94,
-            -50,
-            31,
-            -54,
-            31,
-            -81,
-            97,
-            97,
-            -93,
-            -81,
-            97,
-            97,
-            31,
-            -81,
-            227,
-            -126,
-            31,
-            31,
-            250,
-            -81,
-            -81,
-            -81,
-            -81,
-            -81,
-            97,
-            -81,
-            -81,
-            -81,
-            227,
-            -81,
-            -155,
-            -156,
-            -81,
-            -127,
-            250,
-            250,
-            227,
-            -129,
-            250,
-            227,
-            -81,
-            -128,
-        ],
-    ),
-    "BASE10_INTEGER": (
-        [
-            0,
-            12,
-            27,
-            28,
-            30,
-            31,
-            46,
-            48,
-            49,
-            50,
-            51,
-            52,
-            53,
-            54,
-            55,
-            56,
-            57,
-            58,
-            59,
-            60,
-            61,
-            62,
-            63,
-            64,
-            66,
-            67,
-            95,
-            96,
-            98,
-            115,
-            117,
-            120,
-            129,
-            131,
-            132,
-            135,
-            136,
-            171,
-            174,
-            180,
-            199,
-            201,
-            235,
-        ],
-        [
-            32,
-            32,
-            32,
-            -53,
-            32,
-            32,
-            32,
-            -66,
-            32,
-            32,
-            -62,
-            -63,
-            -64,
-            -65,
-            32,
-            -60,
-            -61,
-            32,
-            -56,
-            -57,
-            -58,
-            -59,
-            32,
-            32,
-            -55,
-            32,
-            32,
-            32,
-            -94,
-            -50,
-            32,
-            -54,
-            32,
-            -81,
-            32,
-            32,
-            -93,
-            32,
-            32,
-            32,
-            32,
-            32,
-            32,
-        ],
-    ),
-    "BASE16_INTEGER": (
-        [
-            0,
-            12,
-            27,
-            28,
-            30,
-            31,
-            46,
-            48,
-            49,
-            50,
-            51,
-            52,
-            53,
-            54,
-            55,
-            56,
-            57,
-            58,
-            59,
-            60,
-            61,
-            62,
-            63,
-            64,
-            66,
-            67,
-            95,
-            96,
-            98,
-            115,
-            117,
-            120,
-            129,
-            131,
-            132,
-            135,
-            136,
-            171,
-            174,
-            180,
-            199,
-            201,
-            235,
-        ],
-        [
-            33,
-            33,
-            33,
-            -53,
-            33,
-            33,
-            33,
-            -66,
-            33,
-            33,
-            -62,
-            -63,
-            -64,
-            -65,
-            33,
-            -60,
-            -61,
-            33,
-            -56,
-            -57,
-            -58,
-            -59,
-            33,
-            33,
-            -55,
-            33,
-            33,
-            33,
-            -94,
-            -50,
-            33,
-            -54,
-            33,
-            -81,
-            33,
-            33,
-            -93,
-            33,
-            33,
-            33,
-            33,
-            33,
-            33,
-        ],
-    ),
-    "BASE8_INTEGER": (
-        [
-            0,
-            12,
-            27,
-            28,
-            30,
-            31,
-            46,
-            48,
-            49,
-            50,
-            51,
-            52,
-            53,
-            54,
-            55,
-            56,
-            57,
-            58,
-            59,
-            60,
-            61,
-            62,
-            63,
-            64,
-            66,
-            67,
-            95,
-            96,
-            98,
-            115,
-            117,
-            120,
-            129,
-            131,
-            132,
-            135,
-            136,
-            171,
-            174,
-            180,
-            199,
-            201,
-            235,
-        ],
-        [
-            34,
-            34,
-            34,
-            -53,
-            34,
-            34,
-            34,
-            -66,
-            34,
-            34,
-            -62,
-            -63,
-            -64,
-            -65,
-            34,
-            -60,
-            -61,
-            34,
-            -56,
-            -57,
-            -58,
-            -59,
-            34,
-            34,
-            -55,
-            34,
-            34,
-            34,
-            -94,
-            -50,
-            34,
-            -54,
-            34,
-            -81,
-            34,
-            34,
-            -93,
-            34,
-            34,
-            34,
-            34,
-            34,
-            34,
-        ],
-    ),
-    "BASE2_INTEGER": (
-        [
-            0,
-            12,
-            27,
-            28,
-            30,
-            31,
-            46,
-            48,
-            49,
-            50,
-            51,
-            52,
-            53,
-            54,
-            55,
-            56,
-            57,
-            58,
-            59,
-            60,
-            61,
-            62,
-            63,
-            64,
-            66,
-            67,
-            95,
-            96,
-            98,
-            115,
-            117,
-            120,
-            129,
-            131,
-            132,
-            135,
-            136,
-            171,
-            174,
-            180,
-            199,
-            201,
-            235,
-        ],
-        [
-            35,
-            35,
-            35,
-            -53,
-            35,
-            35,
-            35,
-            -66,
-            35,
-            35,
-            -62,
-            -63,
-            -64,
-            -65,
-            35,
-            -60,
-            -61,
-            35,
-            -56,
-            -57,
-            -58,
-            -59,
-            35,
-            35,
-            -55,
-            35,
-            35,
-            35,
-            -94,
-            -50,
-            35,
-            -54,
-            35,
-            -81,
-            35,
-            35,
-            -93,
-            35,
-            35,
-            35,
-            35,
-            35,
-            35,
-        ],
-    ),
-    "FLOAT": (
-        [
-            0,
-            12,
-            27,
-            28,
-            30,
-            31,
-            46,
-            48,
-            49,
-            50,
-            51,
-            52,
-            53,
-            54,
-            55,
-            56,
-            57,
-            58,
-            59,
-            60,
-            61,
-            62,
-            63,
-            64,
-            66,
-            67,
-            95,
-            96,
-            98,
-            115,
-            117,
-            120,
-            129,
-            131,
-            132,
-            135,
-            136,
-            171,
-            174,
-            180,
-            199,
-            201,
-            235,
-        ],
-        [
-            36,
-            36,
-            36,
-            -53,
-            36,
-            36,
-            36,
-            -66,
-            36,
-            36,
-            -62,
-            -63,
-            -64,
-            -65,
-            36,
-            -60,
-            -61,
-            36,
-            -56,
-            -57,
-            -58,
-            -59,
-            36,
-            36,
-            -55,
-            36,
-            36,
-            36,
-            -94,
-            -50,
-            36,
-            -54,
-            36,
-            -81,
-            36,
-            36,
-            -93,
-            36,
-            36,
-            36,
-            36,
-            36,
-            36,
-        ],
-    ),
-    "STRING": (
-        [
-            0,
-            12,
-            27,
-            28,
-            30,
-            31,
-            46,
-            48,
-            49,
-            50,
-            51,
-            52,
-            53,
-            54,
-            55,
-            56,
-            57,
-            58,
-            59,
-            60,
-            61,
-            62,
-            63,
-            64,
-            66,
-            67,
-            70,
-            95,
-            96,
-            98,
-            115,
-            117,
-            120,
-            129,
-            131,
-            132,
-            135,
-            136,
-            171,
-            174,
-            180,
-            199,
-            201,
-            235,
-        ],
-        [
-            37,
-            37,
-            37,
-            -53,
-            37,
-            37,
-            37,
-            -66,
-            37,
-            37,
-            -62,
-            -63,
-            -64,
-            -65,
-            37,
-            -60,
-            -61,
-            37,
-            -56,
-            -57,
-            -58,
-            -59,
-            37,
-            37,
-            -55,
-            37,
-            37,
-            37,
-            37,
-            -94,
-            -50,
-            37,
-            -54,
-            37,
-            -81,
-            37,
-            37,
-            -93,
-            37,
-            37,
-            37,
-            37,
-            37,
-            37,
-        ],
-    ),
-    "CHAR": (
-        [
-            0,
-            12,
-            27,
-            28,
-            30,
-            31,
-            46,
-            48,
-            49,
-            50,
-            51,
-            52,
-            53,
-            54,
-            55,
-            56,
-            57,
-            58,
-            59,
-            60,
-            61,
-            62,
-            63,
-            64,
-            66,
-            67,
-            70,
-            95,
-            96,
-            98,
-            115,
-            117,
-            120,
-            129,
-            131,
-            132,
-            135,
-            136,
-            171,
-            174,
-            180,
-            199,
-            201,
-            235,
-        ],
-        [
-            38,
-            38,
-            38,
-            -53,
-            38,
-            38,
-            38,
-            -66,
-            38,
-            38,
-            -62,
-            -63,
-            -64,
-            -65,
-            38,
-            -60,
-            -61,
-            38,
-            -56,
-            -57,
-            -58,
-            -59,
-            38,
-            38,
-            -55,
-            38,
-            38,
-            38,
-            38,
-            -94,
-            -50,
-            38,
-            -54,
-            38,
-            -81,
-            38,
-            38,
-            -93,
-            38,
-            38,
-            38,
-            38,
-            38,
-            38,
-        ],
-    ),
-    "DATE": (
-        [
-            0,
-            12,
-            27,
-            28,
-            30,
-            31,
-            46,
-            48,
-            49,
-            50,
-            51,
-            52,
-            53,
-            54,
-            55,
-            56,
-            57,
-            58,
-            59,
-            60,
-            61,
-            62,
-            63,
-            64,
-            66,
-            67,
-            95,
-            96,
-            98,
-            115,
-            117,
-            120,
-            129,
-            131,
-            132,
-            135,
-            136,
-            171,
-            174,
-            180,
-            199,
-            201,
-            235,
-        ],
-        [
-            39,
-            39,
-            39,
-            -53,
-            39,
-            39,
-            39,
-            -66,
-            39,
-            39,
-            -62,
-            -63,
-            -64,
-            -65,
-            39,
-            -60,
-            -61,
-            39,
-            -56,
-            -57,
-            -58,
-            -59,
-            39,
-            39,
-            -55,
-            39,
-            39,
-            39,
-            -94,
-            -50,
-            39,
-            -54,
-            39,
-            -81,
-            39,
-            39,
-            -93,
-            39,
-            39,
-            39,
-            39,
-            39,
-            39,
-        ],
-    ),
-    "DATETIME": (
-        [
-            0,
-            12,
-            27,
-            28,
-            30,
-            31,
-            46,
-            48,
-            49,
-            50,
-            51,
-            52,
-            53,
-            54,
-            55,
-            56,
-            57,
-            58,
-            59,
-            60,
-            61,
-            62,
-            63,
-            64,
-            66,
-            67,
-            95,
-            96,
-            98,
-            115,
-            117,
-            120,
-            129,
-            131,
-            132,
-            135,
-            136,
-            171,
-            174,
-            180,
-            199,
-            201,
-            235,
-        ],
-        [
-            40,
-            40,
-            40,
-            -53,
-            40,
-            40,
-            40,
-            -66,
-            40,
-            40,
-            -62,
-            -63,
-            -64,
-            -65,
-            40,
-            -60,
-            -61,
-            40,
-            -56,
-            -57,
-            -58,
-            -59,
-            40,
-            40,
-            -55,
-            40,
-            40,
-            40,
-            -94,
-            -50,
-            40,
-            -54,
-            40,
-            -81,
-            40,
-            40,
-            -93,
-            40,
-            40,
-            40,
-            40,
-            40,
-            40,
-        ],
-    ),
-    "DATE_INTERVAL": (
-        [
-            0,
-            12,
-            27,
-            28,
-            30,
-            31,
-            46,
-            48,
-            49,
-            50,
-            51,
-            52,
-            53,
-            54,
-            55,
-            56,
-            57,
-            58,
-            59,
-            60,
-            61,
-            62,
-            63,
-            64,
-            66,
-            67,
-            95,
-            96,
-            98,
-            115,
-            117,
-            120,
-            129,
-            131,
-            132,
-            135,
-            136,
-            171,
-            174,
-            180,
-            199,
-            201,
-            235,
-        ],
-        [
-            41,
-            41,
-            41,
-            -53,
-            41,
-            41,
-            41,
-            -66,
-            41,
-            41,
-            -62,
-            -63,
-            -64,
-            -65,
-            41,
-            -60,
-            -61,
-            41,
-            -56,
-            -57,
-            -58,
-            -59,
-            41,
-            41,
-            -55,
-            41,
-            41,
-            41,
-            -94,
-            -50,
-            41,
-            -54,
-            41,
-            -81,
-            41,
-            41,
-            -93,
-            41,
-            41,
-            41,
-            41,
-            41,
-            41,
-        ],
-    ),
-    "DATETIME_INTERVAL": (
-        [
-            0,
-            12,
-            27,
-            28,
-            30,
-            31,
-            46,
-            48,
-            49,
-            50,
-            51,
-            52,
-            53,
-            54,
-            55,
-            56,
-            57,
-            58,
-            59,
-            60,
-            61,
-            62,
-            63,
-            64,
-            66,
-            67,
-            95,
-            96,
-            98,
-            115,
-            117,
-            120,
-            129,
-            131,
-            132,
-            135,
-            136,
-            171,
-            174,
-            180,
-            199,
-            201,
-            235,
-        ],
-        [
-            42,
-            42,
-            42,
-            -53,
-            42,
-            42,
-            42,
-            -66,
-            42,
-            42,
-            -62,
-            -63,
-            -64,
-            -65,
-            42,
-            -60,
-            -61,
-            42,
-            -56,
-            -57,
-            -58,
-            -59,
-            42,
-            42,
-            -55,
-            42,
-            42,
-            42,
-            -94,
-            -50,
-            42,
-            -54,
-            42,
-            -81,
-            42,
-            42,
-            -93,
-            42,
-            42,
-            42,
-            42,
-            42,
-            42,
-        ],
-    ),
-    "UNDER_IDENTIFIER": (
-        [
-            0,
-            12,
-            27,
-            28,
-            30,
-            31,
-            46,
-            48,
-            49,
-            50,
-            51,
-            52,
-            53,
-            54,
-            55,
-            56,
-            57,
-            58,
-            59,
-            60,
-            61,
-            62,
-            63,
-            64,
-            66,
-            67,
-            70,
-            81,
-            95,
-            96,
-            98,
-            103,
-            104,
-            115,
-            117,
-            120,
-            129,
-            131,
-            132,
-            135,
-            136,
-            157,
-            171,
-            174,
-            177,
-            180,
-            199,
-            201,
-            230,
-            235,
-            284,
-            288,
-            297,
-        ],
-        [
-            43,
-            43,
-            43,
-            -53,
-            93,
-            43,
-            43,
-            -66,
-            43,
-            43,
-            -62,
-            -63,
-            -64,
-            -65,
-            43,
-            -60,
-            -61,
-            43,
-            -56,
-            -57,
-            -58,
-            -59,
-            43,
-            43,
-            -55,
-            43,
-            43,
-            43,
-            143,
-            93,
-            -94,
-            43,
-            43,
-            -50,
-            43,
-            -54,
-            43,
-            -81,
-            93,
-            93,
-            -93,
-            43,
-            93,
-            93,
-            43,
-            43,
-            43,
-            43,
-            43,
-            93,
-            43,
-            43,
-            43,
-        ],
-    ),
-    "UPPER_IDENTIFIER": (
-        [
-            0,
-            12,
-            27,
-            28,
-            30,
-            31,
-            46,
-            48,
-            49,
-            50,
-            51,
-            52,
-            53,
-            54,
-            55,
-            56,
-            57,
-            58,
-            59,
-            60,
-            61,
-            62,
-            63,
-            64,
-            66,
-            67,
-            70,
-            81,
-            95,
-            96,
-            98,
-            103,
-            104,
-            115,
-            117,
-            120,
-            129,
-            131,
-            132,
-            135,
-            136,
-            157,
-            159,
-            171,
-            174,
-            177,
-            180,
-            187,
-            188,
-            193,
-            195,
-            199,
-            201,
-            210,
-            218,
-            219,
-            226,
-            227,
-            230,
-            231,
-            233,
-            235,
-            249,
-            250,
-            253,
-            255,
-            261,
-            263,
-            264,
-            266,
-            267,
-            268,
-            269,
-            279,
-            281,
-            284,
-            288,
-            292,
-            297,
-            298,
-            301,
-            302,
-            313,
-            318,
-            320,
-            322,
-            338,
-        ],
-        [
-            44,
-            44,
-            44,
-            -53,
-            94,
-            44,
-            44,
-            -66,
-            44,
-            44,
-            -62,
-            -63,
-            -64,
-            -65,
-            44,
-            -60,
-            -61,
-            44,
-            -56,
-            -57,
-            -58,
-            -59,
-            44,
-            44,
-            -55,
-            44,
-            44,
-            44,
-            144,
-            94,
-            -94,
-            44,
-            44,
-            -50,
-            44,
-            -54,
-            44,
-            -81,
-            94,
-            94,
-            -93,
-            44,
-            -81,
-            94,
-            94,
-            44,
-            44,
-            214,
-            -81,
-            229,
-            -126,
-            44,
-            44,
-            244,
-            258,
-            -81,
-            -81,
-            -81,
-            44,
-            -81,
-            -81,
-            94,
-            -81,
-            -81,
-            214,
-            214,
-            -81,
-            229,
-            -81,
-            -155,
-            -156,
-            -81,
-            -127,
-            229,
-            229,
-            44,
-            44,
-            229,
-            44,
-            -129,
-            244,
-            323,
-            229,
-            -81,
-            -128,
-            334,
-            340,
-        ],
-    ),
-    "LOWER_IDENTIFIER": (
-        [
-            0,
-            12,
-            27,
-            28,
-            30,
-            31,
-            46,
-            48,
-            49,
-            50,
-            51,
-            52,
-            53,
-            54,
-            55,
-            56,
-            57,
-            58,
-            59,
-            60,
-            61,
-            62,
-            63,
-            64,
-            66,
-            67,
-            70,
-            81,
-            95,
-            96,
-            98,
-            103,
-            104,
-            115,
-            117,
-            120,
-            129,
-            131,
-            132,
-            135,
-            136,
-            157,
-            159,
-            171,
-            174,
-            177,
-            180,
-            188,
-            193,
-            195,
-            199,
-            201,
-            210,
-            219,
-            226,
-            227,
-            230,
-            231,
-            233,
-            235,
-            249,
-            250,
-            256,
-            261,
-            263,
-            264,
-            266,
-            267,
-            268,
-            269,
-            279,
-            281,
-            284,
-            288,
-            289,
-            292,
-            297,
-            298,
-            301,
-            313,
-            318,
-            320,
-        ],
-        [
-            45,
-            45,
-            45,
-            -53,
-            92,
-            45,
-            45,
-            -66,
-            45,
-            45,
-            -62,
-            -63,
-            -64,
-            -65,
-            45,
-            -60,
-            -61,
-            45,
-            -56,
-            -57,
-            -58,
-            -59,
-            45,
-            45,
-            -55,
-            45,
-            45,
-            45,
-            142,
-            92,
-            -94,
-            45,
-            45,
-            -50,
-            45,
-            -54,
-            45,
-            165,
-            92,
-            92,
-            -93,
-            45,
-            -81,
-            92,
-            92,
-            45,
-            45,
-            -81,
-            228,
-            -126,
-            45,
-            45,
-            228,
-            -81,
-            -81,
-            -81,
-            45,
-            -81,
-            -81,
-            92,
-            -81,
-            -81,
-            228,
-            -81,
-            228,
-            -81,
-            -155,
-            -156,
-            -81,
-            -127,
-            228,
-            228,
-            45,
-            45,
-            310,
-            228,
-            45,
-            -129,
-            228,
-            228,
-            -81,
-            -128,
-        ],
-    ),
-    "$end": (
-        [
-            1,
-            2,
-            3,
-            4,
-            5,
-            6,
-            7,
-            8,
-            9,
-            10,
-            11,
-            12,
-            13,
-            14,
-            15,
-            16,
-            17,
-            18,
-            19,
-            20,
-            21,
-            22,
-            23,
-            24,
-            25,
-            26,
-            28,
-            32,
-            33,
-            34,
-            35,
-            36,
-            37,
-            38,
-            39,
-            40,
-            41,
-            42,
-            43,
-            44,
-            45,
-            65,
-            68,
-            102,
-            105,
-            106,
-            107,
-            108,
-            109,
-            110,
-            112,
-            113,
-            114,
-            115,
-            119,
-            120,
-            148,
-            149,
-            150,
-            153,
-            163,
-            176,
-            178,
-            207,
-            208,
-            232,
-            234,
-            240,
-        ],
-        [
-            0,
-            -14,
-            -15,
-            -13,
-            -11,
-            -9,
-            -7,
-            -5,
-            -3,
-            -16,
-            -17,
-            -18,
-            -19,
-            -20,
-            -21,
-            -22,
-            -23,
-            -26,
-            -27,
-            -28,
-            -29,
-            -30,
-            -31,
-            -32,
-            -33,
-            -46,
-            -53,
-            -73,
-            -74,
-            -75,
-            -76,
-            -77,
-            -45,
-            -44,
-            -40,
-            -41,
-            -42,
-            -43,
-            -47,
-            -48,
-            -49,
-            -52,
-            -51,
-            -12,
-            -10,
-            -8,
-            -6,
-            -4,
-            -2,
-            -1,
-            -78,
-            -79,
-            -80,
-            -50,
-            -34,
-            -54,
-            -35,
-            -122,
-            -81,
-            -123,
-            -82,
-            -118,
-            -120,
-            -81,
-            -121,
-            -116,
-            -117,
-            -119,
-        ],
-    ),
-    "SPACE": (
-        [
-            2,
-            3,
-            4,
-            5,
-            6,
-            7,
-            8,
-            9,
-            10,
-            11,
-            12,
-            13,
-            14,
-            15,
-            16,
-            17,
-            18,
-            19,
-            20,
-            21,
-            22,
-            23,
-            24,
-            25,
-            26,
-            28,
-            29,
-            32,
-            33,
-            34,
-            35,
-            36,
-            37,
-            38,
-            39,
-            40,
-            41,
-            42,
-            43,
-            44,
-            45,
-            47,
-            65,
-            68,
-            83,
-            84,
-            85,
-            86,
-            87,
-            88,
-            89,
-            90,
-            91,
-            92,
-            93,
-            94,
-            102,
-            105,
-            106,
-            107,
-            108,
-            109,
-            110,
-            112,
-            113,
-            114,
-            115,
-            119,
-            120,
-            125,
-            128,
-            138,
-            140,
-            142,
-            143,
-            144,
-            145,
-            147,
-            148,
-            149,
-            150,
-            151,
-            153,
-            155,
-            163,
-            164,
-            166,
-            167,
-            168,
-            169,
-            172,
-            175,
-            176,
-            178,
-            189,
-            196,
-            200,
-            207,
-            208,
-            214,
-            223,
-            224,
-            225,
-            228,
-            229,
-            232,
-            234,
-            239,
-            240,
-            244,
-            246,
-            247,
-            248,
-            258,
-            265,
-            270,
-            293,
-            303,
-            304,
-            305,
-            306,
-            310,
-            327,
-            328,
-            329,
-            331,
-        ],
-        [
-            -14,
-            -15,
-            -13,
-            -11,
-            -9,
-            -7,
-            -5,
-            64,
-            -16,
-            -17,
-            -18,
-            -19,
-            -20,
-            -21,
-            -22,
-            -23,
-            -26,
-            -27,
-            -28,
-            -29,
-            -30,
-            -31,
-            -32,
-            -33,
-            -46,
-            -53,
-            81,
-            -73,
-            -74,
-            -75,
-            -76,
-            -77,
-            -45,
-            -44,
-            -40,
-            -41,
-            -42,
-            -43,
-            -47,
-            -48,
-            -49,
-            103,
-            -52,
-            64,
-            132,
-            132,
-            -83,
-            -84,
-            -85,
-            -86,
-            -87,
-            -88,
-            -89,
-            -90,
-            -91,
-            -95,
-            -12,
-            -10,
-            -8,
-            -6,
-            -4,
-            -2,
-            -1,
-            -78,
-            -79,
-            -80,
-            -50,
-            -34,
-            -54,
-            132,
-            132,
-            -102,
-            174,
-            -49,
-            -47,
-            -48,
-            -92,
-            -101,
-            -35,
-            -122,
-            -81,
-            132,
-            -123,
-            180,
-            -82,
-            -96,
-            132,
-            132,
-            -97,
-            -99,
-            -100,
-            -103,
-            -118,
-            -120,
-            218,
-            230,
-            -54,
-            -81,
-            -121,
-            256,
-            263,
-            -140,
-            -141,
-            -138,
-            -139,
-            -116,
-            -117,
-            -98,
-            -119,
-            279,
-            -198,
-            -199,
-            -200,
-            289,
-            -143,
-            297,
-            313,
-            279,
-            279,
-            -201,
-            -202,
-            289,
-            313,
-            -142,
-            -147,
-            -148,
-        ],
-    ),
-    "DOT_OPERATOR": (
-        [
-            2,
-            3,
-            4,
-            5,
-            6,
-            7,
-            8,
-            9,
-            10,
-            11,
-            12,
-            13,
-            14,
-            15,
-            16,
-            17,
-            18,
-            19,
-            20,
-            21,
-            22,
-            23,
-            24,
-            25,
-            26,
-            27,
-            28,
-            32,
-            33,
-            34,
-            35,
-            36,
-            37,
-            38,
-            39,
-            40,
-            41,
-            42,
-            43,
-            44,
-            45,
-            65,
-            67,
-            68,
-            102,
-            105,
-            106,
-            107,
-            108,
-            109,
-            110,
-            112,
-            113,
-            114,
-            115,
-            119,
-            120,
-            126,
-            148,
-            149,
-            150,
-            152,
-            153,
-            163,
-            176,
-            178,
-            207,
-            208,
-            232,
-            234,
-            240,
-            270,
-        ],
-        [
-            -14,
-            -15,
-            -13,
-            -11,
-            -9,
-            -7,
-            -5,
-            66,
-            -16,
-            -17,
-            -18,
-            -19,
-            -20,
-            -21,
-            -22,
-            -23,
-            -26,
-            -27,
-            -28,
-            -29,
-            -30,
-            -31,
-            -32,
-            -33,
-            -46,
-            66,
-            -53,
-            -73,
-            -74,
-            -75,
-            -76,
-            -77,
-            -45,
-            -44,
-            -40,
-            -41,
-            -42,
-            -43,
-            -47,
-            -48,
-            -49,
-            -52,
-            66,
-            66,
-            -12,
-            -10,
-            -8,
-            -6,
-            -4,
-            -2,
-            -1,
-            -78,
-            -79,
-            -80,
-            -50,
-            -34,
-            -54,
-            66,
-            -35,
-            -122,
-            -81,
-            66,
-            -123,
-            -82,
-            -118,
-            -120,
-            -81,
-            -121,
-            -116,
-            -117,
-            -119,
-            298,
-        ],
-    ),
-    "STAR": (
-        [
-            2,
-            3,
-            4,
-            5,
-            6,
-            7,
-            8,
-            9,
-            10,
-            11,
-            12,
-            13,
-            14,
-            15,
-            16,
-            17,
-            18,
-            19,
-            20,
-            21,
-            22,
-            23,
-            24,
-            25,
-            26,
-            27,
-            28,
-            32,
-            33,
-            34,
-            35,
-            36,
-            37,
-            38,
-            39,
-            40,
-            41,
-            42,
-            43,
-            44,
-            45,
-            65,
-            67,
-            68,
-            102,
-            105,
-            106,
-            107,
-            108,
-            109,
-            110,
-            112,
-            113,
-            114,
-            115,
-            119,
-            120,
-            126,
-            148,
-            149,
-            150,
-            152,
-            153,
-            163,
-            176,
-            178,
-            207,
-            208,
-            232,
-            234,
-            240,
-        ],
-        [
-            -14,
-            -15,
-            -13,
-            -11,
-            -9,
-            59,
-            -5,
-            -3,
-            -16,
-            -17,
-            -18,
-            -19,
-            -20,
-            -21,
-            -22,
-            -23,
-            -26,
-            -27,
-            -28,
-            -29,
-            -30,
-            -31,
-            -32,
-            -33,
-            -46,
-            59,
-            -53,
-            -73,
-            -74,
-            -75,
-            -76,
-            -77,
-            -45,
-            -44,
-            -40,
-            -41,
-            -42,
-            -43,
-            -47,
-            -48,
-            -49,
-            -52,
-            59,
-            -3,
-            -12,
-            -10,
-            -8,
-            59,
-            -4,
-            -2,
-            -1,
-            -78,
-            -79,
-            -80,
-            -50,
-            -34,
-            -54,
-            59,
-            -35,
-            -122,
-            -81,
-            59,
-            -123,
-            -82,
-            -118,
-            -120,
-            -81,
-            -121,
-            -116,
-            -117,
-            -119,
-        ],
-    ),
-    "SLASH": (
-        [
-            2,
-            3,
-            4,
-            5,
-            6,
-            7,
-            8,
-            9,
-            10,
-            11,
-            12,
-            13,
-            14,
-            15,
-            16,
-            17,
-            18,
-            19,
-            20,
-            21,
-            22,
-            23,
-            24,
-            25,
-            26,
-            27,
-            28,
-            32,
-            33,
-            34,
-            35,
-            36,
-            37,
-            38,
-            39,
-            40,
-            41,
-            42,
-            43,
-            44,
-            45,
-            65,
-            67,
-            68,
-            102,
-            105,
-            106,
-            107,
-            108,
-            109,
-            110,
-            112,
-            113,
-            114,
-            115,
-            119,
-            120,
-            126,
-            148,
-            149,
-            150,
-            152,
-            153,
-            163,
-            176,
-            178,
-            207,
-            208,
-            232,
-            234,
-            240,
-        ],
-        [
-            -14,
-            -15,
-            -13,
-            -11,
-            -9,
-            60,
-            -5,
-            -3,
-            -16,
-            -17,
-            -18,
-            -19,
-            -20,
-            -21,
-            -22,
-            -23,
-            -26,
-            -27,
-            -28,
-            -29,
-            -30,
-            -31,
-            -32,
-            -33,
-            -46,
-            60,
-            -53,
-            -73,
-            -74,
-            -75,
-            -76,
-            -77,
-            -45,
-            -44,
-            -40,
-            -41,
-            -42,
-            -43,
-            -47,
-            -48,
-            -49,
-            -52,
-            60,
-            -3,
-            -12,
-            -10,
-            -8,
-            60,
-            -4,
-            -2,
-            -1,
-            -78,
-            -79,
-            -80,
-            -50,
-            -34,
-            -54,
-            60,
-            -35,
-            -122,
-            -81,
-            60,
-            -123,
-            -82,
-            -118,
-            -120,
-            -81,
-            -121,
-            -116,
-            -117,
-            -119,
-        ],
-    ),
-    "DOUBLESLASH": (
-        [
-            2,
-            3,
-            4,
-            5,
-            6,
-            7,
-            8,
-            9,
-            10,
-            11,
-            12,
-            13,
-            14,
-            15,
-            16,
-            17,
-            18,
-            19,
-            20,
-            21,
-            22,
-            23,
-            24,
-            25,
-            26,
-            27,
-            28,
-            32,
-            33,
-            34,
-            35,
-            36,
-            37,
-            38,
-            39,
-            40,
-            41,
-            42,
-            43,
-            44,
-            45,
-            65,
-            67,
-            68,
-            102,
-            105,
-            106,
-            107,
-            108,
-            109,
-            110,
-            112,
-            113,
-            114,
-            115,
-            119,
-            120,
-            126,
-            148,
-            149,
-            150,
-            152,
-            153,
-            163,
-            176,
-            178,
-            207,
-            208,
-            232,
-            234,
-            240,
-        ],
-        [
-            -14,
-            -15,
-            -13,
-            -11,
-            -9,
-            61,
-            -5,
-            -3,
-            -16,
-            -17,
-            -18,
-            -19,
-            -20,
-            -21,
-            -22,
-            -23,
-            -26,
-            -27,
-            -28,
-            -29,
-            -30,
-            -31,
-            -32,
-            -33,
-            -46,
-            61,
-            -53,
-            -73,
-            -74,
-            -75,
-            -76,
-            -77,
-            -45,
-            -44,
-            -40,
-            -41,
-            -42,
-            -43,
-            -47,
-            -48,
-            -49,
-            -52,
-            61,
-            -3,
-            -12,
-            -10,
-            -8,
-            61,
-            -4,
-            -2,
-            -1,
-            -78,
-            -79,
-            -80,
-            -50,
-            -34,
-            -54,
-            61,
-            -35,
-            -122,
-            -81,
-            61,
-            -123,
-            -82,
-            -118,
-            -120,
-            -81,
-            -121,
-            -116,
-            -117,
-            -119,
-        ],
-    ),
-    "PERCENT": (
-        [
-            2,
-            3,
-            4,
-            5,
-            6,
-            7,
-            8,
-            9,
-            10,
-            11,
-            12,
-            13,
-            14,
-            15,
-            16,
-            17,
-            18,
-            19,
-            20,
-            21,
-            22,
-            23,
-            24,
-            25,
-            26,
-            27,
-            28,
-            32,
-            33,
-            34,
-            35,
-            36,
-            37,
-            38,
-            39,
-            40,
-            41,
-            42,
-            43,
-            44,
-            45,
-            65,
-            67,
-            68,
-            102,
-            105,
-            106,
-            107,
-            108,
-            109,
-            110,
-            112,
-            113,
-            114,
-            115,
-            119,
-            120,
-            126,
-            148,
-            149,
-            150,
-            152,
-            153,
-            163,
-            176,
-            178,
-            207,
-            208,
-            232,
-            234,
-            240,
-        ],
-        [
-            -14,
-            -15,
-            -13,
-            -11,
-            -9,
-            62,
-            -5,
-            -3,
-            -16,
-            -17,
-            -18,
-            -19,
-            -20,
-            -21,
-            -22,
-            -23,
-            -26,
-            -27,
-            -28,
-            -29,
-            -30,
-            -31,
-            -32,
-            -33,
-            -46,
-            62,
-            -53,
-            -73,
-            -74,
-            -75,
-            -76,
-            -77,
-            -45,
-            -44,
-            -40,
-            -41,
-            -42,
-            -43,
-            -47,
-            -48,
-            -49,
-            -52,
-            62,
-            -3,
-            -12,
-            -10,
-            -8,
-            62,
-            -4,
-            -2,
-            -1,
-            -78,
-            -79,
-            -80,
-            -50,
-            -34,
-            -54,
-            62,
-            -35,
-            -122,
-            -81,
-            62,
-            -123,
-            -82,
-            -118,
-            -120,
-            -81,
-            -121,
-            -116,
-            -117,
-            -119,
-        ],
-    ),
-    "PLUS": (
-        [
-            2,
-            3,
-            4,
-            5,
-            6,
-            7,
-            8,
-            9,
-            10,
-            11,
-            12,
-            13,
-            14,
-            15,
-            16,
-            17,
-            18,
-            19,
-            20,
-            21,
-            22,
-            23,
-            24,
-            25,
-            26,
-            27,
-            28,
-            32,
-            33,
-            34,
-            35,
-            36,
-            37,
-            38,
-            39,
-            40,
-            41,
-            42,
-            43,
-            44,
-            45,
-            65,
-            67,
-            68,
-            102,
-            105,
-            106,
-            107,
-            108,
-            109,
-            110,
-            112,
-            113,
-            114,
-            115,
-            119,
-            120,
-            126,
-            148,
-            149,
-            150,
-            152,
-            153,
-            163,
-            176,
-            178,
-            207,
-            208,
-            232,
-            234,
-            240,
-        ],
-        [
-            -14,
-            -15,
-            -13,
-            -11,
-            56,
-            -7,
-            -5,
-            -3,
-            -16,
-            -17,
-            -18,
-            -19,
-            -20,
-            -21,
-            -22,
-            -23,
-            -26,
-            -27,
-            -28,
-            -29,
-            -30,
-            -31,
-            -32,
-            -33,
-            -46,
-            56,
-            -53,
-            -73,
-            -74,
-            -75,
-            -76,
-            -77,
-            -45,
-            -44,
-            -40,
-            -41,
-            -42,
-            -43,
-            -47,
-            -48,
-            -49,
-            -52,
-            56,
-            -3,
-            -12,
-            -10,
-            56,
-            -6,
-            -4,
-            -2,
-            -1,
-            -78,
-            -79,
-            -80,
-            -50,
-            -34,
-            -54,
-            56,
-            -35,
-            -122,
-            -81,
-            56,
-            -123,
-            -82,
-            -118,
-            -120,
-            -81,
-            -121,
-            -116,
-            -117,
-            -119,
-        ],
-    ),
-    "MINUS": (
-        [
-            2,
-            3,
-            4,
-            5,
-            6,
-            7,
-            8,
-            9,
-            10,
-            11,
-            12,
-            13,
-            14,
-            15,
-            16,
-            17,
-            18,
-            19,
-            20,
-            21,
-            22,
-            23,
-            24,
-            25,
-            26,
-            27,
-            28,
-            32,
-            33,
-            34,
-            35,
-            36,
-            37,
-            38,
-            39,
-            40,
-            41,
-            42,
-            43,
-            44,
-            45,
-            65,
-            67,
-            68,
-            102,
-            105,
-            106,
-            107,
-            108,
-            109,
-            110,
-            112,
-            113,
-            114,
-            115,
-            119,
-            120,
-            126,
-            148,
-            149,
-            150,
-            152,
-            153,
-            163,
-            176,
-            178,
-            207,
-            208,
-            232,
-            234,
-            240,
-        ],
-        [
-            -14,
-            -15,
-            -13,
-            -11,
-            57,
-            -7,
-            -5,
-            -3,
-            -16,
-            -17,
-            -18,
-            -19,
-            -20,
-            -21,
-            -22,
-            -23,
-            -26,
-            -27,
-            -28,
-            -29,
-            -30,
-            -31,
-            -32,
-            -33,
-            -46,
-            57,
-            -53,
-            -73,
-            -74,
-            -75,
-            -76,
-            -77,
-            -45,
-            -44,
-            -40,
-            -41,
-            -42,
-            -43,
-            -47,
-            -48,
-            -49,
-            -52,
-            57,
-            -3,
-            -12,
-            -10,
-            57,
-            -6,
-            -4,
-            -2,
-            -1,
-            -78,
-            -79,
-            -80,
-            -50,
-            -34,
-            -54,
-            57,
-            -35,
-            -122,
-            -81,
-            57,
-            -123,
-            -82,
-            -118,
-            -120,
-            -81,
-            -121,
-            -116,
-            -117,
-            -119,
-        ],
-    ),
-    "COLON": (
-        [
-            2,
-            3,
-            4,
-            5,
-            6,
-            7,
-            8,
-            9,
-            10,
-            11,
-            12,
-            13,
-            14,
-            15,
-            16,
-            17,
-            18,
-            19,
-            20,
-            21,
-            22,
-            23,
-            24,
-            25,
-            26,
-            27,
-            28,
-            32,
-            33,
-            34,
-            35,
-            36,
-            37,
-            38,
-            39,
-            40,
-            41,
-            42,
-            43,
-            44,
-            45,
-            65,
-            67,
-            68,
-            83,
-            84,
-            85,
-            86,
-            87,
-            88,
-            89,
-            90,
-            91,
-            92,
-            93,
-            94,
-            102,
-            105,
-            106,
-            107,
-            108,
-            109,
-            110,
-            112,
-            113,
-            114,
-            115,
-            119,
-            120,
-            126,
-            137,
-            138,
-            139,
-            142,
-            143,
-            144,
-            145,
-            146,
-            147,
-            148,
-            149,
-            150,
-            152,
-            153,
-            163,
-            164,
-            166,
-            167,
-            168,
-            169,
-            172,
-            175,
-            176,
-            178,
-            204,
-            205,
-            207,
-            208,
-            232,
-            234,
-            239,
-            240,
-            273,
-            274,
-        ],
-        [
-            -14,
-            -15,
-            -13,
-            51,
-            -9,
-            -7,
-            -5,
-            -3,
-            -16,
-            -17,
-            -18,
-            -19,
-            -20,
-            -21,
-            -22,
-            -23,
-            -26,
-            -27,
-            -28,
-            -29,
-            -30,
-            -31,
-            -32,
-            -33,
-            -46,
-            51,
-            -53,
-            -73,
-            -74,
-            -75,
-            -76,
-            -77,
-            -45,
-            -44,
-            -40,
-            -41,
-            -42,
-            -43,
-            -47,
-            -48,
-            -49,
-            -52,
-            51,
-            -3,
-            131,
-            135,
-            -83,
-            -84,
-            -85,
-            -86,
-            -87,
-            -88,
-            -89,
-            -90,
-            -91,
-            -95,
-            -12,
-            -10,
-            -8,
-            -6,
-            -4,
-            -2,
-            -1,
-            -78,
-            -79,
-            -80,
-            -50,
-            -34,
-            -54,
-            51,
-            131,
-            -102,
-            135,
-            -90,
-            -91,
-            -95,
-            135,
-            131,
-            -101,
-            -35,
-            -122,
-            -81,
-            51,
-            -123,
-            -82,
-            -96,
-            131,
-            135,
-            135,
-            -99,
-            -100,
-            -103,
-            -118,
-            -120,
-            131,
-            135,
-            -81,
-            -121,
-            -116,
-            -117,
-            -98,
-            -119,
-            131,
-            135,
-        ],
-    ),
-    "OPERATOR": (
-        [
-            2,
-            3,
-            4,
-            5,
-            6,
-            7,
-            8,
-            9,
-            10,
-            11,
-            12,
-            13,
-            14,
-            15,
-            16,
-            17,
-            18,
-            19,
-            20,
-            21,
-            22,
-            23,
-            24,
-            25,
-            26,
-            27,
-            28,
-            32,
-            33,
-            34,
-            35,
-            36,
-            37,
-            38,
-            39,
-            40,
-            41,
-            42,
-            43,
-            44,
-            45,
-            65,
-            67,
-            68,
-            102,
-            105,
-            106,
-            107,
-            108,
-            109,
-            110,
-            112,
-            113,
-            114,
-            115,
-            119,
-            120,
-            126,
-            148,
-            149,
-            150,
-            152,
-            153,
-            163,
-            176,
-            178,
-            207,
-            208,
-            228,
-            232,
-            234,
-            240,
-            244,
-            245,
-            246,
-            247,
-            248,
-            305,
-            306,
-        ],
-        [
-            -14,
-            -15,
-            -13,
-            52,
-            -9,
-            -7,
-            -5,
-            -3,
-            -16,
-            -17,
-            -18,
-            -19,
-            -20,
-            -21,
-            -22,
-            -23,
-            -26,
-            -27,
-            -28,
-            -29,
-            -30,
-            -31,
-            -32,
-            -33,
-            -46,
-            52,
-            -53,
-            -73,
-            -74,
-            -75,
-            -76,
-            -77,
-            -45,
-            -44,
-            -40,
-            -41,
-            -42,
-            -43,
-            -47,
-            -48,
-            -49,
-            -52,
-            52,
-            -3,
-            -12,
-            -10,
-            -8,
-            -6,
-            -4,
-            -2,
-            -1,
-            -78,
-            -79,
-            -80,
-            -50,
-            -34,
-            -54,
-            52,
-            -35,
-            -122,
-            -81,
-            52,
-            -123,
-            -82,
-            -118,
-            -120,
-            -81,
-            -121,
-            -138,
-            -116,
-            -117,
-            -119,
-            -139,
-            281,
-            -198,
-            -199,
-            -200,
-            -201,
-            -202,
-        ],
-    ),
-    "ARROW": (
-        [
-            2,
-            3,
-            4,
-            5,
-            6,
-            7,
-            8,
-            9,
-            10,
-            11,
-            12,
-            13,
-            14,
-            15,
-            16,
-            17,
-            18,
-            19,
-            20,
-            21,
-            22,
-            23,
-            24,
-            25,
-            26,
-            27,
-            28,
-            32,
-            33,
-            34,
-            35,
-            36,
-            37,
-            38,
-            39,
-            40,
-            41,
-            42,
-            43,
-            44,
-            45,
-            65,
-            67,
-            68,
-            82,
-            83,
-            84,
-            85,
-            86,
-            87,
-            88,
-            89,
-            90,
-            91,
-            92,
-            93,
-            94,
-            102,
-            105,
-            106,
-            107,
-            108,
-            109,
-            110,
-            112,
-            113,
-            114,
-            115,
-            119,
-            120,
-            126,
-            130,
-            133,
-            134,
-            138,
-            145,
-            147,
-            148,
-            149,
-            150,
-            152,
-            153,
-            163,
-            164,
-            166,
-            167,
-            168,
-            169,
-            172,
-            175,
-            176,
-            178,
-            202,
-            203,
-            207,
-            208,
-            221,
-            222,
-            223,
-            224,
-            225,
-            228,
-            229,
-            232,
-            234,
-            239,
-            240,
-            262,
-            265,
-            293,
-            311,
-            314,
-            315,
-            327,
-            328,
-            329,
-            331,
-            335,
-        ],
-        [
-            -14,
-            -15,
-            -13,
-            53,
-            -9,
-            -7,
-            -5,
-            -3,
-            -16,
-            -17,
-            -18,
-            -19,
-            -20,
-            -21,
-            -22,
-            -23,
-            -26,
-            -27,
-            -28,
-            -29,
-            -30,
-            -31,
-            -32,
-            -33,
-            -46,
-            53,
-            -53,
-            -73,
-            -74,
-            -75,
-            -76,
-            -77,
-            -45,
-            -44,
-            -40,
-            -41,
-            -42,
-            -43,
-            -47,
-            -48,
-            -49,
-            -52,
-            53,
-            -3,
-            129,
-            -81,
-            -81,
-            -83,
-            -84,
-            -85,
-            -86,
-            -87,
-            -88,
-            -89,
-            -90,
-            -91,
-            -95,
-            -12,
-            -10,
-            -8,
-            -6,
-            -4,
-            -2,
-            -1,
-            -78,
-            -79,
-            -80,
-            -50,
-            -34,
-            -54,
-            53,
-            -104,
-            -114,
-            -105,
-            -102,
-            -92,
-            -101,
-            -35,
-            -122,
-            -81,
-            53,
-            -123,
-            -82,
-            -96,
-            -81,
-            -81,
-            -97,
-            -99,
-            -100,
-            -103,
-            -118,
-            -120,
-            -108,
-            -109,
-            -81,
-            -121,
-            261,
-            -132,
-            -133,
-            -140,
-            -141,
-            -138,
-            -139,
-            -116,
-            -117,
-            -98,
-            -119,
-            -134,
-            -143,
-            -81,
-            261,
-            -136,
-            -137,
-            -81,
-            -142,
-            -147,
-            -148,
-            -135,
-        ],
-    ),
-    "ATSYM": (
-        [
-            2,
-            3,
-            4,
-            5,
-            6,
-            7,
-            8,
-            9,
-            10,
-            11,
-            12,
-            13,
-            14,
-            15,
-            16,
-            17,
-            18,
-            19,
-            20,
-            21,
-            22,
-            23,
-            24,
-            25,
-            26,
-            27,
-            28,
-            32,
-            33,
-            34,
-            35,
-            36,
-            37,
-            38,
-            39,
-            40,
-            41,
-            42,
-            43,
-            44,
-            45,
-            65,
-            67,
-            68,
-            92,
-            102,
-            105,
-            106,
-            107,
-            108,
-            109,
-            110,
-            112,
-            113,
-            114,
-            115,
-            119,
-            120,
-            126,
-            142,
-            148,
-            149,
-            150,
-            152,
-            153,
-            163,
-            165,
-            176,
-            178,
-            207,
-            208,
-            232,
-            234,
-            240,
-        ],
-        [
-            -14,
-            -15,
-            -13,
-            54,
-            -9,
-            -7,
-            -5,
-            -3,
-            -16,
-            -17,
-            -18,
-            -19,
-            -20,
-            -21,
-            -22,
-            -23,
-            -26,
-            -27,
-            -28,
-            -29,
-            -30,
-            -31,
-            -32,
-            -33,
-            -46,
-            54,
-            -53,
-            -73,
-            -74,
-            -75,
-            -76,
-            -77,
-            -45,
-            -44,
-            -40,
-            -41,
-            -42,
-            -43,
-            -47,
-            -48,
-            -49,
-            -52,
-            54,
-            -3,
-            136,
-            -12,
-            -10,
-            -8,
-            -6,
-            -4,
-            -2,
-            -1,
-            -78,
-            -79,
-            -80,
-            -50,
-            -34,
-            -54,
-            54,
-            136,
-            -35,
-            -122,
-            -81,
-            54,
-            -123,
-            -82,
-            136,
-            -118,
-            -120,
-            -81,
-            -121,
-            -116,
-            -117,
-            -119,
-        ],
-    ),
-    "KEYWORD_WHERE": (
-        [
-            2,
-            3,
-            4,
-            5,
-            6,
-            7,
-            8,
-            9,
-            10,
-            11,
-            12,
-            13,
-            14,
-            15,
-            16,
-            17,
-            18,
-            19,
-            20,
-            21,
-            22,
-            23,
-            24,
-            25,
-            26,
-            28,
-            32,
-            33,
-            34,
-            35,
-            36,
-            37,
-            38,
-            39,
-            40,
-            41,
-            42,
-            43,
-            44,
-            45,
-            65,
-            68,
-            69,
-            71,
-            100,
-            101,
-            102,
-            105,
-            106,
-            107,
-            108,
-            109,
-            110,
-            111,
-            112,
-            113,
-            114,
-            115,
-            119,
-            120,
-            148,
-            149,
-            150,
-            153,
-            154,
-            163,
-            176,
-            178,
-            207,
-            208,
-            211,
-            212,
-            215,
-            216,
-            217,
-            220,
-            221,
-            222,
-            223,
-            224,
-            225,
-            228,
-            229,
-            232,
-            234,
-            240,
-            262,
-            265,
-            271,
-            286,
-            287,
-            293,
-            311,
-            312,
-            314,
-            315,
-            327,
-            328,
-            329,
-            331,
-            335,
-        ],
-        [
-            47,
-            -15,
-            -13,
-            -11,
-            -9,
-            -7,
-            -5,
-            -3,
-            -16,
-            -17,
-            -18,
-            -19,
-            -20,
-            -21,
-            -22,
-            -23,
-            -26,
-            -27,
-            -28,
-            -29,
-            -30,
-            -31,
-            -32,
-            -33,
-            -46,
-            -53,
-            -73,
-            -74,
-            -75,
-            -76,
-            -77,
-            -45,
-            -44,
-            -40,
-            -41,
-            -42,
-            -43,
-            -47,
-            -48,
-            -49,
-            -52,
-            -3,
-            47,
-            47,
-            47,
-            47,
-            -12,
-            -10,
-            -8,
-            -6,
-            -4,
-            -2,
-            -1,
-            47,
-            -78,
-            -79,
-            -80,
-            -50,
-            -34,
-            -54,
-            -35,
-            -122,
-            -81,
-            -123,
-            47,
-            47,
-            -118,
-            -120,
-            -81,
-            -121,
-            251,
-            -175,
-            257,
-            -151,
-            -152,
-            -124,
-            -125,
-            -132,
-            -133,
-            -140,
-            -141,
-            -138,
-            -139,
-            47,
-            47,
-            -119,
-            -134,
-            -143,
-            -150,
-            -176,
-            -177,
-            -81,
-            -131,
-            -130,
-            -136,
-            -137,
-            -81,
-            -142,
-            -147,
-            -148,
-            -135,
-        ],
-    ),
-    "TICK_OPERATOR": (
-        [
-            2,
-            3,
-            4,
-            5,
-            6,
-            7,
-            8,
-            9,
-            10,
-            11,
-            12,
-            13,
-            14,
-            15,
-            16,
-            17,
-            18,
-            19,
-            20,
-            21,
-            22,
-            23,
-            24,
-            25,
-            26,
-            28,
-            32,
-            33,
-            34,
-            35,
-            36,
-            37,
-            38,
-            39,
-            40,
-            41,
-            42,
-            43,
-            44,
-            45,
-            65,
-            68,
-            69,
-            71,
-            100,
-            101,
-            102,
-            105,
-            106,
-            107,
-            108,
-            109,
-            110,
-            111,
-            112,
-            113,
-            114,
-            115,
-            119,
-            120,
-            148,
-            149,
-            150,
-            153,
-            154,
-            163,
-            176,
-            178,
-            207,
-            208,
-            232,
-            234,
-            240,
-        ],
-        [
-            48,
-            -15,
-            -13,
-            -11,
-            -9,
-            -7,
-            -5,
-            -3,
-            -16,
-            -17,
-            -18,
-            -19,
-            -20,
-            -21,
-            -22,
-            -23,
-            -26,
-            -27,
-            -28,
-            -29,
-            -30,
-            -31,
-            -32,
-            -33,
-            -46,
-            -53,
-            -73,
-            -74,
-            -75,
-            -76,
-            -77,
-            -45,
-            -44,
-            -40,
-            -41,
-            -42,
-            -43,
-            -47,
-            -48,
-            -49,
-            -52,
-            -3,
-            48,
-            48,
-            48,
-            48,
-            -12,
-            -10,
-            -8,
-            -6,
-            -4,
-            -2,
-            -1,
-            48,
-            -78,
-            -79,
-            -80,
-            -50,
-            -34,
-            -54,
-            -35,
-            -122,
-            -81,
-            -123,
-            48,
-            48,
-            -118,
-            -120,
-            -81,
-            -121,
-            48,
-            48,
-            -119,
-        ],
-    ),
-    "RPAREN": (
-        [
-            2,
-            3,
-            4,
-            5,
-            6,
-            7,
-            8,
-            9,
-            10,
-            11,
-            12,
-            13,
-            14,
-            15,
-            16,
-            17,
-            18,
-            19,
-            20,
-            21,
-            22,
-            23,
-            24,
-            25,
-            26,
-            27,
-            28,
-            32,
-            33,
-            34,
-            35,
-            36,
-            37,
-            38,
-            39,
-            40,
-            41,
-            42,
-            43,
-            44,
-            45,
-            51,
-            52,
-            53,
-            54,
-            56,
-            57,
-            59,
-            60,
-            61,
-            62,
-            65,
-            66,
-            68,
-            71,
-            72,
-            73,
-            74,
-            75,
-            76,
-            77,
-            78,
-            79,
-            80,
-            83,
-            84,
-            85,
-            86,
-            87,
-            88,
-            89,
-            90,
-            91,
-            92,
-            93,
-            94,
-            95,
-            102,
-            105,
-            106,
-            107,
-            108,
-            109,
-            110,
-            111,
-            112,
-            113,
-            114,
-            115,
-            116,
-            118,
-            119,
-            120,
-            130,
-            133,
-            134,
-            137,
-            138,
-            139,
-            141,
-            142,
-            143,
-            144,
-            145,
-            147,
-            148,
-            149,
-            150,
-            153,
-            154,
-            161,
-            163,
-            164,
-            166,
-            167,
-            168,
-            169,
-            170,
-            172,
-            173,
-            175,
-            176,
-            178,
-            179,
-            202,
-            203,
-            204,
-            205,
-            206,
-            207,
-            208,
-            220,
-            221,
-            222,
-            223,
-            224,
-            225,
-            226,
-            228,
-            229,
-            232,
-            234,
-            236,
-            237,
-            238,
-            239,
-            240,
-            259,
-            260,
-            262,
-            265,
-            266,
-            267,
-            273,
-            274,
-            282,
-            293,
-            294,
-            295,
-            299,
-            300,
-            311,
-            312,
-            314,
-            315,
-            316,
-            317,
-            327,
-            328,
-            329,
-            330,
-            331,
-            333,
-            334,
-            335,
-            337,
-            339,
-            340,
-            341,
-        ],
-        [
-            -14,
-            -15,
-            -13,
-            -11,
-            -9,
-            -7,
-            -5,
-            -3,
-            -16,
-            -17,
-            -18,
-            -19,
-            -20,
-            -21,
-            -22,
-            -23,
-            -26,
-            -27,
-            -28,
-            -29,
-            -30,
-            -31,
-            -32,
-            -33,
-            -46,
-            -81,
-            -53,
-            -73,
-            -74,
-            -75,
-            -76,
-            -77,
-            -45,
-            -44,
-            -40,
-            -41,
-            -42,
-            -43,
-            -47,
-            -48,
-            -49,
-            -62,
-            -63,
-            -64,
-            -65,
-            -60,
-            -61,
-            -56,
-            -57,
-            -58,
-            -59,
-            -52,
-            -55,
-            -51,
-            115,
-            119,
-            120,
-            -38,
-            -67,
-            -68,
-            -69,
-            -70,
-            -71,
-            -72,
-            -81,
-            -81,
-            -83,
-            -84,
-            -85,
-            -86,
-            -87,
-            -88,
-            -89,
-            -90,
-            -91,
-            -95,
-            138,
-            -12,
-            -10,
-            -8,
-            -6,
-            -4,
-            -2,
-            -1,
-            115,
-            -78,
-            -79,
-            -80,
-            -50,
-            -36,
-            -39,
-            -34,
-            -54,
-            -104,
-            -114,
-            -105,
-            169,
-            -102,
-            172,
-            175,
-            -90,
-            -91,
-            -95,
-            -92,
-            -101,
-            -35,
-            -122,
-            -81,
-            -123,
-            -81,
-            200,
-            -82,
-            -96,
-            -81,
-            -81,
-            -97,
-            -99,
-            -106,
-            -100,
-            -107,
-            -103,
-            -118,
-            -120,
-            -37,
-            -108,
-            -109,
-            -81,
-            -81,
-            239,
-            -81,
-            -121,
-            -124,
-            -125,
-            -132,
-            -133,
-            -140,
-            -141,
-            265,
-            -138,
-            -139,
-            -116,
-            -117,
-            -110,
-            -115,
-            -111,
-            -98,
-            -119,
-            -146,
-            -145,
-            -134,
-            -143,
-            -155,
-            -156,
-            -81,
-            -81,
-            305,
-            -81,
-            -81,
-            -81,
-            -112,
-            -113,
-            -131,
-            -130,
-            -136,
-            -137,
-            328,
-            329,
-            -81,
-            -142,
-            -147,
-            -144,
-            -148,
-            336,
-            -81,
-            -135,
-            -203,
-            -205,
-            -81,
-            -204,
-        ],
-    ),
-    "COMMA": (
-        [
-            2,
-            3,
-            4,
-            5,
-            6,
-            7,
-            8,
-            9,
-            10,
-            11,
-            12,
-            13,
-            14,
-            15,
-            16,
-            17,
-            18,
-            19,
-            20,
-            21,
-            22,
-            23,
-            24,
-            25,
-            26,
-            27,
-            28,
-            32,
-            33,
-            34,
-            35,
-            36,
-            37,
-            38,
-            39,
-            40,
-            41,
-            42,
-            43,
-            44,
-            45,
-            65,
-            67,
-            68,
-            71,
-            85,
-            86,
-            87,
-            88,
-            89,
-            90,
-            91,
-            92,
-            93,
-            94,
-            100,
-            102,
-            105,
-            106,
-            107,
-            108,
-            109,
-            110,
-            112,
-            113,
-            114,
-            115,
-            119,
-            120,
-            126,
-            137,
-            138,
-            139,
-            142,
-            143,
-            144,
-            145,
-            147,
-            148,
-            149,
-            150,
-            152,
-            153,
-            154,
-            163,
-            164,
-            168,
-            169,
-            172,
-            175,
-            176,
-            178,
-            191,
-            204,
-            205,
-            207,
-            208,
-            212,
-            216,
-            220,
-            221,
-            222,
-            223,
-            224,
-            225,
-            228,
-            229,
-            232,
-            234,
-            239,
-            240,
-            259,
-            262,
-            265,
-            273,
-            274,
-            285,
-            287,
-            293,
-            295,
-            311,
-            312,
-            314,
-            315,
-            327,
-            328,
-            329,
-            331,
-            334,
-            335,
-            340,
-        ],
-        [
-            -14,
-            -15,
-            -13,
-            -11,
-            -9,
-            -7,
-            -5,
-            -3,
-            -16,
-            -17,
-            -18,
-            -19,
-            -20,
-            -21,
-            -22,
-            -23,
-            -26,
-            -27,
-            -28,
-            -29,
-            -30,
-            -31,
-            -32,
-            -33,
-            -46,
-            80,
-            -53,
-            -73,
-            -74,
-            -75,
-            -76,
-            -77,
-            -45,
-            -44,
-            -40,
-            -41,
-            -42,
-            -43,
-            -47,
-            -48,
-            -49,
-            -52,
-            80,
-            -51,
-            117,
-            -83,
-            -84,
-            -85,
-            -86,
-            -87,
-            -88,
-            -89,
-            -90,
-            -91,
-            -95,
-            117,
-            -12,
-            -10,
-            -8,
-            -6,
-            -4,
-            -2,
-            -1,
-            -78,
-            -79,
-            -80,
-            -50,
-            -34,
-            -54,
-            80,
-            171,
-            -102,
-            171,
-            -90,
-            -91,
-            -95,
-            -92,
-            -101,
-            -35,
-            -122,
-            -81,
-            80,
-            -123,
-            117,
-            -82,
-            -96,
-            -97,
-            -99,
-            -100,
-            -103,
-            -118,
-            -120,
-            219,
-            235,
-            235,
-            -81,
-            -121,
-            253,
-            219,
-            -124,
-            -125,
-            -132,
-            -133,
-            -140,
-            -141,
-            -138,
-            -139,
-            -116,
-            -117,
-            -98,
-            -119,
-            219,
-            -134,
-            -143,
-            235,
-            235,
-            253,
-            -177,
-            -81,
-            318,
-            -131,
-            -130,
-            -136,
-            -137,
-            -81,
-            -142,
-            -147,
-            -148,
-            338,
-            -135,
-            338,
-        ],
-    ),
-    "RBRACKET": (
-        [
-            2,
-            3,
-            4,
-            5,
-            6,
-            7,
-            8,
-            9,
-            10,
-            11,
-            12,
-            13,
-            14,
-            15,
-            16,
-            17,
-            18,
-            19,
-            20,
-            21,
-            22,
-            23,
-            24,
-            25,
-            26,
-            28,
-            31,
-            32,
-            33,
-            34,
-            35,
-            36,
-            37,
-            38,
-            39,
-            40,
-            41,
-            42,
-            43,
-            44,
-            45,
-            65,
-            68,
-            74,
-            97,
-            99,
-            100,
-            102,
-            105,
-            106,
-            107,
-            108,
-            109,
-            110,
-            112,
-            113,
-            114,
-            115,
-            116,
-            118,
-            119,
-            120,
-            148,
-            149,
-            150,
-            153,
-            154,
-            163,
-            176,
-            178,
-            179,
-            207,
-            208,
-            220,
-            221,
-            222,
-            223,
-            224,
-            225,
-            228,
-            229,
-            232,
-            234,
-            240,
-            262,
-            265,
-            266,
-            267,
-            283,
-            293,
-            296,
-            311,
-            312,
-            314,
-            315,
-            319,
-            327,
-            328,
-            329,
-            331,
-            335,
-        ],
-        [
-            -14,
-            -15,
-            -13,
-            -11,
-            -9,
-            -7,
-            -5,
-            -3,
-            -16,
-            -17,
-            -18,
-            -19,
-            -20,
-            -21,
-            -22,
-            -23,
-            -26,
-            -27,
-            -28,
-            -29,
-            -30,
-            -31,
-            -32,
-            -33,
-            -46,
-            -53,
-            -81,
-            -73,
-            -74,
-            -75,
-            -76,
-            -77,
-            -45,
-            -44,
-            -40,
-            -41,
-            -42,
-            -43,
-            -47,
-            -48,
-            -49,
-            -52,
-            -51,
-            -38,
-            147,
-            148,
-            -81,
-            -12,
-            -10,
-            -8,
-            -6,
-            -4,
-            -2,
-            -1,
-            -78,
-            -79,
-            -80,
-            -50,
-            -36,
-            -39,
-            -34,
-            -54,
-            -35,
-            -122,
-            -81,
-            -123,
-            -81,
-            -82,
-            -118,
-            -120,
-            -37,
-            -81,
-            -121,
-            -124,
-            -125,
-            -132,
-            -133,
-            -140,
-            -141,
-            -138,
-            -139,
-            -116,
-            -117,
-            -119,
-            -134,
-            -143,
-            -155,
-            -156,
-            306,
-            -81,
-            -81,
-            -131,
-            -130,
-            -136,
-            -137,
-            331,
-            -81,
-            -142,
-            -147,
-            -148,
-            -135,
-        ],
-    ),
-    "PADDING": (
-        [
-            2,
-            3,
-            4,
-            5,
-            6,
-            7,
-            8,
-            9,
-            10,
-            11,
-            12,
-            13,
-            14,
-            15,
-            16,
-            17,
-            18,
-            19,
-            20,
-            21,
-            22,
-            23,
-            24,
-            25,
-            26,
-            28,
-            32,
-            33,
-            34,
-            35,
-            36,
-            37,
-            38,
-            39,
-            40,
-            41,
-            42,
-            43,
-            44,
-            45,
-            47,
-            65,
-            68,
-            102,
-            105,
-            106,
-            107,
-            108,
-            109,
-            110,
-            112,
-            113,
-            114,
-            115,
-            119,
-            120,
-            122,
-            123,
-            124,
-            127,
-            148,
-            149,
-            150,
-            153,
-            156,
-            158,
-            163,
-            176,
-            178,
-            181,
-            182,
-            183,
-            184,
-            185,
-            190,
-            191,
-            192,
-            194,
-            207,
-            208,
-            209,
-            220,
-            221,
-            222,
-            223,
-            224,
-            225,
-            226,
-            227,
-            228,
-            229,
-            232,
-            234,
-            240,
-            241,
-            242,
-            243,
-            244,
-            246,
-            247,
-            248,
-            251,
-            257,
-            259,
-            260,
-            261,
-            262,
-            265,
-            271,
-            272,
-            275,
-            277,
-            278,
-            280,
-            293,
-            294,
-            295,
-            296,
-            303,
-            304,
-            305,
-            306,
-            307,
-            309,
-            311,
-            312,
-            314,
-            315,
-            321,
-            323,
-            324,
-            325,
-            327,
-            328,
-            329,
-            330,
-            331,
-            332,
-            335,
-            336,
-        ],
-        [
-            -14,
-            -15,
-            -13,
-            -11,
-            -9,
-            -7,
-            -5,
-            -3,
-            -16,
-            -17,
-            -18,
-            -19,
-            -20,
-            -21,
-            -22,
-            -23,
-            -26,
-            -27,
-            -28,
-            -29,
-            -30,
-            -31,
-            -32,
-            -33,
-            -46,
-            -53,
-            -73,
-            -74,
-            -75,
-            -76,
-            -77,
-            -45,
-            -44,
-            -40,
-            -41,
-            -42,
-            -43,
-            -47,
-            -48,
-            -49,
-            104,
-            -52,
-            -51,
-            -12,
-            -10,
-            -8,
-            -6,
-            -4,
-            -2,
-            -1,
-            -78,
-            -79,
-            -80,
-            -50,
-            -34,
-            -54,
-            157,
-            -169,
-            -170,
-            -181,
-            -35,
-            -122,
-            177,
-            -123,
-            -171,
-            -173,
-            -82,
-            -118,
-            -120,
-            157,
-            -165,
-            -166,
-            -167,
-            -168,
-            -182,
-            -24,
-            -25,
-            -149,
-            177,
-            -121,
-            -172,
-            -124,
-            -125,
-            -132,
-            -133,
-            -140,
-            -141,
-            266,
-            266,
-            -138,
-            -139,
-            -116,
-            -117,
-            -119,
-            -184,
-            266,
-            -193,
-            -81,
-            -198,
-            -199,
-            -200,
-            284,
-            288,
-            -146,
-            -145,
-            266,
-            -134,
-            -143,
-            -150,
-            -183,
-            -188,
-            -190,
-            -194,
-            -197,
-            -81,
-            266,
-            266,
-            266,
-            -81,
-            -81,
-            -201,
-            -202,
-            -174,
-            -153,
-            -131,
-            -130,
-            -136,
-            -137,
-            266,
-            -192,
-            -196,
-            -195,
-            -81,
-            -142,
-            -147,
-            -144,
-            -148,
-            -189,
-            -135,
-            -191,
-        ],
-    ),
-    "KEYWORD_IN": (
-        [
-            2,
-            3,
-            4,
-            5,
-            6,
-            7,
-            8,
-            9,
-            10,
-            11,
-            12,
-            13,
-            14,
-            15,
-            16,
-            17,
-            18,
-            19,
-            20,
-            21,
-            22,
-            23,
-            24,
-            25,
-            26,
-            28,
-            32,
-            33,
-            34,
-            35,
-            36,
-            37,
-            38,
-            39,
-            40,
-            41,
-            42,
-            43,
-            44,
-            45,
-            65,
-            68,
-            102,
-            105,
-            106,
-            107,
-            108,
-            109,
-            110,
-            112,
-            113,
-            114,
-            115,
-            119,
-            120,
-            121,
-            122,
-            123,
-            124,
-            127,
-            148,
-            149,
-            150,
-            153,
-            156,
-            158,
-            163,
-            176,
-            178,
-            181,
-            182,
-            183,
-            184,
-            185,
-            190,
-            191,
-            192,
-            194,
-            207,
-            208,
-            209,
-            220,
-            221,
-            222,
-            223,
-            224,
-            225,
-            228,
-            229,
-            232,
-            234,
-            240,
-            241,
-            242,
-            243,
-            244,
-            246,
-            247,
-            248,
-            262,
-            265,
-            271,
-            272,
-            275,
-            277,
-            278,
-            280,
-            293,
-            303,
-            304,
-            305,
-            306,
-            307,
-            309,
-            311,
-            312,
-            314,
-            315,
-            321,
-            323,
-            324,
-            325,
-            327,
-            328,
-            329,
-            331,
-            332,
-            335,
-            336,
-        ],
-        [
-            -14,
-            -15,
-            -13,
-            -11,
-            -9,
-            -7,
-            -5,
-            -3,
-            -16,
-            -17,
-            -18,
-            -19,
-            -20,
-            -21,
-            -22,
-            -23,
-            -26,
-            -27,
-            -28,
-            -29,
-            -30,
-            -31,
-            -32,
-            -33,
-            -46,
-            -53,
-            -73,
-            -74,
-            -75,
-            -76,
-            -77,
-            -45,
-            -44,
-            -40,
-            -41,
-            -42,
-            -43,
-            -47,
-            -48,
-            -49,
-            -52,
-            -51,
-            -12,
-            -10,
-            -8,
-            -6,
-            -4,
-            -2,
-            -1,
-            -78,
-            -79,
-            -80,
-            -50,
-            -34,
-            -54,
-            155,
-            -81,
-            -169,
-            -170,
-            -181,
-            -35,
-            -122,
-            -81,
-            -123,
-            -171,
-            -173,
-            -82,
-            -118,
-            -120,
-            -81,
-            -165,
-            -166,
-            -167,
-            -168,
-            -182,
-            -24,
-            -25,
-            -149,
-            -81,
-            -121,
-            -172,
-            -124,
-            -125,
-            -132,
-            -133,
-            -140,
-            -141,
-            -138,
-            -139,
-            -116,
-            -117,
-            -119,
-            -184,
-            -81,
-            -193,
-            -81,
-            -198,
-            -199,
-            -200,
-            -134,
-            -143,
-            -150,
-            -183,
-            -188,
-            -190,
-            -194,
-            -197,
-            -81,
-            -81,
-            -81,
-            -201,
-            -202,
-            -174,
-            -153,
-            -131,
-            -130,
-            -136,
-            -137,
-            -81,
-            -192,
-            -196,
-            -195,
-            -81,
-            -142,
-            -147,
-            -148,
-            -189,
-            -135,
-            -191,
-        ],
-    ),
-    "EQ": (
-        [
-            18,
-            19,
-            20,
-            21,
-            22,
-            23,
-            24,
-            25,
-            26,
-            32,
-            33,
-            34,
-            35,
-            36,
-            37,
-            38,
-            39,
-            40,
-            41,
-            42,
-            43,
-            44,
-            45,
-            85,
-            86,
-            87,
-            88,
-            89,
-            90,
-            91,
-            92,
-            93,
-            94,
-            112,
-            113,
-            114,
-            120,
-            125,
-            128,
-            133,
-            138,
-            145,
-            147,
-            151,
-            160,
-            162,
-            164,
-            166,
-            167,
-            168,
-            169,
-            172,
-            175,
-            186,
-            200,
-            202,
-            203,
-            239,
-            258,
-            290,
-            291,
-            310,
-            326,
-        ],
-        [
-            -26,
-            -27,
-            -28,
-            -29,
-            -30,
-            -31,
-            -32,
-            -33,
-            -46,
-            -73,
-            -74,
-            -75,
-            -76,
-            -77,
-            -45,
-            -44,
-            -40,
-            -41,
-            -42,
-            -43,
-            -47,
-            -48,
-            -49,
-            -83,
-            -84,
-            -85,
-            -86,
-            -87,
-            -88,
-            -89,
-            -90,
-            -91,
-            -95,
-            -78,
-            -79,
-            -80,
-            -54,
-            -81,
-            -81,
-            -114,
-            -102,
-            -92,
-            -101,
-            -81,
-            199,
-            201,
-            -96,
-            -81,
-            -81,
-            -97,
-            -99,
-            -100,
-            -103,
-            210,
-            -54,
-            -108,
-            -109,
-            -98,
-            -81,
-            -185,
-            -187,
-            -81,
-            -186,
-        ],
-    ),
-    "ANNOTATION": ([18, 32, 33, 34, 35, 36], [70, -73, -74, -75, -76, -77]),
-    "DOUBLE_COLON": ([43, 44, 45, 125, 200], [-47, -48, -49, 159, 233]),
-    "KEYWORD_CLASS": ([157], [187]),
-    "KEYWORD_INSTANCE": ([157], [188]),
-    "KEYWORD_DATA": ([157], [189]),
-    "KEYWORD_FORALL": (
-        [159, 188, 219, 226, 227, 231, 233, 249, 250, 264, 266, 267, 268, 318],
-        [196, 196, 196, -81, -81, 196, 196, 196, 196, 196, -155, -156, 196, 196],
-    ),
-    "FATARROW": (
-        [
-            191,
-            197,
-            198,
-            212,
-            213,
-            216,
-            220,
-            221,
-            222,
-            223,
-            224,
-            225,
-            228,
-            229,
-            252,
-            254,
-            259,
-            260,
-            262,
-            265,
-            285,
-            287,
-            293,
-            308,
-            311,
-            312,
-            314,
-            315,
-            327,
-            328,
-            329,
-            331,
-            335,
-        ],
-        [
-            -146,
-            231,
-            -154,
-            -81,
-            255,
-            -146,
-            -124,
-            -125,
-            -132,
-            -133,
-            -140,
-            -141,
-            -138,
-            -139,
-            -178,
-            -180,
-            -146,
-            -145,
-            -134,
-            -143,
-            -81,
-            -177,
-            -81,
-            -179,
-            -131,
-            -130,
-            -136,
-            -137,
-            -81,
-            -142,
-            -147,
-            -148,
-            -135,
-        ],
-    ),
-    "PIPE": (
-        [
-            228,
-            229,
-            242,
-            243,
-            244,
-            246,
-            247,
-            248,
-            266,
-            276,
-            277,
-            278,
-            280,
-            303,
-            304,
-            305,
-            306,
-            321,
-            324,
-            325,
-        ],
-        [
-            -138,
-            -139,
-            -81,
-            -193,
-            -81,
-            -198,
-            -199,
-            -200,
-            -155,
-            301,
-            -156,
-            -194,
-            -197,
-            -81,
-            -81,
-            -201,
-            -202,
-            -81,
-            -196,
-            -195,
-        ],
-    ),
-    "KEYWORD_DERIVING": (
-        [
-            228,
-            229,
-            242,
-            243,
-            244,
-            246,
-            247,
-            248,
-            266,
-            276,
-            277,
-            278,
-            280,
-            303,
-            304,
-            305,
-            306,
-            321,
-            324,
-            325,
-        ],
-        [
-            -138,
-            -139,
-            -81,
-            -193,
-            -81,
-            -198,
-            -199,
-            -200,
-            -155,
-            302,
-            -156,
-            -194,
-            -197,
-            -81,
-            -81,
-            -201,
-            -202,
-            -81,
-            -196,
-            -195,
-        ],
-    ),
-}
-
-_lr_action = {}
-for _k, _v in _lr_action_items.items():
-    for _x, _y in zip(_v[0], _v[1]):
-        if not _x in _lr_action:
-            _lr_action[_x] = {}
-        _lr_action[_x][_k] = _y
-del _lr_action_items
-
-_lr_goto_items = {
-    "st_expr": ([0, 180], [1, 208]),
-    "expr": (
-        [0, 12, 27, 31, 46, 49, 50, 55, 58, 63, 64, 67, 117, 129, 180, 199, 201],
-        [2, 69, 71, 100, 101, 69, 69, 69, 69, 69, 69, 111, 154, 163, 2, 232, 234],
-    ),
-    "expr_term0": (
-        [0, 12, 27, 31, 46, 49, 50, 55, 58, 63, 64, 67, 117, 129, 180, 199, 201],
-        [3, 3, 3, 3, 102, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3],
-    ),
-    "expr_term1": (
-        [0, 12, 27, 31, 46, 49, 50, 55, 58, 63, 64, 67, 117, 129, 180, 199, 201],
-        [4, 4, 4, 4, 4, 105, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4],
-    ),
-    "expr_term2": (
-        [0, 12, 27, 31, 46, 49, 50, 55, 58, 63, 64, 67, 117, 129, 180, 199, 201],
-        [5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5],
-    ),
-    "expr_term6": (
-        [0, 12, 27, 31, 46, 49, 50, 55, 58, 63, 64, 67, 117, 129, 180, 199, 201],
-        [6, 6, 6, 6, 6, 6, 106, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6],
-    ),
-    "expr_term7": (
-        [0, 12, 27, 31, 46, 49, 50, 55, 58, 63, 64, 67, 117, 129, 180, 199, 201],
-        [7, 7, 7, 7, 7, 7, 7, 107, 7, 7, 7, 7, 7, 7, 7, 7, 7],
-    ),
-    "expr_term9": (
-        [0, 12, 27, 31, 46, 49, 50, 55, 58, 63, 64, 67, 117, 129, 180, 199, 201],
-        [8, 8, 8, 8, 8, 8, 8, 8, 108, 109, 8, 8, 8, 8, 8, 8, 8],
-    ),
-    "expr_factor": (
-        [0, 12, 27, 31, 46, 49, 50, 55, 58, 63, 64, 67, 117, 129, 180, 199, 201],
-        [9, 68, 9, 9, 9, 9, 9, 9, 9, 9, 110, 9, 9, 9, 9, 9, 9],
-    ),
-    "literal": (
-        [
-            0,
-            12,
-            27,
-            30,
-            31,
-            46,
-            49,
-            50,
-            55,
-            58,
-            63,
-            64,
-            67,
-            95,
-            96,
-            117,
-            129,
-            132,
-            135,
-            171,
-            174,
-            180,
-            199,
-            201,
-            235,
-        ],
-        [
-            10,
-            10,
-            10,
-            86,
-            10,
-            10,
-            10,
-            10,
-            10,
-            10,
-            10,
-            10,
-            10,
-            86,
-            86,
-            10,
-            10,
-            86,
-            86,
-            86,
-            86,
-            10,
-            10,
-            10,
-            86,
-        ],
-    ),
-    "identifier": (
-        [0, 12, 27, 31, 46, 49, 50, 55, 58, 63, 64, 67, 70, 117, 129, 180, 199, 201],
-        [11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 114, 11, 11, 11, 11, 11],
-    ),
-    "enclosed_expr": (
-        [
-            0,
-            9,
-            12,
-            27,
-            31,
-            46,
-            49,
-            50,
-            55,
-            58,
-            63,
-            64,
-            67,
-            68,
-            110,
-            117,
-            129,
-            180,
-            199,
-            201,
-        ],
-        [
-            12,
-            65,
-            12,
-            12,
-            12,
-            12,
-            12,
-            12,
-            12,
-            12,
-            12,
-            12,
-            12,
-            65,
-            65,
-            12,
-            12,
-            12,
-            12,
-            12,
-        ],
-    ),
-    "letexpr": (
-        [0, 12, 27, 31, 46, 49, 50, 55, 58, 63, 64, 67, 117, 129, 180, 199, 201],
-        [13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13],
-    ),
-    "where_expr": (
-        [0, 12, 27, 31, 46, 49, 50, 55, 58, 63, 64, 67, 117, 129, 180, 199, 201],
-        [14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14],
-    ),
-    "lambda_expr": (
-        [0, 12, 27, 31, 46, 49, 50, 55, 58, 63, 64, 67, 117, 129, 180, 199, 201],
-        [15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15],
-    ),
-    "simple_list_expr": (
-        [0, 12, 27, 31, 46, 49, 50, 55, 58, 63, 64, 67, 117, 129, 180, 199, 201],
-        [16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16],
-    ),
-    "simple_tuple_expr": (
-        [0, 12, 27, 31, 46, 49, 50, 55, 58, 63, 64, 67, 117, 129, 180, 199, 201],
-        [17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17],
-    ),
-    "number": (
-        [
-            0,
-            12,
-            27,
-            30,
-            31,
-            46,
-            49,
-            50,
-            55,
-            58,
-            63,
-            64,
-            67,
-            95,
-            96,
-            117,
-            129,
-            132,
-            135,
-            171,
-            174,
-            180,
-            199,
-            201,
-            235,
-        ],
-        [
-            18,
-            18,
-            18,
-            18,
-            18,
-            18,
-            18,
-            18,
-            18,
-            18,
-            18,
-            18,
-            18,
-            18,
-            18,
-            18,
-            18,
-            18,
-            18,
-            18,
-            18,
-            18,
-            18,
-            18,
-            18,
-        ],
-    ),
-    "concrete_number": (
-        [
-            0,
-            12,
-            27,
-            30,
-            31,
-            46,
-            49,
-            50,
-            55,
-            58,
-            63,
-            64,
-            67,
-            95,
-            96,
-            117,
-            129,
-            132,
-            135,
-            171,
-            174,
-            180,
-            199,
-            201,
-            235,
-        ],
-        [
-            19,
-            19,
-            19,
-            19,
-            19,
-            19,
-            19,
-            19,
-            19,
-            19,
-            19,
-            19,
-            19,
-            19,
-            19,
-            19,
-            19,
-            19,
-            19,
-            19,
-            19,
-            19,
-            19,
-            19,
-            19,
-        ],
-    ),
-    "string": (
-        [
-            0,
-            12,
-            27,
-            30,
-            31,
-            46,
-            49,
-            50,
-            55,
-            58,
-            63,
-            64,
-            67,
-            70,
-            95,
-            96,
-            117,
-            129,
-            132,
-            135,
-            171,
-            174,
-            180,
-            199,
-            201,
-            235,
-        ],
-        [
-            20,
-            20,
-            20,
-            20,
-            20,
-            20,
-            20,
-            20,
-            20,
-            20,
-            20,
-            20,
-            20,
-            112,
-            20,
-            20,
-            20,
-            20,
-            20,
-            20,
-            20,
-            20,
-            20,
-            20,
-            20,
-            20,
-        ],
-    ),
-    "char": (
-        [
-            0,
-            12,
-            27,
-            30,
-            31,
-            46,
-            49,
-            50,
-            55,
-            58,
-            63,
-            64,
-            67,
-            70,
-            95,
-            96,
-            117,
-            129,
-            132,
-            135,
-            171,
-            174,
-            180,
-            199,
-            201,
-            235,
-        ],
-        [
-            21,
-            21,
-            21,
-            21,
-            21,
-            21,
-            21,
-            21,
-            21,
-            21,
-            21,
-            21,
-            21,
-            113,
-            21,
-            21,
-            21,
-            21,
-            21,
-            21,
-            21,
-            21,
-            21,
-            21,
-            21,
-            21,
-        ],
-    ),
-    "date": (
-        [
-            0,
-            12,
-            27,
-            30,
-            31,
-            46,
-            49,
-            50,
-            55,
-            58,
-            63,
-            64,
-            67,
-            95,
-            96,
-            117,
-            129,
-            132,
-            135,
-            171,
-            174,
-            180,
-            199,
-            201,
-            235,
-        ],
-        [
-            22,
-            22,
-            22,
-            22,
-            22,
-            22,
-            22,
-            22,
-            22,
-            22,
-            22,
-            22,
-            22,
-            22,
-            22,
-            22,
-            22,
-            22,
-            22,
-            22,
-            22,
-            22,
-            22,
-            22,
-            22,
-        ],
-    ),
-    "datetime": (
-        [
-            0,
-            12,
-            27,
-            30,
-            31,
-            46,
-            49,
-            50,
-            55,
-            58,
-            63,
-            64,
-            67,
-            95,
-            96,
-            117,
-            129,
-            132,
-            135,
-            171,
-            174,
-            180,
-            199,
-            201,
-            235,
-        ],
-        [
-            23,
-            23,
-            23,
-            23,
-            23,
-            23,
-            23,
-            23,
-            23,
-            23,
-            23,
-            23,
-            23,
-            23,
-            23,
-            23,
-            23,
-            23,
-            23,
-            23,
-            23,
-            23,
-            23,
-            23,
-            23,
-        ],
-    ),
-    "date_interval": (
-        [
-            0,
-            12,
-            27,
-            30,
-            31,
-            46,
-            49,
-            50,
-            55,
-            58,
-            63,
-            64,
-            67,
-            95,
-            96,
-            117,
-            129,
-            132,
-            135,
-            171,
-            174,
-            180,
-            199,
-            201,
-            235,
-        ],
-        [
-            24,
-            24,
-            24,
-            24,
-            24,
-            24,
-            24,
-            24,
-            24,
-            24,
-            24,
-            24,
-            24,
-            24,
-            24,
-            24,
-            24,
-            24,
-            24,
-            24,
-            24,
-            24,
-            24,
-            24,
-            24,
-        ],
-    ),
-    "datetime_interval": (
-        [
-            0,
-            12,
-            27,
-            30,
-            31,
-            46,
-            49,
-            50,
-            55,
-            58,
-            63,
-            64,
-            67,
-            95,
-            96,
-            117,
-            129,
-            132,
-            135,
-            171,
-            174,
-            180,
-            199,
-            201,
-            235,
-        ],
-        [
-            25,
-            25,
-            25,
-            25,
-            25,
-            25,
-            25,
-            25,
-            25,
-            25,
-            25,
-            25,
-            25,
-            25,
-            25,
-            25,
-            25,
-            25,
-            25,
-            25,
-            25,
-            25,
-            25,
-            25,
-            25,
-        ],
-    ),
-    "_identifier": (
-        [
-            0,
-            12,
-            27,
-            31,
-            46,
-            49,
-            50,
-            55,
-            58,
-            63,
-            64,
-            67,
-            70,
-            81,
-            95,
-            103,
-            104,
-            117,
-            129,
-            157,
-            177,
-            180,
-            199,
-            201,
-            230,
-            284,
-            288,
-            297,
-        ],
-        [
-            26,
-            26,
-            26,
-            26,
-            26,
-            26,
-            26,
-            26,
-            26,
-            26,
-            26,
-            26,
-            26,
-            125,
-            140,
-            151,
-            151,
-            26,
-            26,
-            125,
-            151,
-            26,
-            26,
-            26,
-            270,
-            125,
-            125,
-            270,
-        ],
-    ),
-    "_enclosed_operator": (
-        [
-            0,
-            9,
-            12,
-            27,
-            31,
-            46,
-            49,
-            50,
-            55,
-            58,
-            63,
-            64,
-            67,
-            68,
-            81,
-            103,
-            104,
-            110,
-            117,
-            129,
-            157,
-            177,
-            180,
-            199,
-            201,
-            284,
-            288,
-        ],
-        [
-            28,
-            28,
-            28,
-            28,
-            28,
-            28,
-            28,
-            28,
-            28,
-            28,
-            28,
-            28,
-            28,
-            28,
-            128,
-            128,
-            128,
-            28,
-            28,
-            28,
-            128,
-            128,
-            28,
-            28,
-            28,
-            128,
-            128,
-        ],
-    ),
-    "infixl_operator_0": (
-        [2, 69, 71, 100, 101, 111, 154, 163, 232, 234],
-        [46, 46, 46, 46, 46, 46, 46, 46, 46, 46],
-    ),
-    "infixr_operator_2": ([5, 27, 67, 126, 152], [49, 76, 76, 76, 76]),
-    "infixl_operator_2": ([5, 27, 67, 126, 152], [50, 75, 75, 75, 75]),
-    "infixl_operator_6": ([6, 27, 67, 106, 126, 152], [55, 77, 77, 55, 77, 77]),
-    "infixl_operator_7": ([7, 27, 67, 107, 126, 152], [58, 78, 78, 58, 78, 78]),
-    "infixr_operator_9": ([9, 27, 67, 68, 110, 126, 152], [63, 79, 79, 63, 63, 79, 79]),
-    "_list_items": ([27, 31], [72, 99]),
-    "_st_operator": ([27, 67, 126, 152], [73, 73, 161, 73]),
-    "empty": (
-        [
-            27,
-            30,
-            31,
-            71,
-            83,
-            84,
-            95,
-            96,
-            100,
-            122,
-            125,
-            128,
-            131,
-            132,
-            135,
-            150,
-            151,
-            154,
-            159,
-            166,
-            167,
-            171,
-            174,
-            181,
-            188,
-            204,
-            205,
-            207,
-            212,
-            219,
-            226,
-            227,
-            231,
-            233,
-            235,
-            242,
-            244,
-            249,
-            250,
-            258,
-            261,
-            264,
-            268,
-            273,
-            274,
-            285,
-            293,
-            294,
-            295,
-            296,
-            303,
-            304,
-            310,
-            318,
-            321,
-            327,
-            334,
-            340,
-        ],
-        [
-            74,
-            98,
-            74,
-            118,
-            133,
-            133,
-            98,
-            98,
-            118,
-            158,
-            133,
-            133,
-            98,
-            98,
-            98,
-            178,
-            133,
-            118,
-            195,
-            133,
-            133,
-            98,
-            98,
-            158,
-            195,
-            237,
-            237,
-            178,
-            254,
-            195,
-            267,
-            267,
-            195,
-            195,
-            98,
-            277,
-            280,
-            195,
-            195,
-            291,
-            267,
-            195,
-            195,
-            237,
-            237,
-            254,
-            315,
-            267,
-            267,
-            267,
-            280,
-            280,
-            291,
-            195,
-            277,
-            315,
-            339,
-            339,
-        ],
-    ),
-    "patterns": ([30, 174], [82, 206]),
-    "pattern": (
-        [30, 95, 96, 131, 132, 135, 171, 174, 235],
-        [83, 137, 146, 164, 166, 146, 204, 83, 273],
-    ),
-    "simple_pattern": (
-        [30, 95, 96, 132, 135, 171, 174, 235],
-        [84, 139, 145, 167, 168, 205, 84, 274],
-    ),
-    "possibly_named_pattern": (
-        [30, 95, 96, 131, 132, 135, 171, 174, 235],
-        [85, 85, 85, 85, 85, 85, 85, 85, 85],
-    ),
-    "cons_pattern": (
-        [30, 95, 96, 132, 135, 171, 174, 235],
-        [87, 87, 87, 87, 87, 87, 87, 87],
-    ),
-    "list_cons_pattern": (
-        [30, 95, 96, 132, 135, 171, 174, 235],
-        [88, 88, 88, 88, 88, 88, 88, 88],
-    ),
-    "tuple_cons_pattern": (
-        [30, 95, 96, 132, 135, 171, 174, 235],
-        [89, 89, 89, 89, 89, 89, 89, 89],
-    ),
-    "empty_list_pattern": (
-        [30, 95, 96, 132, 135, 171, 174, 235],
-        [90, 90, 90, 90, 90, 90, 90, 90],
-    ),
-    "empty_tuple_pattern": (
-        [30, 95, 96, 132, 135, 171, 174, 235],
-        [91, 91, 91, 91, 91, 91, 91, 91],
-    ),
-    "_pattern_name": (
-        [30, 95, 96, 131, 132, 135, 171, 174, 235],
-        [96, 96, 96, 96, 96, 96, 96, 96, 96],
-    ),
-    "_list_items_cont": ([71, 100, 154], [116, 116, 179]),
-    "local_definitions": ([81, 284, 288], [121, 307, 309]),
-    "local_definition": ([81, 157, 284, 288], [122, 182, 122, 122]),
-    "nametype_decl": ([81, 157, 284, 288], [123, 123, 123, 123]),
-    "valuedef": ([81, 157, 284, 288], [124, 124, 124, 124]),
-    "equation": (
-        [81, 103, 104, 157, 177, 284, 288],
-        [127, 150, 150, 127, 207, 127, 127],
-    ),
-    "_patterns": (
-        [83, 84, 125, 128, 151, 166, 167],
-        [130, 134, 160, 162, 160, 202, 203],
-    ),
-    "patterns_comma_sep": ([95], [141]),
-    "equations": ([103, 104], [149, 153]),
-    "_local_definition_set": ([122, 181], [156, 209]),
-    "_patterns_comma": ([137, 139], [170, 173]),
-    "_equation_set": ([150, 207], [176, 240]),
-    "definition": ([157], [181]),
-    "datatype_definition": ([157], [183]),
-    "typeclass": ([157], [184]),
-    "instance": ([157], [185]),
-    "_datatype_lhs": ([157], [186]),
-    "st_type_expr": ([159, 233], [190, 272]),
-    "type_expr": (
-        [159, 188, 219, 231, 233, 249, 250, 264, 268, 318],
-        [191, 216, 259, 271, 191, 282, 283, 295, 296, 259],
-    ),
-    "constrained_type_expr": ([159, 233], [192, 192]),
-    "type_scheme": (
-        [159, 188, 219, 231, 233, 249, 250, 264, 268, 318],
-        [193, 193, 193, 193, 193, 193, 193, 193, 193, 193],
-    ),
-    "_constrained_type_expr_bare": ([159, 188, 233], [194, 217, 194]),
-    "type_constraints": ([159, 188, 233], [197, 197, 197]),
-    "_type_expr_list_trail": ([159, 188, 219, 233, 318], [198, 198, 260, 198, 330]),
-    "_typeclass_def": ([187], [211]),
-    "simple_type_constraint": ([187, 253, 255], [212, 285, 286]),
-    "simple_type_constraints": ([187], [213]),
-    "_maybe_constrained_type_expr": ([188], [215]),
-    "type_function_expr": ([193, 292], [220, 312]),
-    "type_term": ([193, 292], [221, 311]),
-    "type_app_expression": ([193, 292], [222, 222]),
-    "type_factor": ([193, 263, 292, 313], [223, 293, 223, 327]),
-    "type_variable": (
-        [193, 210, 256, 263, 279, 281, 292, 301, 313],
-        [224, 246, 287, 224, 246, 246, 224, 246, 224],
-    ),
-    "type_cons": (
-        [193, 210, 263, 279, 281, 292, 301, 313],
-        [225, 247, 225, 247, 247, 225, 247, 225],
-    ),
-    "_patterns_comma_trail": ([204, 205, 273, 274], [236, 238, 299, 300]),
-    "_data_rhs": ([210], [241]),
-    "data_cons": ([210, 301], [242, 321]),
-    "_data_cons": ([210, 301], [243, 243]),
-    "cons_arg": ([210, 279, 281, 301], [245, 303, 304, 245]),
-    "_cons_arg_factor": ([210, 279, 281, 301], [248, 248, 248, 248]),
-    "_simple_type_constraints": ([212, 285], [252, 308]),
-    "_app_args_non_empty": ([223], [262]),
-    "_maybe_padding": (
-        [226, 227, 242, 261, 294, 295, 296, 321],
-        [264, 268, 276, 292, 316, 317, 319, 276],
-    ),
-    "_type_scheme_generics": ([230, 297], [269, 320]),
-    "_data_conses": ([242, 321], [275, 332]),
-    "_cons_args": ([244, 303, 304], [278, 324, 325]),
-    "_cons_params": ([258, 310], [290, 326]),
-    "_type_expr_list": ([264], [294]),
-    "_app_args": ([293, 327], [314, 335]),
-    "_derivations_list": ([322], [333]),
-    "_derivations_list_trail": ([334, 340], [337, 341]),
-}
-
-_lr_goto = {}
-for _k, _v in _lr_goto_items.items():
-    for _x, _y in zip(_v[0], _v[1]):
-        if not _x in _lr_goto:
-            _lr_goto[_x] = {}
-        _lr_goto[_x][_k] = _y
-del _lr_goto_items
-_lr_productions = [
-    ("S' -> st_expr", "S'", 1, None, None, None),
-    (
-        "expr_factor -> expr_factor SPACE expr_factor",
-        "expr_factor",
-        3,
-        "p_application",
-        "__init__.py",
-        531,
-    ),
-    (
-        "expr_term9 -> expr_factor infixr_operator_9 expr_term9",
-        "expr_term9",
-        3,
-        "p_expressions_precedence_rules",
-        "__init__.py",
-        538,
-    ),
-    (
-        "expr_term9 -> expr_factor",
-        "expr_term9",
-        1,
-        "p_expressions_precedence_rules",
-        "__init__.py",
-        539,
-    ),
-    (
-        "expr_term7 -> expr_term7 infixl_operator_7 expr_term9",
-        "expr_term7",
-        3,
-        "p_expressions_precedence_rules",
-        "__init__.py",
-        541,
-    ),
-    (
-        "expr_term7 -> expr_term9",
-        "expr_term7",
-        1,
-        "p_expressions_precedence_rules",
-        "__init__.py",
-        542,
-    ),
-    (
-        "expr_term6 -> expr_term6 infixl_operator_6 expr_term7",
-        "expr_term6",
-        3,
-        "p_expressions_precedence_rules",
-        "__init__.py",
-        544,
-    ),
-    (
-        "expr_term6 -> expr_term7",
-        "expr_term6",
-        1,
-        "p_expressions_precedence_rules",
-        "__init__.py",
-        545,
-    ),
-    (
-        "expr_term2 -> expr_term2 infixl_operator_2 expr_term6",
-        "expr_term2",
-        3,
-        "p_expressions_precedence_rules",
-        "__init__.py",
-        547,
-    ),
-    (
-        "expr_term2 -> expr_term6",
-        "expr_term2",
-        1,
-        "p_expressions_precedence_rules",
-        "__init__.py",
-        548,
-    ),
-    (
-        "expr_term1 -> expr_term2 infixr_operator_2 expr_term1",
-        "expr_term1",
-        3,
-        "p_expressions_precedence_rules",
-        "__init__.py",
-        550,
-    ),
-    (
-        "expr_term1 -> expr_term2",
-        "expr_term1",
-        1,
-        "p_expressions_precedence_rules",
-        "__init__.py",
-        551,
-    ),
-    (
-        "expr_term0 -> expr infixl_operator_0 expr_term0",
-        "expr_term0",
-        3,
-        "p_expressions_precedence_rules",
-        "__init__.py",
-        553,
-    ),
-    (
-        "expr_term0 -> expr_term1",
-        "expr_term0",
-        1,
-        "p_expressions_precedence_rules",
-        "__init__.py",
-        554,
-    ),
-    ("st_expr -> expr", "st_expr", 1, "p_standalone_definitions", "__init__.py", 567),
-    ("expr -> expr_term0", "expr", 1, "p_standalone_definitions", "__init__.py", 569),
-    (
-        "expr_factor -> literal",
-        "expr_factor",
-        1,
-        "p_standalone_definitions",
-        "__init__.py",
-        571,
-    ),
-    (
-        "expr_factor -> identifier",
-        "expr_factor",
-        1,
-        "p_standalone_definitions",
-        "__init__.py",
-        572,
-    ),
-    (
-        "expr_factor -> enclosed_expr",
-        "expr_factor",
-        1,
-        "p_standalone_definitions",
-        "__init__.py",
-        573,
-    ),
-    (
-        "expr_factor -> letexpr",
-        "expr_factor",
-        1,
-        "p_standalone_definitions",
-        "__init__.py",
-        574,
-    ),
-    (
-        "expr_factor -> where_expr",
-        "expr_factor",
-        1,
-        "p_standalone_definitions",
-        "__init__.py",
-        575,
-    ),
-    (
-        "expr_factor -> lambda_expr",
-        "expr_factor",
-        1,
-        "p_standalone_definitions",
-        "__init__.py",
-        576,
-    ),
-    (
-        "expr_factor -> simple_list_expr",
-        "expr_factor",
-        1,
-        "p_standalone_definitions",
-        "__init__.py",
-        577,
-    ),
-    (
-        "expr_factor -> simple_tuple_expr",
-        "expr_factor",
-        1,
-        "p_standalone_definitions",
-        "__init__.py",
-        578,
-    ),
-    (
-        "st_type_expr -> type_expr",
-        "st_type_expr",
-        1,
-        "p_standalone_definitions",
-        "__init__.py",
-        580,
-    ),
-    (
-        "st_type_expr -> constrained_type_expr",
-        "st_type_expr",
-        1,
-        "p_standalone_definitions",
-        "__init__.py",
-        581,
-    ),
-    ("literal -> number", "literal", 1, "p_literals", "__init__.py", 589),
-    ("literal -> concrete_number", "literal", 1, "p_literals", "__init__.py", 590),
-    ("literal -> string", "literal", 1, "p_literals", "__init__.py", 591),
-    ("literal -> char", "literal", 1, "p_literals", "__init__.py", 592),
-    ("literal -> date", "literal", 1, "p_literals", "__init__.py", 593),
-    ("literal -> datetime", "literal", 1, "p_literals", "__init__.py", 594),
-    ("literal -> date_interval", "literal", 1, "p_literals", "__init__.py", 595),
-    ("literal -> datetime_interval", "literal", 1, "p_literals", "__init__.py", 596),
-    (
-        "simple_tuple_expr -> LPAREN _list_items RPAREN",
-        "simple_tuple_expr",
-        3,
-        "p_tuple_expr",
-        "__init__.py",
-        602,
-    ),
-    (
-        "simple_list_expr -> LBRACKET _list_items RBRACKET",
-        "simple_list_expr",
-        3,
-        "p_list_expr",
-        "__init__.py",
-        609,
-    ),
-    (
-        "_list_items -> expr _list_items_cont",
-        "_list_items",
-        2,
-        "p_list_items",
-        "__init__.py",
-        616,
-    ),
-    (
-        "_list_items_cont -> COMMA expr _list_items_cont",
-        "_list_items_cont",
-        3,
-        "p_list_items",
-        "__init__.py",
-        617,
-    ),
-    (
-        "_list_items -> empty",
-        "_list_items",
-        1,
-        "p_list_items_empty",
-        "__init__.py",
-        623,
-    ),
-    (
-        "_list_items_cont -> empty",
-        "_list_items_cont",
-        1,
-        "p_list_items_empty",
-        "__init__.py",
-        624,
-    ),
-    ("date -> DATE", "date", 1, "p_date", "__init__.py", 630),
-    ("datetime -> DATETIME", "datetime", 1, "p_datetime", "__init__.py", 636),
-    (
-        "date_interval -> DATE_INTERVAL",
-        "date_interval",
-        1,
-        "p_date_interval",
-        "__init__.py",
-        642,
-    ),
-    (
-        "datetime_interval -> DATETIME_INTERVAL",
-        "datetime_interval",
-        1,
-        "p_datetime_interval",
-        "__init__.py",
-        648,
-    ),
-    ("char -> CHAR", "char", 1, "p_char", "__init__.py", 654),
-    ("string -> STRING", "string", 1, "p_string", "__init__.py", 659),
-    ("identifier -> _identifier", "identifier", 1, "p_variable", "__init__.py", 664),
-    (
-        "_identifier -> UNDER_IDENTIFIER",
-        "_identifier",
-        1,
-        "p_bare_identifier",
-        "__init__.py",
-        671,
-    ),
-    (
-        "_identifier -> UPPER_IDENTIFIER",
-        "_identifier",
-        1,
-        "p_bare_identifier",
-        "__init__.py",
-        672,
-    ),
-    (
-        "_identifier -> LOWER_IDENTIFIER",
-        "_identifier",
-        1,
-        "p_bare_identifier",
-        "__init__.py",
-        673,
-    ),
-    (
-        "enclosed_expr -> LPAREN expr RPAREN",
-        "enclosed_expr",
-        3,
-        "p_paren_expr",
-        "__init__.py",
-        680,
-    ),
-    (
-        "expr_factor -> enclosed_expr expr_factor",
-        "expr_factor",
-        2,
-        "p_application_after_paren",
-        "__init__.py",
-        685,
-    ),
-    (
-        "expr_factor -> expr_factor enclosed_expr",
-        "expr_factor",
-        2,
-        "p_application_after_paren",
-        "__init__.py",
-        686,
-    ),
-    (
-        "enclosed_expr -> _enclosed_operator",
-        "enclosed_expr",
-        1,
-        "p_operators_as_expressios",
-        "__init__.py",
-        692,
-    ),
-    (
-        "_enclosed_operator -> LPAREN _st_operator RPAREN",
-        "_enclosed_operator",
-        3,
-        "p_enclosed_operator",
-        "__init__.py",
-        698,
-    ),
-    (
-        "infixr_operator_9 -> DOT_OPERATOR",
-        "infixr_operator_9",
-        1,
-        "p_operator",
-        "__init__.py",
-        708,
-    ),
-    (
-        "infixl_operator_7 -> STAR",
-        "infixl_operator_7",
-        1,
-        "p_operator",
-        "__init__.py",
-        710,
-    ),
-    (
-        "infixl_operator_7 -> SLASH",
-        "infixl_operator_7",
-        1,
-        "p_operator",
-        "__init__.py",
-        711,
-    ),
-    (
-        "infixl_operator_7 -> DOUBLESLASH",
-        "infixl_operator_7",
-        1,
-        "p_operator",
-        "__init__.py",
-        712,
-    ),
-    (
-        "infixl_operator_7 -> PERCENT",
-        "infixl_operator_7",
-        1,
-        "p_operator",
-        "__init__.py",
-        713,
-    ),
-    (
-        "infixl_operator_6 -> PLUS",
-        "infixl_operator_6",
-        1,
-        "p_operator",
-        "__init__.py",
-        715,
-    ),
-    (
-        "infixl_operator_6 -> MINUS",
-        "infixl_operator_6",
-        1,
-        "p_operator",
-        "__init__.py",
-        716,
-    ),
-    (
-        "infixr_operator_2 -> COLON",
-        "infixr_operator_2",
-        1,
-        "p_operator",
-        "__init__.py",
-        719,
-    ),
-    (
-        "infixl_operator_2 -> OPERATOR",
-        "infixl_operator_2",
-        1,
-        "p_operator",
-        "__init__.py",
-        721,
-    ),
-    (
-        "infixl_operator_2 -> ARROW",
-        "infixl_operator_2",
-        1,
-        "p_operator",
-        "__init__.py",
-        722,
-    ),
-    (
-        "infixl_operator_2 -> ATSYM",
-        "infixl_operator_2",
-        1,
-        "p_operator",
-        "__init__.py",
-        723,
-    ),
-    (
-        "infixl_operator_0 -> TICK_OPERATOR",
-        "infixl_operator_0",
-        1,
-        "p_operator",
-        "__init__.py",
-        725,
-    ),
-    (
-        "_st_operator -> infixl_operator_2",
-        "_st_operator",
-        1,
-        "p_operator",
-        "__init__.py",
-        727,
-    ),
-    (
-        "_st_operator -> infixr_operator_2",
-        "_st_operator",
-        1,
-        "p_operator",
-        "__init__.py",
-        728,
-    ),
-    (
-        "_st_operator -> infixl_operator_6",
-        "_st_operator",
-        1,
-        "p_operator",
-        "__init__.py",
-        729,
-    ),
-    (
-        "_st_operator -> infixl_operator_7",
-        "_st_operator",
-        1,
-        "p_operator",
-        "__init__.py",
-        730,
-    ),
-    (
-        "_st_operator -> infixr_operator_9",
-        "_st_operator",
-        1,
-        "p_operator",
-        "__init__.py",
-        731,
-    ),
-    ("_st_operator -> COMMA", "_st_operator", 1, "p_operator", "__init__.py", 732),
-    ("number -> BASE10_INTEGER", "number", 1, "p_integer", "__init__.py", 739),
-    ("number -> BASE16_INTEGER", "number", 1, "p_integer", "__init__.py", 740),
-    ("number -> BASE8_INTEGER", "number", 1, "p_integer", "__init__.py", 741),
-    ("number -> BASE2_INTEGER", "number", 1, "p_integer", "__init__.py", 742),
-    ("number -> FLOAT", "number", 1, "p_float", "__init__.py", 771),
-    (
-        "concrete_number -> number ANNOTATION string",
-        "concrete_number",
-        3,
-        "p_concrete_number",
-        "__init__.py",
-        776,
-    ),
-    (
-        "concrete_number -> number ANNOTATION char",
-        "concrete_number",
-        3,
-        "p_concrete_number",
-        "__init__.py",
-        777,
-    ),
-    (
-        "concrete_number -> number ANNOTATION identifier",
-        "concrete_number",
-        3,
-        "p_concrete_number",
-        "__init__.py",
-        778,
-    ),
-    ("empty -> <empty>", "empty", 0, "p_empty", "__init__.py", 787),
-    (
-        "lambda_expr -> BACKSLASH patterns ARROW expr",
-        "lambda_expr",
-        4,
-        "p_lambda_definition",
-        "__init__.py",
-        792,
-    ),
-    (
-        "pattern -> possibly_named_pattern",
-        "pattern",
-        1,
-        "p_pattern",
-        "__init__.py",
-        801,
-    ),
-    ("simple_pattern -> literal", "simple_pattern", 1, "p_pattern", "__init__.py", 803),
-    (
-        "simple_pattern -> cons_pattern",
-        "simple_pattern",
-        1,
-        "p_pattern",
-        "__init__.py",
-        804,
-    ),
-    (
-        "simple_pattern -> list_cons_pattern",
-        "simple_pattern",
-        1,
-        "p_pattern",
-        "__init__.py",
-        805,
-    ),
-    (
-        "simple_pattern -> tuple_cons_pattern",
-        "simple_pattern",
-        1,
-        "p_pattern",
-        "__init__.py",
-        806,
-    ),
-    (
-        "simple_pattern -> empty_list_pattern",
-        "simple_pattern",
-        1,
-        "p_pattern",
-        "__init__.py",
-        807,
-    ),
-    (
-        "simple_pattern -> empty_tuple_pattern",
-        "simple_pattern",
-        1,
-        "p_pattern",
-        "__init__.py",
-        808,
-    ),
-    (
-        "simple_pattern -> LOWER_IDENTIFIER",
-        "simple_pattern",
-        1,
-        "p_var_pattern",
-        "__init__.py",
-        814,
-    ),
-    (
-        "simple_pattern -> UNDER_IDENTIFIER",
-        "simple_pattern",
-        1,
-        "p_var_pattern",
-        "__init__.py",
-        815,
-    ),
-    (
-        "possibly_named_pattern -> _pattern_name simple_pattern",
-        "possibly_named_pattern",
-        2,
-        "p_possibly_named_pattern",
-        "__init__.py",
-        821,
-    ),
-    (
-        "_pattern_name -> LOWER_IDENTIFIER ATSYM",
-        "_pattern_name",
-        2,
-        "p_pattern_name",
-        "__init__.py",
-        832,
-    ),
-    (
-        "_pattern_name -> empty",
-        "_pattern_name",
-        1,
-        "p_no_pattern_name",
-        "__init__.py",
-        838,
-    ),
-    (
-        "simple_pattern -> UPPER_IDENTIFIER",
-        "simple_pattern",
-        1,
-        "p_simplecons_pattern",
-        "__init__.py",
-        844,
-    ),
-    (
-        "list_cons_pattern -> pattern COLON pattern",
-        "list_cons_pattern",
-        3,
-        "p_list_cons_for_param",
-        "__init__.py",
-        850,
-    ),
-    (
-        "list_cons_pattern -> simple_pattern COLON simple_pattern",
-        "list_cons_pattern",
-        3,
-        "p_list_cons_for_param",
-        "__init__.py",
-        851,
-    ),
-    (
-        "cons_pattern -> LPAREN _identifier SPACE patterns RPAREN",
-        "cons_pattern",
-        5,
-        "p_param_pattern",
-        "__init__.py",
-        857,
-    ),
-    (
-        "simple_pattern -> LPAREN pattern RPAREN",
-        "simple_pattern",
-        3,
-        "p_pattern_trivially_enclosed",
-        "__init__.py",
-        865,
-    ),
-    (
-        "simple_pattern -> LPAREN simple_pattern RPAREN",
-        "simple_pattern",
-        3,
-        "p_pattern_trivially_enclosed",
-        "__init__.py",
-        866,
-    ),
-    (
-        "empty_list_pattern -> LBRACKET RBRACKET",
-        "empty_list_pattern",
-        2,
-        "p_empty_list_as_pattern",
-        "__init__.py",
-        872,
-    ),
-    (
-        "empty_tuple_pattern -> LPAREN RPAREN",
-        "empty_tuple_pattern",
-        2,
-        "p_unit_value_as_pattern",
-        "__init__.py",
-        879,
-    ),
-    (
-        "tuple_cons_pattern -> LPAREN patterns_comma_sep RPAREN",
-        "tuple_cons_pattern",
-        3,
-        "p_tuple_cons_pattern",
-        "__init__.py",
-        885,
-    ),
-    ("patterns -> pattern _patterns", "patterns", 2, "p_patterns", "__init__.py", 893),
-    (
-        "patterns -> simple_pattern _patterns",
-        "patterns",
-        2,
-        "p_patterns",
-        "__init__.py",
-        894,
-    ),
-    (
-        "patterns_comma_sep -> pattern _patterns_comma",
-        "patterns_comma_sep",
-        2,
-        "p_patterns",
-        "__init__.py",
-        895,
-    ),
-    (
-        "patterns_comma_sep -> simple_pattern _patterns_comma",
-        "patterns_comma_sep",
-        2,
-        "p_patterns",
-        "__init__.py",
-        896,
-    ),
-    (
-        "_patterns -> SPACE pattern _patterns",
-        "_patterns",
-        3,
-        "p_patterns",
-        "__init__.py",
-        897,
-    ),
-    (
-        "_patterns -> SPACE simple_pattern _patterns",
-        "_patterns",
-        3,
-        "p_patterns",
-        "__init__.py",
-        898,
-    ),
-    (
-        "_patterns_comma -> COMMA pattern _patterns_comma_trail",
-        "_patterns_comma",
-        3,
-        "p_patterns",
-        "__init__.py",
-        899,
-    ),
-    (
-        "_patterns_comma -> COMMA simple_pattern _patterns_comma_trail",
-        "_patterns_comma",
-        3,
-        "p_patterns",
-        "__init__.py",
-        900,
-    ),
-    (
-        "_patterns_comma_trail -> COMMA pattern _patterns_comma_trail",
-        "_patterns_comma_trail",
-        3,
-        "p_patterns",
-        "__init__.py",
-        901,
-    ),
-    (
-        "_patterns_comma_trail -> COMMA simple_pattern _patterns_comma_trail",
-        "_patterns_comma_trail",
-        3,
-        "p_patterns",
-        "__init__.py",
-        902,
-    ),
-    ("_patterns -> empty", "_patterns", 1, "p_patterns_empty", "__init__.py", 908),
-    (
-        "_patterns_comma_trail -> empty",
-        "_patterns_comma_trail",
-        1,
-        "p_patterns_empty",
-        "__init__.py",
-        909,
-    ),
-    (
-        "equation -> _identifier _patterns EQ expr",
-        "equation",
-        4,
-        "p_equation",
-        "__init__.py",
-        915,
-    ),
-    (
-        "equation -> _enclosed_operator _patterns EQ expr",
-        "equation",
-        4,
-        "p_equation",
-        "__init__.py",
-        916,
-    ),
-    (
-        "equations -> equation _equation_set",
-        "equations",
-        2,
-        "p_equation_set",
-        "__init__.py",
-        926,
-    ),
-    (
-        "_equation_set -> PADDING equation _equation_set",
-        "_equation_set",
-        3,
-        "p_equation_set2",
-        "__init__.py",
-        934,
-    ),
-    (
-        "_equation_set -> empty",
-        "_equation_set",
-        1,
-        "p_equation_set3",
-        "__init__.py",
-        941,
-    ),
-    (
-        "letexpr -> KEYWORD_LET SPACE local_definitions KEYWORD_IN SPACE st_expr",
-        "letexpr",
-        6,
-        "p_let_expr",
-        "__init__.py",
-        951,
-    ),
-    (
-        "where_expr -> expr KEYWORD_WHERE SPACE equations",
-        "where_expr",
-        4,
-        "p_where_expr",
-        "__init__.py",
-        959,
-    ),
-    (
-        "where_expr -> expr KEYWORD_WHERE PADDING equations",
-        "where_expr",
-        4,
-        "p_where_expr",
-        "__init__.py",
-        960,
-    ),
-    (
-        "type_expr -> type_scheme type_function_expr",
-        "type_expr",
-        2,
-        "p_type_expr",
-        "__init__.py",
-        970,
-    ),
-    (
-        "type_expr -> type_scheme type_term",
-        "type_expr",
-        2,
-        "p_type_expr",
-        "__init__.py",
-        971,
-    ),
-    (
-        "type_scheme -> empty",
-        "type_scheme",
-        1,
-        "p_type_scheme_empty",
-        "__init__.py",
-        980,
-    ),
-    (
-        "type_scheme -> KEYWORD_FORALL SPACE _type_scheme_generics",
-        "type_scheme",
-        3,
-        "p_type_scheme",
-        "__init__.py",
-        984,
-    ),
-    (
-        "_type_scheme_generics -> _identifier SPACE _type_scheme_generics",
-        "_type_scheme_generics",
-        3,
-        "p_type_scheme_generics",
-        "__init__.py",
-        991,
-    ),
-    (
-        "_type_scheme_generics -> _identifier DOT_OPERATOR",
-        "_type_scheme_generics",
-        2,
-        "p_last_type_scheme_generic",
-        "__init__.py",
-        996,
-    ),
-    (
-        "type_function_expr -> type_term ARROW _maybe_padding type_function_expr",
-        "type_function_expr",
-        4,
-        "p_type_function_expr",
-        "__init__.py",
-        1001,
-    ),
-    (
-        "type_function_expr -> type_term",
-        "type_function_expr",
-        1,
-        "p_type_function_expr",
-        "__init__.py",
-        1002,
-    ),
-    (
-        "type_term -> type_app_expression",
-        "type_term",
-        1,
-        "p_type_term",
-        "__init__.py",
-        1012,
-    ),
-    ("type_term -> type_factor", "type_term", 1, "p_type_term", "__init__.py", 1013),
-    (
-        "type_app_expression -> type_factor _app_args_non_empty",
-        "type_app_expression",
-        2,
-        "p_type_application_expr",
-        "__init__.py",
-        1018,
-    ),
-    (
-        "_app_args -> SPACE type_factor _app_args",
-        "_app_args",
-        3,
-        "p_type_application_args",
-        "__init__.py",
-        1030,
-    ),
-    (
-        "_app_args_non_empty -> SPACE type_factor _app_args",
-        "_app_args_non_empty",
-        3,
-        "p_type_application_args",
-        "__init__.py",
-        1031,
-    ),
-    (
-        "_app_args -> empty",
-        "_app_args",
-        1,
-        "p_type_application_args_empty",
-        "__init__.py",
-        1037,
-    ),
-    (
-        "type_variable -> LOWER_IDENTIFIER",
-        "type_variable",
-        1,
-        "p_type_variable",
-        "__init__.py",
-        1042,
-    ),
-    (
-        "type_cons -> UPPER_IDENTIFIER",
-        "type_cons",
-        1,
-        "p_type_cons",
-        "__init__.py",
-        1047,
-    ),
-    (
-        "type_factor -> type_variable",
-        "type_factor",
-        1,
-        "p_type_factor_identifier",
-        "__init__.py",
-        1052,
-    ),
-    (
-        "type_factor -> type_cons",
-        "type_factor",
-        1,
-        "p_type_factor_identifier",
-        "__init__.py",
-        1053,
-    ),
-    (
-        "type_factor -> LPAREN _maybe_padding _type_expr_list _maybe_padding RPAREN",
-        "type_factor",
-        5,
-        "p_type_factor_tuple",
-        "__init__.py",
-        1060,
-    ),
-    (
-        "type_factor -> LPAREN RPAREN",
-        "type_factor",
-        2,
-        "p_type_factor_unit_type",
-        "__init__.py",
-        1066,
-    ),
-    (
-        "_type_expr_list -> type_expr COMMA _type_expr_list_trail",
-        "_type_expr_list",
-        3,
-        "p_type_expr_list",
-        "__init__.py",
-        1071,
-    ),
-    (
-        "_type_expr_list_trail -> type_expr COMMA _type_expr_list_trail",
-        "_type_expr_list_trail",
-        3,
-        "p_type_expr_list",
-        "__init__.py",
-        1072,
-    ),
-    (
-        "_type_expr_list_trail -> type_expr",
-        "_type_expr_list_trail",
-        1,
-        "p_type_expr_list_last_item",
-        "__init__.py",
-        1078,
-    ),
-    (
-        "type_factor -> LPAREN _maybe_padding type_expr _maybe_padding RPAREN",
-        "type_factor",
-        5,
-        "p_type_factor_paren",
-        "__init__.py",
-        1084,
-    ),
-    (
-        "type_factor -> LBRACKET _maybe_padding type_expr _maybe_padding RBRACKET",
-        "type_factor",
-        5,
-        "p_type_factor_bracket",
-        "__init__.py",
-        1089,
-    ),
-    (
-        "constrained_type_expr -> _constrained_type_expr_bare",
-        "constrained_type_expr",
-        1,
-        "p_constrained_type_expr",
-        "__init__.py",
-        1121,
-    ),
-    (
-        "_constrained_type_expr_bare -> type_constraints FATARROW type_expr",
-        "_constrained_type_expr_bare",
-        3,
-        "p_constrained_type_expr_bare",
-        "__init__.py",
-        1129,
-    ),
-    (
-        "_maybe_constrained_type_expr -> type_expr",
-        "_maybe_constrained_type_expr",
-        1,
-        "p_maybe_constrained_type_expr_no_constraint",
-        "__init__.py",
-        1148,
-    ),
-    (
-        "_maybe_constrained_type_expr -> _constrained_type_expr_bare",
-        "_maybe_constrained_type_expr",
-        1,
-        "p_maybe_constrained_type_expr_constrained",
-        "__init__.py",
-        1154,
-    ),
-    (
-        "instance -> KEYWORD_INSTANCE _maybe_constrained_type_expr KEYWORD_WHERE PADDING local_definitions",
-        "instance",
-        5,
-        "p_instance",
-        "__init__.py",
-        1160,
-    ),
-    (
-        "type_constraints -> _type_expr_list_trail",
-        "type_constraints",
-        1,
-        "p_type_constraint",
-        "__init__.py",
-        1179,
-    ),
-    (
-        "_maybe_padding -> PADDING",
-        "_maybe_padding",
-        1,
-        "p_maybe_padding",
-        "__init__.py",
-        1185,
-    ),
-    (
-        "_maybe_padding -> empty",
-        "_maybe_padding",
-        1,
-        "p_maybe_padding",
-        "__init__.py",
-        1186,
-    ),
-    (
-        "program -> definitions _trailing_new_lines",
-        "program",
-        2,
-        "p_program",
-        "__init__.py",
-        1194,
-    ),
-    (
-        "_trailing_new_lines -> empty",
-        "_trailing_new_lines",
-        1,
-        "p_trailing_new_lines",
-        "__init__.py",
-        1200,
-    ),
-    (
-        "_trailing_new_lines -> NEWLINE _trailing_new_lines",
-        "_trailing_new_lines",
-        2,
-        "p_trailing_new_lines",
-        "__init__.py",
-        1201,
-    ),
-    (
-        "definitions -> definition _definition_set",
-        "definitions",
-        2,
-        "p_definitions",
-        "__init__.py",
-        1206,
-    ),
-    (
-        "_definition_set -> newlines definition _definition_set",
-        "_definition_set",
-        3,
-        "p_definition_set",
-        "__init__.py",
-        1212,
-    ),
-    (
-        "newlines -> NEWLINE _trailing_new_lines",
-        "newlines",
-        2,
-        "p_newlines",
-        "__init__.py",
-        1218,
-    ),
-    (
-        "_definition_set -> empty",
-        "_definition_set",
-        1,
-        "p_definition_set2",
-        "__init__.py",
-        1222,
-    ),
-    (
-        "_definition_set -> newlines",
-        "_definition_set",
-        1,
-        "p_definition_set2",
-        "__init__.py",
-        1223,
-    ),
-    (
-        "definition -> local_definition",
-        "definition",
-        1,
-        "p_definition",
-        "__init__.py",
-        1229,
-    ),
-    (
-        "definition -> datatype_definition",
-        "definition",
-        1,
-        "p_definition",
-        "__init__.py",
-        1230,
-    ),
-    ("definition -> typeclass", "definition", 1, "p_definition", "__init__.py", 1231),
-    ("definition -> instance", "definition", 1, "p_definition", "__init__.py", 1232),
-    (
-        "local_definition -> nametype_decl",
-        "local_definition",
-        1,
-        "p_local_definition",
-        "__init__.py",
-        1239,
-    ),
-    (
-        "local_definition -> valuedef",
-        "local_definition",
-        1,
-        "p_local_definition",
-        "__init__.py",
-        1240,
-    ),
-    (
-        "local_definitions -> local_definition _local_definition_set",
-        "local_definitions",
-        2,
-        "p_local_definitions",
-        "__init__.py",
-        1246,
-    ),
-    (
-        "_local_definition_set -> PADDING definition _local_definition_set",
-        "_local_definition_set",
-        3,
-        "p_local_definition_set",
-        "__init__.py",
-        1252,
-    ),
-    (
-        "_local_definition_set -> empty",
-        "_local_definition_set",
-        1,
-        "p_local_definition_set_empty",
-        "__init__.py",
-        1258,
-    ),
-    (
-        "typeclass -> KEYWORD_CLASS _typeclass_def KEYWORD_WHERE PADDING local_definitions",
-        "typeclass",
-        5,
-        "p_typeclass",
-        "__init__.py",
-        1264,
-    ),
-    (
-        "_typeclass_def -> simple_type_constraint",
-        "_typeclass_def",
-        1,
-        "p_typeclass_def",
-        "__init__.py",
-        1272,
-    ),
-    (
-        "_typeclass_def -> simple_type_constraints FATARROW simple_type_constraint",
-        "_typeclass_def",
-        3,
-        "p_typeclass_def_with_constraints",
-        "__init__.py",
-        1278,
-    ),
-    (
-        "simple_type_constraint -> UPPER_IDENTIFIER SPACE type_variable",
-        "simple_type_constraint",
-        3,
-        "p_type_constraint_def",
-        "__init__.py",
-        1284,
-    ),
-    (
-        "simple_type_constraints -> simple_type_constraint _simple_type_constraints",
-        "simple_type_constraints",
-        2,
-        "p_type_constraints",
-        "__init__.py",
-        1290,
-    ),
-    (
-        "_simple_type_constraints -> COMMA simple_type_constraint _simple_type_constraints",
-        "_simple_type_constraints",
-        3,
-        "p_type_constraints",
-        "__init__.py",
-        1291,
-    ),
-    (
-        "_simple_type_constraints -> empty",
-        "_simple_type_constraints",
-        1,
-        "p_type_constraints_empty",
-        "__init__.py",
-        1297,
-    ),
-    ("valuedef -> equation", "valuedef", 1, "p_valuedef", "__init__.py", 1303),
-    (
-        "nametype_decl -> _identifier DOUBLE_COLON st_type_expr",
-        "nametype_decl",
-        3,
-        "p_nametype_decl",
-        "__init__.py",
-        1309,
-    ),
-    (
-        "nametype_decl -> LPAREN _st_operator RPAREN DOUBLE_COLON st_type_expr",
-        "nametype_decl",
-        5,
-        "p_nametype_decl_operators",
-        "__init__.py",
-        1318,
-    ),
-    (
-        "datatype_definition -> _datatype_lhs EQ _data_rhs",
-        "datatype_definition",
-        3,
-        "p_datatype_definition",
-        "__init__.py",
-        1327,
-    ),
-    (
-        "_datatype_lhs -> KEYWORD_DATA SPACE UPPER_IDENTIFIER _cons_params",
-        "_datatype_lhs",
-        4,
-        "p_datatype_lhs",
-        "__init__.py",
-        1340,
-    ),
-    (
-        "_cons_params -> SPACE LOWER_IDENTIFIER _cons_params",
-        "_cons_params",
-        3,
-        "p_datatype_cons_params",
-        "__init__.py",
-        1349,
-    ),
-    (
-        "_cons_params -> empty",
-        "_cons_params",
-        1,
-        "p_datatype_cons_params_empty",
-        "__init__.py",
-        1355,
-    ),
-    (
-        "_data_rhs -> data_cons _data_conses",
-        "_data_rhs",
-        2,
-        "p_datatype_body",
-        "__init__.py",
-        1361,
-    ),
-    (
-        "_data_conses -> _maybe_padding PIPE data_cons _data_conses",
-        "_data_conses",
-        4,
-        "p_datatype_body",
-        "__init__.py",
-        1362,
-    ),
-    (
-        "_data_conses -> empty",
-        "_data_conses",
-        1,
-        "p_datatype_conses_empty",
-        "__init__.py",
-        1368,
-    ),
-    (
-        "_data_conses -> _maybe_padding KEYWORD_DERIVING LPAREN _derivations_list RPAREN",
-        "_data_conses",
-        5,
-        "p_datatype_derivations",
-        "__init__.py",
-        1373,
-    ),
-    (
-        "_data_conses -> _maybe_padding KEYWORD_DERIVING UPPER_IDENTIFIER",
-        "_data_conses",
-        3,
-        "p_datatype_single_derivation",
-        "__init__.py",
-        1379,
-    ),
-    ("data_cons -> _data_cons", "data_cons", 1, "p_data_cons", "__init__.py", 1384),
-    (
-        "_data_cons -> UPPER_IDENTIFIER _cons_args",
-        "_data_cons",
-        2,
-        "p_bare_data_cons",
-        "__init__.py",
-        1390,
-    ),
-    (
-        "_data_cons -> cons_arg OPERATOR cons_arg _cons_args",
-        "_data_cons",
-        4,
-        "p_bare_data_cons_operator",
-        "__init__.py",
-        1395,
-    ),
-    (
-        "_cons_args -> SPACE cons_arg _cons_args",
-        "_cons_args",
-        3,
-        "p_data_cons_args",
-        "__init__.py",
-        1403,
-    ),
-    (
-        "_cons_args -> empty",
-        "_cons_args",
-        1,
-        "p_data_cons_args_empty",
-        "__init__.py",
-        1409,
-    ),
-    ("cons_arg -> type_variable", "cons_arg", 1, "p_cons_arg", "__init__.py", 1415),
-    ("cons_arg -> type_cons", "cons_arg", 1, "p_cons_arg", "__init__.py", 1416),
-    ("cons_arg -> _cons_arg_factor", "cons_arg", 1, "p_cons_arg", "__init__.py", 1417),
-    (
-        "_cons_arg_factor -> LPAREN type_expr RPAREN",
-        "_cons_arg_factor",
-        3,
-        "p_cons_arg_factor",
-        "__init__.py",
-        1423,
-    ),
-    (
-        "_cons_arg_factor -> LBRACKET type_expr RBRACKET",
-        "_cons_arg_factor",
-        3,
-        "p_cons_arg_factor_list",
-        "__init__.py",
-        1429,
-    ),
-    (
-        "_derivations_list -> UPPER_IDENTIFIER _derivations_list_trail",
-        "_derivations_list",
-        2,
-        "p_derivations_list",
-        "__init__.py",
-        1435,
-    ),
-    (
-        "_derivations_list_trail -> COMMA UPPER_IDENTIFIER _derivations_list_trail",
-        "_derivations_list_trail",
-        3,
-        "p_derivations_list",
-        "__init__.py",
-        1436,
-    ),
-    (
-        "_derivations_list_trail -> empty",
-        "_derivations_list_trail",
-        1,
-        "p_derivations_list_trail_empty",
-        "__init__.py",
-        1442,
-    ),
-]
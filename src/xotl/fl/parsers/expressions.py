@@ -13,6 +13,6 @@ from xotl.fl.ast.base import AST
 
 def parse(code: str, debug=False, tracking=False) -> AST:
     """Parse a single expression `code`."""
-    from xotl.fl.parsers import expr_parser, lexer
+    from xotl.fl.parsers import default_context
 
-    return expr_parser.parse(code, lexer=lexer, debug=debug, tracking=tracking)
+    return default_context.parse_expression(code, debug=debug, tracking=tracking)
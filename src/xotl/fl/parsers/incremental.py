@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------
+# Copyright (c) Merchise Autrement [~º/~] and Contributors
+# All rights reserved.
+#
+# This is free software; you can do what the LICENCE file allows you to.
+#
+"""Reparse programs incrementally while they are edited.
+
+A `Document`:class: keeps the source of a program split in top-level
+definitions (as `~xotl.fl.parsers.streaming.split_definitions`:func: does),
+and the tokens and definitions of each one.  After an edit only the
+definitions whose lines changed are lexed and parsed again; so the time
+taken by an edit depends on the size of the definitions it touches and not
+on the size of the program.
+
+"""
+
+from bisect import bisect_right
+from typing import Iterator, List, Optional, Tuple
+
+from ply.lex import LexError
+
+from xotl.fl.parsers import ParserContext, ParserError, default_context
+from xotl.fl.parsers.scanner import scan
+from xotl.fl.parsers.streaming import _split
+
+Position = Tuple[int, int]
+
+
+class TopLevel:
+    """The source of a top-level definition, its tokens and definitions.
+
+    `lines` are the lines of the definition, including the empty lines and
+    comments after it.  The line numbers and positions of the `tokens` are
+    relative to the first line of the definition.
+
+    If the source cannot be parsed, `definitions` is empty and `error` is
+    the exception raised (with line numbers relative to the first line).
+
+    """
+
+    def __init__(self, lines: List[str], source: str, context: ParserContext) -> None:
+        self.lines = lines
+        self.source = source
+        self.tokens: List = []
+        self.definitions: List = []
+        self.error: Optional[Exception] = None
+        try:
+            self.tokens = list(scan(source))
+            self.definitions = context.parse_program(source, tokens=self.tokens)
+        except (LexError, ParserError, TypeError, ValueError) as error:
+            self.error = error
+
+    def __repr__(self):
+        return f"<TopLevel {self.source!r}>"
+
+
+class Document:
+    """A program being edited.
+
+    `definitions` are the same definitions `xotl.fl.parse`:func: returns for
+    the `source`, except for the definitions that cannot be parsed (see
+    `errors`).
+
+    Example:
+
+       >>> doc = Document("id x = x\\nmain = id 1\\n")
+       >>> doc.edit((2, 10), (2, 11), "2")
+       1
+       >>> doc.definitions[1]
+       <equation main = Application(Identifier('id'), Literal(2, TypeCons('Number', ())))>
+
+    """
+
+    def __init__(self, source: str = "", *, context: ParserContext = None) -> None:
+        self.context = context or default_context
+        self._reset(_split_lines(source))
+
+    @property
+    def source(self) -> str:
+        return "".join(line for toplevel in self._toplevels for line in toplevel.lines)
+
+    @property
+    def definitions(self) -> List:
+        return [definition for toplevel in self._toplevels for definition in toplevel.definitions]
+
+    @property
+    def errors(self) -> List[Exception]:
+        "The errors of the definitions that cannot be parsed."
+        result = []
+        for lineno, toplevel in self.toplevels():
+            if toplevel.error is not None:
+                if lineno == 1:
+                    result.append(toplevel.error)
+                else:
+                    # Parse it again to report the right line numbers.
+                    try:
+                        self.context.parse_program(toplevel.source, lineno=lineno)
+                    except (LexError, ParserError, TypeError, ValueError) as error:
+                        result.append(error)
+        return result
+
+    def toplevels(self) -> Iterator[Tuple[int, TopLevel]]:
+        "Generate the line number of each top-level definition and its source."
+        for index, toplevel in enumerate(self._toplevels):
+            yield self._start(index), toplevel
+
+    def edit(self, start: Position, end: Position, text: str) -> int:
+        """Replace the text between `start` and `end` with `text`.
+
+        The positions are pairs of line and column; lines are numbered from
+        1 (as in the errors of the parser) and columns from 0.  The position
+        after the last line is that of the line following it.
+
+        Return the number of top-level definitions lexed and parsed again.
+
+        """
+        start, end = self._normalize(start), self._normalize(end)
+        (start_line, start_column), (end_line, end_column) = start, end
+        if not 1 <= start_line <= end_line <= self._end or (
+            start_line == end_line and start_column > end_column
+        ):
+            raise ValueError(f"Invalid range: {start}, {end}")
+        if self._base is None:
+            # Only comments and empty lines, parse everything.
+            lines = _split_lines(self.source)
+            lines[start_line - 1 : end_line] = _replace(lines, start, end, text, 1)
+            self._reset(lines)
+            return len(self._toplevels)
+        toplevels = self._toplevels
+        # The definition before the ones touched is also split again, the
+        # edit could make its lines continue it.
+        lo = max(self._index(start_line) - 1, 0)
+        hi = self._index(min(end_line, self._end - 1)) + 1
+        self._move_gap(hi)
+        region_start = self._start(lo)
+        region = [line for toplevel in toplevels[lo:hi] for line in toplevel.lines]
+        i, j = start_line - region_start, end_line - region_start
+        replacement = _replace(region, start, end, text, region_start)
+        delta = len(replacement) - (min(j + 1, len(region)) - i)
+        region[i : j + 1] = replacement
+        if lo == 0 and _base_indentation(region + self._following(hi)) != self._base:
+            lines = region + [line for toplevel in toplevels[hi:] for line in toplevel.lines]
+            self._reset(lines)
+            return len(self._toplevels)
+        while True:
+            # The lines of the next definition don't change, but the last
+            # definition of the region ends with its indentation.  If the
+            # region has just comments, they belong to the next one.
+            following = self._following(hi)
+            chunks = list(_split(region + following, self._base))
+            if not following or chunks[-1][0] == following:
+                break
+            region.extend(toplevels[hi].lines)
+            hi += 1
+            self._move_gap(hi)
+        if following:
+            chunks.pop()
+        previous = {}
+        for toplevel in toplevels[lo:hi]:
+            previous.setdefault(toplevel.source, toplevel)
+        result = []
+        reparsed = 0
+        for lines, source in chunks:
+            # The source of a definition ending without a new line is the
+            # same as if it ended with the indentation of the next one.
+            toplevel = previous.pop(source, None)
+            if toplevel is None or toplevel.lines != lines:
+                toplevel = TopLevel(lines, source, self.context)
+                reparsed += 1
+            result.append(toplevel)
+        starts = []
+        lineno = region_start
+        for toplevel in result:
+            starts.append(lineno)
+            lineno += len(toplevel.lines)
+        toplevels[lo:hi] = result
+        self._starts[lo:hi] = starts
+        self._gap = lo + len(result)
+        self._end += delta
+        return reparsed
+
+    def _normalize(self, position: Position) -> Position:
+        # If the last line doesn't end with a new line, the position after
+        # it is its end.
+        if position[0] == self._end and self._toplevels:
+            last = self._toplevels[-1].lines[-1]
+            if not last.endswith("\n"):
+                return self._end - 1, len(last) + position[1]
+        return position
+
+    def _reset(self, lines: List[str]) -> None:
+        self._base = _base_indentation(lines)
+        self._toplevels = [
+            TopLevel(chunk, source, self.context) for chunk, source in _split(lines, self._base)
+        ]
+        # The first line of each definition.  To keep edits from updating
+        # all the following definitions, the ones from `_gap` onward are
+        # relative to `_end` (the number of the line after the last one).
+        self._starts: List[int] = []
+        lineno = 1
+        for toplevel in self._toplevels:
+            self._starts.append(lineno)
+            lineno += len(toplevel.lines)
+        self._gap = len(self._starts)
+        self._end = lineno
+
+    def _start(self, index: int) -> int:
+        if index < self._gap:
+            return self._starts[index]
+        else:
+            return self._starts[index] + self._end
+
+    def _index(self, lineno: int) -> int:
+        "Return the index of the definition at line `lineno`."
+        starts, gap = self._starts, self._gap
+        if gap < len(starts) and lineno >= starts[gap] + self._end:
+            return bisect_right(starts, lineno - self._end, gap) - 1
+        else:
+            return max(bisect_right(starts, lineno, 0, gap) - 1, 0)
+
+    def _move_gap(self, index: int) -> None:
+        starts, end = self._starts, self._end
+        for i in range(self._gap, index):
+            starts[i] += end
+        for i in range(index, self._gap):
+            starts[i] -= end
+        self._gap = index
+
+    def _following(self, index: int) -> List[str]:
+        # The first line of the definition at `index` (if any).
+        if index < len(self._toplevels):
+            return self._toplevels[index].lines[:1]
+        else:
+            return []
+
+
+def _replace(lines: List[str], start: Position, end: Position, text: str, lineno: int):
+    # Return the lines replacing the ones from start to end; `lineno` is the
+    # number of the first of the `lines`.
+    (start_line, start_column), (end_line, end_column) = start, end
+    i, j = start_line - lineno, end_line - lineno
+    first = lines[i] if i < len(lines) else ""
+    last = lines[j] if j < len(lines) else ""
+    return _split_lines(first[:start_column] + text + last[end_column:])
+
+
+def _split_lines(text: str) -> List[str]:
+    # Like text.splitlines(True) but only at '\n', as the lexer does.
+    lines = [line + "\n" for line in text.split("\n")]
+    last = lines.pop()
+    if last != "\n":
+        lines.append(last[:-1])
+    return lines
+
+
+def _base_indentation(lines: List[str]) -> Optional[int]:
+    for line in lines:
+        stripped = line.lstrip()
+        if stripped and not stripped.startswith("--"):
+            return len(line) - len(stripped)
+    return None
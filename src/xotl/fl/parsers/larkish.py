@@ -21,7 +21,7 @@ from xotl.fl.ast.types import (
     TypeCons,
     TypeConstraint,
     TypeRecord,
-    TypeSchema,
+    TypeScheme,
     TypeVariable,
 )
 from xotl.fl.builtins import NumberType
@@ -37,6 +37,7 @@ class LexerHelper:
     """
 
     BLOCK_END_type = "_END"
+    always_accept = ()  # no terminals beyond those the grammar uses
     BLOCK_BEGIN_types = (
         "KEYWORD_WHERE",
         "KEYWORD_DATA",
@@ -111,24 +112,26 @@ class ASTBuilder(Transformer):
     def type_factor_enclosed_type_expr(self, _lparen, result, _rparen):
         return result
 
-    @v_args(tree=True)
-    def type_constraint(self, tree):
-        name, var = tree.children
-        assert isinstance(name, Token) and name.type == "UPPER_IDENTIFIER"
-        assert isinstance(var, TypeVariable)
-        return TypeConstraint(name, var)
+    @v_args(inline=True)
+    def type_constraint(self, type_):
+        if (
+            isinstance(type_, TypeCons)
+            and len(type_.subtypes) == 1
+            and isinstance(type_.subtypes[0], TypeVariable)
+        ):
+            return TypeConstraint(type_.cons, type_.subtypes[0])
+        raise ValueError(f"Invalid constraint '{type_!s}'")
 
     @v_args(tree=True)
     def type_expr_no_constraints(self, tree):
-        schema, expr = tree.children
-        assert isinstance(schema, TypeSchema) and schema.type_ is None  # type: ignore
+        generics, expr = tree.children
+        assert isinstance(generics, tuple)
         assert isinstance(expr, Type)
-        schema.type_ = expr
-        return schema
+        return TypeScheme(generics, expr)
 
-    @v_args(meta=True)
-    def type_constraints(self, children, meta):
-        *types, _fatarrow = children
+    @v_args(inline=True)
+    def type_constraints(self, *types):
+        *types, _fatarrow = types
         assert isinstance(_fatarrow, Token) and _fatarrow.type == "FATARROW"
         assert all(isinstance(t, TypeConstraint) for t in types)
         return types
@@ -138,23 +141,21 @@ class ASTBuilder(Transformer):
         constraints, type_expr = tree.children
         return ConstrainedType((), type_expr, constraints)
 
-    @v_args(meta=True)
-    def type_schema(self, children, meta):
-        forall, *identifiers = children
+    @v_args(inline=True)
+    def type_schema(self, forall, *identifiers):
         assert isinstance(forall, Token) and forall.type == "KEYWORD_FORALL"
         assert all(isinstance(i, Token) and i.type == "LOWER_IDENTIFIER" for i in identifiers)
-        # NB: Return a partially built TypeSchema with a type.
-        return TypeSchema((i.value for i in identifiers), None)  # type: ignore
+        # NB: Types are immutable, return the generics so that the rule
+        # including the schema builds it with the type.
+        return tuple(i.value for i in identifiers)
 
     @v_args(tree=True)
     def type_expr(self, tree):
-        partial_schema, type_ = tree.children
+        generics, type_ = tree.children
         if isinstance(type_, ConstrainedType):
-            type_.generics = partial_schema.generics
-            return type_
+            return ConstrainedType(generics, type_.type_, type_.constraints)
         else:
-            partial_schema.type_ = type_
-            return partial_schema
+            return TypeScheme(generics, type_)
 
     @v_args(inline=True)
     def type_factor_list(self, type_expr):
@@ -221,27 +222,45 @@ class record_type_item:
     type_: Type
 
 
-type_expr_parser = Lark.open(
-    os.path.join(os.path.dirname(__file__), "grammar.lark"),
+GRAMMAR = os.path.join(os.path.dirname(__file__), "grammar.lark")
+
+with open(GRAMMAR, encoding="utf-8") as _file:
+    _grammar = _file.read()
+
+# The type language is LALR(1), so its parser builds the AST while parsing
+# (no parse tree) and Lark caches its tables in the temporary directory.  The
+# expressions need the Earley parser (the grammar is ambiguous, e.g. 'where'
+# expressions are factors); both start symbols share a single parser and the
+# parse trees must be transformed by `ASTBuilder`:class:.
+type_expr_parser = Lark(
+    _grammar,
+    parser="lalr",
     lexer="standard",
     propagate_positions=True,
     start="type_expr",
-    debug=True,
-    postlex=LexerHelper(),
-)
-expr_parser = Lark.open(
-    os.path.join(os.path.dirname(__file__), "grammar.lark"),
-    lexer="standard",
-    propagate_positions=True,
-    start="expr",
-    debug=True,
+    cache=True,
+    transformer=ASTBuilder(),
     postlex=LexerHelper(),
 )
-program_parser = Lark.open(
-    os.path.join(os.path.dirname(__file__), "grammar.lark"),
+_earley_parser = Lark(
+    _grammar,
     lexer="standard",
     propagate_positions=True,
-    start="program",
-    debug=True,
+    start=["expr", "program"],
     postlex=LexerHelper(),
 )
+
+
+class _StartParser:
+    "Parse with a parser of several start symbols from the given one."
+
+    def __init__(self, parser: Lark, start: str) -> None:
+        self.parser = parser
+        self.start = start
+
+    def parse(self, text: str):
+        return self.parser.parse(text, start=self.start)
+
+
+expr_parser = _StartParser(_earley_parser, "expr")
+program_parser = _StartParser(_earley_parser, "program")
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------
+# Copyright (c) Merchise Autrement [~º/~] and Contributors
+# All rights reserved.
+#
+# This is free software; you can do what the LICENCE file allows you to.
+#
+"""Parse programs leaving the equations for later.
+
+`parse_lazy`:func: parses the type annotations, data types, type classes and
+instances of a program, but it only looks at the first tokens of each
+top-level equation to find its name.  The equations are
+`LazyEquation`:class: objects which parse their source the first time their
+patterns or body are needed; e.g. when the type checker looks for the
+dependencies of the names reachable from ``main`` (see the `roots` of
+`xotl.fl.typecheck.typecheck_program`:func:).
+
+"""
+
+import io
+from itertools import islice
+from typing import List, Optional
+
+from xotl.fl.ast.pattern import Equation
+from xotl.fl.parsers import ParserContext, ParserError, default_context
+from xotl.fl.parsers.scanner import scan
+from xotl.fl.parsers.streaming import _lines, _numbered, split_definitions
+
+_NAMES = ("LOWER_IDENTIFIER", "UPPER_IDENTIFIER", "UNDER_IDENTIFIER")
+
+
+class LazyEquation(Equation):
+    """An equation parsed the first time its `patterns` or `body` are needed.
+
+    The `name` is known without parsing.  Syntax errors in the `source` are
+    raised (with the line numbers of the whole program) by the first access
+    to the patterns or the body.
+
+    """
+
+    __slots__ = ("source", "lineno", "context", "_equation")
+
+    def __init__(
+        self, name: str, source: str, lineno: int = 1, *, context: ParserContext = None
+    ) -> None:
+        self.name = name
+        self.source = source
+        self.lineno = lineno
+        self.context = context or default_context
+        self._equation: Optional[Equation] = None
+
+    @property
+    def parsed(self) -> bool:
+        "True if the source has been parsed."
+        return self._equation is not None
+
+    @property
+    def patterns(self):  # type: ignore
+        return self.force().patterns
+
+    @property
+    def body(self):  # type: ignore
+        return self.force().body
+
+    @property
+    def _hash(self):  # type: ignore
+        return self.force()._hash
+
+    def force(self) -> Equation:
+        "Parse the source (if not done yet) and return the equation."
+        result = self._equation
+        if result is None:
+            definitions = self.context.parse_program(self.source, lineno=self.lineno)
+            if len(definitions) != 1 or not isinstance(definitions[0], Equation):
+                raise ParserError(f"Expected an equation of {self.name!s} at line {self.lineno}")
+            result = self._equation = definitions[0]
+        return result
+
+    def __repr__(self):
+        if self._equation is None:
+            return f"<equation {self.name!s} ...>"
+        else:
+            return repr(self._equation)
+
+    def __reduce__(self):
+        return Equation, (self.name, self.patterns, self.body)
+
+
+def parse_lazy(source: str, *, context: ParserContext = None, debug: bool = False) -> List:
+    """Parse the program `source` without parsing its equations.
+
+    Return the same definitions `xotl.fl.parse`:func: would return, except
+    that the equations are `LazyEquation`:class: objects.
+
+    """
+    context = context or default_context
+    result: List = []
+    for lineno, chunk in _numbered(split_definitions(_lines(io.StringIO(source), None))):
+        name = _equation_name(chunk)
+        if name is None:
+            result.extend(context.parse_program(chunk, debug=debug, lineno=lineno))
+        else:
+            result.append(LazyEquation(name, chunk, lineno, context=context))
+    return result
+
+
+def _equation_name(source: str) -> Optional[str]:
+    # Return the name of the equation defined by `source`, or None if it
+    # doesn't start like an equation: 'name = ...', 'name args = ...',
+    # '(op) = ...' or '(op) args = ...'.
+    tokens = list(islice(scan(source), 4))
+    if tokens and tokens[0].type in _NAMES:
+        name, following = tokens[0].value, tokens[1:2]
+    elif (
+        len(tokens) >= 3
+        and tokens[0].type == "LPAREN"
+        and tokens[1].type not in _NAMES + ("LPAREN", "RPAREN")
+        and tokens[2].type == "RPAREN"
+    ):
+        name, following = tokens[1].value, tokens[3:4]
+    else:
+        return None
+    if following and following[0].type in ("EQ", "SPACE"):
+        return name
+    else:
+        return None
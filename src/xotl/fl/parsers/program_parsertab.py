@@ -1,9678 +0,0 @@
-# program_parsertab.py
-# This file is automatically generated. Do not edit.
-# pylint: disable=W,C,R
-# type: ignore
-# flake8: noqa
-_tabversion = "3.10"
-
-_lr_method = "LALR"
-
-_lr_signature = "programrightARROWleftKEYWORD_LETleftKEYWORD_INleftKEYWORD_WHEREleftTICK_OPERATORleftOPERATORleftPLUSMINUSleftSTARSLASHDOUBLESLASHPERCENTrightDOT_OPERATORleftSPACEANNOTATION ARROW ATSYM BACKSLASH BASE10_INTEGER BASE16_INTEGER BASE2_INTEGER BASE8_INTEGER CHAR COLON COMMA DATE DATETIME DATETIME_INTERVAL DATE_INTERVAL DOT_OPERATOR DOUBLESLASH DOUBLE_COLON EQ FATARROW FLOAT KEYWORD_CLASS KEYWORD_DATA KEYWORD_DERIVING KEYWORD_FORALL KEYWORD_IN KEYWORD_INSTANCE KEYWORD_LET KEYWORD_WHERE LBRACKET LOWER_IDENTIFIER LPAREN MINUS NEWLINE OPERATOR PADDING PERCENT PIPE PLUS RBRACKET RPAREN SLASH SPACE STAR STRING TICK_OPERATOR UNDER_IDENTIFIER UPPER_IDENTIFIERexpr_factor : expr_factor SPACE expr_factor\n    expr_term9 : expr_factor infixr_operator_9 expr_term9\n               | expr_factor\n\n    expr_term7 : expr_term7 infixl_operator_7 expr_term9\n               | expr_term9\n\n    expr_term6 : expr_term6 infixl_operator_6 expr_term7\n               | expr_term7\n\n    expr_term2 : expr_term2 infixl_operator_2 expr_term6\n               | expr_term6\n\n    expr_term1 : expr_term2 infixr_operator_2 expr_term1\n               | expr_term2\n\n    expr_term0 : expr infixl_operator_0 expr_term0\n               | expr_term1\n\n    \n    st_expr : expr\n\n    expr : expr_term0\n\n    expr_factor : literal\n                | identifier\n                | enclosed_expr\n                | letexpr\n                | where_expr\n                | lambda_expr\n                | simple_list_expr\n                | simple_tuple_expr\n\n    st_type_expr : type_expr\n                 | constrained_type_expr\n\n    literal : number\n             | concrete_number\n             | string\n             | char\n             | date\n             | datetime\n             | date_interval\n             | datetime_interval\n    simple_tuple_expr : LPAREN _list_items RPAREN\n    simple_list_expr : LBRACKET _list_items RBRACKET\n    _list_items : expr _list_items_cont\n       _list_items_cont : COMMA expr _list_items_cont\n    _list_items : empty\n       _list_items_cont : empty\n    date : DATE\n    datetime : DATETIME\n    date_interval : DATE_INTERVAL\n    datetime_interval : DATETIME_INTERVAL\n    char : CHARstring : STRINGidentifier : _identifier\n\n    _identifier : UNDER_IDENTIFIER\n                   | UPPER_IDENTIFIER\n                   | LOWER_IDENTIFIER\n\n    enclosed_expr : LPAREN expr RPARENexpr_factor : enclosed_expr expr_factor\n                   | expr_factor enclosed_expr\n    enclosed_expr : _enclosed_operator\n    _enclosed_operator : LPAREN _st_operator RPAREN\n    infixr_operator_9 : DOT_OPERATOR\n\n    infixl_operator_7 : STAR\n                     | SLASH\n                     | DOUBLESLASH\n                     | PERCENT\n\n    infixl_operator_6 : PLUS\n                     | MINUS\n\n\n    infixr_operator_2 : COLON\n\n    infixl_operator_2 : OPERATOR\n                      | ARROW\n                      | ATSYM\n\n    infixl_operator_0 : TICK_OPERATOR\n\n    _st_operator : infixl_operator_2\n                 | infixr_operator_2\n                 | infixl_operator_6\n                 | infixl_operator_7\n                 | infixr_operator_9\n                 | COMMA\n\n    number : BASE10_INTEGER\n              | BASE16_INTEGER\n              | BASE8_INTEGER\n              | BASE2_INTEGER\n    number : FLOATconcrete_number :  number ANNOTATION string\n                        | number ANNOTATION char\n                        | number ANNOTATION identifier\n    empty : lambda_expr : BACKSLASH patterns ARROW expr\n    \n    pattern : possibly_named_pattern\n\n    simple_pattern : literal\n    simple_pattern : cons_pattern\n    simple_pattern : list_cons_pattern\n    simple_pattern : tuple_cons_pattern\n    simple_pattern : empty_list_pattern\n    simple_pattern : empty_tuple_pattern\n    simple_pattern : LOWER_IDENTIFIER\n       simple_pattern : UNDER_IDENTIFIER\n    possibly_named_pattern : _pattern_name simple_pattern\n    _pattern_name : LOWER_IDENTIFIER ATSYM\n    _pattern_name : empty\n    simple_pattern : UPPER_IDENTIFIER\n    list_cons_pattern : pattern COLON pattern\n       list_cons_pattern : simple_pattern COLON simple_pattern\n    cons_pattern : LPAREN _identifier SPACE patterns RPAREN\n    simple_pattern : LPAREN pattern RPAREN\n    simple_pattern : LPAREN simple_pattern RPAREN\n    empty_list_pattern : LBRACKET RBRACKETempty_tuple_pattern : LPAREN RPARENtuple_cons_pattern : LPAREN patterns_comma_sep RPAREN\n    patterns : pattern _patterns\n       patterns : simple_pattern _patterns\n       patterns_comma_sep : pattern _patterns_comma\n       patterns_comma_sep : simple_pattern _patterns_comma\n       _patterns : SPACE pattern _patterns\n       _patterns : SPACE simple_pattern _patterns\n       _patterns_comma : COMMA pattern _patterns_comma_trail\n       _patterns_comma : COMMA simple_pattern _patterns_comma_trail\n       _patterns_comma_trail : COMMA pattern _patterns_comma_trail\n       _patterns_comma_trail : COMMA simple_pattern _patterns_comma_trail\n    _patterns : empty\n       _patterns_comma_trail : empty\n    equation : _identifier _patterns EQ expr\n       equation : _enclosed_operator _patterns EQ expr\n    equations : equation _equation_set\n    \n    _equation_set : PADDING equation _equation_set\n    \n    _equation_set : empty\n    \n    letexpr : KEYWORD_LET SPACE local_definitions KEYWORD_IN SPACE st_expr\n\n    \n    where_expr : expr KEYWORD_WHERE SPACE equations\n    where_expr : expr KEYWORD_WHERE PADDING equations\n    type_expr : type_scheme type_function_expr\n                 | type_scheme type_termtype_scheme : emptytype_scheme : KEYWORD_FORALL SPACE _type_scheme_generics_type_scheme_generics : _identifier SPACE _type_scheme_generics_type_scheme_generics : _identifier DOT_OPERATORtype_function_expr : type_term ARROW _maybe_padding type_function_expr\n                          | type_term\n    type_term : type_app_expression\n                 | type_factortype_app_expression : type_factor _app_args_non_empty_app_args : SPACE type_factor _app_args\n       _app_args_non_empty : SPACE type_factor _app_args\n    _app_args : emptytype_variable : LOWER_IDENTIFIERtype_cons : UPPER_IDENTIFIERtype_factor : type_variable\n                   | type_cons\n\n    type_factor : LPAREN _maybe_padding _type_expr_list _maybe_padding RPARENtype_factor : LPAREN RPAREN_type_expr_list : type_expr COMMA _type_expr_list_trail\n       _type_expr_list_trail : type_expr COMMA _type_expr_list_trail\n    _type_expr_list_trail : type_expr\n    type_factor : LPAREN _maybe_padding type_expr _maybe_padding RPARENtype_factor : LBRACKET _maybe_padding type_expr _maybe_padding RBRACKETconstrained_type_expr : _constrained_type_expr_bare\n\n    _constrained_type_expr_bare : type_constraints FATARROW type_expr\n    _maybe_constrained_type_expr : type_expr\n    _maybe_constrained_type_expr : _constrained_type_expr_bare\n    instance : KEYWORD_INSTANCE _maybe_constrained_type_expr                   KEYWORD_WHERE PADDING local_definitionstype_constraints : _type_expr_list_trail\n    _maybe_padding : PADDING\n                      | empty\n    program : definitions _trailing_new_lines\n    _trailing_new_lines : empty\n       _trailing_new_lines : NEWLINE _trailing_new_lines\n    definitions : definition _definition_set\n    _definition_set : newlines definition _definition_set\n    newlines : NEWLINE _trailing_new_lines_definition_set : empty\n       _definition_set : newlines\n    definition : local_definition\n                  | datatype_definition\n                  | typeclass\n                  | instance\n    \n    local_definition : nametype_decl\n                     | valuedef\n    local_definitions : local_definition _local_definition_set\n    _local_definition_set : PADDING definition _local_definition_set\n    _local_definition_set : empty\n    typeclass : KEYWORD_CLASS _typeclass_def                    KEYWORD_WHERE PADDING local_definitions\n    _typeclass_def : simple_type_constraint\n    _typeclass_def : simple_type_constraints FATARROW simple_type_constraint\n    simple_type_constraint : UPPER_IDENTIFIER SPACE type_variable\n    simple_type_constraints : simple_type_constraint _simple_type_constraints\n       _simple_type_constraints : COMMA simple_type_constraint _simple_type_constraints\n    _simple_type_constraints : empty\n    valuedef : equation\n    nametype_decl : _identifier DOUBLE_COLON st_type_expr\n    nametype_decl : LPAREN _st_operator RPAREN DOUBLE_COLON st_type_expr\n    datatype_definition : _datatype_lhs EQ _data_rhs\n    _datatype_lhs : KEYWORD_DATA SPACE UPPER_IDENTIFIER _cons_params\n    _cons_params : SPACE LOWER_IDENTIFIER _cons_params\n    _cons_params : empty\n    _data_rhs : data_cons _data_conses\n       _data_conses : _maybe_padding PIPE data_cons _data_conses\n    _data_conses : empty_data_conses : _maybe_padding KEYWORD_DERIVING                        LPAREN _derivations_list RPAREN_data_conses : _maybe_padding KEYWORD_DERIVING UPPER_IDENTIFIERdata_cons : _data_cons_data_cons : UPPER_IDENTIFIER _cons_args_data_cons : cons_arg OPERATOR cons_arg _cons_args_cons_args : SPACE cons_arg _cons_args\n    _cons_args : empty\n    cons_arg : type_variable\n       cons_arg : type_cons\n       cons_arg : _cons_arg_factor\n    _cons_arg_factor : LPAREN type_expr RPAREN\n    _cons_arg_factor : LBRACKET type_expr RBRACKET\n    _derivations_list : UPPER_IDENTIFIER _derivations_list_trail\n       _derivations_list_trail : COMMA UPPER_IDENTIFIER _derivations_list_trail\n    _derivations_list_trail : empty\n    "
-
-_lr_action_items = {
-    "KEYWORD_CLASS": (
-        [0, 22, 23, 25, 27, 65, 67, 274],
-        [11, -158, -81, 11, -81, -159, -162, 11],
-    ),
-    "KEYWORD_INSTANCE": (
-        [0, 22, 23, 25, 27, 65, 67, 274],
-        [12, -158, -81, 12, -81, -159, -162, 12],
-    ),
-    "LPAREN": (
-        [
-            0,
-            12,
-            17,
-            18,
-            19,
-            22,
-            23,
-            25,
-            27,
-            28,
-            36,
-            38,
-            41,
-            43,
-            52,
-            53,
-            54,
-            55,
-            56,
-            57,
-            58,
-            59,
-            60,
-            61,
-            62,
-            65,
-            67,
-            77,
-            78,
-            86,
-            93,
-            94,
-            96,
-            102,
-            115,
-            116,
-            117,
-            118,
-            119,
-            120,
-            121,
-            122,
-            123,
-            124,
-            126,
-            127,
-            128,
-            129,
-            130,
-            131,
-            132,
-            133,
-            134,
-            135,
-            136,
-            137,
-            140,
-            145,
-            147,
-            149,
-            152,
-            156,
-            159,
-            161,
-            162,
-            164,
-            165,
-            167,
-            169,
-            170,
-            171,
-            172,
-            173,
-            174,
-            175,
-            176,
-            177,
-            178,
-            179,
-            180,
-            181,
-            182,
-            183,
-            184,
-            185,
-            186,
-            187,
-            189,
-            190,
-            192,
-            194,
-            195,
-            208,
-            212,
-            213,
-            214,
-            223,
-            229,
-            230,
-            232,
-            233,
-            234,
-            235,
-            236,
-            237,
-            238,
-            239,
-            240,
-            241,
-            247,
-            258,
-            261,
-            263,
-            264,
-            265,
-            274,
-            278,
-            283,
-            285,
-            287,
-            288,
-            289,
-            290,
-            291,
-            292,
-            293,
-            294,
-            295,
-            297,
-            299,
-            301,
-            302,
-            304,
-            307,
-            321,
-            322,
-            325,
-            328,
-            329,
-            340,
-            341,
-            342,
-            344,
-            348,
-            349,
-            350,
-            354,
-        ],
-        [
-            14,
-            -81,
-            -48,
-            -47,
-            -49,
-            -158,
-            -81,
-            14,
-            -81,
-            77,
-            93,
-            -126,
-            -81,
-            115,
-            -63,
-            -64,
-            -65,
-            -62,
-            -60,
-            -61,
-            -56,
-            -57,
-            -58,
-            -59,
-            -55,
-            -159,
-            -162,
-            -81,
-            -81,
-            -81,
-            -81,
-            -81,
-            -81,
-            186,
-            115,
-            115,
-            -26,
-            -27,
-            -28,
-            -29,
-            -30,
-            -31,
-            -32,
-            -33,
-            -94,
-            -73,
-            -74,
-            -75,
-            -76,
-            -77,
-            -45,
-            -44,
-            -40,
-            -41,
-            -42,
-            -43,
-            186,
-            -155,
-            77,
-            77,
-            14,
-            14,
-            -81,
-            93,
-            -81,
-            -156,
-            -81,
-            -127,
-            -46,
-            -116,
-            -15,
-            -13,
-            -11,
-            -9,
-            -7,
-            -5,
-            240,
-            -16,
-            -17,
-            186,
-            -19,
-            -20,
-            -21,
-            -22,
-            -23,
-            186,
-            -53,
-            115,
-            186,
-            -81,
-            115,
-            -93,
-            -81,
-            -117,
-            77,
-            269,
-            93,
-            -129,
-            186,
-            -66,
-            186,
-            186,
-            186,
-            186,
-            186,
-            186,
-            -52,
-            186,
-            240,
-            14,
-            115,
-            115,
-            -78,
-            -79,
-            -80,
-            14,
-            93,
-            -81,
-            -128,
-            -12,
-            324,
-            324,
-            -10,
-            -8,
-            -6,
-            -4,
-            -2,
-            -1,
-            -50,
-            186,
-            -34,
-            -54,
-            186,
-            -35,
-            -122,
-            -81,
-            -123,
-            -82,
-            115,
-            -118,
-            324,
-            -120,
-            186,
-            -81,
-            -121,
-            -14,
-            -119,
-        ],
-    ),
-    "KEYWORD_DATA": (
-        [0, 22, 23, 25, 27, 65, 67, 274],
-        [16, -158, -81, 16, -81, -159, -162, 16],
-    ),
-    "UNDER_IDENTIFIER": (
-        [
-            0,
-            22,
-            23,
-            25,
-            27,
-            43,
-            52,
-            53,
-            54,
-            55,
-            56,
-            57,
-            58,
-            59,
-            60,
-            61,
-            62,
-            65,
-            67,
-            97,
-            102,
-            115,
-            116,
-            126,
-            140,
-            152,
-            156,
-            180,
-            186,
-            187,
-            189,
-            190,
-            192,
-            194,
-            195,
-            206,
-            228,
-            230,
-            232,
-            233,
-            234,
-            235,
-            236,
-            237,
-            238,
-            240,
-            247,
-            258,
-            261,
-            274,
-            288,
-            289,
-            297,
-            299,
-            302,
-            304,
-            329,
-            341,
-            344,
-        ],
-        [
-            18,
-            -158,
-            -81,
-            18,
-            -81,
-            113,
-            -63,
-            -64,
-            -65,
-            -62,
-            -60,
-            -61,
-            -56,
-            -57,
-            -58,
-            -59,
-            -55,
-            -159,
-            -162,
-            18,
-            18,
-            202,
-            113,
-            -94,
-            18,
-            18,
-            18,
-            18,
-            18,
-            -53,
-            113,
-            18,
-            -81,
-            113,
-            -93,
-            18,
-            18,
-            18,
-            -66,
-            18,
-            18,
-            18,
-            18,
-            18,
-            18,
-            18,
-            18,
-            113,
-            113,
-            18,
-            18,
-            18,
-            -50,
-            18,
-            -54,
-            18,
-            113,
-            18,
-            18,
-        ],
-    ),
-    "UPPER_IDENTIFIER": (
-        [
-            0,
-            11,
-            12,
-            22,
-            23,
-            25,
-            27,
-            28,
-            36,
-            38,
-            41,
-            43,
-            52,
-            53,
-            54,
-            55,
-            56,
-            57,
-            58,
-            59,
-            60,
-            61,
-            62,
-            63,
-            65,
-            67,
-            77,
-            78,
-            81,
-            83,
-            86,
-            93,
-            94,
-            96,
-            97,
-            102,
-            115,
-            116,
-            126,
-            140,
-            145,
-            147,
-            149,
-            152,
-            156,
-            159,
-            161,
-            162,
-            164,
-            165,
-            167,
-            180,
-            186,
-            187,
-            189,
-            190,
-            192,
-            194,
-            195,
-            206,
-            208,
-            213,
-            214,
-            223,
-            228,
-            229,
-            230,
-            232,
-            233,
-            234,
-            235,
-            236,
-            237,
-            238,
-            240,
-            247,
-            258,
-            261,
-            269,
-            274,
-            278,
-            283,
-            285,
-            288,
-            289,
-            297,
-            299,
-            302,
-            304,
-            329,
-            336,
-            341,
-            344,
-        ],
-        [
-            17,
-            32,
-            -81,
-            -158,
-            -81,
-            17,
-            -81,
-            71,
-            95,
-            -126,
-            -81,
-            114,
-            -63,
-            -64,
-            -65,
-            -62,
-            -60,
-            -61,
-            -56,
-            -57,
-            -58,
-            -59,
-            -55,
-            139,
-            -159,
-            -162,
-            -81,
-            -81,
-            32,
-            32,
-            -81,
-            -81,
-            -81,
-            -81,
-            17,
-            17,
-            203,
-            114,
-            -94,
-            17,
-            -155,
-            95,
-            95,
-            17,
-            17,
-            -81,
-            95,
-            -81,
-            -156,
-            -81,
-            -127,
-            17,
-            17,
-            -53,
-            114,
-            17,
-            -81,
-            114,
-            -93,
-            17,
-            -81,
-            71,
-            270,
-            95,
-            17,
-            -129,
-            17,
-            -66,
-            17,
-            17,
-            17,
-            17,
-            17,
-            17,
-            17,
-            17,
-            114,
-            114,
-            314,
-            17,
-            95,
-            -81,
-            -128,
-            17,
-            17,
-            -50,
-            17,
-            -54,
-            17,
-            114,
-            347,
-            17,
-            17,
-        ],
-    ),
-    "LOWER_IDENTIFIER": (
-        [
-            0,
-            12,
-            22,
-            23,
-            25,
-            27,
-            28,
-            36,
-            38,
-            41,
-            43,
-            52,
-            53,
-            54,
-            55,
-            56,
-            57,
-            58,
-            59,
-            60,
-            61,
-            62,
-            65,
-            67,
-            77,
-            78,
-            84,
-            86,
-            93,
-            94,
-            96,
-            97,
-            102,
-            115,
-            116,
-            126,
-            140,
-            145,
-            147,
-            149,
-            152,
-            156,
-            159,
-            161,
-            162,
-            164,
-            165,
-            167,
-            180,
-            186,
-            187,
-            189,
-            190,
-            192,
-            194,
-            195,
-            206,
-            208,
-            209,
-            213,
-            223,
-            228,
-            229,
-            230,
-            232,
-            233,
-            234,
-            235,
-            236,
-            237,
-            238,
-            240,
-            247,
-            258,
-            261,
-            274,
-            278,
-            283,
-            285,
-            288,
-            289,
-            297,
-            299,
-            302,
-            304,
-            329,
-            341,
-            344,
-        ],
-        [
-            19,
-            -81,
-            -158,
-            -81,
-            19,
-            -81,
-            76,
-            76,
-            -126,
-            -81,
-            112,
-            -63,
-            -64,
-            -65,
-            -62,
-            -60,
-            -61,
-            -56,
-            -57,
-            -58,
-            -59,
-            -55,
-            -159,
-            -162,
-            -81,
-            -81,
-            76,
-            -81,
-            -81,
-            -81,
-            -81,
-            19,
-            19,
-            201,
-            112,
-            -94,
-            19,
-            -155,
-            76,
-            76,
-            19,
-            19,
-            -81,
-            76,
-            -81,
-            -156,
-            -81,
-            -127,
-            19,
-            19,
-            -53,
-            112,
-            19,
-            254,
-            112,
-            -93,
-            19,
-            -81,
-            267,
-            76,
-            76,
-            19,
-            -129,
-            19,
-            -66,
-            19,
-            19,
-            19,
-            19,
-            19,
-            19,
-            19,
-            19,
-            112,
-            112,
-            19,
-            76,
-            -81,
-            -128,
-            19,
-            19,
-            -50,
-            19,
-            -54,
-            19,
-            112,
-            19,
-            19,
-        ],
-    ),
-    "$end": (
-        [
-            1,
-            2,
-            3,
-            4,
-            5,
-            6,
-            7,
-            8,
-            9,
-            15,
-            17,
-            18,
-            19,
-            21,
-            22,
-            23,
-            24,
-            25,
-            26,
-            27,
-            65,
-            66,
-            67,
-            68,
-            69,
-            70,
-            71,
-            73,
-            74,
-            75,
-            76,
-            87,
-            88,
-            89,
-            90,
-            91,
-            92,
-            95,
-            98,
-            99,
-            100,
-            101,
-            117,
-            118,
-            119,
-            120,
-            121,
-            122,
-            123,
-            124,
-            127,
-            128,
-            129,
-            130,
-            131,
-            132,
-            133,
-            134,
-            135,
-            136,
-            137,
-            141,
-            142,
-            144,
-            146,
-            148,
-            160,
-            163,
-            166,
-            169,
-            170,
-            171,
-            172,
-            173,
-            174,
-            175,
-            176,
-            177,
-            178,
-            179,
-            180,
-            181,
-            182,
-            183,
-            184,
-            185,
-            187,
-            212,
-            215,
-            216,
-            217,
-            218,
-            219,
-            220,
-            222,
-            224,
-            239,
-            241,
-            263,
-            264,
-            265,
-            266,
-            268,
-            270,
-            271,
-            272,
-            273,
-            275,
-            276,
-            277,
-            279,
-            280,
-            287,
-            290,
-            291,
-            292,
-            293,
-            294,
-            295,
-            297,
-            301,
-            302,
-            307,
-            312,
-            315,
-            316,
-            317,
-            318,
-            320,
-            321,
-            322,
-            325,
-            328,
-            334,
-            338,
-            339,
-            340,
-            342,
-            348,
-            349,
-            350,
-            354,
-        ],
-        [
-            0,
-            -81,
-            -81,
-            -165,
-            -166,
-            -167,
-            -168,
-            -169,
-            -170,
-            -181,
-            -48,
-            -47,
-            -49,
-            -157,
-            -158,
-            -81,
-            -160,
-            -164,
-            -163,
-            -81,
-            -159,
-            -81,
-            -162,
-            -184,
-            -81,
-            -193,
-            -81,
-            -198,
-            -199,
-            -200,
-            -138,
-            -124,
-            -125,
-            -132,
-            -133,
-            -140,
-            -141,
-            -139,
-            -182,
-            -24,
-            -25,
-            -149,
-            -26,
-            -27,
-            -28,
-            -29,
-            -30,
-            -31,
-            -32,
-            -33,
-            -73,
-            -74,
-            -75,
-            -76,
-            -77,
-            -45,
-            -44,
-            -40,
-            -41,
-            -42,
-            -43,
-            -161,
-            -188,
-            -190,
-            -194,
-            -197,
-            -134,
-            -143,
-            -150,
-            -46,
-            -116,
-            -15,
-            -13,
-            -11,
-            -9,
-            -7,
-            -5,
-            -3,
-            -16,
-            -17,
-            -18,
-            -19,
-            -20,
-            -21,
-            -22,
-            -23,
-            -53,
-            -117,
-            -81,
-            -81,
-            -201,
-            -202,
-            -174,
-            -81,
-            -153,
-            -81,
-            -52,
-            -51,
-            -78,
-            -79,
-            -80,
-            -183,
-            -81,
-            -192,
-            -196,
-            -195,
-            -171,
-            -173,
-            -131,
-            -130,
-            -136,
-            -137,
-            -12,
-            -10,
-            -8,
-            -6,
-            -4,
-            -2,
-            -1,
-            -50,
-            -34,
-            -54,
-            -35,
-            -189,
-            -81,
-            -81,
-            -142,
-            -147,
-            -148,
-            -122,
-            -81,
-            -123,
-            -82,
-            -191,
-            -172,
-            -135,
-            -118,
-            -120,
-            -81,
-            -121,
-            -14,
-            -119,
-        ],
-    ),
-    "NEWLINE": (
-        [
-            2,
-            3,
-            4,
-            5,
-            6,
-            7,
-            8,
-            9,
-            15,
-            17,
-            18,
-            19,
-            22,
-            23,
-            24,
-            25,
-            26,
-            27,
-            65,
-            66,
-            67,
-            68,
-            69,
-            70,
-            71,
-            73,
-            74,
-            75,
-            76,
-            87,
-            88,
-            89,
-            90,
-            91,
-            92,
-            95,
-            98,
-            99,
-            100,
-            101,
-            117,
-            118,
-            119,
-            120,
-            121,
-            122,
-            123,
-            124,
-            127,
-            128,
-            129,
-            130,
-            131,
-            132,
-            133,
-            134,
-            135,
-            136,
-            137,
-            141,
-            142,
-            144,
-            146,
-            148,
-            160,
-            163,
-            166,
-            169,
-            170,
-            171,
-            172,
-            173,
-            174,
-            175,
-            176,
-            177,
-            178,
-            179,
-            180,
-            181,
-            182,
-            183,
-            184,
-            185,
-            187,
-            212,
-            215,
-            216,
-            217,
-            218,
-            219,
-            220,
-            222,
-            224,
-            239,
-            241,
-            263,
-            264,
-            265,
-            266,
-            268,
-            270,
-            271,
-            272,
-            273,
-            275,
-            276,
-            277,
-            279,
-            280,
-            287,
-            290,
-            291,
-            292,
-            293,
-            294,
-            295,
-            297,
-            301,
-            302,
-            307,
-            312,
-            315,
-            316,
-            317,
-            318,
-            320,
-            321,
-            322,
-            325,
-            328,
-            334,
-            338,
-            339,
-            340,
-            342,
-            348,
-            349,
-            350,
-            354,
-        ],
-        [
-            23,
-            27,
-            -165,
-            -166,
-            -167,
-            -168,
-            -169,
-            -170,
-            -181,
-            -48,
-            -47,
-            -49,
-            -158,
-            23,
-            -160,
-            -164,
-            -163,
-            23,
-            -159,
-            27,
-            -162,
-            -184,
-            -81,
-            -193,
-            -81,
-            -198,
-            -199,
-            -200,
-            -138,
-            -124,
-            -125,
-            -132,
-            -133,
-            -140,
-            -141,
-            -139,
-            -182,
-            -24,
-            -25,
-            -149,
-            -26,
-            -27,
-            -28,
-            -29,
-            -30,
-            -31,
-            -32,
-            -33,
-            -73,
-            -74,
-            -75,
-            -76,
-            -77,
-            -45,
-            -44,
-            -40,
-            -41,
-            -42,
-            -43,
-            -161,
-            -188,
-            -190,
-            -194,
-            -197,
-            -134,
-            -143,
-            -150,
-            -46,
-            -116,
-            -15,
-            -13,
-            -11,
-            -9,
-            -7,
-            -5,
-            -3,
-            -16,
-            -17,
-            -18,
-            -19,
-            -20,
-            -21,
-            -22,
-            -23,
-            -53,
-            -117,
-            -81,
-            -81,
-            -201,
-            -202,
-            -174,
-            -81,
-            -153,
-            -81,
-            -52,
-            -51,
-            -78,
-            -79,
-            -80,
-            -183,
-            -81,
-            -192,
-            -196,
-            -195,
-            -171,
-            -173,
-            -131,
-            -130,
-            -136,
-            -137,
-            -12,
-            -10,
-            -8,
-            -6,
-            -4,
-            -2,
-            -1,
-            -50,
-            -34,
-            -54,
-            -35,
-            -189,
-            -81,
-            -81,
-            -142,
-            -147,
-            -148,
-            -122,
-            -81,
-            -123,
-            -82,
-            -191,
-            -172,
-            -135,
-            -118,
-            -120,
-            -81,
-            -121,
-            -14,
-            -119,
-        ],
-    ),
-    "PADDING": (
-        [
-            4,
-            5,
-            6,
-            7,
-            8,
-            9,
-            15,
-            17,
-            18,
-            19,
-            68,
-            69,
-            70,
-            71,
-            73,
-            74,
-            75,
-            76,
-            79,
-            85,
-            87,
-            88,
-            89,
-            90,
-            91,
-            92,
-            93,
-            94,
-            95,
-            98,
-            99,
-            100,
-            101,
-            117,
-            118,
-            119,
-            120,
-            121,
-            122,
-            123,
-            124,
-            127,
-            128,
-            129,
-            130,
-            131,
-            132,
-            133,
-            134,
-            135,
-            136,
-            137,
-            142,
-            144,
-            146,
-            148,
-            157,
-            158,
-            159,
-            160,
-            163,
-            166,
-            169,
-            170,
-            171,
-            172,
-            173,
-            174,
-            175,
-            176,
-            177,
-            178,
-            179,
-            180,
-            181,
-            182,
-            183,
-            184,
-            185,
-            187,
-            212,
-            215,
-            216,
-            217,
-            218,
-            219,
-            220,
-            222,
-            224,
-            225,
-            226,
-            227,
-            231,
-            239,
-            241,
-            263,
-            264,
-            265,
-            266,
-            268,
-            270,
-            271,
-            272,
-            273,
-            275,
-            276,
-            277,
-            279,
-            280,
-            287,
-            290,
-            291,
-            292,
-            293,
-            294,
-            295,
-            297,
-            301,
-            302,
-            307,
-            312,
-            315,
-            316,
-            317,
-            318,
-            319,
-            320,
-            321,
-            322,
-            325,
-            328,
-            334,
-            338,
-            339,
-            340,
-            342,
-            348,
-            349,
-            350,
-            354,
-        ],
-        [
-            -165,
-            -166,
-            -167,
-            -168,
-            -169,
-            -170,
-            -181,
-            -48,
-            -47,
-            -49,
-            -184,
-            145,
-            -193,
-            -81,
-            -198,
-            -199,
-            -200,
-            -138,
-            152,
-            156,
-            -124,
-            -125,
-            -132,
-            -133,
-            -140,
-            -141,
-            145,
-            145,
-            -139,
-            -182,
-            -24,
-            -25,
-            -149,
-            -26,
-            -27,
-            -28,
-            -29,
-            -30,
-            -31,
-            -32,
-            -33,
-            -73,
-            -74,
-            -75,
-            -76,
-            -77,
-            -45,
-            -44,
-            -40,
-            -41,
-            -42,
-            -43,
-            -188,
-            -190,
-            -194,
-            -197,
-            -146,
-            -145,
-            145,
-            -134,
-            -143,
-            -150,
-            -46,
-            -116,
-            -15,
-            -13,
-            -11,
-            -9,
-            -7,
-            -5,
-            -3,
-            -16,
-            -17,
-            -18,
-            -19,
-            -20,
-            -21,
-            -22,
-            -23,
-            -53,
-            -117,
-            -81,
-            -81,
-            -201,
-            -202,
-            -174,
-            274,
-            -153,
-            -81,
-            145,
-            145,
-            145,
-            289,
-            -52,
-            -51,
-            -78,
-            -79,
-            -80,
-            -183,
-            145,
-            -192,
-            -196,
-            -195,
-            -171,
-            -173,
-            -131,
-            -130,
-            -136,
-            -137,
-            -12,
-            -10,
-            -8,
-            -6,
-            -4,
-            -2,
-            -1,
-            -50,
-            -34,
-            -54,
-            -35,
-            -189,
-            274,
-            -81,
-            -142,
-            -147,
-            -144,
-            -148,
-            -122,
-            341,
-            -123,
-            -82,
-            -191,
-            -172,
-            -135,
-            -118,
-            -120,
-            341,
-            -121,
-            -14,
-            -119,
-        ],
-    ),
-    "KEYWORD_IN": (
-        [
-            4,
-            5,
-            6,
-            7,
-            8,
-            9,
-            15,
-            17,
-            18,
-            19,
-            68,
-            69,
-            70,
-            71,
-            73,
-            74,
-            75,
-            76,
-            87,
-            88,
-            89,
-            90,
-            91,
-            92,
-            95,
-            98,
-            99,
-            100,
-            101,
-            117,
-            118,
-            119,
-            120,
-            121,
-            122,
-            123,
-            124,
-            127,
-            128,
-            129,
-            130,
-            131,
-            132,
-            133,
-            134,
-            135,
-            136,
-            137,
-            142,
-            144,
-            146,
-            148,
-            160,
-            163,
-            166,
-            169,
-            170,
-            171,
-            172,
-            173,
-            174,
-            175,
-            176,
-            177,
-            178,
-            179,
-            180,
-            181,
-            182,
-            183,
-            184,
-            185,
-            187,
-            212,
-            215,
-            216,
-            217,
-            218,
-            219,
-            220,
-            222,
-            224,
-            239,
-            241,
-            263,
-            264,
-            265,
-            266,
-            268,
-            270,
-            271,
-            272,
-            273,
-            275,
-            276,
-            277,
-            279,
-            280,
-            287,
-            290,
-            291,
-            292,
-            293,
-            294,
-            295,
-            297,
-            301,
-            302,
-            303,
-            307,
-            312,
-            315,
-            316,
-            317,
-            318,
-            320,
-            321,
-            322,
-            325,
-            328,
-            334,
-            338,
-            339,
-            340,
-            342,
-            348,
-            349,
-            350,
-            354,
-        ],
-        [
-            -165,
-            -166,
-            -167,
-            -168,
-            -169,
-            -170,
-            -181,
-            -48,
-            -47,
-            -49,
-            -184,
-            -81,
-            -193,
-            -81,
-            -198,
-            -199,
-            -200,
-            -138,
-            -124,
-            -125,
-            -132,
-            -133,
-            -140,
-            -141,
-            -139,
-            -182,
-            -24,
-            -25,
-            -149,
-            -26,
-            -27,
-            -28,
-            -29,
-            -30,
-            -31,
-            -32,
-            -33,
-            -73,
-            -74,
-            -75,
-            -76,
-            -77,
-            -45,
-            -44,
-            -40,
-            -41,
-            -42,
-            -43,
-            -188,
-            -190,
-            -194,
-            -197,
-            -134,
-            -143,
-            -150,
-            -46,
-            -116,
-            -15,
-            -13,
-            -11,
-            -9,
-            -7,
-            -5,
-            -3,
-            -16,
-            -17,
-            -18,
-            -19,
-            -20,
-            -21,
-            -22,
-            -23,
-            -53,
-            -117,
-            -81,
-            -81,
-            -201,
-            -202,
-            -174,
-            -81,
-            -153,
-            -81,
-            -52,
-            -51,
-            -78,
-            -79,
-            -80,
-            -183,
-            -81,
-            -192,
-            -196,
-            -195,
-            -171,
-            -173,
-            -131,
-            -130,
-            -136,
-            -137,
-            -12,
-            -10,
-            -8,
-            -6,
-            -4,
-            -2,
-            -1,
-            -50,
-            -34,
-            -54,
-            327,
-            -35,
-            -189,
-            -81,
-            -81,
-            -142,
-            -147,
-            -148,
-            -122,
-            -81,
-            -123,
-            -82,
-            -191,
-            -172,
-            -135,
-            -118,
-            -120,
-            -81,
-            -121,
-            -14,
-            -119,
-        ],
-    ),
-    "EQ": (
-        [
-            10,
-            13,
-            17,
-            18,
-            19,
-            20,
-            42,
-            44,
-            64,
-            103,
-            104,
-            105,
-            106,
-            107,
-            108,
-            109,
-            110,
-            111,
-            112,
-            113,
-            114,
-            117,
-            118,
-            119,
-            120,
-            121,
-            122,
-            123,
-            124,
-            127,
-            128,
-            129,
-            130,
-            131,
-            132,
-            133,
-            134,
-            135,
-            136,
-            137,
-            138,
-            139,
-            169,
-            191,
-            193,
-            197,
-            204,
-            207,
-            210,
-            211,
-            253,
-            255,
-            256,
-            259,
-            262,
-            263,
-            264,
-            265,
-            267,
-            302,
-            311,
-            323,
-            333,
-        ],
-        [
-            28,
-            -81,
-            -48,
-            -47,
-            -49,
-            -81,
-            102,
-            -114,
-            140,
-            -81,
-            -81,
-            -83,
-            -84,
-            -85,
-            -86,
-            -87,
-            -88,
-            -89,
-            -90,
-            -91,
-            -95,
-            -26,
-            -27,
-            -28,
-            -29,
-            -30,
-            -31,
-            -32,
-            -33,
-            -73,
-            -74,
-            -75,
-            -76,
-            -77,
-            -45,
-            -44,
-            -40,
-            -41,
-            -42,
-            -43,
-            -54,
-            -81,
-            -46,
-            -108,
-            -109,
-            -102,
-            -92,
-            -101,
-            -185,
-            -187,
-            -96,
-            -97,
-            -99,
-            -100,
-            -103,
-            -78,
-            -79,
-            -80,
-            -81,
-            -54,
-            -186,
-            -81,
-            -98,
-        ],
-    ),
-    "KEYWORD_FORALL": (
-        [12, 41, 77, 78, 86, 93, 94, 96, 145, 162, 164, 165, 208, 283],
-        [39, 39, 39, 39, 39, -81, -81, 39, -155, 39, -156, 39, 39, 39],
-    ),
-    "LBRACKET": (
-        [
-            12,
-            28,
-            36,
-            38,
-            41,
-            43,
-            52,
-            53,
-            54,
-            55,
-            56,
-            57,
-            58,
-            59,
-            60,
-            61,
-            62,
-            77,
-            78,
-            86,
-            93,
-            94,
-            96,
-            102,
-            115,
-            116,
-            126,
-            140,
-            145,
-            147,
-            149,
-            159,
-            161,
-            162,
-            164,
-            165,
-            167,
-            180,
-            186,
-            187,
-            189,
-            190,
-            192,
-            194,
-            195,
-            208,
-            213,
-            223,
-            229,
-            230,
-            232,
-            233,
-            234,
-            235,
-            236,
-            237,
-            238,
-            240,
-            258,
-            261,
-            278,
-            283,
-            285,
-            297,
-            299,
-            302,
-            304,
-            329,
-            344,
-        ],
-        [
-            -81,
-            78,
-            94,
-            -126,
-            -81,
-            125,
-            -63,
-            -64,
-            -65,
-            -62,
-            -60,
-            -61,
-            -56,
-            -57,
-            -58,
-            -59,
-            -55,
-            -81,
-            -81,
-            -81,
-            -81,
-            -81,
-            -81,
-            190,
-            125,
-            125,
-            -94,
-            190,
-            -155,
-            78,
-            78,
-            -81,
-            94,
-            -81,
-            -156,
-            -81,
-            -127,
-            190,
-            190,
-            -53,
-            125,
-            190,
-            -81,
-            125,
-            -93,
-            -81,
-            78,
-            94,
-            -129,
-            190,
-            -66,
-            190,
-            190,
-            190,
-            190,
-            190,
-            190,
-            190,
-            125,
-            125,
-            94,
-            -81,
-            -128,
-            -50,
-            190,
-            -54,
-            190,
-            125,
-            190,
-        ],
-    ),
-    "DOUBLE_COLON": ([13, 17, 18, 19, 138], [41, -48, -47, -49, 208]),
-    "SPACE": (
-        [
-            13,
-            16,
-            17,
-            18,
-            19,
-            20,
-            32,
-            39,
-            71,
-            73,
-            74,
-            75,
-            76,
-            90,
-            91,
-            92,
-            95,
-            103,
-            104,
-            105,
-            106,
-            107,
-            108,
-            109,
-            110,
-            111,
-            112,
-            113,
-            114,
-            117,
-            118,
-            119,
-            120,
-            121,
-            122,
-            123,
-            124,
-            127,
-            128,
-            129,
-            130,
-            131,
-            132,
-            133,
-            134,
-            135,
-            136,
-            137,
-            138,
-            139,
-            163,
-            168,
-            169,
-            170,
-            171,
-            172,
-            173,
-            174,
-            175,
-            176,
-            177,
-            178,
-            179,
-            180,
-            181,
-            182,
-            183,
-            184,
-            185,
-            187,
-            188,
-            197,
-            199,
-            201,
-            202,
-            203,
-            204,
-            207,
-            212,
-            215,
-            216,
-            217,
-            218,
-            224,
-            231,
-            239,
-            241,
-            249,
-            250,
-            253,
-            255,
-            256,
-            259,
-            262,
-            263,
-            264,
-            265,
-            267,
-            287,
-            290,
-            291,
-            292,
-            293,
-            294,
-            295,
-            297,
-            301,
-            302,
-            307,
-            316,
-            317,
-            318,
-            320,
-            321,
-            322,
-            323,
-            325,
-            327,
-            328,
-            333,
-            340,
-            342,
-            348,
-            349,
-            350,
-            354,
-        ],
-        [
-            43,
-            63,
-            -48,
-            -47,
-            -49,
-            43,
-            84,
-            97,
-            147,
-            -198,
-            -199,
-            -200,
-            -138,
-            161,
-            -140,
-            -141,
-            -139,
-            43,
-            43,
-            -83,
-            -84,
-            -85,
-            -86,
-            -87,
-            -88,
-            -89,
-            -90,
-            -91,
-            -95,
-            -26,
-            -27,
-            -28,
-            -29,
-            -30,
-            -31,
-            -32,
-            -33,
-            -73,
-            -74,
-            -75,
-            -76,
-            -77,
-            -45,
-            -44,
-            -40,
-            -41,
-            -42,
-            -43,
-            -54,
-            209,
-            -143,
-            228,
-            -46,
-            -116,
-            -15,
-            -13,
-            -11,
-            -9,
-            -7,
-            -5,
-            238,
-            -16,
-            -17,
-            -18,
-            -19,
-            -20,
-            -21,
-            -22,
-            -23,
-            -53,
-            247,
-            -102,
-            261,
-            -49,
-            -47,
-            -48,
-            -92,
-            -101,
-            -117,
-            147,
-            147,
-            -201,
-            -202,
-            278,
-            288,
-            -52,
-            238,
-            43,
-            43,
-            -96,
-            -97,
-            -99,
-            -100,
-            -103,
-            -78,
-            -79,
-            -80,
-            209,
-            -12,
-            -10,
-            -8,
-            -6,
-            -4,
-            -2,
-            -1,
-            -50,
-            -34,
-            -54,
-            -35,
-            278,
-            -142,
-            -147,
-            -148,
-            -122,
-            -81,
-            43,
-            -123,
-            344,
-            -82,
-            -98,
-            -118,
-            -120,
-            -81,
-            -121,
-            -14,
-            -119,
-        ],
-    ),
-    "COMMA": (
-        [
-            14,
-            17,
-            18,
-            19,
-            30,
-            34,
-            76,
-            87,
-            88,
-            89,
-            90,
-            91,
-            92,
-            95,
-            99,
-            105,
-            106,
-            107,
-            108,
-            109,
-            110,
-            111,
-            112,
-            113,
-            114,
-            117,
-            118,
-            119,
-            120,
-            121,
-            122,
-            123,
-            124,
-            127,
-            128,
-            129,
-            130,
-            131,
-            132,
-            133,
-            134,
-            135,
-            136,
-            137,
-            153,
-            155,
-            157,
-            160,
-            163,
-            169,
-            170,
-            171,
-            172,
-            173,
-            174,
-            175,
-            176,
-            177,
-            178,
-            179,
-            180,
-            181,
-            182,
-            183,
-            184,
-            185,
-            186,
-            187,
-            196,
-            197,
-            198,
-            201,
-            202,
-            203,
-            204,
-            207,
-            212,
-            224,
-            226,
-            239,
-            240,
-            241,
-            243,
-            252,
-            253,
-            255,
-            256,
-            259,
-            262,
-            263,
-            264,
-            265,
-            276,
-            277,
-            279,
-            280,
-            287,
-            290,
-            291,
-            292,
-            293,
-            294,
-            295,
-            297,
-            301,
-            302,
-            307,
-            308,
-            309,
-            314,
-            316,
-            317,
-            318,
-            320,
-            321,
-            322,
-            324,
-            325,
-            326,
-            328,
-            333,
-            339,
-            340,
-            342,
-            345,
-            346,
-            347,
-            348,
-            349,
-            350,
-            354,
-        ],
-        [
-            51,
-            -48,
-            -47,
-            -49,
-            81,
-            86,
-            -138,
-            -124,
-            -125,
-            -132,
-            -133,
-            -140,
-            -141,
-            -139,
-            86,
-            -83,
-            -84,
-            -85,
-            -86,
-            -87,
-            -88,
-            -89,
-            -90,
-            -91,
-            -95,
-            -26,
-            -27,
-            -28,
-            -29,
-            -30,
-            -31,
-            -32,
-            -33,
-            -73,
-            -74,
-            -75,
-            -76,
-            -77,
-            -45,
-            -44,
-            -40,
-            -41,
-            -42,
-            -43,
-            81,
-            -177,
-            86,
-            -134,
-            -143,
-            -46,
-            -116,
-            -15,
-            -13,
-            -11,
-            -9,
-            -7,
-            -5,
-            -3,
-            -16,
-            -17,
-            -18,
-            -19,
-            -20,
-            -21,
-            -22,
-            -23,
-            51,
-            -53,
-            258,
-            -102,
-            258,
-            -90,
-            -91,
-            -95,
-            -92,
-            -101,
-            -117,
-            -81,
-            283,
-            -52,
-            51,
-            -51,
-            299,
-            299,
-            -96,
-            -97,
-            -99,
-            -100,
-            -103,
-            -78,
-            -79,
-            -80,
-            -131,
-            -130,
-            -136,
-            -137,
-            -12,
-            -10,
-            -8,
-            -6,
-            -4,
-            -2,
-            -1,
-            -50,
-            -34,
-            -54,
-            -35,
-            329,
-            329,
-            336,
-            -81,
-            -142,
-            -147,
-            -148,
-            -122,
-            -81,
-            51,
-            -123,
-            299,
-            -82,
-            -98,
-            -135,
-            -118,
-            -120,
-            329,
-            329,
-            336,
-            -81,
-            -121,
-            -14,
-            -119,
-        ],
-    ),
-    "OPERATOR": (
-        [
-            14,
-            17,
-            18,
-            19,
-            71,
-            72,
-            73,
-            74,
-            75,
-            76,
-            117,
-            118,
-            119,
-            120,
-            121,
-            122,
-            123,
-            124,
-            127,
-            128,
-            129,
-            130,
-            131,
-            132,
-            133,
-            134,
-            135,
-            136,
-            137,
-            169,
-            170,
-            171,
-            172,
-            173,
-            174,
-            175,
-            176,
-            177,
-            178,
-            179,
-            180,
-            181,
-            182,
-            183,
-            184,
-            185,
-            186,
-            187,
-            212,
-            217,
-            218,
-            239,
-            240,
-            241,
-            263,
-            264,
-            265,
-            287,
-            290,
-            291,
-            292,
-            293,
-            294,
-            295,
-            297,
-            301,
-            302,
-            307,
-            321,
-            322,
-            324,
-            325,
-            328,
-            340,
-            342,
-            348,
-            349,
-            350,
-            354,
-        ],
-        [
-            52,
-            -48,
-            -47,
-            -49,
-            -139,
-            149,
-            -198,
-            -199,
-            -200,
-            -138,
-            -26,
-            -27,
-            -28,
-            -29,
-            -30,
-            -31,
-            -32,
-            -33,
-            -73,
-            -74,
-            -75,
-            -76,
-            -77,
-            -45,
-            -44,
-            -40,
-            -41,
-            -42,
-            -43,
-            -46,
-            -116,
-            -15,
-            -13,
-            52,
-            -9,
-            -7,
-            -5,
-            -3,
-            -16,
-            -17,
-            -18,
-            -19,
-            -20,
-            -21,
-            -22,
-            -23,
-            52,
-            -53,
-            -117,
-            -201,
-            -202,
-            -52,
-            52,
-            -3,
-            -78,
-            -79,
-            -80,
-            -12,
-            -10,
-            -8,
-            -6,
-            -4,
-            -2,
-            -1,
-            -50,
-            -34,
-            -54,
-            -35,
-            -122,
-            -81,
-            52,
-            -123,
-            -82,
-            -118,
-            -120,
-            -81,
-            -121,
-            -14,
-            -119,
-        ],
-    ),
-    "ARROW": (
-        [
-            14,
-            17,
-            18,
-            19,
-            44,
-            76,
-            88,
-            89,
-            90,
-            91,
-            92,
-            95,
-            103,
-            104,
-            105,
-            106,
-            107,
-            108,
-            109,
-            110,
-            111,
-            112,
-            113,
-            114,
-            117,
-            118,
-            119,
-            120,
-            121,
-            122,
-            123,
-            124,
-            127,
-            128,
-            129,
-            130,
-            131,
-            132,
-            133,
-            134,
-            135,
-            136,
-            137,
-            160,
-            163,
-            169,
-            170,
-            171,
-            172,
-            173,
-            174,
-            175,
-            176,
-            177,
-            178,
-            179,
-            180,
-            181,
-            182,
-            183,
-            184,
-            185,
-            186,
-            187,
-            191,
-            193,
-            197,
-            204,
-            207,
-            212,
-            224,
-            239,
-            240,
-            241,
-            248,
-            249,
-            250,
-            253,
-            255,
-            256,
-            259,
-            262,
-            263,
-            264,
-            265,
-            276,
-            279,
-            280,
-            287,
-            290,
-            291,
-            292,
-            293,
-            294,
-            295,
-            297,
-            301,
-            302,
-            305,
-            306,
-            307,
-            316,
-            317,
-            318,
-            320,
-            321,
-            322,
-            324,
-            325,
-            328,
-            333,
-            339,
-            340,
-            342,
-            348,
-            349,
-            350,
-            354,
-        ],
-        [
-            53,
-            -48,
-            -47,
-            -49,
-            -114,
-            -138,
-            159,
-            -132,
-            -133,
-            -140,
-            -141,
-            -139,
-            -81,
-            -81,
-            -83,
-            -84,
-            -85,
-            -86,
-            -87,
-            -88,
-            -89,
-            -90,
-            -91,
-            -95,
-            -26,
-            -27,
-            -28,
-            -29,
-            -30,
-            -31,
-            -32,
-            -33,
-            -73,
-            -74,
-            -75,
-            -76,
-            -77,
-            -45,
-            -44,
-            -40,
-            -41,
-            -42,
-            -43,
-            -134,
-            -143,
-            -46,
-            -116,
-            -15,
-            -13,
-            53,
-            -9,
-            -7,
-            -5,
-            -3,
-            -16,
-            -17,
-            -18,
-            -19,
-            -20,
-            -21,
-            -22,
-            -23,
-            53,
-            -53,
-            -108,
-            -109,
-            -102,
-            -92,
-            -101,
-            -117,
-            -81,
-            -52,
-            53,
-            -3,
-            304,
-            -81,
-            -81,
-            -96,
-            -97,
-            -99,
-            -100,
-            -103,
-            -78,
-            -79,
-            -80,
-            159,
-            -136,
-            -137,
-            -12,
-            -10,
-            -8,
-            -6,
-            -4,
-            -2,
-            -1,
-            -50,
-            -34,
-            -54,
-            -104,
-            -105,
-            -35,
-            -81,
-            -142,
-            -147,
-            -148,
-            -122,
-            -81,
-            53,
-            -123,
-            -82,
-            -98,
-            -135,
-            -118,
-            -120,
-            -81,
-            -121,
-            -14,
-            -119,
-        ],
-    ),
-    "ATSYM": (
-        [
-            14,
-            17,
-            18,
-            19,
-            112,
-            117,
-            118,
-            119,
-            120,
-            121,
-            122,
-            123,
-            124,
-            127,
-            128,
-            129,
-            130,
-            131,
-            132,
-            133,
-            134,
-            135,
-            136,
-            137,
-            169,
-            170,
-            171,
-            172,
-            173,
-            174,
-            175,
-            176,
-            177,
-            178,
-            179,
-            180,
-            181,
-            182,
-            183,
-            184,
-            185,
-            186,
-            187,
-            201,
-            212,
-            239,
-            240,
-            241,
-            254,
-            263,
-            264,
-            265,
-            287,
-            290,
-            291,
-            292,
-            293,
-            294,
-            295,
-            297,
-            301,
-            302,
-            307,
-            321,
-            322,
-            324,
-            325,
-            328,
-            340,
-            342,
-            348,
-            349,
-            350,
-            354,
-        ],
-        [
-            54,
-            -48,
-            -47,
-            -49,
-            195,
-            -26,
-            -27,
-            -28,
-            -29,
-            -30,
-            -31,
-            -32,
-            -33,
-            -73,
-            -74,
-            -75,
-            -76,
-            -77,
-            -45,
-            -44,
-            -40,
-            -41,
-            -42,
-            -43,
-            -46,
-            -116,
-            -15,
-            -13,
-            54,
-            -9,
-            -7,
-            -5,
-            -3,
-            -16,
-            -17,
-            -18,
-            -19,
-            -20,
-            -21,
-            -22,
-            -23,
-            54,
-            -53,
-            195,
-            -117,
-            -52,
-            54,
-            -3,
-            195,
-            -78,
-            -79,
-            -80,
-            -12,
-            -10,
-            -8,
-            -6,
-            -4,
-            -2,
-            -1,
-            -50,
-            -34,
-            -54,
-            -35,
-            -122,
-            -81,
-            54,
-            -123,
-            -82,
-            -118,
-            -120,
-            -81,
-            -121,
-            -14,
-            -119,
-        ],
-    ),
-    "COLON": (
-        [
-            14,
-            17,
-            18,
-            19,
-            103,
-            104,
-            105,
-            106,
-            107,
-            108,
-            109,
-            110,
-            111,
-            112,
-            113,
-            114,
-            117,
-            118,
-            119,
-            120,
-            121,
-            122,
-            123,
-            124,
-            127,
-            128,
-            129,
-            130,
-            131,
-            132,
-            133,
-            134,
-            135,
-            136,
-            137,
-            169,
-            170,
-            171,
-            172,
-            173,
-            174,
-            175,
-            176,
-            177,
-            178,
-            179,
-            180,
-            181,
-            182,
-            183,
-            184,
-            185,
-            186,
-            187,
-            196,
-            197,
-            198,
-            201,
-            202,
-            203,
-            204,
-            205,
-            207,
-            212,
-            239,
-            240,
-            241,
-            249,
-            250,
-            253,
-            255,
-            256,
-            259,
-            262,
-            263,
-            264,
-            265,
-            287,
-            290,
-            291,
-            292,
-            293,
-            294,
-            295,
-            297,
-            301,
-            302,
-            307,
-            308,
-            309,
-            321,
-            322,
-            324,
-            325,
-            328,
-            333,
-            340,
-            342,
-            345,
-            346,
-            348,
-            349,
-            350,
-            354,
-        ],
-        [
-            55,
-            -48,
-            -47,
-            -49,
-            192,
-            194,
-            -83,
-            -84,
-            -85,
-            -86,
-            -87,
-            -88,
-            -89,
-            -90,
-            -91,
-            -95,
-            -26,
-            -27,
-            -28,
-            -29,
-            -30,
-            -31,
-            -32,
-            -33,
-            -73,
-            -74,
-            -75,
-            -76,
-            -77,
-            -45,
-            -44,
-            -40,
-            -41,
-            -42,
-            -43,
-            -46,
-            -116,
-            -15,
-            -13,
-            55,
-            -9,
-            -7,
-            -5,
-            -3,
-            -16,
-            -17,
-            -18,
-            -19,
-            -20,
-            -21,
-            -22,
-            -23,
-            55,
-            -53,
-            192,
-            -102,
-            194,
-            -90,
-            -91,
-            -95,
-            194,
-            192,
-            -101,
-            -117,
-            -52,
-            55,
-            -3,
-            192,
-            194,
-            -96,
-            194,
-            -99,
-            -100,
-            -103,
-            -78,
-            -79,
-            -80,
-            -12,
-            -10,
-            -8,
-            -6,
-            -4,
-            -2,
-            -1,
-            -50,
-            -34,
-            -54,
-            -35,
-            192,
-            194,
-            -122,
-            -81,
-            55,
-            -123,
-            -82,
-            -98,
-            -118,
-            -120,
-            192,
-            194,
-            -81,
-            -121,
-            -14,
-            -119,
-        ],
-    ),
-    "PLUS": (
-        [
-            14,
-            17,
-            18,
-            19,
-            117,
-            118,
-            119,
-            120,
-            121,
-            122,
-            123,
-            124,
-            127,
-            128,
-            129,
-            130,
-            131,
-            132,
-            133,
-            134,
-            135,
-            136,
-            137,
-            169,
-            170,
-            171,
-            172,
-            173,
-            174,
-            175,
-            176,
-            177,
-            178,
-            179,
-            180,
-            181,
-            182,
-            183,
-            184,
-            185,
-            186,
-            187,
-            212,
-            239,
-            240,
-            241,
-            263,
-            264,
-            265,
-            287,
-            290,
-            291,
-            292,
-            293,
-            294,
-            295,
-            297,
-            301,
-            302,
-            307,
-            321,
-            322,
-            324,
-            325,
-            328,
-            340,
-            342,
-            348,
-            349,
-            350,
-            354,
-        ],
-        [
-            56,
-            -48,
-            -47,
-            -49,
-            -26,
-            -27,
-            -28,
-            -29,
-            -30,
-            -31,
-            -32,
-            -33,
-            -73,
-            -74,
-            -75,
-            -76,
-            -77,
-            -45,
-            -44,
-            -40,
-            -41,
-            -42,
-            -43,
-            -46,
-            -116,
-            -15,
-            -13,
-            -11,
-            56,
-            -7,
-            -5,
-            -3,
-            -16,
-            -17,
-            -18,
-            -19,
-            -20,
-            -21,
-            -22,
-            -23,
-            56,
-            -53,
-            -117,
-            -52,
-            56,
-            -3,
-            -78,
-            -79,
-            -80,
-            -12,
-            -10,
-            56,
-            -6,
-            -4,
-            -2,
-            -1,
-            -50,
-            -34,
-            -54,
-            -35,
-            -122,
-            -81,
-            56,
-            -123,
-            -82,
-            -118,
-            -120,
-            -81,
-            -121,
-            -14,
-            -119,
-        ],
-    ),
-    "MINUS": (
-        [
-            14,
-            17,
-            18,
-            19,
-            117,
-            118,
-            119,
-            120,
-            121,
-            122,
-            123,
-            124,
-            127,
-            128,
-            129,
-            130,
-            131,
-            132,
-            133,
-            134,
-            135,
-            136,
-            137,
-            169,
-            170,
-            171,
-            172,
-            173,
-            174,
-            175,
-            176,
-            177,
-            178,
-            179,
-            180,
-            181,
-            182,
-            183,
-            184,
-            185,
-            186,
-            187,
-            212,
-            239,
-            240,
-            241,
-            263,
-            264,
-            265,
-            287,
-            290,
-            291,
-            292,
-            293,
-            294,
-            295,
-            297,
-            301,
-            302,
-            307,
-            321,
-            322,
-            324,
-            325,
-            328,
-            340,
-            342,
-            348,
-            349,
-            350,
-            354,
-        ],
-        [
-            57,
-            -48,
-            -47,
-            -49,
-            -26,
-            -27,
-            -28,
-            -29,
-            -30,
-            -31,
-            -32,
-            -33,
-            -73,
-            -74,
-            -75,
-            -76,
-            -77,
-            -45,
-            -44,
-            -40,
-            -41,
-            -42,
-            -43,
-            -46,
-            -116,
-            -15,
-            -13,
-            -11,
-            57,
-            -7,
-            -5,
-            -3,
-            -16,
-            -17,
-            -18,
-            -19,
-            -20,
-            -21,
-            -22,
-            -23,
-            57,
-            -53,
-            -117,
-            -52,
-            57,
-            -3,
-            -78,
-            -79,
-            -80,
-            -12,
-            -10,
-            57,
-            -6,
-            -4,
-            -2,
-            -1,
-            -50,
-            -34,
-            -54,
-            -35,
-            -122,
-            -81,
-            57,
-            -123,
-            -82,
-            -118,
-            -120,
-            -81,
-            -121,
-            -14,
-            -119,
-        ],
-    ),
-    "STAR": (
-        [
-            14,
-            17,
-            18,
-            19,
-            117,
-            118,
-            119,
-            120,
-            121,
-            122,
-            123,
-            124,
-            127,
-            128,
-            129,
-            130,
-            131,
-            132,
-            133,
-            134,
-            135,
-            136,
-            137,
-            169,
-            170,
-            171,
-            172,
-            173,
-            174,
-            175,
-            176,
-            177,
-            178,
-            179,
-            180,
-            181,
-            182,
-            183,
-            184,
-            185,
-            186,
-            187,
-            212,
-            239,
-            240,
-            241,
-            263,
-            264,
-            265,
-            287,
-            290,
-            291,
-            292,
-            293,
-            294,
-            295,
-            297,
-            301,
-            302,
-            307,
-            321,
-            322,
-            324,
-            325,
-            328,
-            340,
-            342,
-            348,
-            349,
-            350,
-            354,
-        ],
-        [
-            58,
-            -48,
-            -47,
-            -49,
-            -26,
-            -27,
-            -28,
-            -29,
-            -30,
-            -31,
-            -32,
-            -33,
-            -73,
-            -74,
-            -75,
-            -76,
-            -77,
-            -45,
-            -44,
-            -40,
-            -41,
-            -42,
-            -43,
-            -46,
-            -116,
-            -15,
-            -13,
-            -11,
-            -9,
-            58,
-            -5,
-            -3,
-            -16,
-            -17,
-            -18,
-            -19,
-            -20,
-            -21,
-            -22,
-            -23,
-            58,
-            -53,
-            -117,
-            -52,
-            58,
-            -3,
-            -78,
-            -79,
-            -80,
-            -12,
-            -10,
-            -8,
-            58,
-            -4,
-            -2,
-            -1,
-            -50,
-            -34,
-            -54,
-            -35,
-            -122,
-            -81,
-            58,
-            -123,
-            -82,
-            -118,
-            -120,
-            -81,
-            -121,
-            -14,
-            -119,
-        ],
-    ),
-    "SLASH": (
-        [
-            14,
-            17,
-            18,
-            19,
-            117,
-            118,
-            119,
-            120,
-            121,
-            122,
-            123,
-            124,
-            127,
-            128,
-            129,
-            130,
-            131,
-            132,
-            133,
-            134,
-            135,
-            136,
-            137,
-            169,
-            170,
-            171,
-            172,
-            173,
-            174,
-            175,
-            176,
-            177,
-            178,
-            179,
-            180,
-            181,
-            182,
-            183,
-            184,
-            185,
-            186,
-            187,
-            212,
-            239,
-            240,
-            241,
-            263,
-            264,
-            265,
-            287,
-            290,
-            291,
-            292,
-            293,
-            294,
-            295,
-            297,
-            301,
-            302,
-            307,
-            321,
-            322,
-            324,
-            325,
-            328,
-            340,
-            342,
-            348,
-            349,
-            350,
-            354,
-        ],
-        [
-            59,
-            -48,
-            -47,
-            -49,
-            -26,
-            -27,
-            -28,
-            -29,
-            -30,
-            -31,
-            -32,
-            -33,
-            -73,
-            -74,
-            -75,
-            -76,
-            -77,
-            -45,
-            -44,
-            -40,
-            -41,
-            -42,
-            -43,
-            -46,
-            -116,
-            -15,
-            -13,
-            -11,
-            -9,
-            59,
-            -5,
-            -3,
-            -16,
-            -17,
-            -18,
-            -19,
-            -20,
-            -21,
-            -22,
-            -23,
-            59,
-            -53,
-            -117,
-            -52,
-            59,
-            -3,
-            -78,
-            -79,
-            -80,
-            -12,
-            -10,
-            -8,
-            59,
-            -4,
-            -2,
-            -1,
-            -50,
-            -34,
-            -54,
-            -35,
-            -122,
-            -81,
-            59,
-            -123,
-            -82,
-            -118,
-            -120,
-            -81,
-            -121,
-            -14,
-            -119,
-        ],
-    ),
-    "DOUBLESLASH": (
-        [
-            14,
-            17,
-            18,
-            19,
-            117,
-            118,
-            119,
-            120,
-            121,
-            122,
-            123,
-            124,
-            127,
-            128,
-            129,
-            130,
-            131,
-            132,
-            133,
-            134,
-            135,
-            136,
-            137,
-            169,
-            170,
-            171,
-            172,
-            173,
-            174,
-            175,
-            176,
-            177,
-            178,
-            179,
-            180,
-            181,
-            182,
-            183,
-            184,
-            185,
-            186,
-            187,
-            212,
-            239,
-            240,
-            241,
-            263,
-            264,
-            265,
-            287,
-            290,
-            291,
-            292,
-            293,
-            294,
-            295,
-            297,
-            301,
-            302,
-            307,
-            321,
-            322,
-            324,
-            325,
-            328,
-            340,
-            342,
-            348,
-            349,
-            350,
-            354,
-        ],
-        [
-            60,
-            -48,
-            -47,
-            -49,
-            -26,
-            -27,
-            -28,
-            -29,
-            -30,
-            -31,
-            -32,
-            -33,
-            -73,
-            -74,
-            -75,
-            -76,
-            -77,
-            -45,
-            -44,
-            -40,
-            -41,
-            -42,
-            -43,
-            -46,
-            -116,
-            -15,
-            -13,
-            -11,
-            -9,
-            60,
-            -5,
-            -3,
-            -16,
-            -17,
-            -18,
-            -19,
-            -20,
-            -21,
-            -22,
-            -23,
-            60,
-            -53,
-            -117,
-            -52,
-            60,
-            -3,
-            -78,
-            -79,
-            -80,
-            -12,
-            -10,
-            -8,
-            60,
-            -4,
-            -2,
-            -1,
-            -50,
-            -34,
-            -54,
-            -35,
-            -122,
-            -81,
-            60,
-            -123,
-            -82,
-            -118,
-            -120,
-            -81,
-            -121,
-            -14,
-            -119,
-        ],
-    ),
-    "PERCENT": (
-        [
-            14,
-            17,
-            18,
-            19,
-            117,
-            118,
-            119,
-            120,
-            121,
-            122,
-            123,
-            124,
-            127,
-            128,
-            129,
-            130,
-            131,
-            132,
-            133,
-            134,
-            135,
-            136,
-            137,
-            169,
-            170,
-            171,
-            172,
-            173,
-            174,
-            175,
-            176,
-            177,
-            178,
-            179,
-            180,
-            181,
-            182,
-            183,
-            184,
-            185,
-            186,
-            187,
-            212,
-            239,
-            240,
-            241,
-            263,
-            264,
-            265,
-            287,
-            290,
-            291,
-            292,
-            293,
-            294,
-            295,
-            297,
-            301,
-            302,
-            307,
-            321,
-            322,
-            324,
-            325,
-            328,
-            340,
-            342,
-            348,
-            349,
-            350,
-            354,
-        ],
-        [
-            61,
-            -48,
-            -47,
-            -49,
-            -26,
-            -27,
-            -28,
-            -29,
-            -30,
-            -31,
-            -32,
-            -33,
-            -73,
-            -74,
-            -75,
-            -76,
-            -77,
-            -45,
-            -44,
-            -40,
-            -41,
-            -42,
-            -43,
-            -46,
-            -116,
-            -15,
-            -13,
-            -11,
-            -9,
-            61,
-            -5,
-            -3,
-            -16,
-            -17,
-            -18,
-            -19,
-            -20,
-            -21,
-            -22,
-            -23,
-            61,
-            -53,
-            -117,
-            -52,
-            61,
-            -3,
-            -78,
-            -79,
-            -80,
-            -12,
-            -10,
-            -8,
-            61,
-            -4,
-            -2,
-            -1,
-            -50,
-            -34,
-            -54,
-            -35,
-            -122,
-            -81,
-            61,
-            -123,
-            -82,
-            -118,
-            -120,
-            -81,
-            -121,
-            -14,
-            -119,
-        ],
-    ),
-    "DOT_OPERATOR": (
-        [
-            14,
-            17,
-            18,
-            19,
-            117,
-            118,
-            119,
-            120,
-            121,
-            122,
-            123,
-            124,
-            127,
-            128,
-            129,
-            130,
-            131,
-            132,
-            133,
-            134,
-            135,
-            136,
-            137,
-            168,
-            169,
-            170,
-            171,
-            172,
-            173,
-            174,
-            175,
-            176,
-            177,
-            178,
-            179,
-            180,
-            181,
-            182,
-            183,
-            184,
-            185,
-            186,
-            187,
-            212,
-            239,
-            240,
-            241,
-            263,
-            264,
-            265,
-            287,
-            290,
-            291,
-            292,
-            293,
-            294,
-            295,
-            297,
-            301,
-            302,
-            307,
-            321,
-            322,
-            324,
-            325,
-            328,
-            340,
-            342,
-            348,
-            349,
-            350,
-            354,
-        ],
-        [
-            62,
-            -48,
-            -47,
-            -49,
-            -26,
-            -27,
-            -28,
-            -29,
-            -30,
-            -31,
-            -32,
-            -33,
-            -73,
-            -74,
-            -75,
-            -76,
-            -77,
-            -45,
-            -44,
-            -40,
-            -41,
-            -42,
-            -43,
-            229,
-            -46,
-            -116,
-            -15,
-            -13,
-            -11,
-            -9,
-            -7,
-            -5,
-            62,
-            -16,
-            -17,
-            -18,
-            -19,
-            -20,
-            -21,
-            -22,
-            -23,
-            62,
-            -53,
-            -117,
-            -52,
-            62,
-            62,
-            -78,
-            -79,
-            -80,
-            -12,
-            -10,
-            -8,
-            -6,
-            -4,
-            -2,
-            -1,
-            -50,
-            -34,
-            -54,
-            -35,
-            -122,
-            -81,
-            62,
-            -123,
-            -82,
-            -118,
-            -120,
-            -81,
-            -121,
-            -14,
-            -119,
-        ],
-    ),
-    "KEYWORD_WHERE": (
-        [
-            17,
-            18,
-            19,
-            29,
-            30,
-            33,
-            34,
-            35,
-            76,
-            87,
-            88,
-            89,
-            90,
-            91,
-            92,
-            95,
-            117,
-            118,
-            119,
-            120,
-            121,
-            122,
-            123,
-            124,
-            127,
-            128,
-            129,
-            130,
-            131,
-            132,
-            133,
-            134,
-            135,
-            136,
-            137,
-            154,
-            155,
-            160,
-            163,
-            166,
-            169,
-            170,
-            171,
-            172,
-            173,
-            174,
-            175,
-            176,
-            177,
-            178,
-            179,
-            180,
-            181,
-            182,
-            183,
-            184,
-            185,
-            187,
-            212,
-            224,
-            239,
-            241,
-            242,
-            243,
-            252,
-            263,
-            264,
-            265,
-            276,
-            277,
-            279,
-            280,
-            286,
-            287,
-            290,
-            291,
-            292,
-            293,
-            294,
-            295,
-            296,
-            297,
-            301,
-            302,
-            307,
-            316,
-            317,
-            318,
-            320,
-            321,
-            322,
-            325,
-            326,
-            328,
-            339,
-            340,
-            342,
-            348,
-            349,
-            350,
-            354,
-        ],
-        [
-            -48,
-            -47,
-            -49,
-            79,
-            -175,
-            85,
-            -151,
-            -152,
-            -138,
-            -124,
-            -125,
-            -132,
-            -133,
-            -140,
-            -141,
-            -139,
-            -26,
-            -27,
-            -28,
-            -29,
-            -30,
-            -31,
-            -32,
-            -33,
-            -73,
-            -74,
-            -75,
-            -76,
-            -77,
-            -45,
-            -44,
-            -40,
-            -41,
-            -42,
-            -43,
-            -176,
-            -177,
-            -134,
-            -143,
-            -150,
-            -46,
-            231,
-            -15,
-            -13,
-            -11,
-            -9,
-            -7,
-            -5,
-            -3,
-            -16,
-            -17,
-            -18,
-            -19,
-            -20,
-            -21,
-            -22,
-            -23,
-            -53,
-            231,
-            -81,
-            -52,
-            -3,
-            231,
-            231,
-            231,
-            -78,
-            -79,
-            -80,
-            -131,
-            -130,
-            -136,
-            -137,
-            231,
-            -12,
-            -10,
-            -8,
-            -6,
-            -4,
-            -2,
-            -1,
-            231,
-            -50,
-            -34,
-            -54,
-            -35,
-            -81,
-            -142,
-            -147,
-            -148,
-            -122,
-            -81,
-            -123,
-            231,
-            231,
-            -135,
-            -118,
-            -120,
-            -81,
-            -121,
-            231,
-            -119,
-        ],
-    ),
-    "TICK_OPERATOR": (
-        [
-            17,
-            18,
-            19,
-            117,
-            118,
-            119,
-            120,
-            121,
-            122,
-            123,
-            124,
-            127,
-            128,
-            129,
-            130,
-            131,
-            132,
-            133,
-            134,
-            135,
-            136,
-            137,
-            169,
-            170,
-            171,
-            172,
-            173,
-            174,
-            175,
-            176,
-            177,
-            178,
-            179,
-            180,
-            181,
-            182,
-            183,
-            184,
-            185,
-            187,
-            212,
-            239,
-            241,
-            242,
-            243,
-            252,
-            263,
-            264,
-            265,
-            286,
-            287,
-            290,
-            291,
-            292,
-            293,
-            294,
-            295,
-            296,
-            297,
-            301,
-            302,
-            307,
-            321,
-            322,
-            325,
-            326,
-            328,
-            340,
-            342,
-            348,
-            349,
-            350,
-            354,
-        ],
-        [
-            -48,
-            -47,
-            -49,
-            -26,
-            -27,
-            -28,
-            -29,
-            -30,
-            -31,
-            -32,
-            -33,
-            -73,
-            -74,
-            -75,
-            -76,
-            -77,
-            -45,
-            -44,
-            -40,
-            -41,
-            -42,
-            -43,
-            -46,
-            232,
-            -15,
-            -13,
-            -11,
-            -9,
-            -7,
-            -5,
-            -3,
-            -16,
-            -17,
-            -18,
-            -19,
-            -20,
-            -21,
-            -22,
-            -23,
-            -53,
-            232,
-            -52,
-            -3,
-            232,
-            232,
-            232,
-            -78,
-            -79,
-            -80,
-            232,
-            -12,
-            -10,
-            -8,
-            -6,
-            -4,
-            -2,
-            -1,
-            232,
-            -50,
-            -34,
-            -54,
-            -35,
-            -122,
-            -81,
-            -123,
-            232,
-            232,
-            -118,
-            -120,
-            -81,
-            -121,
-            232,
-            -119,
-        ],
-    ),
-    "RPAREN": (
-        [
-            17,
-            18,
-            19,
-            44,
-            45,
-            46,
-            47,
-            48,
-            49,
-            50,
-            51,
-            52,
-            53,
-            54,
-            55,
-            56,
-            57,
-            58,
-            59,
-            60,
-            61,
-            62,
-            76,
-            87,
-            88,
-            89,
-            90,
-            91,
-            92,
-            93,
-            95,
-            103,
-            104,
-            105,
-            106,
-            107,
-            108,
-            109,
-            110,
-            111,
-            112,
-            113,
-            114,
-            115,
-            117,
-            118,
-            119,
-            120,
-            121,
-            122,
-            123,
-            124,
-            127,
-            128,
-            129,
-            130,
-            131,
-            132,
-            133,
-            134,
-            135,
-            136,
-            137,
-            145,
-            150,
-            157,
-            158,
-            160,
-            163,
-            164,
-            169,
-            170,
-            171,
-            172,
-            173,
-            174,
-            175,
-            176,
-            177,
-            178,
-            179,
-            180,
-            181,
-            182,
-            183,
-            184,
-            185,
-            186,
-            187,
-            191,
-            193,
-            196,
-            197,
-            198,
-            200,
-            201,
-            202,
-            203,
-            204,
-            207,
-            212,
-            224,
-            225,
-            226,
-            239,
-            241,
-            243,
-            244,
-            245,
-            246,
-            249,
-            250,
-            253,
-            255,
-            256,
-            257,
-            259,
-            260,
-            262,
-            263,
-            264,
-            265,
-            276,
-            277,
-            279,
-            280,
-            281,
-            282,
-            287,
-            290,
-            291,
-            292,
-            293,
-            294,
-            295,
-            296,
-            297,
-            298,
-            300,
-            301,
-            302,
-            305,
-            306,
-            307,
-            308,
-            309,
-            310,
-            313,
-            314,
-            316,
-            317,
-            318,
-            319,
-            320,
-            321,
-            322,
-            325,
-            326,
-            328,
-            330,
-            331,
-            332,
-            333,
-            335,
-            337,
-            339,
-            340,
-            342,
-            343,
-            345,
-            346,
-            347,
-            348,
-            349,
-            350,
-            351,
-            352,
-            353,
-            354,
-        ],
-        [
-            -48,
-            -47,
-            -49,
-            -114,
-            138,
-            -67,
-            -68,
-            -69,
-            -70,
-            -71,
-            -72,
-            -63,
-            -64,
-            -65,
-            -62,
-            -60,
-            -61,
-            -56,
-            -57,
-            -58,
-            -59,
-            -55,
-            -138,
-            -124,
-            -125,
-            -132,
-            -133,
-            -140,
-            -141,
-            163,
-            -139,
-            -81,
-            -81,
-            -83,
-            -84,
-            -85,
-            -86,
-            -87,
-            -88,
-            -89,
-            -90,
-            -91,
-            -95,
-            197,
-            -26,
-            -27,
-            -28,
-            -29,
-            -30,
-            -31,
-            -32,
-            -33,
-            -73,
-            -74,
-            -75,
-            -76,
-            -77,
-            -45,
-            -44,
-            -40,
-            -41,
-            -42,
-            -43,
-            -155,
-            217,
-            -146,
-            -145,
-            -134,
-            -143,
-            -156,
-            -46,
-            -116,
-            -15,
-            -13,
-            -11,
-            -9,
-            -7,
-            -5,
-            -3,
-            -16,
-            -17,
-            -18,
-            -19,
-            -20,
-            -21,
-            -22,
-            -23,
-            -81,
-            -53,
-            -108,
-            -109,
-            256,
-            -102,
-            259,
-            262,
-            -90,
-            -91,
-            -95,
-            -92,
-            -101,
-            -117,
-            -81,
-            -81,
-            -81,
-            -52,
-            -51,
-            297,
-            301,
-            302,
-            -38,
-            -81,
-            -81,
-            -96,
-            -97,
-            -99,
-            -106,
-            -100,
-            -107,
-            -103,
-            -78,
-            -79,
-            -80,
-            -131,
-            -130,
-            -136,
-            -137,
-            317,
-            318,
-            -12,
-            -10,
-            -8,
-            -6,
-            -4,
-            -2,
-            -1,
-            297,
-            -50,
-            -36,
-            -39,
-            -34,
-            -54,
-            -104,
-            -105,
-            -35,
-            -81,
-            -81,
-            333,
-            334,
-            -81,
-            -81,
-            -142,
-            -147,
-            -144,
-            -148,
-            -122,
-            -81,
-            -123,
-            -81,
-            -82,
-            -110,
-            -115,
-            -111,
-            -98,
-            -203,
-            -205,
-            -135,
-            -118,
-            -120,
-            -37,
-            -81,
-            -81,
-            -81,
-            -81,
-            -121,
-            -14,
-            -112,
-            -113,
-            -204,
-            -119,
-        ],
-    ),
-    "RBRACKET": (
-        [
-            17,
-            18,
-            19,
-            76,
-            87,
-            88,
-            89,
-            90,
-            91,
-            92,
-            95,
-            117,
-            118,
-            119,
-            120,
-            121,
-            122,
-            123,
-            124,
-            125,
-            127,
-            128,
-            129,
-            130,
-            131,
-            132,
-            133,
-            134,
-            135,
-            136,
-            137,
-            145,
-            151,
-            160,
-            163,
-            164,
-            169,
-            170,
-            171,
-            172,
-            173,
-            174,
-            175,
-            176,
-            177,
-            178,
-            179,
-            180,
-            181,
-            182,
-            183,
-            184,
-            185,
-            187,
-            190,
-            212,
-            224,
-            227,
-            239,
-            241,
-            246,
-            251,
-            252,
-            263,
-            264,
-            265,
-            276,
-            277,
-            279,
-            280,
-            284,
-            287,
-            290,
-            291,
-            292,
-            293,
-            294,
-            295,
-            297,
-            298,
-            300,
-            301,
-            302,
-            307,
-            316,
-            317,
-            318,
-            320,
-            321,
-            322,
-            325,
-            326,
-            328,
-            339,
-            340,
-            342,
-            343,
-            348,
-            349,
-            350,
-            354,
-        ],
-        [
-            -48,
-            -47,
-            -49,
-            -138,
-            -124,
-            -125,
-            -132,
-            -133,
-            -140,
-            -141,
-            -139,
-            -26,
-            -27,
-            -28,
-            -29,
-            -30,
-            -31,
-            -32,
-            -33,
-            207,
-            -73,
-            -74,
-            -75,
-            -76,
-            -77,
-            -45,
-            -44,
-            -40,
-            -41,
-            -42,
-            -43,
-            -155,
-            218,
-            -134,
-            -143,
-            -156,
-            -46,
-            -116,
-            -15,
-            -13,
-            -11,
-            -9,
-            -7,
-            -5,
-            -3,
-            -16,
-            -17,
-            -18,
-            -19,
-            -20,
-            -21,
-            -22,
-            -23,
-            -53,
-            -81,
-            -117,
-            -81,
-            -81,
-            -52,
-            -51,
-            -38,
-            307,
-            -81,
-            -78,
-            -79,
-            -80,
-            -131,
-            -130,
-            -136,
-            -137,
-            320,
-            -12,
-            -10,
-            -8,
-            -6,
-            -4,
-            -2,
-            -1,
-            -50,
-            -36,
-            -39,
-            -34,
-            -54,
-            -35,
-            -81,
-            -142,
-            -147,
-            -148,
-            -122,
-            -81,
-            -123,
-            -81,
-            -82,
-            -135,
-            -118,
-            -120,
-            -37,
-            -81,
-            -121,
-            -14,
-            -119,
-        ],
-    ),
-    "FATARROW": (
-        [
-            30,
-            31,
-            34,
-            37,
-            40,
-            76,
-            80,
-            82,
-            87,
-            88,
-            89,
-            90,
-            91,
-            92,
-            95,
-            99,
-            153,
-            155,
-            157,
-            158,
-            160,
-            163,
-            221,
-            224,
-            276,
-            277,
-            279,
-            280,
-            316,
-            317,
-            318,
-            320,
-            339,
-        ],
-        [
-            -81,
-            83,
-            -146,
-            96,
-            -154,
-            -138,
-            -178,
-            -180,
-            -124,
-            -125,
-            -132,
-            -133,
-            -140,
-            -141,
-            -139,
-            -146,
-            -81,
-            -177,
-            -146,
-            -145,
-            -134,
-            -143,
-            -179,
-            -81,
-            -131,
-            -130,
-            -136,
-            -137,
-            -81,
-            -142,
-            -147,
-            -148,
-            -135,
-        ],
-    ),
-    "BASE10_INTEGER": (
-        [
-            43,
-            52,
-            53,
-            54,
-            55,
-            56,
-            57,
-            58,
-            59,
-            60,
-            61,
-            62,
-            102,
-            115,
-            116,
-            126,
-            140,
-            180,
-            186,
-            187,
-            189,
-            190,
-            192,
-            194,
-            195,
-            230,
-            232,
-            233,
-            234,
-            235,
-            236,
-            237,
-            238,
-            240,
-            258,
-            261,
-            297,
-            299,
-            302,
-            304,
-            329,
-            344,
-        ],
-        [
-            127,
-            -63,
-            -64,
-            -65,
-            -62,
-            -60,
-            -61,
-            -56,
-            -57,
-            -58,
-            -59,
-            -55,
-            127,
-            127,
-            127,
-            -94,
-            127,
-            127,
-            127,
-            -53,
-            127,
-            127,
-            -81,
-            127,
-            -93,
-            127,
-            -66,
-            127,
-            127,
-            127,
-            127,
-            127,
-            127,
-            127,
-            127,
-            127,
-            -50,
-            127,
-            -54,
-            127,
-            127,
-            127,
-        ],
-    ),
-    "BASE16_INTEGER": (
-        [
-            43,
-            52,
-            53,
-            54,
-            55,
-            56,
-            57,
-            58,
-            59,
-            60,
-            61,
-            62,
-            102,
-            115,
-            116,
-            126,
-            140,
-            180,
-            186,
-            187,
-            189,
-            190,
-            192,
-            194,
-            195,
-            230,
-            232,
-            233,
-            234,
-            235,
-            236,
-            237,
-            238,
-            240,
-            258,
-            261,
-            297,
-            299,
-            302,
-            304,
-            329,
-            344,
-        ],
-        [
-            128,
-            -63,
-            -64,
-            -65,
-            -62,
-            -60,
-            -61,
-            -56,
-            -57,
-            -58,
-            -59,
-            -55,
-            128,
-            128,
-            128,
-            -94,
-            128,
-            128,
-            128,
-            -53,
-            128,
-            128,
-            -81,
-            128,
-            -93,
-            128,
-            -66,
-            128,
-            128,
-            128,
-            128,
-            128,
-            128,
-            128,
-            128,
-            128,
-            -50,
-            128,
-            -54,
-            128,
-            128,
-            128,
-        ],
-    ),
-    "BASE8_INTEGER": (
-        [
-            43,
-            52,
-            53,
-            54,
-            55,
-            56,
-            57,
-            58,
-            59,
-            60,
-            61,
-            62,
-            102,
-            115,
-            116,
-            126,
-            140,
-            180,
-            186,
-            187,
-            189,
-            190,
-            192,
-            194,
-            195,
-            230,
-            232,
-            233,
-            234,
-            235,
-            236,
-            237,
-            238,
-            240,
-            258,
-            261,
-            297,
-            299,
-            302,
-            304,
-            329,
-            344,
-        ],
-        [
-            129,
-            -63,
-            -64,
-            -65,
-            -62,
-            -60,
-            -61,
-            -56,
-            -57,
-            -58,
-            -59,
-            -55,
-            129,
-            129,
-            129,
-            -94,
-            129,
-            129,
-            129,
-            -53,
-            129,
-            129,
-            -81,
-            129,
-            -93,
-            129,
-            -66,
-            129,
-            129,
-            129,
-            129,
-            129,
-            129,
-            129,
-            129,
-            129,
-            -50,
-            129,
-            -54,
-            129,
-            129,
-            129,
-        ],
-    ),
-    "BASE2_INTEGER": (
-        [
-            43,
-            52,
-            53,
-            54,
-            55,
-            56,
-            57,
-            58,
-            59,
-            60,
-            61,
-            62,
-            102,
-            115,
-            116,
-            126,
-            140,
-            180,
-            186,
-            187,
-            189,
-            190,
-            192,
-            194,
-            195,
-            230,
-            232,
-            233,
-            234,
-            235,
-            236,
-            237,
-            238,
-            240,
-            258,
-            261,
-            297,
-            299,
-            302,
-            304,
-            329,
-            344,
-        ],
-        [
-            130,
-            -63,
-            -64,
-            -65,
-            -62,
-            -60,
-            -61,
-            -56,
-            -57,
-            -58,
-            -59,
-            -55,
-            130,
-            130,
-            130,
-            -94,
-            130,
-            130,
-            130,
-            -53,
-            130,
-            130,
-            -81,
-            130,
-            -93,
-            130,
-            -66,
-            130,
-            130,
-            130,
-            130,
-            130,
-            130,
-            130,
-            130,
-            130,
-            -50,
-            130,
-            -54,
-            130,
-            130,
-            130,
-        ],
-    ),
-    "FLOAT": (
-        [
-            43,
-            52,
-            53,
-            54,
-            55,
-            56,
-            57,
-            58,
-            59,
-            60,
-            61,
-            62,
-            102,
-            115,
-            116,
-            126,
-            140,
-            180,
-            186,
-            187,
-            189,
-            190,
-            192,
-            194,
-            195,
-            230,
-            232,
-            233,
-            234,
-            235,
-            236,
-            237,
-            238,
-            240,
-            258,
-            261,
-            297,
-            299,
-            302,
-            304,
-            329,
-            344,
-        ],
-        [
-            131,
-            -63,
-            -64,
-            -65,
-            -62,
-            -60,
-            -61,
-            -56,
-            -57,
-            -58,
-            -59,
-            -55,
-            131,
-            131,
-            131,
-            -94,
-            131,
-            131,
-            131,
-            -53,
-            131,
-            131,
-            -81,
-            131,
-            -93,
-            131,
-            -66,
-            131,
-            131,
-            131,
-            131,
-            131,
-            131,
-            131,
-            131,
-            131,
-            -50,
-            131,
-            -54,
-            131,
-            131,
-            131,
-        ],
-    ),
-    "STRING": (
-        [
-            43,
-            52,
-            53,
-            54,
-            55,
-            56,
-            57,
-            58,
-            59,
-            60,
-            61,
-            62,
-            102,
-            115,
-            116,
-            126,
-            140,
-            180,
-            186,
-            187,
-            189,
-            190,
-            192,
-            194,
-            195,
-            206,
-            230,
-            232,
-            233,
-            234,
-            235,
-            236,
-            237,
-            238,
-            240,
-            258,
-            261,
-            297,
-            299,
-            302,
-            304,
-            329,
-            344,
-        ],
-        [
-            132,
-            -63,
-            -64,
-            -65,
-            -62,
-            -60,
-            -61,
-            -56,
-            -57,
-            -58,
-            -59,
-            -55,
-            132,
-            132,
-            132,
-            -94,
-            132,
-            132,
-            132,
-            -53,
-            132,
-            132,
-            -81,
-            132,
-            -93,
-            132,
-            132,
-            -66,
-            132,
-            132,
-            132,
-            132,
-            132,
-            132,
-            132,
-            132,
-            132,
-            -50,
-            132,
-            -54,
-            132,
-            132,
-            132,
-        ],
-    ),
-    "CHAR": (
-        [
-            43,
-            52,
-            53,
-            54,
-            55,
-            56,
-            57,
-            58,
-            59,
-            60,
-            61,
-            62,
-            102,
-            115,
-            116,
-            126,
-            140,
-            180,
-            186,
-            187,
-            189,
-            190,
-            192,
-            194,
-            195,
-            206,
-            230,
-            232,
-            233,
-            234,
-            235,
-            236,
-            237,
-            238,
-            240,
-            258,
-            261,
-            297,
-            299,
-            302,
-            304,
-            329,
-            344,
-        ],
-        [
-            133,
-            -63,
-            -64,
-            -65,
-            -62,
-            -60,
-            -61,
-            -56,
-            -57,
-            -58,
-            -59,
-            -55,
-            133,
-            133,
-            133,
-            -94,
-            133,
-            133,
-            133,
-            -53,
-            133,
-            133,
-            -81,
-            133,
-            -93,
-            133,
-            133,
-            -66,
-            133,
-            133,
-            133,
-            133,
-            133,
-            133,
-            133,
-            133,
-            133,
-            -50,
-            133,
-            -54,
-            133,
-            133,
-            133,
-        ],
-    ),
-    "DATE": (
-        [
-            43,
-            52,
-            53,
-            54,
-            55,
-            56,
-            57,
-            58,
-            59,
-            60,
-            61,
-            62,
-            102,
-            115,
-            116,
-            126,
-            140,
-            180,
-            186,
-            187,
-            189,
-            190,
-            192,
-            194,
-            195,
-            230,
-            232,
-            233,
-            234,
-            235,
-            236,
-            237,
-            238,
-            240,
-            258,
-            261,
-            297,
-            299,
-            302,
-            304,
-            329,
-            344,
-        ],
-        [
-            134,
-            -63,
-            -64,
-            -65,
-            -62,
-            -60,
-            -61,
-            -56,
-            -57,
-            -58,
-            -59,
-            -55,
-            134,
-            134,
-            134,
-            -94,
-            134,
-            134,
-            134,
-            -53,
-            134,
-            134,
-            -81,
-            134,
-            -93,
-            134,
-            -66,
-            134,
-            134,
-            134,
-            134,
-            134,
-            134,
-            134,
-            134,
-            134,
-            -50,
-            134,
-            -54,
-            134,
-            134,
-            134,
-        ],
-    ),
-    "DATETIME": (
-        [
-            43,
-            52,
-            53,
-            54,
-            55,
-            56,
-            57,
-            58,
-            59,
-            60,
-            61,
-            62,
-            102,
-            115,
-            116,
-            126,
-            140,
-            180,
-            186,
-            187,
-            189,
-            190,
-            192,
-            194,
-            195,
-            230,
-            232,
-            233,
-            234,
-            235,
-            236,
-            237,
-            238,
-            240,
-            258,
-            261,
-            297,
-            299,
-            302,
-            304,
-            329,
-            344,
-        ],
-        [
-            135,
-            -63,
-            -64,
-            -65,
-            -62,
-            -60,
-            -61,
-            -56,
-            -57,
-            -58,
-            -59,
-            -55,
-            135,
-            135,
-            135,
-            -94,
-            135,
-            135,
-            135,
-            -53,
-            135,
-            135,
-            -81,
-            135,
-            -93,
-            135,
-            -66,
-            135,
-            135,
-            135,
-            135,
-            135,
-            135,
-            135,
-            135,
-            135,
-            -50,
-            135,
-            -54,
-            135,
-            135,
-            135,
-        ],
-    ),
-    "DATE_INTERVAL": (
-        [
-            43,
-            52,
-            53,
-            54,
-            55,
-            56,
-            57,
-            58,
-            59,
-            60,
-            61,
-            62,
-            102,
-            115,
-            116,
-            126,
-            140,
-            180,
-            186,
-            187,
-            189,
-            190,
-            192,
-            194,
-            195,
-            230,
-            232,
-            233,
-            234,
-            235,
-            236,
-            237,
-            238,
-            240,
-            258,
-            261,
-            297,
-            299,
-            302,
-            304,
-            329,
-            344,
-        ],
-        [
-            136,
-            -63,
-            -64,
-            -65,
-            -62,
-            -60,
-            -61,
-            -56,
-            -57,
-            -58,
-            -59,
-            -55,
-            136,
-            136,
-            136,
-            -94,
-            136,
-            136,
-            136,
-            -53,
-            136,
-            136,
-            -81,
-            136,
-            -93,
-            136,
-            -66,
-            136,
-            136,
-            136,
-            136,
-            136,
-            136,
-            136,
-            136,
-            136,
-            -50,
-            136,
-            -54,
-            136,
-            136,
-            136,
-        ],
-    ),
-    "DATETIME_INTERVAL": (
-        [
-            43,
-            52,
-            53,
-            54,
-            55,
-            56,
-            57,
-            58,
-            59,
-            60,
-            61,
-            62,
-            102,
-            115,
-            116,
-            126,
-            140,
-            180,
-            186,
-            187,
-            189,
-            190,
-            192,
-            194,
-            195,
-            230,
-            232,
-            233,
-            234,
-            235,
-            236,
-            237,
-            238,
-            240,
-            258,
-            261,
-            297,
-            299,
-            302,
-            304,
-            329,
-            344,
-        ],
-        [
-            137,
-            -63,
-            -64,
-            -65,
-            -62,
-            -60,
-            -61,
-            -56,
-            -57,
-            -58,
-            -59,
-            -55,
-            137,
-            137,
-            137,
-            -94,
-            137,
-            137,
-            137,
-            -53,
-            137,
-            137,
-            -81,
-            137,
-            -93,
-            137,
-            -66,
-            137,
-            137,
-            137,
-            137,
-            137,
-            137,
-            137,
-            137,
-            137,
-            -50,
-            137,
-            -54,
-            137,
-            137,
-            137,
-        ],
-    ),
-    "KEYWORD_LET": (
-        [
-            52,
-            53,
-            54,
-            55,
-            56,
-            57,
-            58,
-            59,
-            60,
-            61,
-            62,
-            102,
-            140,
-            180,
-            186,
-            187,
-            190,
-            230,
-            232,
-            233,
-            234,
-            235,
-            236,
-            237,
-            238,
-            240,
-            297,
-            299,
-            302,
-            304,
-            344,
-        ],
-        [
-            -63,
-            -64,
-            -65,
-            -62,
-            -60,
-            -61,
-            -56,
-            -57,
-            -58,
-            -59,
-            -55,
-            188,
-            188,
-            188,
-            188,
-            -53,
-            188,
-            188,
-            -66,
-            188,
-            188,
-            188,
-            188,
-            188,
-            188,
-            188,
-            -50,
-            188,
-            -54,
-            188,
-            188,
-        ],
-    ),
-    "BACKSLASH": (
-        [
-            52,
-            53,
-            54,
-            55,
-            56,
-            57,
-            58,
-            59,
-            60,
-            61,
-            62,
-            102,
-            140,
-            180,
-            186,
-            187,
-            190,
-            230,
-            232,
-            233,
-            234,
-            235,
-            236,
-            237,
-            238,
-            240,
-            297,
-            299,
-            302,
-            304,
-            344,
-        ],
-        [
-            -63,
-            -64,
-            -65,
-            -62,
-            -60,
-            -61,
-            -56,
-            -57,
-            -58,
-            -59,
-            -55,
-            189,
-            189,
-            189,
-            189,
-            -53,
-            189,
-            189,
-            -66,
-            189,
-            189,
-            189,
-            189,
-            189,
-            189,
-            189,
-            -50,
-            189,
-            -54,
-            189,
-            189,
-        ],
-    ),
-    "PIPE": (
-        [
-            69,
-            70,
-            71,
-            73,
-            74,
-            75,
-            76,
-            95,
-            143,
-            144,
-            145,
-            146,
-            148,
-            215,
-            216,
-            217,
-            218,
-            268,
-            271,
-            272,
-        ],
-        [
-            -81,
-            -193,
-            -81,
-            -198,
-            -199,
-            -200,
-            -138,
-            -139,
-            213,
-            -156,
-            -155,
-            -194,
-            -197,
-            -81,
-            -81,
-            -201,
-            -202,
-            -81,
-            -196,
-            -195,
-        ],
-    ),
-    "KEYWORD_DERIVING": (
-        [
-            69,
-            70,
-            71,
-            73,
-            74,
-            75,
-            76,
-            95,
-            143,
-            144,
-            145,
-            146,
-            148,
-            215,
-            216,
-            217,
-            218,
-            268,
-            271,
-            272,
-        ],
-        [
-            -81,
-            -193,
-            -81,
-            -198,
-            -199,
-            -200,
-            -138,
-            -139,
-            214,
-            -156,
-            -155,
-            -194,
-            -197,
-            -81,
-            -81,
-            -201,
-            -202,
-            -81,
-            -196,
-            -195,
-        ],
-    ),
-    "ANNOTATION": ([117, 127, 128, 129, 130, 131], [206, -73, -74, -75, -76, -77]),
-}
-
-_lr_action = {}
-for _k, _v in _lr_action_items.items():
-    for _x, _y in zip(_v[0], _v[1]):
-        if not _x in _lr_action:
-            _lr_action[_x] = {}
-        _lr_action[_x][_k] = _y
-del _lr_action_items
-
-_lr_goto_items = {
-    "program": ([0], [1]),
-    "definitions": ([0], [2]),
-    "definition": ([0, 25, 274], [3, 66, 315]),
-    "local_definition": ([0, 25, 152, 156, 247, 274], [4, 4, 220, 220, 220, 4]),
-    "datatype_definition": ([0, 25, 274], [5, 5, 5]),
-    "typeclass": ([0, 25, 274], [6, 6, 6]),
-    "instance": ([0, 25, 274], [7, 7, 7]),
-    "nametype_decl": ([0, 25, 152, 156, 247, 274], [8, 8, 8, 8, 8, 8]),
-    "valuedef": ([0, 25, 152, 156, 247, 274], [9, 9, 9, 9, 9, 9]),
-    "_datatype_lhs": ([0, 25, 274], [10, 10, 10]),
-    "_identifier": (
-        [
-            0,
-            25,
-            97,
-            102,
-            115,
-            140,
-            152,
-            156,
-            180,
-            186,
-            190,
-            206,
-            228,
-            230,
-            233,
-            234,
-            235,
-            236,
-            237,
-            238,
-            240,
-            247,
-            274,
-            288,
-            289,
-            299,
-            304,
-            341,
-            344,
-        ],
-        [
-            13,
-            13,
-            168,
-            169,
-            199,
-            169,
-            13,
-            13,
-            169,
-            169,
-            169,
-            169,
-            168,
-            169,
-            169,
-            169,
-            169,
-            169,
-            169,
-            169,
-            169,
-            13,
-            13,
-            323,
-            323,
-            169,
-            169,
-            323,
-            169,
-        ],
-    ),
-    "equation": (
-        [0, 25, 152, 156, 247, 274, 288, 289, 341],
-        [15, 15, 15, 15, 15, 15, 322, 322, 348],
-    ),
-    "_enclosed_operator": (
-        [
-            0,
-            25,
-            102,
-            140,
-            152,
-            156,
-            177,
-            180,
-            186,
-            190,
-            230,
-            233,
-            234,
-            235,
-            236,
-            237,
-            238,
-            240,
-            241,
-            247,
-            274,
-            288,
-            289,
-            295,
-            299,
-            304,
-            341,
-            344,
-        ],
-        [
-            20,
-            20,
-            187,
-            187,
-            20,
-            20,
-            187,
-            187,
-            187,
-            187,
-            187,
-            187,
-            187,
-            187,
-            187,
-            187,
-            187,
-            187,
-            187,
-            20,
-            20,
-            20,
-            20,
-            187,
-            187,
-            187,
-            20,
-            187,
-        ],
-    ),
-    "_trailing_new_lines": ([2, 23, 27], [21, 65, 67]),
-    "empty": (
-        [
-            2,
-            3,
-            12,
-            13,
-            20,
-            23,
-            27,
-            30,
-            41,
-            43,
-            66,
-            69,
-            71,
-            77,
-            78,
-            86,
-            93,
-            94,
-            96,
-            103,
-            104,
-            115,
-            116,
-            139,
-            153,
-            159,
-            162,
-            165,
-            186,
-            189,
-            190,
-            192,
-            194,
-            208,
-            215,
-            216,
-            220,
-            224,
-            225,
-            226,
-            227,
-            243,
-            249,
-            250,
-            252,
-            258,
-            261,
-            267,
-            268,
-            283,
-            308,
-            309,
-            314,
-            315,
-            316,
-            322,
-            323,
-            326,
-            329,
-            345,
-            346,
-            347,
-            348,
-        ],
-        [
-            22,
-            26,
-            38,
-            44,
-            44,
-            22,
-            22,
-            82,
-            38,
-            126,
-            26,
-            144,
-            148,
-            38,
-            38,
-            38,
-            164,
-            164,
-            38,
-            44,
-            44,
-            126,
-            126,
-            211,
-            82,
-            164,
-            38,
-            38,
-            246,
-            126,
-            246,
-            126,
-            126,
-            38,
-            148,
-            148,
-            275,
-            280,
-            164,
-            164,
-            164,
-            300,
-            44,
-            44,
-            300,
-            126,
-            126,
-            211,
-            144,
-            38,
-            331,
-            331,
-            337,
-            275,
-            280,
-            342,
-            44,
-            300,
-            126,
-            331,
-            331,
-            337,
-            342,
-        ],
-    ),
-    "_definition_set": ([3, 66], [24, 141]),
-    "newlines": ([3, 66], [25, 25]),
-    "_typeclass_def": ([11], [29]),
-    "simple_type_constraint": ([11, 81, 83], [30, 153, 154]),
-    "simple_type_constraints": ([11], [31]),
-    "_maybe_constrained_type_expr": ([12], [33]),
-    "type_expr": (
-        [12, 41, 77, 78, 86, 96, 162, 165, 208, 283],
-        [34, 99, 150, 151, 157, 166, 226, 227, 99, 157],
-    ),
-    "_constrained_type_expr_bare": ([12, 41, 208], [35, 101, 101]),
-    "type_scheme": (
-        [12, 41, 77, 78, 86, 96, 162, 165, 208, 283],
-        [36, 36, 36, 36, 36, 36, 36, 36, 36, 36],
-    ),
-    "type_constraints": ([12, 41, 208], [37, 37, 37]),
-    "_type_expr_list_trail": ([12, 41, 86, 208, 283], [40, 40, 158, 40, 319]),
-    "_patterns": ([13, 20, 103, 104, 249, 250, 323], [42, 64, 191, 193, 305, 306, 42]),
-    "_st_operator": ([14, 186, 240, 324], [45, 245, 245, 245]),
-    "infixl_operator_2": ([14, 173, 186, 240, 324], [46, 234, 46, 46, 46]),
-    "infixr_operator_2": ([14, 173, 186, 240, 324], [47, 233, 47, 47, 47]),
-    "infixl_operator_6": ([14, 174, 186, 240, 291, 324], [48, 235, 48, 48, 235, 48]),
-    "infixl_operator_7": ([14, 175, 186, 240, 292, 324], [49, 236, 49, 49, 236, 49]),
-    "infixr_operator_9": (
-        [14, 177, 186, 240, 241, 295, 324],
-        [50, 237, 50, 50, 237, 237, 50],
-    ),
-    "_data_rhs": ([28], [68]),
-    "data_cons": ([28, 213], [69, 268]),
-    "_data_cons": ([28, 213], [70, 70]),
-    "cons_arg": ([28, 147, 149, 213], [72, 215, 216, 72]),
-    "type_variable": (
-        [28, 36, 84, 147, 149, 161, 213, 223, 278],
-        [73, 91, 155, 73, 73, 91, 73, 91, 91],
-    ),
-    "type_cons": (
-        [28, 36, 147, 149, 161, 213, 223, 278],
-        [74, 92, 74, 74, 92, 74, 92, 92],
-    ),
-    "_cons_arg_factor": ([28, 147, 149, 213], [75, 75, 75, 75]),
-    "_simple_type_constraints": ([30, 153], [80, 221]),
-    "type_function_expr": ([36, 223], [87, 277]),
-    "type_term": ([36, 223], [88, 276]),
-    "type_app_expression": ([36, 223], [89, 89]),
-    "type_factor": ([36, 161, 223, 278], [90, 224, 90, 316]),
-    "st_type_expr": ([41, 208], [98, 266]),
-    "constrained_type_expr": ([41, 208], [100, 100]),
-    "pattern": (
-        [43, 115, 116, 189, 192, 194, 258, 261, 329],
-        [103, 196, 205, 249, 253, 205, 308, 249, 345],
-    ),
-    "simple_pattern": (
-        [43, 115, 116, 189, 194, 258, 261, 329],
-        [104, 198, 204, 250, 255, 309, 250, 346],
-    ),
-    "possibly_named_pattern": (
-        [43, 115, 116, 189, 192, 194, 258, 261, 329],
-        [105, 105, 105, 105, 105, 105, 105, 105, 105],
-    ),
-    "literal": (
-        [
-            43,
-            102,
-            115,
-            116,
-            140,
-            180,
-            186,
-            189,
-            190,
-            194,
-            230,
-            233,
-            234,
-            235,
-            236,
-            237,
-            238,
-            240,
-            258,
-            261,
-            299,
-            304,
-            329,
-            344,
-        ],
-        [
-            106,
-            178,
-            106,
-            106,
-            178,
-            178,
-            178,
-            106,
-            178,
-            106,
-            178,
-            178,
-            178,
-            178,
-            178,
-            178,
-            178,
-            178,
-            106,
-            106,
-            178,
-            178,
-            106,
-            178,
-        ],
-    ),
-    "cons_pattern": (
-        [43, 115, 116, 189, 194, 258, 261, 329],
-        [107, 107, 107, 107, 107, 107, 107, 107],
-    ),
-    "list_cons_pattern": (
-        [43, 115, 116, 189, 194, 258, 261, 329],
-        [108, 108, 108, 108, 108, 108, 108, 108],
-    ),
-    "tuple_cons_pattern": (
-        [43, 115, 116, 189, 194, 258, 261, 329],
-        [109, 109, 109, 109, 109, 109, 109, 109],
-    ),
-    "empty_list_pattern": (
-        [43, 115, 116, 189, 194, 258, 261, 329],
-        [110, 110, 110, 110, 110, 110, 110, 110],
-    ),
-    "empty_tuple_pattern": (
-        [43, 115, 116, 189, 194, 258, 261, 329],
-        [111, 111, 111, 111, 111, 111, 111, 111],
-    ),
-    "_pattern_name": (
-        [43, 115, 116, 189, 192, 194, 258, 261, 329],
-        [116, 116, 116, 116, 116, 116, 116, 116, 116],
-    ),
-    "number": (
-        [
-            43,
-            102,
-            115,
-            116,
-            140,
-            180,
-            186,
-            189,
-            190,
-            194,
-            230,
-            233,
-            234,
-            235,
-            236,
-            237,
-            238,
-            240,
-            258,
-            261,
-            299,
-            304,
-            329,
-            344,
-        ],
-        [
-            117,
-            117,
-            117,
-            117,
-            117,
-            117,
-            117,
-            117,
-            117,
-            117,
-            117,
-            117,
-            117,
-            117,
-            117,
-            117,
-            117,
-            117,
-            117,
-            117,
-            117,
-            117,
-            117,
-            117,
-        ],
-    ),
-    "concrete_number": (
-        [
-            43,
-            102,
-            115,
-            116,
-            140,
-            180,
-            186,
-            189,
-            190,
-            194,
-            230,
-            233,
-            234,
-            235,
-            236,
-            237,
-            238,
-            240,
-            258,
-            261,
-            299,
-            304,
-            329,
-            344,
-        ],
-        [
-            118,
-            118,
-            118,
-            118,
-            118,
-            118,
-            118,
-            118,
-            118,
-            118,
-            118,
-            118,
-            118,
-            118,
-            118,
-            118,
-            118,
-            118,
-            118,
-            118,
-            118,
-            118,
-            118,
-            118,
-        ],
-    ),
-    "string": (
-        [
-            43,
-            102,
-            115,
-            116,
-            140,
-            180,
-            186,
-            189,
-            190,
-            194,
-            206,
-            230,
-            233,
-            234,
-            235,
-            236,
-            237,
-            238,
-            240,
-            258,
-            261,
-            299,
-            304,
-            329,
-            344,
-        ],
-        [
-            119,
-            119,
-            119,
-            119,
-            119,
-            119,
-            119,
-            119,
-            119,
-            119,
-            263,
-            119,
-            119,
-            119,
-            119,
-            119,
-            119,
-            119,
-            119,
-            119,
-            119,
-            119,
-            119,
-            119,
-            119,
-        ],
-    ),
-    "char": (
-        [
-            43,
-            102,
-            115,
-            116,
-            140,
-            180,
-            186,
-            189,
-            190,
-            194,
-            206,
-            230,
-            233,
-            234,
-            235,
-            236,
-            237,
-            238,
-            240,
-            258,
-            261,
-            299,
-            304,
-            329,
-            344,
-        ],
-        [
-            120,
-            120,
-            120,
-            120,
-            120,
-            120,
-            120,
-            120,
-            120,
-            120,
-            264,
-            120,
-            120,
-            120,
-            120,
-            120,
-            120,
-            120,
-            120,
-            120,
-            120,
-            120,
-            120,
-            120,
-            120,
-        ],
-    ),
-    "date": (
-        [
-            43,
-            102,
-            115,
-            116,
-            140,
-            180,
-            186,
-            189,
-            190,
-            194,
-            230,
-            233,
-            234,
-            235,
-            236,
-            237,
-            238,
-            240,
-            258,
-            261,
-            299,
-            304,
-            329,
-            344,
-        ],
-        [
-            121,
-            121,
-            121,
-            121,
-            121,
-            121,
-            121,
-            121,
-            121,
-            121,
-            121,
-            121,
-            121,
-            121,
-            121,
-            121,
-            121,
-            121,
-            121,
-            121,
-            121,
-            121,
-            121,
-            121,
-        ],
-    ),
-    "datetime": (
-        [
-            43,
-            102,
-            115,
-            116,
-            140,
-            180,
-            186,
-            189,
-            190,
-            194,
-            230,
-            233,
-            234,
-            235,
-            236,
-            237,
-            238,
-            240,
-            258,
-            261,
-            299,
-            304,
-            329,
-            344,
-        ],
-        [
-            122,
-            122,
-            122,
-            122,
-            122,
-            122,
-            122,
-            122,
-            122,
-            122,
-            122,
-            122,
-            122,
-            122,
-            122,
-            122,
-            122,
-            122,
-            122,
-            122,
-            122,
-            122,
-            122,
-            122,
-        ],
-    ),
-    "date_interval": (
-        [
-            43,
-            102,
-            115,
-            116,
-            140,
-            180,
-            186,
-            189,
-            190,
-            194,
-            230,
-            233,
-            234,
-            235,
-            236,
-            237,
-            238,
-            240,
-            258,
-            261,
-            299,
-            304,
-            329,
-            344,
-        ],
-        [
-            123,
-            123,
-            123,
-            123,
-            123,
-            123,
-            123,
-            123,
-            123,
-            123,
-            123,
-            123,
-            123,
-            123,
-            123,
-            123,
-            123,
-            123,
-            123,
-            123,
-            123,
-            123,
-            123,
-            123,
-        ],
-    ),
-    "datetime_interval": (
-        [
-            43,
-            102,
-            115,
-            116,
-            140,
-            180,
-            186,
-            189,
-            190,
-            194,
-            230,
-            233,
-            234,
-            235,
-            236,
-            237,
-            238,
-            240,
-            258,
-            261,
-            299,
-            304,
-            329,
-            344,
-        ],
-        [
-            124,
-            124,
-            124,
-            124,
-            124,
-            124,
-            124,
-            124,
-            124,
-            124,
-            124,
-            124,
-            124,
-            124,
-            124,
-            124,
-            124,
-            124,
-            124,
-            124,
-            124,
-            124,
-            124,
-            124,
-        ],
-    ),
-    "_data_conses": ([69, 268], [142, 312]),
-    "_maybe_padding": (
-        [69, 93, 94, 159, 225, 226, 227, 268],
-        [143, 162, 165, 223, 281, 282, 284, 143],
-    ),
-    "_cons_args": ([71, 215, 216], [146, 271, 272]),
-    "_app_args_non_empty": ([90], [160]),
-    "_type_scheme_generics": ([97, 228], [167, 285]),
-    "expr": (
-        [
-            102,
-            140,
-            180,
-            186,
-            190,
-            230,
-            233,
-            234,
-            235,
-            236,
-            237,
-            238,
-            240,
-            299,
-            304,
-            344,
-        ],
-        [
-            170,
-            212,
-            242,
-            243,
-            252,
-            286,
-            242,
-            242,
-            242,
-            242,
-            242,
-            242,
-            296,
-            326,
-            328,
-            350,
-        ],
-    ),
-    "expr_term0": (
-        [
-            102,
-            140,
-            180,
-            186,
-            190,
-            230,
-            233,
-            234,
-            235,
-            236,
-            237,
-            238,
-            240,
-            299,
-            304,
-            344,
-        ],
-        [
-            171,
-            171,
-            171,
-            171,
-            171,
-            287,
-            171,
-            171,
-            171,
-            171,
-            171,
-            171,
-            171,
-            171,
-            171,
-            171,
-        ],
-    ),
-    "expr_term1": (
-        [
-            102,
-            140,
-            180,
-            186,
-            190,
-            230,
-            233,
-            234,
-            235,
-            236,
-            237,
-            238,
-            240,
-            299,
-            304,
-            344,
-        ],
-        [
-            172,
-            172,
-            172,
-            172,
-            172,
-            172,
-            290,
-            172,
-            172,
-            172,
-            172,
-            172,
-            172,
-            172,
-            172,
-            172,
-        ],
-    ),
-    "expr_term2": (
-        [
-            102,
-            140,
-            180,
-            186,
-            190,
-            230,
-            233,
-            234,
-            235,
-            236,
-            237,
-            238,
-            240,
-            299,
-            304,
-            344,
-        ],
-        [
-            173,
-            173,
-            173,
-            173,
-            173,
-            173,
-            173,
-            173,
-            173,
-            173,
-            173,
-            173,
-            173,
-            173,
-            173,
-            173,
-        ],
-    ),
-    "expr_term6": (
-        [
-            102,
-            140,
-            180,
-            186,
-            190,
-            230,
-            233,
-            234,
-            235,
-            236,
-            237,
-            238,
-            240,
-            299,
-            304,
-            344,
-        ],
-        [
-            174,
-            174,
-            174,
-            174,
-            174,
-            174,
-            174,
-            291,
-            174,
-            174,
-            174,
-            174,
-            174,
-            174,
-            174,
-            174,
-        ],
-    ),
-    "expr_term7": (
-        [
-            102,
-            140,
-            180,
-            186,
-            190,
-            230,
-            233,
-            234,
-            235,
-            236,
-            237,
-            238,
-            240,
-            299,
-            304,
-            344,
-        ],
-        [
-            175,
-            175,
-            175,
-            175,
-            175,
-            175,
-            175,
-            175,
-            292,
-            175,
-            175,
-            175,
-            175,
-            175,
-            175,
-            175,
-        ],
-    ),
-    "expr_term9": (
-        [
-            102,
-            140,
-            180,
-            186,
-            190,
-            230,
-            233,
-            234,
-            235,
-            236,
-            237,
-            238,
-            240,
-            299,
-            304,
-            344,
-        ],
-        [
-            176,
-            176,
-            176,
-            176,
-            176,
-            176,
-            176,
-            176,
-            176,
-            293,
-            294,
-            176,
-            176,
-            176,
-            176,
-            176,
-        ],
-    ),
-    "expr_factor": (
-        [
-            102,
-            140,
-            180,
-            186,
-            190,
-            230,
-            233,
-            234,
-            235,
-            236,
-            237,
-            238,
-            240,
-            299,
-            304,
-            344,
-        ],
-        [
-            177,
-            177,
-            241,
-            177,
-            177,
-            177,
-            177,
-            177,
-            177,
-            177,
-            177,
-            295,
-            177,
-            177,
-            177,
-            177,
-        ],
-    ),
-    "identifier": (
-        [
-            102,
-            140,
-            180,
-            186,
-            190,
-            206,
-            230,
-            233,
-            234,
-            235,
-            236,
-            237,
-            238,
-            240,
-            299,
-            304,
-            344,
-        ],
-        [
-            179,
-            179,
-            179,
-            179,
-            179,
-            265,
-            179,
-            179,
-            179,
-            179,
-            179,
-            179,
-            179,
-            179,
-            179,
-            179,
-            179,
-        ],
-    ),
-    "enclosed_expr": (
-        [
-            102,
-            140,
-            177,
-            180,
-            186,
-            190,
-            230,
-            233,
-            234,
-            235,
-            236,
-            237,
-            238,
-            240,
-            241,
-            295,
-            299,
-            304,
-            344,
-        ],
-        [
-            180,
-            180,
-            239,
-            180,
-            180,
-            180,
-            180,
-            180,
-            180,
-            180,
-            180,
-            180,
-            180,
-            180,
-            239,
-            239,
-            180,
-            180,
-            180,
-        ],
-    ),
-    "letexpr": (
-        [
-            102,
-            140,
-            180,
-            186,
-            190,
-            230,
-            233,
-            234,
-            235,
-            236,
-            237,
-            238,
-            240,
-            299,
-            304,
-            344,
-        ],
-        [
-            181,
-            181,
-            181,
-            181,
-            181,
-            181,
-            181,
-            181,
-            181,
-            181,
-            181,
-            181,
-            181,
-            181,
-            181,
-            181,
-        ],
-    ),
-    "where_expr": (
-        [
-            102,
-            140,
-            180,
-            186,
-            190,
-            230,
-            233,
-            234,
-            235,
-            236,
-            237,
-            238,
-            240,
-            299,
-            304,
-            344,
-        ],
-        [
-            182,
-            182,
-            182,
-            182,
-            182,
-            182,
-            182,
-            182,
-            182,
-            182,
-            182,
-            182,
-            182,
-            182,
-            182,
-            182,
-        ],
-    ),
-    "lambda_expr": (
-        [
-            102,
-            140,
-            180,
-            186,
-            190,
-            230,
-            233,
-            234,
-            235,
-            236,
-            237,
-            238,
-            240,
-            299,
-            304,
-            344,
-        ],
-        [
-            183,
-            183,
-            183,
-            183,
-            183,
-            183,
-            183,
-            183,
-            183,
-            183,
-            183,
-            183,
-            183,
-            183,
-            183,
-            183,
-        ],
-    ),
-    "simple_list_expr": (
-        [
-            102,
-            140,
-            180,
-            186,
-            190,
-            230,
-            233,
-            234,
-            235,
-            236,
-            237,
-            238,
-            240,
-            299,
-            304,
-            344,
-        ],
-        [
-            184,
-            184,
-            184,
-            184,
-            184,
-            184,
-            184,
-            184,
-            184,
-            184,
-            184,
-            184,
-            184,
-            184,
-            184,
-            184,
-        ],
-    ),
-    "simple_tuple_expr": (
-        [
-            102,
-            140,
-            180,
-            186,
-            190,
-            230,
-            233,
-            234,
-            235,
-            236,
-            237,
-            238,
-            240,
-            299,
-            304,
-            344,
-        ],
-        [
-            185,
-            185,
-            185,
-            185,
-            185,
-            185,
-            185,
-            185,
-            185,
-            185,
-            185,
-            185,
-            185,
-            185,
-            185,
-            185,
-        ],
-    ),
-    "patterns_comma_sep": ([115], [200]),
-    "_cons_params": ([139, 267], [210, 311]),
-    "local_definitions": ([152, 156, 247], [219, 222, 303]),
-    "_type_expr_list": ([162], [225]),
-    "infixl_operator_0": (
-        [170, 212, 242, 243, 252, 286, 296, 326, 328, 350],
-        [230, 230, 230, 230, 230, 230, 230, 230, 230, 230],
-    ),
-    "_list_items": ([186, 190], [244, 251]),
-    "patterns": ([189, 261], [248, 310]),
-    "_patterns_comma": ([196, 198], [257, 260]),
-    "_local_definition_set": ([220, 315], [273, 338]),
-    "_app_args": ([224, 316], [279, 339]),
-    "_list_items_cont": ([243, 252, 326], [298, 298, 343]),
-    "_derivations_list": ([269], [313]),
-    "equations": ([288, 289], [321, 325]),
-    "_patterns_comma_trail": ([308, 309, 345, 346], [330, 332, 351, 352]),
-    "_derivations_list_trail": ([314, 347], [335, 353]),
-    "_equation_set": ([322, 348], [340, 354]),
-    "st_expr": ([344], [349]),
-}
-
-_lr_goto = {}
-for _k, _v in _lr_goto_items.items():
-    for _x, _y in zip(_v[0], _v[1]):
-        if not _x in _lr_goto:
-            _lr_goto[_x] = {}
-        _lr_goto[_x][_k] = _y
-del _lr_goto_items
-_lr_productions = [
-    ("S' -> program", "S'", 1, None, None, None),
-    (
-        "expr_factor -> expr_factor SPACE expr_factor",
-        "expr_factor",
-        3,
-        "p_application",
-        "__init__.py",
-        531,
-    ),
-    (
-        "expr_term9 -> expr_factor infixr_operator_9 expr_term9",
-        "expr_term9",
-        3,
-        "p_expressions_precedence_rules",
-        "__init__.py",
-        538,
-    ),
-    (
-        "expr_term9 -> expr_factor",
-        "expr_term9",
-        1,
-        "p_expressions_precedence_rules",
-        "__init__.py",
-        539,
-    ),
-    (
-        "expr_term7 -> expr_term7 infixl_operator_7 expr_term9",
-        "expr_term7",
-        3,
-        "p_expressions_precedence_rules",
-        "__init__.py",
-        541,
-    ),
-    (
-        "expr_term7 -> expr_term9",
-        "expr_term7",
-        1,
-        "p_expressions_precedence_rules",
-        "__init__.py",
-        542,
-    ),
-    (
-        "expr_term6 -> expr_term6 infixl_operator_6 expr_term7",
-        "expr_term6",
-        3,
-        "p_expressions_precedence_rules",
-        "__init__.py",
-        544,
-    ),
-    (
-        "expr_term6 -> expr_term7",
-        "expr_term6",
-        1,
-        "p_expressions_precedence_rules",
-        "__init__.py",
-        545,
-    ),
-    (
-        "expr_term2 -> expr_term2 infixl_operator_2 expr_term6",
-        "expr_term2",
-        3,
-        "p_expressions_precedence_rules",
-        "__init__.py",
-        547,
-    ),
-    (
-        "expr_term2 -> expr_term6",
-        "expr_term2",
-        1,
-        "p_expressions_precedence_rules",
-        "__init__.py",
-        548,
-    ),
-    (
-        "expr_term1 -> expr_term2 infixr_operator_2 expr_term1",
-        "expr_term1",
-        3,
-        "p_expressions_precedence_rules",
-        "__init__.py",
-        550,
-    ),
-    (
-        "expr_term1 -> expr_term2",
-        "expr_term1",
-        1,
-        "p_expressions_precedence_rules",
-        "__init__.py",
-        551,
-    ),
-    (
-        "expr_term0 -> expr infixl_operator_0 expr_term0",
-        "expr_term0",
-        3,
-        "p_expressions_precedence_rules",
-        "__init__.py",
-        553,
-    ),
-    (
-        "expr_term0 -> expr_term1",
-        "expr_term0",
-        1,
-        "p_expressions_precedence_rules",
-        "__init__.py",
-        554,
-    ),
-    ("st_expr -> expr", "st_expr", 1, "p_standalone_definitions", "__init__.py", 567),
-    ("expr -> expr_term0", "expr", 1, "p_standalone_definitions", "__init__.py", 569),
-    (
-        "expr_factor -> literal",
-        "expr_factor",
-        1,
-        "p_standalone_definitions",
-        "__init__.py",
-        571,
-    ),
-    (
-        "expr_factor -> identifier",
-        "expr_factor",
-        1,
-        "p_standalone_definitions",
-        "__init__.py",
-        572,
-    ),
-    (
-        "expr_factor -> enclosed_expr",
-        "expr_factor",
-        1,
-        "p_standalone_definitions",
-        "__init__.py",
-        573,
-    ),
-    (
-        "expr_factor -> letexpr",
-        "expr_factor",
-        1,
-        "p_standalone_definitions",
-        "__init__.py",
-        574,
-    ),
-    (
-        "expr_factor -> where_expr",
-        "expr_factor",
-        1,
-        "p_standalone_definitions",
-        "__init__.py",
-        575,
-    ),
-    (
-        "expr_factor -> lambda_expr",
-        "expr_factor",
-        1,
-        "p_standalone_definitions",
-        "__init__.py",
-        576,
-    ),
-    (
-        "expr_factor -> simple_list_expr",
-        "expr_factor",
-        1,
-        "p_standalone_definitions",
-        "__init__.py",
-        577,
-    ),
-    (
-        "expr_factor -> simple_tuple_expr",
-        "expr_factor",
-        1,
-        "p_standalone_definitions",
-        "__init__.py",
-        578,
-    ),
-    (
-        "st_type_expr -> type_expr",
-        "st_type_expr",
-        1,
-        "p_standalone_definitions",
-        "__init__.py",
-        580,
-    ),
-    (
-        "st_type_expr -> constrained_type_expr",
-        "st_type_expr",
-        1,
-        "p_standalone_definitions",
-        "__init__.py",
-        581,
-    ),
-    ("literal -> number", "literal", 1, "p_literals", "__init__.py", 589),
-    ("literal -> concrete_number", "literal", 1, "p_literals", "__init__.py", 590),
-    ("literal -> string", "literal", 1, "p_literals", "__init__.py", 591),
-    ("literal -> char", "literal", 1, "p_literals", "__init__.py", 592),
-    ("literal -> date", "literal", 1, "p_literals", "__init__.py", 593),
-    ("literal -> datetime", "literal", 1, "p_literals", "__init__.py", 594),
-    ("literal -> date_interval", "literal", 1, "p_literals", "__init__.py", 595),
-    ("literal -> datetime_interval", "literal", 1, "p_literals", "__init__.py", 596),
-    (
-        "simple_tuple_expr -> LPAREN _list_items RPAREN",
-        "simple_tuple_expr",
-        3,
-        "p_tuple_expr",
-        "__init__.py",
-        602,
-    ),
-    (
-        "simple_list_expr -> LBRACKET _list_items RBRACKET",
-        "simple_list_expr",
-        3,
-        "p_list_expr",
-        "__init__.py",
-        609,
-    ),
-    (
-        "_list_items -> expr _list_items_cont",
-        "_list_items",
-        2,
-        "p_list_items",
-        "__init__.py",
-        616,
-    ),
-    (
-        "_list_items_cont -> COMMA expr _list_items_cont",
-        "_list_items_cont",
-        3,
-        "p_list_items",
-        "__init__.py",
-        617,
-    ),
-    (
-        "_list_items -> empty",
-        "_list_items",
-        1,
-        "p_list_items_empty",
-        "__init__.py",
-        623,
-    ),
-    (
-        "_list_items_cont -> empty",
-        "_list_items_cont",
-        1,
-        "p_list_items_empty",
-        "__init__.py",
-        624,
-    ),
-    ("date -> DATE", "date", 1, "p_date", "__init__.py", 630),
-    ("datetime -> DATETIME", "datetime", 1, "p_datetime", "__init__.py", 636),
-    (
-        "date_interval -> DATE_INTERVAL",
-        "date_interval",
-        1,
-        "p_date_interval",
-        "__init__.py",
-        642,
-    ),
-    (
-        "datetime_interval -> DATETIME_INTERVAL",
-        "datetime_interval",
-        1,
-        "p_datetime_interval",
-        "__init__.py",
-        648,
-    ),
-    ("char -> CHAR", "char", 1, "p_char", "__init__.py", 654),
-    ("string -> STRING", "string", 1, "p_string", "__init__.py", 659),
-    ("identifier -> _identifier", "identifier", 1, "p_variable", "__init__.py", 664),
-    (
-        "_identifier -> UNDER_IDENTIFIER",
-        "_identifier",
-        1,
-        "p_bare_identifier",
-        "__init__.py",
-        671,
-    ),
-    (
-        "_identifier -> UPPER_IDENTIFIER",
-        "_identifier",
-        1,
-        "p_bare_identifier",
-        "__init__.py",
-        672,
-    ),
-    (
-        "_identifier -> LOWER_IDENTIFIER",
-        "_identifier",
-        1,
-        "p_bare_identifier",
-        "__init__.py",
-        673,
-    ),
-    (
-        "enclosed_expr -> LPAREN expr RPAREN",
-        "enclosed_expr",
-        3,
-        "p_paren_expr",
-        "__init__.py",
-        680,
-    ),
-    (
-        "expr_factor -> enclosed_expr expr_factor",
-        "expr_factor",
-        2,
-        "p_application_after_paren",
-        "__init__.py",
-        685,
-    ),
-    (
-        "expr_factor -> expr_factor enclosed_expr",
-        "expr_factor",
-        2,
-        "p_application_after_paren",
-        "__init__.py",
-        686,
-    ),
-    (
-        "enclosed_expr -> _enclosed_operator",
-        "enclosed_expr",
-        1,
-        "p_operators_as_expressios",
-        "__init__.py",
-        692,
-    ),
-    (
-        "_enclosed_operator -> LPAREN _st_operator RPAREN",
-        "_enclosed_operator",
-        3,
-        "p_enclosed_operator",
-        "__init__.py",
-        698,
-    ),
-    (
-        "infixr_operator_9 -> DOT_OPERATOR",
-        "infixr_operator_9",
-        1,
-        "p_operator",
-        "__init__.py",
-        708,
-    ),
-    (
-        "infixl_operator_7 -> STAR",
-        "infixl_operator_7",
-        1,
-        "p_operator",
-        "__init__.py",
-        710,
-    ),
-    (
-        "infixl_operator_7 -> SLASH",
-        "infixl_operator_7",
-        1,
-        "p_operator",
-        "__init__.py",
-        711,
-    ),
-    (
-        "infixl_operator_7 -> DOUBLESLASH",
-        "infixl_operator_7",
-        1,
-        "p_operator",
-        "__init__.py",
-        712,
-    ),
-    (
-        "infixl_operator_7 -> PERCENT",
-        "infixl_operator_7",
-        1,
-        "p_operator",
-        "__init__.py",
-        713,
-    ),
-    (
-        "infixl_operator_6 -> PLUS",
-        "infixl_operator_6",
-        1,
-        "p_operator",
-        "__init__.py",
-        715,
-    ),
-    (
-        "infixl_operator_6 -> MINUS",
-        "infixl_operator_6",
-        1,
-        "p_operator",
-        "__init__.py",
-        716,
-    ),
-    (
-        "infixr_operator_2 -> COLON",
-        "infixr_operator_2",
-        1,
-        "p_operator",
-        "__init__.py",
-        719,
-    ),
-    (
-        "infixl_operator_2 -> OPERATOR",
-        "infixl_operator_2",
-        1,
-        "p_operator",
-        "__init__.py",
-        721,
-    ),
-    (
-        "infixl_operator_2 -> ARROW",
-        "infixl_operator_2",
-        1,
-        "p_operator",
-        "__init__.py",
-        722,
-    ),
-    (
-        "infixl_operator_2 -> ATSYM",
-        "infixl_operator_2",
-        1,
-        "p_operator",
-        "__init__.py",
-        723,
-    ),
-    (
-        "infixl_operator_0 -> TICK_OPERATOR",
-        "infixl_operator_0",
-        1,
-        "p_operator",
-        "__init__.py",
-        725,
-    ),
-    (
-        "_st_operator -> infixl_operator_2",
-        "_st_operator",
-        1,
-        "p_operator",
-        "__init__.py",
-        727,
-    ),
-    (
-        "_st_operator -> infixr_operator_2",
-        "_st_operator",
-        1,
-        "p_operator",
-        "__init__.py",
-        728,
-    ),
-    (
-        "_st_operator -> infixl_operator_6",
-        "_st_operator",
-        1,
-        "p_operator",
-        "__init__.py",
-        729,
-    ),
-    (
-        "_st_operator -> infixl_operator_7",
-        "_st_operator",
-        1,
-        "p_operator",
-        "__init__.py",
-        730,
-    ),
-    (
-        "_st_operator -> infixr_operator_9",
-        "_st_operator",
-        1,
-        "p_operator",
-        "__init__.py",
-        731,
-    ),
-    ("_st_operator -> COMMA", "_st_operator", 1, "p_operator", "__init__.py", 732),
-    ("number -> BASE10_INTEGER", "number", 1, "p_integer", "__init__.py", 739),
-    ("number -> BASE16_INTEGER", "number", 1, "p_integer", "__init__.py", 740),
-    ("number -> BASE8_INTEGER", "number", 1, "p_integer", "__init__.py", 741),
-    ("number -> BASE2_INTEGER", "number", 1, "p_integer", "__init__.py", 742),
-    ("number -> FLOAT", "number", 1, "p_float", "__init__.py", 771),
-    (
-        "concrete_number -> number ANNOTATION string",
-        "concrete_number",
-        3,
-        "p_concrete_number",
-        "__init__.py",
-        776,
-    ),
-    (
-        "concrete_number -> number ANNOTATION char",
-        "concrete_number",
-        3,
-        "p_concrete_number",
-        "__init__.py",
-        777,
-    ),
-    (
-        "concrete_number -> number ANNOTATION identifier",
-        "concrete_number",
-        3,
-        "p_concrete_number",
-        "__init__.py",
-        778,
-    ),
-    ("empty -> <empty>", "empty", 0, "p_empty", "__init__.py", 787),
-    (
-        "lambda_expr -> BACKSLASH patterns ARROW expr",
-        "lambda_expr",
-        4,
-        "p_lambda_definition",
-        "__init__.py",
-        792,
-    ),
-    (
-        "pattern -> possibly_named_pattern",
-        "pattern",
-        1,
-        "p_pattern",
-        "__init__.py",
-        801,
-    ),
-    ("simple_pattern -> literal", "simple_pattern", 1, "p_pattern", "__init__.py", 803),
-    (
-        "simple_pattern -> cons_pattern",
-        "simple_pattern",
-        1,
-        "p_pattern",
-        "__init__.py",
-        804,
-    ),
-    (
-        "simple_pattern -> list_cons_pattern",
-        "simple_pattern",
-        1,
-        "p_pattern",
-        "__init__.py",
-        805,
-    ),
-    (
-        "simple_pattern -> tuple_cons_pattern",
-        "simple_pattern",
-        1,
-        "p_pattern",
-        "__init__.py",
-        806,
-    ),
-    (
-        "simple_pattern -> empty_list_pattern",
-        "simple_pattern",
-        1,
-        "p_pattern",
-        "__init__.py",
-        807,
-    ),
-    (
-        "simple_pattern -> empty_tuple_pattern",
-        "simple_pattern",
-        1,
-        "p_pattern",
-        "__init__.py",
-        808,
-    ),
-    (
-        "simple_pattern -> LOWER_IDENTIFIER",
-        "simple_pattern",
-        1,
-        "p_var_pattern",
-        "__init__.py",
-        814,
-    ),
-    (
-        "simple_pattern -> UNDER_IDENTIFIER",
-        "simple_pattern",
-        1,
-        "p_var_pattern",
-        "__init__.py",
-        815,
-    ),
-    (
-        "possibly_named_pattern -> _pattern_name simple_pattern",
-        "possibly_named_pattern",
-        2,
-        "p_possibly_named_pattern",
-        "__init__.py",
-        821,
-    ),
-    (
-        "_pattern_name -> LOWER_IDENTIFIER ATSYM",
-        "_pattern_name",
-        2,
-        "p_pattern_name",
-        "__init__.py",
-        832,
-    ),
-    (
-        "_pattern_name -> empty",
-        "_pattern_name",
-        1,
-        "p_no_pattern_name",
-        "__init__.py",
-        838,
-    ),
-    (
-        "simple_pattern -> UPPER_IDENTIFIER",
-        "simple_pattern",
-        1,
-        "p_simplecons_pattern",
-        "__init__.py",
-        844,
-    ),
-    (
-        "list_cons_pattern -> pattern COLON pattern",
-        "list_cons_pattern",
-        3,
-        "p_list_cons_for_param",
-        "__init__.py",
-        850,
-    ),
-    (
-        "list_cons_pattern -> simple_pattern COLON simple_pattern",
-        "list_cons_pattern",
-        3,
-        "p_list_cons_for_param",
-        "__init__.py",
-        851,
-    ),
-    (
-        "cons_pattern -> LPAREN _identifier SPACE patterns RPAREN",
-        "cons_pattern",
-        5,
-        "p_param_pattern",
-        "__init__.py",
-        857,
-    ),
-    (
-        "simple_pattern -> LPAREN pattern RPAREN",
-        "simple_pattern",
-        3,
-        "p_pattern_trivially_enclosed",
-        "__init__.py",
-        865,
-    ),
-    (
-        "simple_pattern -> LPAREN simple_pattern RPAREN",
-        "simple_pattern",
-        3,
-        "p_pattern_trivially_enclosed",
-        "__init__.py",
-        866,
-    ),
-    (
-        "empty_list_pattern -> LBRACKET RBRACKET",
-        "empty_list_pattern",
-        2,
-        "p_empty_list_as_pattern",
-        "__init__.py",
-        872,
-    ),
-    (
-        "empty_tuple_pattern -> LPAREN RPAREN",
-        "empty_tuple_pattern",
-        2,
-        "p_unit_value_as_pattern",
-        "__init__.py",
-        879,
-    ),
-    (
-        "tuple_cons_pattern -> LPAREN patterns_comma_sep RPAREN",
-        "tuple_cons_pattern",
-        3,
-        "p_tuple_cons_pattern",
-        "__init__.py",
-        885,
-    ),
-    ("patterns -> pattern _patterns", "patterns", 2, "p_patterns", "__init__.py", 893),
-    (
-        "patterns -> simple_pattern _patterns",
-        "patterns",
-        2,
-        "p_patterns",
-        "__init__.py",
-        894,
-    ),
-    (
-        "patterns_comma_sep -> pattern _patterns_comma",
-        "patterns_comma_sep",
-        2,
-        "p_patterns",
-        "__init__.py",
-        895,
-    ),
-    (
-        "patterns_comma_sep -> simple_pattern _patterns_comma",
-        "patterns_comma_sep",
-        2,
-        "p_patterns",
-        "__init__.py",
-        896,
-    ),
-    (
-        "_patterns -> SPACE pattern _patterns",
-        "_patterns",
-        3,
-        "p_patterns",
-        "__init__.py",
-        897,
-    ),
-    (
-        "_patterns -> SPACE simple_pattern _patterns",
-        "_patterns",
-        3,
-        "p_patterns",
-        "__init__.py",
-        898,
-    ),
-    (
-        "_patterns_comma -> COMMA pattern _patterns_comma_trail",
-        "_patterns_comma",
-        3,
-        "p_patterns",
-        "__init__.py",
-        899,
-    ),
-    (
-        "_patterns_comma -> COMMA simple_pattern _patterns_comma_trail",
-        "_patterns_comma",
-        3,
-        "p_patterns",
-        "__init__.py",
-        900,
-    ),
-    (
-        "_patterns_comma_trail -> COMMA pattern _patterns_comma_trail",
-        "_patterns_comma_trail",
-        3,
-        "p_patterns",
-        "__init__.py",
-        901,
-    ),
-    (
-        "_patterns_comma_trail -> COMMA simple_pattern _patterns_comma_trail",
-        "_patterns_comma_trail",
-        3,
-        "p_patterns",
-        "__init__.py",
-        902,
-    ),
-    ("_patterns -> empty", "_patterns", 1, "p_patterns_empty", "__init__.py", 908),
-    (
-        "_patterns_comma_trail -> empty",
-        "_patterns_comma_trail",
-        1,
-        "p_patterns_empty",
-        "__init__.py",
-        909,
-    ),
-    (
-        "equation -> _identifier _patterns EQ expr",
-        "equation",
-        4,
-        "p_equation",
-        "__init__.py",
-        915,
-    ),
-    (
-        "equation -> _enclosed_operator _patterns EQ expr",
-        "equation",
-        4,
-        "p_equation",
-        "__init__.py",
-        916,
-    ),
-    (
-        "equations -> equation _equation_set",
-        "equations",
-        2,
-        "p_equation_set",
-        "__init__.py",
-        926,
-    ),
-    (
-        "_equation_set -> PADDING equation _equation_set",
-        "_equation_set",
-        3,
-        "p_equation_set2",
-        "__init__.py",
-        934,
-    ),
-    (
-        "_equation_set -> empty",
-        "_equation_set",
-        1,
-        "p_equation_set3",
-        "__init__.py",
-        941,
-    ),
-    (
-        "letexpr -> KEYWORD_LET SPACE local_definitions KEYWORD_IN SPACE st_expr",
-        "letexpr",
-        6,
-        "p_let_expr",
-        "__init__.py",
-        951,
-    ),
-    (
-        "where_expr -> expr KEYWORD_WHERE SPACE equations",
-        "where_expr",
-        4,
-        "p_where_expr",
-        "__init__.py",
-        959,
-    ),
-    (
-        "where_expr -> expr KEYWORD_WHERE PADDING equations",
-        "where_expr",
-        4,
-        "p_where_expr",
-        "__init__.py",
-        960,
-    ),
-    (
-        "type_expr -> type_scheme type_function_expr",
-        "type_expr",
-        2,
-        "p_type_expr",
-        "__init__.py",
-        970,
-    ),
-    (
-        "type_expr -> type_scheme type_term",
-        "type_expr",
-        2,
-        "p_type_expr",
-        "__init__.py",
-        971,
-    ),
-    (
-        "type_scheme -> empty",
-        "type_scheme",
-        1,
-        "p_type_scheme_empty",
-        "__init__.py",
-        980,
-    ),
-    (
-        "type_scheme -> KEYWORD_FORALL SPACE _type_scheme_generics",
-        "type_scheme",
-        3,
-        "p_type_scheme",
-        "__init__.py",
-        984,
-    ),
-    (
-        "_type_scheme_generics -> _identifier SPACE _type_scheme_generics",
-        "_type_scheme_generics",
-        3,
-        "p_type_scheme_generics",
-        "__init__.py",
-        991,
-    ),
-    (
-        "_type_scheme_generics -> _identifier DOT_OPERATOR",
-        "_type_scheme_generics",
-        2,
-        "p_last_type_scheme_generic",
-        "__init__.py",
-        996,
-    ),
-    (
-        "type_function_expr -> type_term ARROW _maybe_padding type_function_expr",
-        "type_function_expr",
-        4,
-        "p_type_function_expr",
-        "__init__.py",
-        1001,
-    ),
-    (
-        "type_function_expr -> type_term",
-        "type_function_expr",
-        1,
-        "p_type_function_expr",
-        "__init__.py",
-        1002,
-    ),
-    (
-        "type_term -> type_app_expression",
-        "type_term",
-        1,
-        "p_type_term",
-        "__init__.py",
-        1012,
-    ),
-    ("type_term -> type_factor", "type_term", 1, "p_type_term", "__init__.py", 1013),
-    (
-        "type_app_expression -> type_factor _app_args_non_empty",
-        "type_app_expression",
-        2,
-        "p_type_application_expr",
-        "__init__.py",
-        1018,
-    ),
-    (
-        "_app_args -> SPACE type_factor _app_args",
-        "_app_args",
-        3,
-        "p_type_application_args",
-        "__init__.py",
-        1030,
-    ),
-    (
-        "_app_args_non_empty -> SPACE type_factor _app_args",
-        "_app_args_non_empty",
-        3,
-        "p_type_application_args",
-        "__init__.py",
-        1031,
-    ),
-    (
-        "_app_args -> empty",
-        "_app_args",
-        1,
-        "p_type_application_args_empty",
-        "__init__.py",
-        1037,
-    ),
-    (
-        "type_variable -> LOWER_IDENTIFIER",
-        "type_variable",
-        1,
-        "p_type_variable",
-        "__init__.py",
-        1042,
-    ),
-    (
-        "type_cons -> UPPER_IDENTIFIER",
-        "type_cons",
-        1,
-        "p_type_cons",
-        "__init__.py",
-        1047,
-    ),
-    (
-        "type_factor -> type_variable",
-        "type_factor",
-        1,
-        "p_type_factor_identifier",
-        "__init__.py",
-        1052,
-    ),
-    (
-        "type_factor -> type_cons",
-        "type_factor",
-        1,
-        "p_type_factor_identifier",
-        "__init__.py",
-        1053,
-    ),
-    (
-        "type_factor -> LPAREN _maybe_padding _type_expr_list _maybe_padding RPAREN",
-        "type_factor",
-        5,
-        "p_type_factor_tuple",
-        "__init__.py",
-        1060,
-    ),
-    (
-        "type_factor -> LPAREN RPAREN",
-        "type_factor",
-        2,
-        "p_type_factor_unit_type",
-        "__init__.py",
-        1066,
-    ),
-    (
-        "_type_expr_list -> type_expr COMMA _type_expr_list_trail",
-        "_type_expr_list",
-        3,
-        "p_type_expr_list",
-        "__init__.py",
-        1071,
-    ),
-    (
-        "_type_expr_list_trail -> type_expr COMMA _type_expr_list_trail",
-        "_type_expr_list_trail",
-        3,
-        "p_type_expr_list",
-        "__init__.py",
-        1072,
-    ),
-    (
-        "_type_expr_list_trail -> type_expr",
-        "_type_expr_list_trail",
-        1,
-        "p_type_expr_list_last_item",
-        "__init__.py",
-        1078,
-    ),
-    (
-        "type_factor -> LPAREN _maybe_padding type_expr _maybe_padding RPAREN",
-        "type_factor",
-        5,
-        "p_type_factor_paren",
-        "__init__.py",
-        1084,
-    ),
-    (
-        "type_factor -> LBRACKET _maybe_padding type_expr _maybe_padding RBRACKET",
-        "type_factor",
-        5,
-        "p_type_factor_bracket",
-        "__init__.py",
-        1089,
-    ),
-    (
-        "constrained_type_expr -> _constrained_type_expr_bare",
-        "constrained_type_expr",
-        1,
-        "p_constrained_type_expr",
-        "__init__.py",
-        1121,
-    ),
-    (
-        "_constrained_type_expr_bare -> type_constraints FATARROW type_expr",
-        "_constrained_type_expr_bare",
-        3,
-        "p_constrained_type_expr_bare",
-        "__init__.py",
-        1129,
-    ),
-    (
-        "_maybe_constrained_type_expr -> type_expr",
-        "_maybe_constrained_type_expr",
-        1,
-        "p_maybe_constrained_type_expr_no_constraint",
-        "__init__.py",
-        1148,
-    ),
-    (
-        "_maybe_constrained_type_expr -> _constrained_type_expr_bare",
-        "_maybe_constrained_type_expr",
-        1,
-        "p_maybe_constrained_type_expr_constrained",
-        "__init__.py",
-        1154,
-    ),
-    (
-        "instance -> KEYWORD_INSTANCE _maybe_constrained_type_expr KEYWORD_WHERE PADDING local_definitions",
-        "instance",
-        5,
-        "p_instance",
-        "__init__.py",
-        1160,
-    ),
-    (
-        "type_constraints -> _type_expr_list_trail",
-        "type_constraints",
-        1,
-        "p_type_constraint",
-        "__init__.py",
-        1179,
-    ),
-    (
-        "_maybe_padding -> PADDING",
-        "_maybe_padding",
-        1,
-        "p_maybe_padding",
-        "__init__.py",
-        1185,
-    ),
-    (
-        "_maybe_padding -> empty",
-        "_maybe_padding",
-        1,
-        "p_maybe_padding",
-        "__init__.py",
-        1186,
-    ),
-    (
-        "program -> definitions _trailing_new_lines",
-        "program",
-        2,
-        "p_program",
-        "__init__.py",
-        1194,
-    ),
-    (
-        "_trailing_new_lines -> empty",
-        "_trailing_new_lines",
-        1,
-        "p_trailing_new_lines",
-        "__init__.py",
-        1200,
-    ),
-    (
-        "_trailing_new_lines -> NEWLINE _trailing_new_lines",
-        "_trailing_new_lines",
-        2,
-        "p_trailing_new_lines",
-        "__init__.py",
-        1201,
-    ),
-    (
-        "definitions -> definition _definition_set",
-        "definitions",
-        2,
-        "p_definitions",
-        "__init__.py",
-        1206,
-    ),
-    (
-        "_definition_set -> newlines definition _definition_set",
-        "_definition_set",
-        3,
-        "p_definition_set",
-        "__init__.py",
-        1212,
-    ),
-    (
-        "newlines -> NEWLINE _trailing_new_lines",
-        "newlines",
-        2,
-        "p_newlines",
-        "__init__.py",
-        1218,
-    ),
-    (
-        "_definition_set -> empty",
-        "_definition_set",
-        1,
-        "p_definition_set2",
-        "__init__.py",
-        1222,
-    ),
-    (
-        "_definition_set -> newlines",
-        "_definition_set",
-        1,
-        "p_definition_set2",
-        "__init__.py",
-        1223,
-    ),
-    (
-        "definition -> local_definition",
-        "definition",
-        1,
-        "p_definition",
-        "__init__.py",
-        1229,
-    ),
-    (
-        "definition -> datatype_definition",
-        "definition",
-        1,
-        "p_definition",
-        "__init__.py",
-        1230,
-    ),
-    ("definition -> typeclass", "definition", 1, "p_definition", "__init__.py", 1231),
-    ("definition -> instance", "definition", 1, "p_definition", "__init__.py", 1232),
-    (
-        "local_definition -> nametype_decl",
-        "local_definition",
-        1,
-        "p_local_definition",
-        "__init__.py",
-        1239,
-    ),
-    (
-        "local_definition -> valuedef",
-        "local_definition",
-        1,
-        "p_local_definition",
-        "__init__.py",
-        1240,
-    ),
-    (
-        "local_definitions -> local_definition _local_definition_set",
-        "local_definitions",
-        2,
-        "p_local_definitions",
-        "__init__.py",
-        1246,
-    ),
-    (
-        "_local_definition_set -> PADDING definition _local_definition_set",
-        "_local_definition_set",
-        3,
-        "p_local_definition_set",
-        "__init__.py",
-        1252,
-    ),
-    (
-        "_local_definition_set -> empty",
-        "_local_definition_set",
-        1,
-        "p_local_definition_set_empty",
-        "__init__.py",
-        1258,
-    ),
-    (
-        "typeclass -> KEYWORD_CLASS _typeclass_def KEYWORD_WHERE PADDING local_definitions",
-        "typeclass",
-        5,
-        "p_typeclass",
-        "__init__.py",
-        1264,
-    ),
-    (
-        "_typeclass_def -> simple_type_constraint",
-        "_typeclass_def",
-        1,
-        "p_typeclass_def",
-        "__init__.py",
-        1272,
-    ),
-    (
-        "_typeclass_def -> simple_type_constraints FATARROW simple_type_constraint",
-        "_typeclass_def",
-        3,
-        "p_typeclass_def_with_constraints",
-        "__init__.py",
-        1278,
-    ),
-    (
-        "simple_type_constraint -> UPPER_IDENTIFIER SPACE type_variable",
-        "simple_type_constraint",
-        3,
-        "p_type_constraint_def",
-        "__init__.py",
-        1284,
-    ),
-    (
-        "simple_type_constraints -> simple_type_constraint _simple_type_constraints",
-        "simple_type_constraints",
-        2,
-        "p_type_constraints",
-        "__init__.py",
-        1290,
-    ),
-    (
-        "_simple_type_constraints -> COMMA simple_type_constraint _simple_type_constraints",
-        "_simple_type_constraints",
-        3,
-        "p_type_constraints",
-        "__init__.py",
-        1291,
-    ),
-    (
-        "_simple_type_constraints -> empty",
-        "_simple_type_constraints",
-        1,
-        "p_type_constraints_empty",
-        "__init__.py",
-        1297,
-    ),
-    ("valuedef -> equation", "valuedef", 1, "p_valuedef", "__init__.py", 1303),
-    (
-        "nametype_decl -> _identifier DOUBLE_COLON st_type_expr",
-        "nametype_decl",
-        3,
-        "p_nametype_decl",
-        "__init__.py",
-        1309,
-    ),
-    (
-        "nametype_decl -> LPAREN _st_operator RPAREN DOUBLE_COLON st_type_expr",
-        "nametype_decl",
-        5,
-        "p_nametype_decl_operators",
-        "__init__.py",
-        1318,
-    ),
-    (
-        "datatype_definition -> _datatype_lhs EQ _data_rhs",
-        "datatype_definition",
-        3,
-        "p_datatype_definition",
-        "__init__.py",
-        1327,
-    ),
-    (
-        "_datatype_lhs -> KEYWORD_DATA SPACE UPPER_IDENTIFIER _cons_params",
-        "_datatype_lhs",
-        4,
-        "p_datatype_lhs",
-        "__init__.py",
-        1340,
-    ),
-    (
-        "_cons_params -> SPACE LOWER_IDENTIFIER _cons_params",
-        "_cons_params",
-        3,
-        "p_datatype_cons_params",
-        "__init__.py",
-        1349,
-    ),
-    (
-        "_cons_params -> empty",
-        "_cons_params",
-        1,
-        "p_datatype_cons_params_empty",
-        "__init__.py",
-        1355,
-    ),
-    (
-        "_data_rhs -> data_cons _data_conses",
-        "_data_rhs",
-        2,
-        "p_datatype_body",
-        "__init__.py",
-        1361,
-    ),
-    (
-        "_data_conses -> _maybe_padding PIPE data_cons _data_conses",
-        "_data_conses",
-        4,
-        "p_datatype_body",
-        "__init__.py",
-        1362,
-    ),
-    (
-        "_data_conses -> empty",
-        "_data_conses",
-        1,
-        "p_datatype_conses_empty",
-        "__init__.py",
-        1368,
-    ),
-    (
-        "_data_conses -> _maybe_padding KEYWORD_DERIVING LPAREN _derivations_list RPAREN",
-        "_data_conses",
-        5,
-        "p_datatype_derivations",
-        "__init__.py",
-        1373,
-    ),
-    (
-        "_data_conses -> _maybe_padding KEYWORD_DERIVING UPPER_IDENTIFIER",
-        "_data_conses",
-        3,
-        "p_datatype_single_derivation",
-        "__init__.py",
-        1379,
-    ),
-    ("data_cons -> _data_cons", "data_cons", 1, "p_data_cons", "__init__.py", 1384),
-    (
-        "_data_cons -> UPPER_IDENTIFIER _cons_args",
-        "_data_cons",
-        2,
-        "p_bare_data_cons",
-        "__init__.py",
-        1390,
-    ),
-    (
-        "_data_cons -> cons_arg OPERATOR cons_arg _cons_args",
-        "_data_cons",
-        4,
-        "p_bare_data_cons_operator",
-        "__init__.py",
-        1395,
-    ),
-    (
-        "_cons_args -> SPACE cons_arg _cons_args",
-        "_cons_args",
-        3,
-        "p_data_cons_args",
-        "__init__.py",
-        1403,
-    ),
-    (
-        "_cons_args -> empty",
-        "_cons_args",
-        1,
-        "p_data_cons_args_empty",
-        "__init__.py",
-        1409,
-    ),
-    ("cons_arg -> type_variable", "cons_arg", 1, "p_cons_arg", "__init__.py", 1415),
-    ("cons_arg -> type_cons", "cons_arg", 1, "p_cons_arg", "__init__.py", 1416),
-    ("cons_arg -> _cons_arg_factor", "cons_arg", 1, "p_cons_arg", "__init__.py", 1417),
-    (
-        "_cons_arg_factor -> LPAREN type_expr RPAREN",
-        "_cons_arg_factor",
-        3,
-        "p_cons_arg_factor",
-        "__init__.py",
-        1423,
-    ),
-    (
-        "_cons_arg_factor -> LBRACKET type_expr RBRACKET",
-        "_cons_arg_factor",
-        3,
-        "p_cons_arg_factor_list",
-        "__init__.py",
-        1429,
-    ),
-    (
-        "_derivations_list -> UPPER_IDENTIFIER _derivations_list_trail",
-        "_derivations_list",
-        2,
-        "p_derivations_list",
-        "__init__.py",
-        1435,
-    ),
-    (
-        "_derivations_list_trail -> COMMA UPPER_IDENTIFIER _derivations_list_trail",
-        "_derivations_list_trail",
-        3,
-        "p_derivations_list",
-        "__init__.py",
-        1436,
-    ),
-    (
-        "_derivations_list_trail -> empty",
-        "_derivations_list_trail",
-        1,
-        "p_derivations_list_trail_empty",
-        "__init__.py",
-        1442,
-    ),
-]
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------
+# Copyright (c) Merchise Autrement [~º/~] and Contributors
+# All rights reserved.
+#
+# This is free software; you can do what the LICENCE file allows you to.
+#
+"""A single-pass scanner producing the same tokens as the ply lexer.
+
+The ply lexer tries all its rules at each position and calls a Python
+function for every token; and it keeps the indentation levels in the lexer
+object.  The scanner uses regular expressions made of the same rules (in the
+same order) and handles the tokens in a single loop, which keeps the line
+number and indentation levels in local variables.
+
+"""
+
+import re
+from typing import Iterator
+
+try:
+    from re import _parser as sre_parse  # type: ignore
+except ImportError:  # Python < 3.11
+    import sre_parse  # type: ignore
+
+from ply.lex import LexError, LexToken
+from xotl.fl import parsers
+from xotl.fl.parsers import (
+    _DT_LITERAL_REGEXP,
+    _OPERATOR_MAP,
+    _SPACELESS_AFTER,
+    _SPACELESS_BEFORE,
+    MAX_DT_LITERAL_LENGTH,
+    PRECEDES_DT_LITERAL_REGEXP,
+)
+
+# ply sorts the rules by their line number (the rules for keywords share the
+# same line).
+_RULES = sorted(
+    (
+        (name[2:], rule)
+        for name, rule in vars(parsers).items()
+        if name.startswith("t_") and callable(rule)
+    ),
+    key=lambda item: item[1].__code__.co_firstlineno,
+)
+
+
+def _compile(rules):
+    return re.compile("|".join(f"(?P<{name}>{rule.__doc__})" for name, rule in rules), re.VERBOSE)
+
+
+_SCANNER = _compile(_RULES)
+# FOLLOWS_DT_LITERAL_REGEXP is applied to a slice; the scanner matches at a
+# position instead, where '^' would fail.
+_FOLLOWS_DT_LITERAL = re.compile(_DT_LITERAL_REGEXP)
+
+# The rules that return the matched token untouched.
+_VERBATIM = {
+    "BASE2_INTEGER",
+    "BASE8_INTEGER",
+    "BASE16_INTEGER",
+    "BASE10_INTEGER",
+    "LPAREN",
+    "RPAREN",
+    "LBRACKET",
+    "RBRACKET",
+    "ANNOTATION",
+}
+
+# The rules that convert the value of the token without using the lexer; the
+# scanner calls them as ply does.
+_CONVERTED = {
+    name: rule
+    for name, rule in _RULES
+    if name
+    in (
+        "STRING",
+        "CHAR",
+        "FLOAT",
+        "TICK_OPERATOR",
+        "DATETIME",
+        "DATE",
+        "DATETIME_INTERVAL",
+        "DATE_INTERVAL",
+    )
+}
+
+
+# Trying all the rules at every position is what takes most of the time.  So
+# the scanner selects (by the character at the position) a regular expression
+# with only the rules which can match a string starting with that character;
+# in the same order, so the matched rule is the same.
+_ASCII = [chr(i) for i in range(128)]
+_CATEGORIES = {
+    "CATEGORY_DIGIT": r"\d",
+    "CATEGORY_NOT_DIGIT": r"\D",
+    "CATEGORY_SPACE": r"\s",
+    "CATEGORY_NOT_SPACE": r"\S",
+    "CATEGORY_WORD": r"\w",
+    "CATEGORY_NOT_WORD": r"\W",
+}
+
+
+def _first_chars(items):
+    """Return the ASCII chars which can start a match of the parsed `items`.
+
+    Return a pair of the set of chars and whether the items match the empty
+    string.  The set may be larger than needed (e.g. look-around assertions
+    are ignored), but never smaller.
+
+    """
+    result = set()
+    for op, av in items:
+        op = str(op)
+        if op == "LITERAL":
+            chars, nullable = {chr(av)}, False
+        elif op == "NOT_LITERAL":
+            chars, nullable = set(_ASCII) - {chr(av)}, False
+        elif op == "ANY":
+            chars, nullable = set(_ASCII), False
+        elif op == "IN":
+            chars, nullable = _class_chars(av), False
+        elif op == "SUBPATTERN":
+            chars, nullable = _first_chars(av[-1])
+        elif op == "BRANCH":
+            chars, nullable = set(), False
+            for alternative in av[1]:
+                alt_chars, alt_nullable = _first_chars(alternative)
+                chars |= alt_chars
+                nullable = nullable or alt_nullable
+        elif op in ("MAX_REPEAT", "MIN_REPEAT", "POSSESSIVE_REPEAT"):
+            minimum, _, item = av
+            chars, nullable = _first_chars(item)
+            nullable = nullable or minimum == 0
+        elif op in ("AT", "ASSERT", "ASSERT_NOT"):
+            chars, nullable = set(), True
+        else:
+            return set(_ASCII), True
+        result |= chars
+        if not nullable:
+            return result, False
+    return result, True
+
+
+def _class_chars(items):
+    members = []
+    negate = False
+    for op, av in items:
+        op = str(op)
+        if op == "NEGATE":
+            negate = True
+        elif op == "LITERAL":
+            members.append(re.escape(chr(av)))
+        elif op == "RANGE":
+            members.append(f"{re.escape(chr(av[0]))}-{re.escape(chr(av[1]))}")
+        elif op == "CATEGORY" and str(av) in _CATEGORIES:
+            members.append(_CATEGORIES[str(av)])
+        else:
+            return set(_ASCII)
+    regexp = re.compile(f"[{'^' if negate else ''}{''.join(members)}]")
+    return {char for char in _ASCII if regexp.match(char)}
+
+
+def _dispatch_table():
+    firsts = []
+    for name, rule in _RULES:
+        chars, nullable = _first_chars(sre_parse.parse(rule.__doc__, re.VERBOSE))
+        firsts.append(set(_ASCII) if nullable else chars)
+    compiled: dict = {}
+    result = {}
+    for char in _ASCII:
+        rules = tuple(rule for rule, first in zip(_RULES, firsts) if char in first)
+        if rules:
+            if rules not in compiled:
+                compiled[rules] = _compile(rules).match
+            result[char] = compiled[rules]
+    return result
+
+
+_DISPATCH = _dispatch_table()
+
+
+def scan(source: str, lineno: int = 1) -> Iterator[LexToken]:
+    """Generate the tokens of `source`.
+
+    The tokens are the same (type, value, line number and position) the
+    `xotl.fl.parsers.lexer`:obj: would produce.  `lineno` is the line number
+    of the first line.
+
+    """
+    dispatch = _DISPATCH.get
+    default = _SCANNER.match
+    follows_dt_literal = _FOLLOWS_DT_LITERAL.match
+    precedes_dt_literal = PRECEDES_DT_LITERAL_REGEXP.search
+    operators = _OPERATOR_MAP
+    verbatim = _VERBATIM
+    converted = _CONVERTED
+    level = min_level = 0
+    pos, end = 0, len(source)
+    while pos < end:
+        m = dispatch(source[pos], default)(source, pos)
+        if m is None:
+            raise LexError("Illegal character '%s' at index %d" % (source[pos], pos), source[pos:])
+        kind = m.lastgroup
+        value = m.group()
+        start, pos = pos, m.end()
+        if kind == "SPACE" or kind == "COMMENT":
+            if "\n" in value:
+                level = len(value) - value.rindex("\n") - 1
+                kind = "NEWLINE" if level == min_level else "PADDING"
+                yield _token(kind, value, lineno, start)
+                lineno += value.count("\n")
+                continue
+            elif kind == "COMMENT":
+                continue
+            # See t_SPACE for the rules to emit (or not) a SPACE.
+            before, after = source[start - 1], source[pos]
+            if after == "<" and follows_dt_literal(source, pos, pos + MAX_DT_LITERAL_LENGTH):
+                pass
+            elif before == ">" and precedes_dt_literal(
+                source, max(start - MAX_DT_LITERAL_LENGTH, 0), start
+            ):
+                pass
+            elif before in _SPACELESS_AFTER or after in _SPACELESS_BEFORE:
+                continue
+        elif kind in verbatim:
+            pass
+        elif kind == "IDENTIFIER":
+            if value[0] == "_":
+                kind = "UNDER_IDENTIFIER"
+            elif value[0].isupper():
+                kind = "UPPER_IDENTIFIER"
+            else:
+                kind = "LOWER_IDENTIFIER"
+        elif kind == "OPERATOR":
+            kind = operators.get(value, "OPERATOR")
+        elif kind in converted:
+            token = converted[kind](_token(kind, value, lineno, start))
+            yield token
+            continue
+        elif kind.startswith("KEYWORD_"):
+            yield _token(kind, value.strip(), lineno, start)
+            lineno += value.count("\n")
+            continue
+        elif kind == "NL" or kind == "NL_COMMENT":
+            lineno += value.count("\n")
+            level = len(value) - value.rindex("\n") - 1 if "\n" in value else len(value)
+            min_level = level if kind == "NL" else 0
+            continue
+        else:
+            assert kind == "NLE"
+            continue
+        yield _token(kind, value, lineno, start)
+
+
+def _token(type_, value, lineno, lexpos):
+    result = LexToken()
+    result.type = type_
+    result.value = value
+    result.lineno = lineno
+    result.lexpos = lexpos
+    return result
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------
+# Copyright (c) Merchise Autrement [~º/~] and Contributors
+# All rights reserved.
+#
+# This is free software; you can do what the LICENCE file allows you to.
+#
+"""Parse programs one top-level definition at a time.
+
+A top-level definition starts at a line with the indentation of the first
+definition of the program (usually column 0), and spans all the following
+lines which are more indented, empty or comments.  The exceptions are the
+lines starting with the keywords 'where', 'in' and 'deriving', which
+continue the previous definition (the lexer takes the preceding new line as
+part of the keyword).
+
+"""
+
+import io
+import os
+import re
+from itertools import repeat
+from typing import IO, Iterable, Iterator, List, Optional, Tuple, Union
+
+_CONTINUATION = re.compile(r"(where|in|deriving)\b")
+
+
+def split_definitions(lines: Iterable[str]) -> Iterator[str]:
+    """Group the `lines` of a program into the sources of its definitions.
+
+    Each source has the complete lines of a top-level definition, and the
+    empty lines and comments after them.
+
+    """
+    return (source for _, source in _split(lines))
+
+
+def _split(lines: Iterable[str], base: Optional[int] = None) -> Iterator[Tuple[List[str], str]]:
+    # Generate the lines and the source of each definition.  If `base` is
+    # None, it's the indentation of the first definition.
+    chunk: List[str] = []
+    code = False  # Whether the chunk has more than comments and empty lines
+    for line in lines:
+        stripped = line.lstrip()
+        if stripped and not stripped.startswith("--"):
+            indentation = len(line) - len(stripped)
+            if base is None:
+                base = indentation
+            elif code and indentation <= base and not _CONTINUATION.match(stripped):
+                # With the indentation of the next definition, the lexer
+                # issues the same NEWLINE it does for the whole program.
+                yield chunk, "".join(chunk) + line[:indentation]
+                chunk = []
+            code = True
+        chunk.append(line)
+    if chunk:
+        yield chunk, "".join(chunk)
+
+
+def parse_stream(stream: IO, *, encoding: str = "utf-8", debug: bool = False) -> Iterator:
+    """Parse the program read from `stream`, one definition at a time.
+
+    `stream` can be any object with a ``readline()`` method returning either
+    strings or bytes (decoded with `encoding`); like text and binary files,
+    or `mmap.mmap`:class: objects.
+
+    Yield the same definitions `xotl.fl.parse`:func: would return.  Only
+    the lines of one definition are kept in memory at a time.
+
+    """
+    from xotl.fl.parsers import default_context
+
+    for lineno, source in _numbered(split_definitions(_lines(stream, encoding))):
+        yield from default_context.parse_program(source, debug=debug, lineno=lineno)
+
+
+#: Programs larger than this (in characters) are parsed in parallel by
+#: `xotl.fl.parse`:func: if there are several CPUs.
+PARALLEL_PARSE_THRESHOLD = 1 << 20
+
+
+def parse_parallel(source: str, *, max_workers: Optional[int] = None, debug: bool = False) -> List:
+    """Parse the program `source` in a pool of `max_workers` processes.
+
+    The definitions (see `split_definitions`:func:) are parsed in batches by
+    the workers, which build their parser when they start, and send them back
+    encoded with `xotl.fl.ast.codec`:mod:.  If `max_workers` is None, use a
+    process per CPU.
+
+    Return the same list `xotl.fl.parse`:func: would return.  The line
+    numbers in the errors are those of the whole `source`.
+
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    from xotl.fl.ast.codec import decode
+
+    workers = max_workers or os.cpu_count() or 1
+    sources = _numbered(split_definitions(_lines(io.StringIO(source), None)))
+    # A few batches per worker; each batch has many definitions, so that
+    # sending them (and their ASTs back) doesn't dominate.
+    batches = _batches(sources, len(source) // (workers * 4) + 1)
+    result: List = []
+    with ProcessPoolExecutor(workers, initializer=_init_worker) as executor:
+        for data in executor.map(_parse_batch, batches, repeat(debug)):
+            result.extend(decode(data))
+    return result
+
+
+def _init_worker():
+    from xotl.fl.parsers import _get_parser
+
+    _get_parser()
+
+
+def _parse_batch(batch, debug):
+    from xotl.fl.ast.codec import encode
+    from xotl.fl.parsers import default_context
+
+    result = []
+    for lineno, source in batch:
+        result.extend(default_context.parse_program(source, debug=debug, lineno=lineno))
+    return encode(result)
+
+
+def _batches(sources, size):
+    batch, length = [], 0
+    for lineno, source in sources:
+        batch.append((lineno, source))
+        length += len(source)
+        if length >= size:
+            yield batch
+            batch, length = [], 0
+    if batch:
+        yield batch
+
+
+def _numbered(sources: Iterable[str]) -> Iterator[Tuple[int, str]]:
+    lineno = 1
+    for source in sources:
+        yield lineno, source
+        lineno += source.count("\n")
+
+
+def _lines(stream, encoding) -> Iterator[str]:
+    readline = stream.readline
+    line: Union[str, bytes] = readline()
+    while line:
+        if isinstance(line, bytes):
+            yield line.decode(encoding)
+        else:
+            yield line
+        line = readline()
@@ -1 +0,0 @@
-# Make mypy happy
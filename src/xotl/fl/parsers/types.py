@@ -22,6 +22,6 @@ def parse(code: str, debug=False, tracking=False) -> Type:
        TypeCons('->', (TypeVariable('a'), TypeVariable('b')))
 
     """
-    from xotl.fl.parsers import lexer, type_parser
+    from xotl.fl.parsers import default_context
 
-    return type_parser.parse(code, lexer=lexer, debug=debug, tracking=tracking)
+    return default_context.parse_type(code, debug=debug, tracking=tracking)
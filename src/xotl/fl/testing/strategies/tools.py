@@ -12,7 +12,7 @@ from hypothesis.strategies import SearchStrategy
 from xotl.fl.ast.base import AST
 from xotl.fl.ast.expressions import Identifier, Lambda
 from xotl.fl.ast.types import Type as FLType
-from xotl.fl.ast.types import TypeCons, TypeSchema, TypeVariable
+from xotl.fl.ast.types import TypeCons, TypeScheme, TypeVariable
 from xotl.fl.builtins import BuiltinEnvDict
 from xotl.fl.utils import namesupply
 
@@ -48,9 +48,9 @@ def from_fltype(fltype: FLType) -> SearchStrategy[AST]:
 
 
 class TestTypingEnvironment(BuiltinEnvDict):
-    def __missing__(self, key) -> TypeSchema:
+    def __missing__(self, key) -> TypeScheme:
         try:
             return super().__missing__(key)
         except KeyError:
             var = TypeVariable(key, check=False)
-            return TypeSchema.from_typeexpr(var)
+            return TypeScheme.from_typeexpr(var)
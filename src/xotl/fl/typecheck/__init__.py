@@ -10,17 +10,18 @@
 
 from collections import ChainMap
 from dataclasses import dataclass
-from typing import Iterable, List, Mapping, Sequence, Tuple
+from typing import Iterable, List, Mapping, Sequence, Set, Tuple
 
 from xotl.fl.ast.base import AST
 from xotl.fl.ast.expressions import Application, Identifier, Lambda, Let, Letrec, Literal
 from xotl.fl.ast.pattern import ConcreteLet
 from xotl.fl.ast.typeclasses import Instance, TypeClass
 from xotl.fl.ast.types import FunctionTypeCons as FuncCons
-from xotl.fl.ast.types import Type, TypeScheme, TypeVariable, find_tvars
+from xotl.fl.ast.types import Type, TypeScheme, TypeVariable
 from xotl.fl.meta import Symbolic
 from xotl.fl.utils import TVarSupply
 
+from . import unionfind
 from .exceptions import UnificationError
 from .subst import Substitution, scompose, sidentity, subscheme, subtype
 from .unification import unify, unify_exprs
@@ -37,9 +38,9 @@ TypeEnvironment = Mapping[Symbolic, TypeScheme]
 EMPTY_TYPE_ENV: TypeEnvironment = {}
 
 
-def get_typeenv_unknowns(te: TypeEnvironment) -> List[str]:
+def get_typeenv_unknowns(te: TypeEnvironment) -> Set[str]:
     """Return all the non-generic variables in the environment."""
-    return sum((t.nongenerics for _, t in te.items()), [])
+    return {name for t in te.values() for name in t.nongenerics}
 
 
 class sub_typeenv(TypeEnvironment):
@@ -66,7 +67,13 @@ class sub_typeenv(TypeEnvironment):
 TCResult = Tuple[Substitution, Type]
 
 
-def typecheck(exp: AST, env: TypeEnvironment = None, ns: TVarSupply = None) -> TCResult:
+def typecheck(
+    exp: AST,
+    env: TypeEnvironment = None,
+    ns: TVarSupply = None,
+    *,
+    engine: str = "substitution",
+) -> TCResult:
     """Check the type of `exp` in a given type environment `env`.
 
     The type environment `env` is a mapping from program identifiers to type
@@ -79,6 +86,12 @@ def typecheck(exp: AST, env: TypeEnvironment = None, ns: TVarSupply = None) -> T
     <xotl.fl.utils.tvarsupply>`:class: with prefix set to '.t' (it will create
     '.t0', '.t1', ...).
 
+    The `engine` selects the algorithm.  The default ``'substitution'`` is
+    the algorithm implemented in this module.  ``'unionfind'`` uses mutable
+    type variables instead of substitutions; see
+    `xotl.fl.typecheck.unionfind`:mod:.  Both engines infer the same types
+    (up to the renaming of type variables).
+
     """
     if env is None:
         from xotl.fl.builtins import BuiltinEnvDict
@@ -88,6 +101,10 @@ def typecheck(exp: AST, env: TypeEnvironment = None, ns: TVarSupply = None) -> T
         from xotl.fl.utils import tvarsupply
 
         ns = tvarsupply(".t")
+    if engine == "unionfind":
+        return unionfind.typecheck(exp, env, ns)
+    elif engine != "substitution":
+        raise ValueError(f"Unknown type-checking engine {engine!r}")
     if isinstance(exp, Identifier):
         return typecheck_var(env, ns, exp)
     elif isinstance(exp, Literal):
@@ -117,15 +134,23 @@ def tcl(env: TypeEnvironment, ns: TVarSupply, exprs: Iterable[AST]) -> TCLResult
     names are repeated.
 
     """
-    if not exprs:
-        return sidentity, []
-    else:
-        expr, *exprs = exprs
-        phi, t = typecheck(expr, env, ns)
-        psi, ts = tcl(sub_typeenv(phi, env), ns, exprs)
-        # We can safely modify the ts and improve performance.
-        ts.insert(0, subtype(psi, t))
-        return scompose(psi, phi), ts
+    # Each expression is type-checked in the environment updated with the
+    # substitution found so far.  The type of each expression must be
+    # updated with the substitutions found *after* it; we compose them
+    # backwards.
+    phi: Substitution = sidentity
+    types: List[Type] = []
+    substs: List[Substitution] = []
+    for expr in exprs:
+        psi, t = typecheck(expr, sub_typeenv(phi, env), ns)
+        phi = scompose(psi, phi)
+        types.append(t)
+        substs.append(psi)
+    after: Substitution = sidentity
+    for i in range(len(types) - 1, -1, -1):
+        types[i] = subtype(after, types[i])
+        after = scompose(after, substs[i])
+    return phi, types
 
 
 def newinstance(ns: TVarSupply, ts: TypeScheme) -> Type:
@@ -214,6 +239,23 @@ def typecheck_lambda(env: TypeEnvironment, ns, exp: Lambda) -> TCResult:
 
 
 def typecheck_let(env: TypeEnvironment, ns, exp: Let) -> TCResult:
+    phi, decls = typecheck_let_decls(env, ns, exp)
+    psi, t = typecheck(exp.body, decls, ns)
+    return scompose(psi, phi), t
+
+
+def typecheck_let_decls(
+    env: TypeEnvironment, ns, exp: Let, *, generalize_all: bool = False
+) -> Tuple[Substitution, TypeEnvironment]:
+    """Type check the definitions of `exp`, but not its body.
+
+    Return the substitution found and the type environment (an extension of
+    `env`) to type-check the body.
+
+    If `generalize_all` is True, all the definitions are generalized even if
+    some of them are annotated; otherwise only the annotated ones are.
+
+    """
     exprs: Sequence[AST] = tuple(exp.values())
     phi, types = tcl(env, ns, exprs)
     names: Sequence[str] = tuple(exp.keys())
@@ -234,12 +276,11 @@ def typecheck_let(env: TypeEnvironment, ns, exp: Let) -> TCResult:
             ns,
             names,
             types,
-            _generalize_over=local.keys(),
+            _generalize_over=None if generalize_all else local.keys(),
         )
     else:
         decls = _add_decls(sub_typeenv(phi, env), ns, names, types)
-    psi, t = typecheck(exp.body, decls, ns)
-    return scompose(psi, phi), t
+    return phi, decls
 
 
 def _add_decls(
@@ -266,7 +307,7 @@ def _add_decls(
 
     def genbar(unknowns, names, type_, name):
         if not _generalize_over or name in _generalize_over:
-            schvars = list({tv.name for tv in find_tvars(type_) if tv.name not in unknowns})
+            schvars = [name for name in type_.ftv if name not in unknowns]
             alist: List[Tuple[str, TypeVariable]] = list(zip(schvars, ns))
             restype = subtype(build_substitution(alist), type_)
             return TypeScheme([v.name for _, v in alist], restype)
@@ -282,6 +323,19 @@ def _add_decls(
 
 
 def typecheck_letrec(env: TypeEnvironment, ns, exp: Letrec) -> TCResult:
+    psi, decls = typecheck_letrec_decls(env, ns, exp)
+    psi1, t = typecheck(exp.body, decls, ns)
+    return scompose(psi1, psi), t
+
+
+def typecheck_letrec_decls(
+    env: TypeEnvironment, ns, exp: Letrec, *, generalize_all: bool = False
+) -> Tuple[Substitution, TypeEnvironment]:
+    """Type check the definitions of `exp`, but not its body.
+
+    See `typecheck_let_decls`:func:.
+
+    """
     # This algorithm is quite elaborate.
     #
     # We expected that at least one of exprs is defined in terms of a name.
@@ -329,9 +383,9 @@ def typecheck_letrec(env: TypeEnvironment, ns, exp: Letrec) -> TCResult:
     # body in the **proper** environment.
     nbvs1 = sub_typeenv(psi, nbvs)
     ts = [sch.type_ for _, sch in nbvs1.items()]
-    psi1, t = typecheck(
-        exp.body,
-        _add_decls(sub_typeenv(psi, gamma), ns, names, ts, _generalize_over=local.keys()),
-        ns,
-    )
-    return scompose(psi1, psi), t
+    generalize_over = None if generalize_all else local.keys()
+    return psi, _add_decls(sub_typeenv(psi, gamma), ns, names, ts, _generalize_over=generalize_over)
+
+
+# The program checker uses the functions above.
+from .program import TypecheckSession, typecheck_program  # noqa: E402, F401
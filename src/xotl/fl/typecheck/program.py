@@ -0,0 +1,578 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------
+# Copyright (c) Merchise Autrement [~º/~] and Contributors
+# All rights reserved.
+#
+# This is free software; you can do what the LICENCE file allows you to.
+#
+"""Type checking of whole programs.
+
+A program (as returned by `xotl.fl.parse`:func:) is a flat list of
+definitions.  Instead of type-checking it as a single (and very big) let
+expression, we do a dependency analysis of its value definitions: each
+strongly connected component (a group of mutually recursive definitions) is
+type-checked once, after the components it depends on, and its definitions
+are generalized right away.
+
+Each component is type-checked in an environment that has only the type
+schemes of the definitions it depends on.  So, the time to type-check a
+program grows with the number of definitions (and dependencies), and not
+with the size of the whole program.
+
+A `TypecheckSession`:class: keeps the schemes of each component between
+versions of a program, so that after an edit only the changed components (and
+those depending on schemes that changed) are type-checked again.
+
+"""
+
+from collections import ChainMap
+from dataclasses import dataclass
+from itertools import groupby
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Optional, Sequence, Set, Tuple, Union
+
+from xotl.fl.ast.adt import DataType
+from xotl.fl.ast.expressions import Let, Letrec, count_free_names
+from xotl.fl.ast.pattern import Equation
+from xotl.fl.ast.typeclasses import Instance, TypeClass
+from xotl.fl.ast.types import Type, TypeCons, TypeEnvironment, TypeScheme, TypeVariable
+from xotl.fl.graphs import Condensation, Graph
+from xotl.fl.meta import Symbolic
+from xotl.fl.utils import TVarSupply, namesupply
+from xotl.tools.fp.tools import snd
+
+
+class Program:
+    """The definitions of a program, indexed.
+
+    `equations` maps each name to its equations (in order of appearance),
+    `annotations` maps names to their (explicit) type schemes, and
+    `datatypes` keeps the data types defined.
+
+    Annotations of names without equations are *declarations* of values
+    defined elsewhere.
+
+    Type classes and instances are kept in `typeclasses` and `instances`, but
+    they are not type-checked yet.
+
+    """
+
+    def __init__(self, definitions: Iterable) -> None:
+        self.equations: Dict[Symbolic, List[Equation]] = {}
+        self.annotations: Dict[Symbolic, TypeScheme] = {}
+        self.datatypes: List[DataType] = []
+        self.typeclasses: List[TypeClass] = []
+        self.instances: List[Instance] = []
+        self._dependencies: Dict[Symbolic, Set[Symbolic]] = {}
+        for dfn in definitions:
+            if isinstance(dfn, Equation):
+                self.equations.setdefault(dfn.name, []).append(dfn)
+            elif isinstance(dfn, dict):
+                self.annotations.update(dfn)
+            elif isinstance(dfn, DataType):
+                self.datatypes.append(dfn)
+            elif isinstance(dfn, TypeClass):
+                self.typeclasses.append(dfn)
+            elif isinstance(dfn, Instance):
+                self.instances.append(dfn)
+            else:
+                assert False, f"Unknown definition type {dfn!r}"
+
+    @property
+    def declarations(self) -> TypeEnvironment:
+        "The annotations of names without equations."
+        return {
+            name: scheme for name, scheme in self.annotations.items() if name not in self.equations
+        }
+
+    @property
+    def datatypes_env(self) -> TypeEnvironment:
+        "The type environment implied by the data types of the program."
+        result: Dict[Symbolic, TypeScheme] = {}
+        for datatype in self.datatypes:
+            result.update(datatype.implied_env)
+            result.update(datatype.pattern_matching_env)
+        return result
+
+    def dependencies(self, name: Symbolic) -> Set[Symbolic]:
+        "The names defined in the program used in the equations of `name`."
+        result = self._dependencies.get(name)
+        if result is None:
+            equations = self.equations
+            result = self._dependencies[name] = {
+                dep
+                for equation in equations[name]
+                for dep in count_free_names(equation)
+                if dep in equations
+            }
+        return result
+
+    def reachable(self, roots: Iterable[Symbolic]) -> Set[Symbolic]:
+        """Return the names of the `roots` and those their equations use.
+
+        Only the equations of these names are looked at; so they are the only
+        ones parsed if the program was parsed with ``parse(..., lazy=True)``.
+
+        """
+        result: Set[Symbolic] = set()
+        pending = list(roots)
+        while pending:
+            name = pending.pop()
+            if name not in result:
+                result.add(name)
+                pending.extend(self.dependencies(name))
+        return result
+
+    def get_condensation(self, roots: Iterable[Symbolic] = None) -> "Condensation[Symbolic]":
+        """Return the condensation of the dependencies of the value definitions.
+
+        The `~xotl.fl.graphs.Condensation`:class: keeps the strongly connected
+        components of the names and the DAG between them.  If `roots` is
+        given, only the definitions `reachable`:meth: from them are included.
+
+        """
+        if roots is None:
+            names: Iterable[Symbolic] = self.equations
+        else:
+            reachable = self.reachable(roots)
+            names = [name for name in self.equations if name in reachable]
+        graph: Graph[Symbolic] = Graph()
+        for name in names:
+            graph.add_node(name)
+            graph.add_many(name, self.dependencies(name))
+        return Condensation(graph)
+
+    def get_components(self, roots: Iterable[Symbolic] = None) -> List[Set[Symbolic]]:
+        """Return the strongly connected components of the value definitions.
+
+        Each component comes after the components it depends on.  See
+        `get_condensation`:meth: for `roots`.
+
+        """
+        order = self.get_condensation(roots).get_topological_order()
+        return [set(component) for component in order]
+
+    def get_levels(self, roots: Iterable[Symbolic] = None) -> List[List[Set[Symbolic]]]:
+        """Return the strongly connected components grouped by levels.
+
+        The components of a level only depend on components of the previous
+        levels; so they can be type-checked independently of each other.
+        See `get_condensation`:meth: for `roots`.
+
+        """
+        order = self.get_condensation(roots).get_topological_order(with_score=True)
+        return [[set(component) for component, _ in level] for _, level in groupby(order, key=snd)]
+
+
+def typecheck_program(
+    program: Iterable,
+    env: TypeEnvironment = None,
+    ns: TVarSupply = None,
+    *,
+    engine: str = "substitution",
+    max_workers: int = None,
+    roots: Iterable[Symbolic] = None,
+) -> TypeEnvironment:
+    """Type-check a whole program in the environment `env`.
+
+    The `program` is a list of definitions, as returned by
+    `xotl.fl.parse`:func:.  Return the type environment of the value
+    definitions of the program.
+
+    If `roots` is given, only the definitions of those names (and the ones
+    they use) are type-checked; e.g. ``roots=["main"]``.
+
+    Unlike local definitions in let expressions, every top-level definition
+    is generalized, even those without annotations in a group of mutually
+    recursive definitions.
+
+    The `env`, `ns` and `engine` arguments have the same meaning as in
+    `~xotl.fl.typecheck.typecheck`:func:.  See `TypecheckSession`:class: for
+    `max_workers`.
+
+    """
+    with TypecheckSession(env, ns, engine=engine, max_workers=max_workers) as session:
+        return session.update(program, roots=roots)
+
+
+@dataclass
+class _CheckedComponent:
+    source: Tuple  # the equations and annotations of the component
+    inputs: Tuple  # the schemes of the dependencies of the component
+    schemes: Mapping[Symbolic, TypeScheme]
+
+
+class TypecheckSession:
+    """An incremental type checker of a program.
+
+    Each call to `update`:meth: type-checks a new version of the program, but
+    only re-infers the components (groups of mutually recursive definitions)
+    whose equations or annotations changed, and those whose dependencies got
+    new type schemes.  The other components keep the schemes found before.
+
+    A change in the data types or declarations of the program clears all the
+    schemes found before.
+
+    The session keeps the dependencies of each name and their
+    `~xotl.fl.graphs.Condensation`:class:.  An update only finds the
+    dependencies of the names whose equations changed (or that were added or
+    removed), and updates the edges of the condensation accordingly.
+
+    `rechecked` has the components type-checked by the last update.
+
+    If `max_workers` is greater than 1, the independent components of each
+    level (see `Program.get_levels`:meth:) are type-checked in a pool of
+    (at most) `max_workers` processes.  Each worker receives the global
+    environment once, and then only the equations of the components and the
+    schemes of their dependencies.  The `ns` is not used by the workers;
+    they create their own.  The pool is kept across updates (it's created
+    again only when the data types or declarations change); `close`:meth:
+    shuts it down, and so does leaving the session used as a context
+    manager.
+
+    Example:
+
+    .. doctest::
+
+       >>> from xotl.fl import parse
+       >>> session = TypecheckSession()
+       >>> session.update(parse("one = 1\\nid x = x\\nf x = id one\\n"))["f"]
+       <TypeScheme: forall a0. a0 -> Number>
+       >>> sorted(sorted(c) for c in session.rechecked)
+       [['f'], ['id'], ['one']]
+
+       >>> session.update(parse("one = 1\\nid y = y\\nf x = id one\\n"))["f"]
+       <TypeScheme: forall a0. a0 -> Number>
+       >>> session.rechecked
+       [{'id'}]
+
+    """
+
+    def __init__(
+        self,
+        env: TypeEnvironment = None,
+        ns: TVarSupply = None,
+        *,
+        engine: str = "substitution",
+        max_workers: int = None,
+    ) -> None:
+        if env is None:
+            from xotl.fl.builtins import BuiltinEnvDict
+
+            env = BuiltinEnvDict()
+        if ns is None:
+            from xotl.fl.utils import tvarsupply
+
+            ns = tvarsupply(".t")
+        if engine not in ("substitution", "unionfind"):
+            raise ValueError(f"Unknown type-checking engine {engine!r}")
+        self.env = env
+        self.ns = ns
+        self.engine = engine
+        self.max_workers = max_workers
+        self.rechecked: List[Set[Symbolic]] = []
+        self._globals: Tuple = ()
+        self._components: Dict[FrozenSet[Symbolic], _CheckedComponent] = {}
+        # The equations of the last update, the free names of each name's
+        # equations, the names using each free name, and the dependencies
+        # (the free names that are defined) of each name.
+        self._equations: Dict[Symbolic, Tuple[Equation, ...]] = {}
+        self._free: Dict[Symbolic, FrozenSet[Symbolic]] = {}
+        self._users: Dict[Symbolic, Set[Symbolic]] = {}
+        self._dependencies: Dict[Symbolic, Set[Symbolic]] = {}
+        self._condensation: Condensation[Symbolic] = Condensation()
+        self._executor = None
+
+    def __enter__(self) -> "TypecheckSession":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        "Shut down the pool of workers, if any."
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown()
+
+    def update(self, program: Iterable, *, roots: Iterable[Symbolic] = None) -> TypeEnvironment:
+        """Type-check a new version of the program.
+
+        Return the type environment of the value definitions of the program
+        (only those reachable from the `roots`, if given).
+
+        """
+        if not isinstance(program, Program):
+            program = Program(program)
+        declarations, datatypes_env = program.declarations, program.datatypes_env
+        if self._globals != (declarations, datatypes_env):
+            self._globals = (declarations, datatypes_env)
+            self._components = {}
+            # The workers have the previous global environment.
+            self.close()
+        globalenv = _new_child(self.env, {**datatypes_env, **declarations})
+        condensation = self._condensation
+        reachable = self._update_dependencies(program.equations, roots)
+        order = condensation.get_topological_order(with_score=True)
+        if reachable is not None:
+            # A component is either reachable or not, as a whole.
+            order = [(component, score) for component, score in order if component & reachable]
+        components: Dict[FrozenSet[Symbolic], _CheckedComponent] = {}
+        result: Dict[Symbolic, TypeScheme] = {}
+        self.rechecked = rechecked = []
+        for _, level in groupby(order, key=snd):
+            pending = []
+            for component, _ in level:
+                key = frozenset(component)
+                names = sorted(component)
+                # The equations kept by the session are the same objects
+                # for unchanged names; so they compare by identity.
+                source = tuple(
+                    (name, self._equations[name], program.annotations.get(name)) for name in names
+                )
+                deps = sorted({
+                    dep for name in names for dep in self._dependencies[name] if dep not in key
+                })
+                inputs = tuple((dep, result[dep]) for dep in deps)
+                checked = self._components.get(key)
+                if checked is None or checked.source != source or checked.inputs != inputs:
+                    pending.append((set(component), source, inputs))
+                else:
+                    components[key] = checked
+                    result.update(checked.schemes)
+            jobs = [
+                _job(program, component, condensation.recursive(component), inputs)
+                for component, _, inputs in pending
+            ]
+            if len(jobs) > 1 and self.max_workers and self.max_workers > 1:
+                from concurrent.futures.process import BrokenProcessPool
+
+                if self._executor is None:
+                    self._executor = self._get_executor(globalenv)
+                try:
+                    found = _typecheck_parallel(self._executor, self.max_workers, jobs)
+                except BrokenProcessPool:
+                    self.close()
+                    raise
+            else:
+                found = [
+                    _typecheck_component(*job, globalenv, self.ns, self.engine) for job in jobs
+                ]
+            for (component, source, inputs), schemes in zip(pending, found):
+                components[frozenset(component)] = _CheckedComponent(source, inputs, schemes)
+                result.update(schemes)
+                rechecked.append(component)
+        self._components = components
+        return result
+
+    def _update_dependencies(
+        self, equations: Mapping[Symbolic, Sequence[Equation]], roots: Iterable[Symbolic] = None
+    ) -> Optional[Set[Symbolic]]:
+        """Update the dependencies and condensation with the new `equations`.
+
+        Only the names added, removed or whose equations changed are looked
+        at; and only the edges from them (or to the names added and removed)
+        change in the condensation.  If `roots` are given, the names not
+        reachable from them are left as they were (their equations are not
+        looked at) and the reachable names are returned.
+
+        """
+        condensation, dependencies = self._condensation, self._dependencies
+        users, free, previous = self._users, self._free, self._equations
+        for name in [name for name in condensation if name not in equations]:
+            for user in users.get(name, ()):
+                dependencies[user].discard(name)
+            self._set_free_names(name, frozenset())
+            del free[name]
+            previous.pop(name, None)
+            dependencies.pop(name, None)
+            condensation.remove_node(name)
+        for name in equations:
+            if name not in condensation:
+                condensation.add_node(name)
+                for user in users.get(name, ()):
+                    dependencies[user].add(name)
+                    condensation.add_edge(user, name)
+        if roots is None:
+            for name, eqs in equations.items():
+                self._update_name(name, tuple(eqs), equations)
+            return None
+        reachable: Set[Symbolic] = set()
+        pending = list(roots)
+        while pending:
+            name = pending.pop()
+            if name not in reachable:
+                reachable.add(name)
+                self._update_name(name, tuple(equations[name]), equations)
+                pending.extend(dependencies[name])
+        return reachable
+
+    def _update_name(
+        self,
+        name: Symbolic,
+        eqs: Tuple[Equation, ...],
+        equations: Mapping[Symbolic, Sequence[Equation]],
+    ) -> None:
+        previous, dependencies = self._equations, self._dependencies
+        if name in previous and previous[name] == eqs:
+            return
+        previous[name] = eqs
+        names = frozenset(dep for equation in eqs for dep in count_free_names(equation))
+        self._set_free_names(name, names)
+        old, new = dependencies.get(name, set()), {dep for dep in names if dep in equations}
+        for dep in old - new:
+            self._condensation.remove_edge(name, dep)
+        for dep in new - old:
+            self._condensation.add_edge(name, dep)
+        dependencies[name] = new
+
+    def _set_free_names(self, name: Symbolic, names: FrozenSet[Symbolic]) -> None:
+        users, old = self._users, self._free.get(name, frozenset())
+        for dep in old - names:
+            users[dep].discard(name)
+            if not users[dep]:
+                del users[dep]
+        for dep in names - old:
+            users.setdefault(dep, set()).add(name)
+        self._free[name] = names
+
+    def _get_executor(self, globalenv: TypeEnvironment):
+        from concurrent.futures import ProcessPoolExecutor
+
+        return ProcessPoolExecutor(
+            self.max_workers,
+            initializer=_init_worker,
+            initargs=(globalenv, self.engine),
+        )
+
+
+def _new_child(env: TypeEnvironment, m: TypeEnvironment) -> TypeEnvironment:
+    "Return an environment with the items of `m` over those of `env`."
+    new_child = getattr(env, "new_child", None)
+    if new_child is not None:
+        # BuiltinEnvDict and ChainMap
+        return new_child(m)
+    else:
+        return ChainMap(m, env)
+
+
+# The arguments to type-check a component: its equations, its annotations, if
+# it is recursive, and the schemes of its dependencies.
+_Job = Tuple[
+    Mapping[Symbolic, Sequence[Equation]],
+    TypeEnvironment,
+    bool,
+    TypeEnvironment,
+]
+
+
+def _job(program: Program, component: Set[Symbolic], recursive: bool, inputs: Tuple) -> _Job:
+    annotations, equations = program.annotations, program.equations
+    return (
+        {name: equations[name] for name in component},
+        {name: annotations[name] for name in component if name in annotations},
+        recursive,
+        dict(inputs),
+    )
+
+
+def _typecheck_component(
+    equations: Mapping[Symbolic, Sequence[Equation]],
+    annotations: TypeEnvironment,
+    recursive: bool,
+    deps: TypeEnvironment,
+    globalenv: TypeEnvironment,
+    ns: TVarSupply,
+    engine: str,
+) -> Dict[Symbolic, TypeScheme]:
+    from xotl.fl.match import FunctionDefinition
+
+    from . import typecheck_let_decls, typecheck_letrec_decls, unionfind
+
+    definitions = {name: FunctionDefinition(eqs).compile() for name, eqs in equations.items()}
+    if recursive:
+        exp: Union[Let, Letrec] = Letrec(definitions, None, annotations)
+    else:
+        exp = Let(definitions, None, annotations)
+    scope = ChainMap(deps, globalenv)
+    if engine == "unionfind":
+        schemes: Mapping[Symbolic, TypeScheme] = unionfind.typecheck_bindings(
+            exp, scope, ns, generalize_all=True
+        )
+    elif recursive:
+        _, decls = typecheck_letrec_decls(scope, ns, exp, generalize_all=True)
+        schemes = decls.maps[0]  # type: ignore
+    else:
+        _, decls = typecheck_let_decls(scope, ns, exp, generalize_all=True)
+        schemes = decls.maps[0]  # type: ignore
+    return {name: _rename_generics(schemes[name]) for name in equations}
+
+
+def _typecheck_parallel(executor, workers: int, jobs: Sequence[_Job]):
+    # Send the jobs in (at most) `workers` chunks, to reduce the overhead of
+    # many small components.
+    size = -(-len(jobs) // workers)
+    chunks = [jobs[i : i + size] for i in range(0, len(jobs), size)]
+    return [schemes for chunk in executor.map(_typecheck_chunk, chunks) for schemes in chunk]
+
+
+_worker_state: Tuple = ()
+
+
+def _init_worker(globalenv: TypeEnvironment, engine: str) -> None:
+    from xotl.fl.utils import tvarsupply
+
+    global _worker_state
+    _worker_state = (globalenv, tvarsupply(".t"), engine)
+
+
+def _typecheck_chunk(jobs: Sequence[_Job]) -> List[Dict[Symbolic, TypeScheme]]:
+    globalenv, ns, engine = _worker_state
+    return [_typecheck_component(*job, globalenv, ns, engine) for job in jobs]
+
+
+def _rename_generics(scheme: TypeScheme) -> TypeScheme:
+    """Rename the generics of `scheme` to 'a0', 'a1', ...
+
+    The names are given in the order of first occurrence and avoid the
+    non-generic variables of the scheme.
+
+    """
+    if not scheme.generics:
+        return scheme
+    generics = set(scheme.generics)
+    names = namesupply("a", exclude=scheme.nongenerics)
+    renaming: Dict[str, Type] = {}
+    for name in _first_occurrences(scheme.type_):
+        if name in generics and name not in renaming:
+            renaming[name] = TypeVariable(next(names))
+    # Generics that don't occur in the type.
+    for name in scheme.generics:
+        if name not in renaming:
+            renaming[name] = TypeVariable(next(names))
+    return TypeScheme(
+        [t.name for t in renaming.values()],  # type: ignore
+        _replace(scheme.type_, renaming),
+    )
+
+
+def _first_occurrences(t: Type) -> Sequence[str]:
+    result: List[str] = []
+    stack: List[Type] = [t]
+    while stack:
+        t = stack.pop()
+        if isinstance(t, TypeVariable):
+            result.append(t.name)
+        elif isinstance(t, TypeCons):
+            stack.extend(reversed(t.subtypes))
+    return result
+
+
+def _replace(t: Type, renaming: Mapping[str, Type]) -> Type:
+    from .subst import subtype
+
+    def substitution(name: str) -> Type:
+        result = renaming.get(name, None)
+        return TypeVariable(name, check=False) if result is None else result
+
+    return subtype(substitution, t)
@@ -7,9 +7,9 @@
 # This is free software; you can do what the LICENCE file allows you to.
 #
 from typing import Any  # noqa
-from typing import Callable
+from typing import Callable, List, Tuple
 
-from xotl.fl.ast.types import Type, TypeCons, TypeScheme, TypeVariable, find_tvars
+from xotl.fl.ast.types import Type, TypeCons, TypeScheme, TypeVariable
 
 _STR_PADDING = " " * 4
 
@@ -29,11 +29,30 @@ class Composition:
         self.g = g
 
     def __call__(self, s: str) -> Type:
-        return subtype(self.f, self.g(s))
+        return subtype(self, TypeVariable(s, check=False))
 
     def __repr__(self):
         return f"Composition({self.f!r}, {self.g!r})"
 
+    @property
+    def chain(self) -> List[Substitution]:
+        """The substitutions composed, in the order they must be applied.
+
+        Compositions are usually very deep (each unification composes the
+        substitution so far), so we flatten them without recursion.
+
+        """
+        result: List[Substitution] = []
+        stack: List[Substitution] = [self]
+        while stack:
+            phi = stack.pop()
+            if isinstance(phi, Composition):
+                stack.append(phi.f)
+                stack.append(phi.g)
+            else:
+                result.append(phi)
+        return result
+
     def __str__(self):
         import textwrap
 
@@ -107,20 +126,55 @@ class delta:
 
 
 def subtype(phi: Substitution, t: Type) -> Type:
-    """Get the sub-type of `t` by applying the substitution `phi`."""
-    # 'subtype(sidentity, t) == t'; and since Type, TypeVariables and TypeCons
-    # are treated immutably we should be safe to return the same type.
-    if phi is sidentity:
+    """Get the sub-type of `t` by applying the substitution `phi`.
+
+    A composition is applied one substitution at a time; see
+    `Composition.chain`:meth:.
+
+    """
+    if isinstance(phi, Composition):
+        for psi in phi.chain:
+            if not isinstance(psi, delta) or psi.vname in t.ftv:
+                t = _subtype(psi, t)
         return t
-    elif isinstance(t, TypeVariable):
-        return phi(t.name)
-    elif isinstance(t, TypeCons):
-        return TypeCons(t.cons, [subtype(phi, subt) for subt in t.subtypes], binary=t.binary)
-    elif isinstance(t, TypeScheme):
-        psi = Exclude(phi, t)
-        return TypeScheme(t.generics, subtype(psi, t.type_))
     else:
-        assert False, f"Node of unknown type {t!r}"
+        return _subtype(phi, t)
+
+
+def _subtype(phi: Substitution, t: Type) -> Type:
+    # 'subtype(sidentity, t) == t'; and since Type, TypeVariables and TypeCons
+    # are treated immutably we should be safe to return the same type.  The
+    # same goes for types without free variables.
+    #
+    # We walk the type with an explicit stack.  Compound types are pushed
+    # twice; the second time (`built` is True) their substituted components
+    # are on top of `results`.
+    results: List[Type] = []
+    stack: List[Tuple[Type, Substitution, bool]] = [(t, phi, False)]
+    while stack:
+        t, phi, built = stack.pop()
+        if phi is sidentity or not t.ftv:
+            results.append(t)
+        elif isinstance(t, TypeVariable):
+            results.append(phi(t.name))
+        elif isinstance(t, TypeCons):
+            if built:
+                count = len(t.subtypes)
+                subtypes = results[len(results) - count :]
+                del results[len(results) - count :]
+                results.append(TypeCons(t.cons, subtypes, binary=t.binary))
+            else:
+                stack.append((t, phi, True))
+                stack.extend((subt, phi, False) for subt in reversed(t.subtypes))
+        elif isinstance(t, TypeScheme):
+            if built:
+                results.append(TypeScheme(t.generics, results.pop()))
+            else:
+                stack.append((t, phi, True))
+                stack.append((t.type_, Exclude(phi, t), False))
+        else:
+            assert False, f"Node of unknown type {t!r}"
+    return results.pop()
 
 
 def scompose(f: Substitution, g: Substitution) -> Substitution:
@@ -162,9 +216,7 @@ def subscheme(phi: Substitution, ts: TypeScheme) -> TypeScheme:
     # to larger syntactic constructs containing type-schemes.
     #
     assert all(
-        not bool(scvs & set(tv.name for tv in find_tvars(phi(unk))))
-        for scvs in (set(ts.generics),)
-        for unk in ts.nongenerics
+        not bool(scvs & phi(unk).ftv) for scvs in (set(ts.generics),) for unk in ts.nongenerics
     )
     return TypeScheme(ts.generics, subtype(Exclude(phi, ts), ts.type_))
 
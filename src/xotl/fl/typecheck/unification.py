@@ -6,9 +6,9 @@
 #
 # This is free software; you can do what the LICENCE file allows you to.
 #
-from typing import Iterable, Tuple
+from typing import Iterable, List, Tuple
 
-from xotl.fl.ast.types import Type, TypeCons, TypeVariable, find_tvars
+from xotl.fl.ast.types import Type, TypeCons, TypeVariable
 
 from .exceptions import UnificationError
 from .subst import Substitution, delta, scompose, sidentity, subtype
@@ -27,29 +27,32 @@ def unify(e1: Type, e2: Type, *, phi: Substitution = sidentity) -> Substitution:
     def extend(phi: Substitution, name: str, t: Type) -> Substitution:
         if isinstance(t, TypeVariable) and name == t.name:
             return phi
-        elif name in {tv.name for tv in find_tvars(t)}:
+        elif name in t.ftv:
             raise UnificationError(f"Cannot unify {name!s} with {t!s}")
         else:
             # TODO: Make the result *descriptible*
             return scompose(delta(name, t), phi)
 
-    def unify_with_tvar(tvar, t):
-        phitvn = phi(tvar.name)
-        if phitvn == tvar:
-            return extend(phi, tvar.name, subtype(phi, t))
+    # The pairs of types yet to unify; the top of the stack is the next
+    # pair, so that sub-terms are unified from left to right.
+    pairs: List[Tuple[Type, Type]] = [(e1, e2)]
+    while pairs:
+        e1, e2 = pairs.pop()
+        if not isinstance(e1, TypeVariable) and isinstance(e2, TypeVariable):
+            e1, e2 = e2, e1
+        if isinstance(e1, TypeVariable):
+            phitvn = phi(e1.name)
+            if phitvn == e1:
+                phi = extend(phi, e1.name, subtype(phi, e2))
+            else:
+                pairs.append((phitvn, subtype(phi, e2)))
         else:
-            return unify(phitvn, subtype(phi, t), phi=phi)
-
-    if isinstance(e1, TypeVariable):
-        return unify_with_tvar(e1, e2)
-    elif isinstance(e2, TypeVariable):
-        return unify_with_tvar(e2, e1)
-    else:
-        assert isinstance(e1, TypeCons) and isinstance(e2, TypeCons)
-        if e1.cons == e2.cons:
-            return unify_exprs(zip(e1.subtypes, e2.subtypes), p=phi)
-        else:
-            raise UnificationError(f"Cannot unify {e1!s} with {e2!s}")
+            assert isinstance(e1, TypeCons) and isinstance(e2, TypeCons)
+            if e1.cons == e2.cons:
+                pairs.extend(reversed(list(zip(e1.subtypes, e2.subtypes))))
+            else:
+                raise UnificationError(f"Cannot unify {e1!s} with {e2!s}")
+    return phi
 
 
 TypePairs = Iterable[Tuple[Type, Type]]
@@ -0,0 +1,649 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------
+# Copyright (c) Merchise Autrement [~º/~] and Contributors
+# All rights reserved.
+#
+# This is free software; you can do what the LICENCE file allows you to.
+#
+"""A type checker based on mutable type variables.
+
+The algorithm in `xotl.fl.typecheck`:mod: threads a substitution through the
+whole inference.  Each unification wraps the previous substitution into
+another `~xotl.fl.typecheck.subst.Composition`:class:, so resolving a single
+type variable walks a chain that grows with the number of unifications done
+so far.
+
+Here, each type variable is a mutable `TypeCell`:class:.  Cells form a
+union-find forest: unifying two unknown variables links their roots (union
+by rank), and binding a variable to a type constructor stores the
+constructor in the root of its set.  Resolving a variable is a `find`:func:
+with path compression, and the occurs check walks the (resolved) term in
+place.  Nothing is ever substituted.
+
+Let-polymorphism uses levels (as in OCaml's type checker and Rémy's
+algorithm).  Each cell records the let-depth at which it was created;
+unifying cells keeps the outermost level, and binding a cell lowers the
+levels of the cells in the bound term.  A ``let`` generalizes the cells in
+the types of its definitions whose level is deeper than the ``let`` itself,
+without inspecting the type environment.
+
+The types inferred are the same (up to the renaming of type variables) to
+those inferred by the substitution-based algorithm, which is kept as the
+reference implementation.  Select this engine with ``typecheck(...,
+engine='unionfind')``.
+
+"""
+
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+from xotl.fl.ast.base import AST
+from xotl.fl.ast.expressions import Application, Identifier, Lambda, Let, Letrec, Literal
+from xotl.fl.ast.pattern import ConcreteLet
+from xotl.fl.ast.types import Type, TypeCons, TypeScheme, TypeVariable
+from xotl.fl.meta import Symbolic
+from xotl.fl.utils import TVarSupply
+
+from .exceptions import UnificationError
+
+
+class TypeCell:
+    """A mutable type variable.
+
+    Only the root of each set in the union-find forest is meaningful.  Its
+    `instance` is None while the variable is unknown, or the term the
+    variable was bound to.  The `level` is the let-depth of the outermost
+    scope the variable is known in.
+
+    """
+
+    __slots__ = ("name", "parent", "rank", "instance", "level")
+
+    def __init__(self, name: str, level: int = 0) -> None:
+        self.name = name
+        self.parent: TypeCell = self
+        self.rank = 0
+        self.instance: Optional[Term] = None
+        self.level = level
+
+    def __repr__(self):
+        return f"<TypeCell {self.name}>"
+
+
+class ConsTerm:
+    """The application of a type constructor to its arguments."""
+
+    __slots__ = ("cons", "args", "binary")
+
+    def __init__(self, cons: str, args: Sequence["Term"], binary: bool = False) -> None:
+        self.cons = cons
+        self.args = tuple(args)
+        self.binary = binary
+
+    def __repr__(self):
+        return f"<ConsTerm {self.cons} {self.args!r}>"
+
+
+class OpaqueTerm:
+    """A type we don't unify structurally.
+
+    Type schemes nested inside a type (e.g. ``(forall a. a -> a) -> b``) are
+    kept as they are.  They can be bound to variables, and unified with equal
+    types.
+
+    """
+
+    __slots__ = ("type_",)
+
+    def __init__(self, type_: Type) -> None:
+        self.type_ = type_
+
+    def __repr__(self):
+        return f"<OpaqueTerm {self.type_!s}>"
+
+
+Term = Union[TypeCell, ConsTerm, OpaqueTerm]
+
+
+def find(cell: TypeCell) -> TypeCell:
+    "Return the root of `cell`, compressing the path to it."
+    root = cell
+    while root.parent is not root:
+        root = root.parent
+    while cell.parent is not root:
+        cell.parent, cell = root, cell.parent
+    return root
+
+
+def resolve(term: Term) -> Term:
+    """Return the term `term` currently stands for.
+
+    The result is either an unknown root cell, or a non-variable term.
+
+    """
+    if isinstance(term, TypeCell):
+        root = find(term)
+        instance = root.instance
+        return root if instance is None else instance
+    else:
+        return term
+
+
+def occurs(cell: TypeCell, term: Term) -> bool:
+    """Return True if the root `cell` occurs in `term`.
+
+    The levels of the unknown cells in `term` are lowered to the level of
+    `cell`.
+
+    """
+    level = cell.level
+    stack: List[Term] = [term]
+    while stack:
+        t = resolve(stack.pop())
+        if t is cell:
+            return True
+        elif isinstance(t, TypeCell):
+            if t.level > level:
+                t.level = level
+        elif isinstance(t, ConsTerm):
+            stack.extend(t.args)
+    return False
+
+
+def lower_levels(term: Term, level: int) -> None:
+    "Lower the level of the unknown cells in `term` to `level`."
+    stack: List[Term] = [term]
+    while stack:
+        t = resolve(stack.pop())
+        if isinstance(t, TypeCell):
+            if t.level > level:
+                t.level = level
+        elif isinstance(t, ConsTerm):
+            stack.extend(t.args)
+
+
+def unify_terms(t1: Term, t2: Term) -> None:
+    """Unify the terms `t1` and `t2` in place.
+
+    If the terms cannot be unified raise a `UnificationError`:class:.  The
+    cells bound before the failure remain bound.
+
+    """
+    pairs = [(t1, t2)]
+    while pairs:
+        a, b = pairs.pop()
+        a, b = resolve(a), resolve(b)
+        if a is b:
+            continue
+        elif isinstance(a, TypeCell) and isinstance(b, TypeCell):
+            _union(a, b)
+        elif isinstance(a, TypeCell):
+            _bind(a, b)
+        elif isinstance(b, TypeCell):
+            _bind(b, a)
+        elif (
+            isinstance(a, ConsTerm)
+            and isinstance(b, ConsTerm)
+            and a.cons == b.cons
+            and len(a.args) == len(b.args)
+        ):
+            pairs.extend(zip(a.args, b.args))
+        elif isinstance(a, OpaqueTerm) and isinstance(b, OpaqueTerm) and a.type_ == b.type_:
+            continue
+        else:
+            raise UnificationError(f"Cannot unify {export(a)!s} with {export(b)!s}")
+
+
+def _union(a: TypeCell, b: TypeCell) -> None:
+    if a.rank < b.rank:
+        a, b = b, a
+    b.parent = a
+    if a.rank == b.rank:
+        a.rank += 1
+    if b.level < a.level:
+        a.level = b.level
+
+
+def _bind(cell: TypeCell, term: Term) -> None:
+    if occurs(cell, term):
+        raise UnificationError(f"Cannot unify {cell.name!s} with {export(term)!s}")
+    cell.instance = term
+
+
+def export(term: Term) -> Type:
+    """Return the type expression `term` stands for.
+
+    Unknown variables are exported as type variables named after the root of
+    their set.
+
+    """
+    memo: Dict[int, Type] = {}
+
+    def exported(t: Term) -> Type:
+        t = resolve(t)
+        if isinstance(t, TypeCell):
+            return TypeVariable(t.name, check=False)
+        elif isinstance(t, ConsTerm):
+            return memo[id(t)]
+        else:
+            assert isinstance(t, OpaqueTerm)
+            return t.type_
+
+    # Export the constructors bottom-up: a constructor stays in the stack
+    # until all its arguments are exported.
+    stack: List[Term] = [term]
+    while stack:
+        t = resolve(stack[-1])
+        if isinstance(t, ConsTerm) and id(t) not in memo:
+            pending = [arg for arg in map(resolve, t.args) if _pending(arg, memo)]
+            if pending:
+                stack.extend(pending)
+                continue
+            memo[id(t)] = TypeCons(t.cons, [exported(arg) for arg in t.args], binary=t.binary)
+        stack.pop()
+    return exported(term)
+
+
+def _pending(t: Term, memo: Mapping[int, Any]) -> bool:
+    return isinstance(t, ConsTerm) and id(t) not in memo
+
+
+def free_cells(term: Term) -> Set[TypeCell]:
+    "Return the (root) unknown cells in `term`."
+    result: Set[TypeCell] = set()
+    stack: List[Term] = [term]
+    while stack:
+        t = resolve(stack.pop())
+        if isinstance(t, TypeCell):
+            result.add(t)
+        elif isinstance(t, ConsTerm):
+            stack.extend(t.args)
+    return result
+
+
+class Scheme:
+    """An internal type scheme.
+
+    The `generics` are root cells that were unknown at the moment of the
+    generalization, and don't occur anywhere else.
+
+    """
+
+    __slots__ = ("generics", "body")
+
+    def __init__(self, generics: Iterable[TypeCell], body: Term) -> None:
+        self.generics: FrozenSet[TypeCell] = frozenset(generics)
+        self.body = body
+
+    def __repr__(self):
+        names = " ".join(sorted(cell.name for cell in self.generics))
+        return f"<Scheme: forall {names}. {export(self.body)!s}>"
+
+
+LocalEnvironment = Dict[Symbolic, Scheme]
+
+# The tasks of `Inference.infer`:meth:.
+_INFER, _APPLY, _ABSTRACT, _LET, _LETREC, _RESTORE = range(6)
+
+_MISSING: Any = object()
+
+
+class Inference:
+    """The state of the inference of a single expression.
+
+    `env` is the type environment of the expression; the names it doesn't
+    define are looked up in `env`.  New type variables are named after those
+    drawn from the type-variables supply `ns`.
+
+    Non-generic variables in `env` are shared among all the lookups, since
+    they stand for the same (yet unknown) type.  They are at level 0, so
+    they are never generalized.  The `level` is the current let-depth,
+    which starts at 1.
+
+    The names bound inside the expression are kept in `local`, which is
+    updated in place when entering and leaving their scopes.
+
+    """
+
+    def __init__(self, env: Mapping[Symbolic, TypeScheme], ns: TVarSupply) -> None:
+        self.env = env
+        self.ns = ns
+        self.cells: Dict[str, TypeCell] = {}
+        self.nongenerics: Dict[str, TypeCell] = {}
+        self.level = 1
+        self.local: LocalEnvironment = {}
+
+    def newcell(self) -> TypeCell:
+        name = next(self.ns).name
+        result = self.cells[name] = TypeCell(name, self.level)
+        return result
+
+    def import_type(self, t: Type, generics: Mapping[str, TypeCell] = None) -> Term:
+        """Convert the type expression `t` to a term.
+
+        Variables in `generics` are replaced by the given cells; every other
+        variable is a non-generic of the environment.
+
+        """
+        memo: Dict[Type, Term] = {}
+
+        def imported(t: Type) -> Term:
+            if isinstance(t, TypeVariable):
+                name = t.name
+                if generics and name in generics:
+                    return generics[name]
+                cell = self.nongenerics.get(name)
+                if cell is None:
+                    cell = self.nongenerics[name] = self.cells[name] = TypeCell(name)
+                return cell
+            elif isinstance(t, TypeScheme):
+                return OpaqueTerm(t)
+            else:
+                return memo[t]
+
+        root = t
+        stack: List[Type] = [root]
+        while stack:
+            t = stack[-1]
+            if isinstance(t, TypeCons) and t not in memo:
+                pending = [st for st in t.subtypes if isinstance(st, TypeCons) and st not in memo]
+                if pending:
+                    stack.extend(pending)
+                    continue
+                memo[t] = ConsTerm(t.cons, [imported(st) for st in t.subtypes], binary=t.binary)
+            else:
+                assert isinstance(t, (TypeCons, TypeVariable, TypeScheme)), f"Unexpected: {t!r}"
+            stack.pop()
+        return imported(root)
+
+    def newinstance(self, scheme: Union[Scheme, TypeScheme]) -> Term:
+        "Create an instance of `scheme` with new cells for its generics."
+        if isinstance(scheme, TypeScheme):
+            generics = {name: self.newcell() for name in scheme.generics}
+            return self.import_type(scheme.type_, generics)
+        elif not scheme.generics:
+            return scheme.body
+        else:
+            renaming: Dict[TypeCell, TypeCell] = {}
+            memo: Dict[int, Term] = {}
+
+            def copied(t: Term) -> Term:
+                t = resolve(t)
+                if isinstance(t, TypeCell):
+                    if t in scheme.generics:
+                        result = renaming.get(t)
+                        if result is None:
+                            result = renaming[t] = self.newcell()
+                        return result
+                    else:
+                        return t
+                elif isinstance(t, ConsTerm):
+                    return memo[id(t)]
+                else:
+                    return t
+
+            stack: List[Term] = [scheme.body]
+            while stack:
+                t = resolve(stack[-1])
+                if isinstance(t, ConsTerm) and id(t) not in memo:
+                    pending = [arg for arg in map(resolve, t.args) if _pending(arg, memo)]
+                    if pending:
+                        stack.extend(pending)
+                        continue
+                    memo[id(t)] = ConsTerm(t.cons, [copied(arg) for arg in t.args], binary=t.binary)
+                stack.pop()
+            return copied(scheme.body)
+
+    def lookup(self, name: Symbolic) -> Term:
+        scheme = self.local.get(name)
+        if scheme is None:
+            return self.newinstance(self.env[name])
+        else:
+            return self.newinstance(scheme)
+
+    def bind(self, schemes: Mapping[Symbolic, Scheme]) -> List[Tuple[Symbolic, Scheme]]:
+        """Bind the names in `schemes` in the local environment.
+
+        Return the bindings shadowed, so that they can be restored.
+
+        """
+        local = self.local
+        result = [(name, local.get(name, _MISSING)) for name in schemes]
+        local.update(schemes)
+        return result
+
+    def restore(self, shadowed: Sequence[Tuple[Symbolic, Scheme]]) -> None:
+        "Restore the bindings returned by `bind`:meth:."
+        local = self.local
+        for name, scheme in shadowed:
+            if scheme is _MISSING:
+                del local[name]
+            else:
+                local[name] = scheme
+
+    def generalize(self, term: Term) -> Scheme:
+        """Generalize the unknowns in `term` created deeper than the current level.
+
+        Cells at the current level or above are known in the enclosing
+        scopes (or in the type environment).
+
+        """
+        level = self.level
+        return Scheme((cell for cell in free_cells(term) if cell.level > level), term)
+
+    def infer(self, exp: AST) -> Term:
+        """Infer the type of `exp` in the current local environment.
+
+        We don't use recursion, so that very deep expressions (e.g. long
+        list literals) can be type-checked.  Instead, we keep a stack of
+        tasks; the types inferred so far are kept in the stack `types`.
+
+        """
+        types: List[Term] = []
+        tasks: List[Tuple[Any, ...]] = [(_INFER, exp)]
+        while tasks:
+            task, arg, *args = tasks.pop()
+            if task == _INFER:
+                if isinstance(arg, Identifier):
+                    types.append(self.lookup(arg.name))
+                elif isinstance(arg, Literal):
+                    types.append(self.import_type(arg.type_))
+                elif isinstance(arg, Application):
+                    tasks.append((_APPLY, arg))
+                    tasks.append((_INFER, arg.e2))
+                    tasks.append((_INFER, arg.e1))
+                elif isinstance(arg, Lambda):
+                    argtype = self.newcell()
+                    shadowed = self.bind({arg.varname: Scheme((), argtype)})
+                    tasks.append((_ABSTRACT, argtype, shadowed))
+                    tasks.append((_INFER, arg.body))
+                elif isinstance(arg, Let):
+                    self.level += 1
+                    tasks.append((_LET, arg))
+                    tasks.extend((_INFER, value) for value in reversed(tuple(arg.values())))
+                elif isinstance(arg, Letrec):
+                    self.level += 1
+                    names = tuple(arg.keys())
+                    nbvs = [self.newcell() for _ in names]
+                    shadowed = self.bind({name: Scheme((), nbv) for name, nbv in zip(names, nbvs)})
+                    tasks.append((_LETREC, arg, nbvs, shadowed))
+                    tasks.extend((_INFER, value) for value in reversed(tuple(arg.values())))
+                elif isinstance(arg, ConcreteLet):
+                    tasks.append((_INFER, arg.ast))
+                else:
+                    assert False, f"Unknown AST node {arg!r}"
+            elif task == _APPLY:
+                t2 = types.pop()
+                t1 = types.pop()
+                types.append(self.apply(arg, t1, t2))
+            elif task == _ABSTRACT:
+                (shadowed,) = args
+                self.restore(shadowed)
+                types.append(ConsTerm("->", [arg, types.pop()], binary=True))
+            elif task == _LET:
+                names = tuple(arg.keys())
+                values = self._pop(types, len(names))
+                self._check_annotations(arg, names, values)
+                self.level -= 1
+                tasks.append((_RESTORE, self.bind(self._schemes(arg, names, values))))
+                tasks.append((_INFER, arg.body))
+            elif task == _LETREC:
+                # See the comments in `xotl.fl.typecheck.typecheck_letrec`:func:.
+                nbvs, shadowed = args
+                names = tuple(arg.keys())
+                values = self._pop(types, len(names))
+                self.restore(shadowed)
+                self._check_annotations(arg, names, values)
+                for t, nbv in zip(values, nbvs):
+                    unify_terms(t, nbv)
+                self.level -= 1
+                tasks.append((_RESTORE, self.bind(self._schemes(arg, names, nbvs))))
+                tasks.append((_INFER, arg.body))
+            else:
+                assert task == _RESTORE
+                self.restore(arg)
+        (result,) = types
+        return result
+
+    def infer_bindings(
+        self, exp: Union[Let, Letrec], *, generalize_all: bool = False
+    ) -> Dict[Symbolic, Scheme]:
+        """Infer the schemes of the definitions in `exp`, ignoring its body.
+
+        If `generalize_all` is True, all the definitions are generalized even
+        if some of them are annotated.
+
+        """
+        names: Sequence[Symbolic] = tuple(exp.keys())
+        self.level += 1
+        if isinstance(exp, Letrec):
+            nbvs = [self.newcell() for _ in names]
+            shadowed = self.bind({name: Scheme((), nbv) for name, nbv in zip(names, nbvs)})
+            types = [self.infer(value) for value in exp.values()]
+            self.restore(shadowed)
+            self._check_annotations(exp, names, types)
+            for t, nbv in zip(types, nbvs):
+                unify_terms(t, nbv)
+            types = nbvs
+        else:
+            types = [self.infer(value) for value in exp.values()]
+            self._check_annotations(exp, names, types)
+        self.level -= 1
+        return self._schemes(exp, names, types, generalize_all=generalize_all)
+
+    @staticmethod
+    def _pop(types: List[Term], count: int) -> List[Term]:
+        result = types[len(types) - count :]
+        del types[len(types) - count :]
+        return result
+
+    def apply(self, exp: Application, t1: Term, t2: Term) -> Term:
+        "Return the type of the application `exp` of a `t1` to a `t2`."
+        t = self.newcell()
+        try:
+            unify_terms(t1, ConsTerm("->", [t2, t], binary=True))
+        except UnificationError:
+            raise UnificationError(
+                f"Cannot type-check {exp!s} :: {export(t1)!s} ~ {export(t2)!s} -> {t.name!s}"
+            )
+        return t
+
+    def _check_annotations(
+        self, exp: Union[Let, Letrec], names: Sequence[Symbolic], types: Sequence[Term]
+    ) -> None:
+        annotations = exp.localenv or {}
+        for name, t in zip(names, types):
+            if name in annotations:
+                unify_terms(self.newinstance(annotations[name]), t)
+
+    def _schemes(
+        self,
+        exp: Union[Let, Letrec],
+        names: Sequence[Symbolic],
+        types: Sequence[Term],
+        *,
+        generalize_all: bool = False,
+    ) -> Dict[Symbolic, Scheme]:
+        # Only the annotated names are generalized if there are annotations;
+        # see `xotl.fl.typecheck._add_decls`:func:.  The types of the names
+        # not generalized are known in the enclosing scope from now on.
+        annotations = exp.localenv or {}
+        schemes = {
+            name: self.generalize(t)
+            for name, t in zip(names, types)
+            if generalize_all or not annotations or name in annotations
+        }
+        for name, t in zip(names, types):
+            if name not in schemes:
+                lower_levels(t, self.level)
+                schemes[name] = Scheme((), t)
+        return schemes
+
+    def substitution(self) -> "Resolution":
+        return Resolution(self)
+
+
+class Resolution:
+    """The substitution implied by the cells of an `Inference`:class:.
+
+    Names which don't belong to any cell are left unchanged.
+
+    """
+
+    def __init__(self, inference: Inference) -> None:
+        self.cells = inference.cells
+
+    def __call__(self, name: str) -> Type:
+        cell = self.cells.get(name)
+        if cell is None:
+            return TypeVariable(name, check=False)
+        else:
+            return export(cell)
+
+    def __repr__(self):
+        return f"<Resolution of {len(self.cells)} cells>"
+
+
+def typecheck(exp: AST, env: Mapping[Symbolic, TypeScheme], ns: TVarSupply):
+    """Check the type of `exp` in a given type environment `env`.
+
+    Return a pair of a substitution and the type, just like
+    `xotl.fl.typecheck.typecheck`:func:.
+
+    """
+    inference = Inference(env, ns)
+    result = inference.infer(exp)
+    return inference.substitution(), export(result)
+
+
+def typecheck_bindings(
+    exp: Union[Let, Letrec],
+    env: Mapping[Symbolic, TypeScheme],
+    ns: TVarSupply,
+    *,
+    generalize_all: bool = False,
+) -> Dict[Symbolic, TypeScheme]:
+    """Check the definitions of `exp` (but not its body) in `env`.
+
+    Return the type schemes of the definitions.  See
+    `Inference.infer_bindings`:meth:.
+
+    """
+    inference = Inference(env, ns)
+    schemes = inference.infer_bindings(exp, generalize_all=generalize_all)
+    return {
+        name: TypeScheme(sorted(cell.name for cell in scheme.generics), export(scheme.body))
+        for name, scheme in schemes.items()
+    }
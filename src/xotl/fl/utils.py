@@ -40,10 +40,6 @@ class namesupply:
         return self
 
     def __next__(self) -> str:
-        assert (
-            self.count < 20000
-        ), "No expression should be so complex to require 20 000 new type variables"
-
         if self.limit is None or self.count < self.limit:
             result = None
             while not result: